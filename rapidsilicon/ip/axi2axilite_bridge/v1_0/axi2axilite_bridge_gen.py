@@ -9,56 +9,6 @@ import sys
 import logging
 import argparse
 
-from datetime import datetime
-
-from litex_wrapper.axi2axilite_bridge_litex_wrapper import AXI2AXILITE
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-from litex.soc.interconnect.axi import AXIInterface, AXILiteInterface
-
-
-# IOs / Interface ----------------------------------------------------------------------------------
-def get_clkin_ios():
-    return [
-        ("s_axi_aclk",      0, Pins(1)),
-        ("s_axi_aresetn",   0, Pins(1))]
-
-# AXI-2-AXILITE Wrapper --------------------------------------------------------------------------------
-class AXI2AXILITEWrapper(Module):
-    def __init__(self, platform, data_width, addr_width, id_width):
-        
-        # Clocking
-        platform.add_extension(get_clkin_ios())
-        self.clock_domains.cd_sys = ClockDomain()
-        self.comb += self.cd_sys.clk.eq(platform.request("s_axi_aclk"))
-        self.comb += self.cd_sys.rst.eq(platform.request("s_axi_aresetn"))
-
-        # AXI SLAVE PORT
-        s_axi = AXIInterface(
-            data_width      = data_width,
-            address_width   = addr_width,
-            id_width        = id_width
-        )
-        
-        # AXI MASTER PORT
-        m_axi = AXILiteInterface(
-            data_width      = data_width,
-            address_width   = addr_width
-        )
-
-        platform.add_extension(s_axi.get_ios("s_axi"))
-        self.comb += s_axi.connect_to_pads(platform.request("s_axi"), mode="slave")
-        
-        platform.add_extension(m_axi.get_ios("m_axi"))
-        self.comb += m_axi.connect_to_pads(platform.request("m_axi"), mode="master")
-
-        # AXI_2_AXILITE
-        self.submodules.axi2axilite = AXI2AXILITE(platform, s_axi, m_axi)
 
 # Build --------------------------------------------------------------------------------------------
 def main():
@@ -94,6 +44,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",            help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                   help="Build Directory")
     build_group.add_argument("--build-name",    default="axi2axilite_bridge_wrapper",  help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -127,14 +78,6 @@ def main():
     if args.json_template:
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
 
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = AXI2AXILITEWrapper(platform,
-        data_width = args.data_width,
-        addr_width = args.addr_width,
-        id_width   = args.id_width
-    )
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -142,46 +85,32 @@ def main():
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version = "v1_0"
-        )
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "axi2axilite_bridge", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"AXI2AXIL\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="AXI2AXIL", ip_version="00000000_00000000_0000000000000001")
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.axi2axilite_bridge_wrapper import AXI2AXILITEWrapper
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = AXI2AXILITEWrapper(platform,
+                data_width = args.data_width,
+                addr_width = args.addr_width,
+                id_width   = args.id_width
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version = "v1_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
 
 if __name__ == "__main__":
     main()
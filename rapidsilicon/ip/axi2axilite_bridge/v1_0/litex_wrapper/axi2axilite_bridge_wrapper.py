@@ -0,0 +1,53 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axi2axilite_bridge LiteX wrapper: IOs and module elaborated by axi2axilite_bridge_gen.py on --build.
+
+from litex_wrapper.axi2axilite_bridge_litex_wrapper import AXI2AXILITE
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIInterface, AXILiteInterface
+
+
+# IOs / Interface ----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("s_axi_aclk",      0, Pins(1)),
+        ("s_axi_aresetn",   0, Pins(1))]
+
+# AXI-2-AXILITE Wrapper --------------------------------------------------------------------------------
+class AXI2AXILITEWrapper(Module):
+    def __init__(self, platform, data_width, addr_width, id_width):
+        
+        # Clocking
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("s_axi_aclk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("s_axi_aresetn"))
+
+        # AXI SLAVE PORT
+        s_axi = AXIInterface(
+            data_width      = data_width,
+            address_width   = addr_width,
+            id_width        = id_width
+        )
+        
+        # AXI MASTER PORT
+        m_axi = AXILiteInterface(
+            data_width      = data_width,
+            address_width   = addr_width
+        )
+
+        platform.add_extension(s_axi.get_ios("s_axi"))
+        self.comb += s_axi.connect_to_pads(platform.request("s_axi"), mode="slave")
+        
+        platform.add_extension(m_axi.get_ios("m_axi"))
+        self.comb += m_axi.connect_to_pads(platform.request("m_axi"), mode="master")
+
+        # AXI_2_AXILITE
+        self.submodules.axi2axilite = AXI2AXILITE(platform, s_axi, m_axi)
@@ -9,69 +9,6 @@ import sys
 import json
 import logging
 import argparse
-import math
-
-from datetime import datetime
-
-from litex_wrapper.axi_async_fifo_litex_wrapper import AXIASYNCFIFO
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-from litex.soc.interconnect.axi import AXIInterface
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-def get_clkin_m_ios():
-    return [
-        ("m_clk", 0, Pins(1)),
-        ("m_rst", 0, Pins(1))
-    ]
-    
-def get_clkin_s_ios():
-    return [
-        ("s_clk", 0, Pins(1)),
-        ("s_rst", 0, Pins(1))
-    ]
-
-class AXIASYNCFIFOWrapper(Module):
-    def __init__(self, platform, data_width, addr_width, id_width, fifo_depth):
-        
-        platform.add_extension(get_clkin_s_ios())
-        platform.add_extension(get_clkin_m_ios())
-        self.clock_domains.cd_sys = ClockDomain()
-
-        # AXI
-        m_axi = AXIInterface(
-            data_width      = data_width,
-            address_width   = (math.ceil(math.log2(fifo_depth))),
-            id_width        = id_width,
-        )
-        
-        s_axi = AXIInterface(
-            data_width      = data_width,
-            address_width   = (math.ceil(math.log2(fifo_depth))),
-            id_width        = id_width,
-        )
-        
-        platform.add_extension(m_axi.get_ios("m_axi"))
-        self.comb += m_axi.connect_to_pads(platform.request("m_axi"), mode="master")
-        
-        platform.add_extension(s_axi.get_ios("s_axi"))
-        self.comb += s_axi.connect_to_pads(platform.request("s_axi"), mode="slave")
-        
-        # AXI-ASYNC-FIFO -------------------------------------------------------------------------------
-        self.submodules.fifo=fifo = AXIASYNCFIFO(platform, m_axi=m_axi, s_axi=s_axi, 
-            fifo_depth   =   fifo_depth,
-            )
-
-        self.comb += self.fifo.m_clk.eq(platform.request("m_clk"))
-        self.comb += self.fifo.m_rst.eq(platform.request("m_rst"))
-        self.comb += self.fifo.s_clk.eq(platform.request("s_clk"))
-        self.comb += self.fifo.s_rst.eq(platform.request("s_rst"))
-        
 
 
 # Build --------------------------------------------------------------------------------------------
@@ -111,6 +48,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",                  help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                         help="Build Directory")
     build_group.add_argument("--build-name",    default="axi_async_fifo_wrapper",    help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -148,16 +86,6 @@ def main():
         
 
 
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = AXIASYNCFIFOWrapper(platform,
-        data_width   = args.data_width,
-        id_width     = args.id_width,
-        fifo_depth   = args.fifo_depth,
-        addr_width   = args.address_width,
-    )
-    
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -165,46 +93,33 @@ def main():
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version = "v1_0"
-        )
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "axi_async_fifo", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"ASYNCFFO\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="ASYNCFFO", ip_version="00000000_00000000_0000000000000001")
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.axi_async_fifo_wrapper import AXIASYNCFIFOWrapper
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = AXIASYNCFIFOWrapper(platform,
+                data_width   = args.data_width,
+                id_width     = args.id_width,
+                fifo_depth   = args.fifo_depth,
+                addr_width   = args.address_width,
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version = "v1_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,65 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axi_async_fifo LiteX wrapper: IOs and module elaborated by axi_async_fifo_gen.py on --build.
+
+import math
+
+from litex_wrapper.axi_async_fifo_litex_wrapper import AXIASYNCFIFO
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIInterface
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_m_ios():
+    return [
+        ("m_clk", 0, Pins(1)),
+        ("m_rst", 0, Pins(1))
+    ]
+    
+def get_clkin_s_ios():
+    return [
+        ("s_clk", 0, Pins(1)),
+        ("s_rst", 0, Pins(1))
+    ]
+
+class AXIASYNCFIFOWrapper(Module):
+    def __init__(self, platform, data_width, addr_width, id_width, fifo_depth):
+        
+        platform.add_extension(get_clkin_s_ios())
+        platform.add_extension(get_clkin_m_ios())
+        self.clock_domains.cd_sys = ClockDomain()
+
+        # AXI
+        m_axi = AXIInterface(
+            data_width      = data_width,
+            address_width   = (math.ceil(math.log2(fifo_depth))),
+            id_width        = id_width,
+        )
+        
+        s_axi = AXIInterface(
+            data_width      = data_width,
+            address_width   = (math.ceil(math.log2(fifo_depth))),
+            id_width        = id_width,
+        )
+        
+        platform.add_extension(m_axi.get_ios("m_axi"))
+        self.comb += m_axi.connect_to_pads(platform.request("m_axi"), mode="master")
+        
+        platform.add_extension(s_axi.get_ios("s_axi"))
+        self.comb += s_axi.connect_to_pads(platform.request("s_axi"), mode="slave")
+        
+        # AXI-ASYNC-FIFO -------------------------------------------------------------------------------
+        self.submodules.fifo=fifo = AXIASYNCFIFO(platform, m_axi=m_axi, s_axi=s_axi, 
+            fifo_depth   =   fifo_depth,
+            )
+
+        self.comb += self.fifo.m_clk.eq(platform.request("m_clk"))
+        self.comb += self.fifo.m_rst.eq(platform.request("m_rst"))
+        self.comb += self.fifo.s_clk.eq(platform.request("s_clk"))
+        self.comb += self.fifo.s_rst.eq(platform.request("s_rst"))
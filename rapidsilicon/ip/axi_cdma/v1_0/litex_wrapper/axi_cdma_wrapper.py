@@ -0,0 +1,90 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axi_cdma LiteX wrapper: IOs and module elaborated by axi_cdma_gen.py on --build.
+
+from litex_wrapper.axi_cdma_litex_wrapper import AXICDMA
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIInterface
+
+
+# IOs / Interface ----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk", 0, Pins(1)),
+        ("rst", 0, Pins(1))]
+
+def get_axis_ios(addr_width, len_width, tag_width):
+    return [
+        ("s_axis_desc", 0,
+            Subsignal("read_addr",  Pins(addr_width)),
+            Subsignal("write_addr", Pins(addr_width)),
+            Subsignal("len",        Pins(len_width)),
+            Subsignal("tag",        Pins(tag_width)),
+            Subsignal("valid",      Pins(1)),
+            Subsignal("ready",      Pins(1))
+        ),
+        
+        ("m_axis_desc_status", 0,
+            Subsignal("tag",        Pins(tag_width)),
+            Subsignal("error",      Pins(4)),
+            Subsignal("valid",      Pins(1))
+        ),
+        
+        ("enable",  0, Pins(1))
+    ]
+
+# AXI-CDMA Wrapper --------------------------------------------------------------------------------
+class AXICDMAWrapper(Module):
+    def __init__(self, platform, data_width, addr_width, id_width, axi_max_burst_len, len_width, tag_width, enable_unaligned):
+    
+        # Clocking
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+
+        # AXI
+        axi = AXIInterface(
+            data_width      = data_width,
+            address_width   = addr_width,
+            id_width        = id_width
+        )
+
+        platform.add_extension(axi.get_ios("m_axi"))
+        self.comb += axi.connect_to_pads(platform.request("m_axi"), mode="master")
+
+        # AXI_CDMA
+        self.submodules.cdma = cdma = AXICDMA(platform, axi,
+            axi_max_burst_len   =  axi_max_burst_len,
+            len_width           =  len_width,
+            tag_width           =  tag_width,
+            enable_unaligned    =  enable_unaligned
+            )
+
+        # Descriptor IOs
+        platform.add_extension(get_axis_ios(addr_width, len_width, tag_width))
+        s_desc_pads = platform.request("s_axis_desc")
+        self.comb += [
+            cdma.s_axis_desc_read_addr.eq(s_desc_pads.read_addr),
+            cdma.s_axis_desc_write_addr.eq(s_desc_pads.write_addr),
+            cdma.s_axis_desc_len.eq(s_desc_pads.len),
+            cdma.s_axis_desc_tag.eq(s_desc_pads.tag),
+            cdma.s_axis_desc_valid.eq(s_desc_pads.valid),
+            s_desc_pads.ready.eq(cdma.s_axis_desc_ready)
+        ]
+        
+        m_desc_pads = platform.request("m_axis_desc_status")
+        self.comb += [
+            m_desc_pads.tag.eq(cdma.m_axis_desc_status_tag),
+            m_desc_pads.error.eq(cdma.m_axis_desc_status_error),
+            m_desc_pads.valid.eq(cdma.m_axis_desc_status_valid),
+        ]
+        
+        self.comb += cdma.enable.eq(platform.request("enable"))
@@ -25,8 +25,8 @@ THE SOFTWARE.
 import itertools
 import logging
 import os
+import sys
 
-import cocotb_test.simulator
 import pytest
 
 import cocotb
@@ -37,6 +37,9 @@ from cocotb.regression import TestFactory
 from cocotbext.axi import AxiBus, AxiRam
 from cocotbext.axi.stream import define_stream
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "lib"))
+from sim_support import sim_cache
+
 DescBus, DescTransaction, DescSource, DescSink, DescMonitor = define_stream("Desc",
     signals=["read_addr", "write_addr", "len", "tag", "valid", "ready"]
 )
@@ -182,7 +185,7 @@ def test_axi_cdma(request, axi_data_width, unaligned):
     sim_build = os.path.join(tests_dir, "sim_build",
         request.node.name.replace('[', '-').replace(']', ''))
 
-    cocotb_test.simulator.run(
+    sim_cache.run(
         python_search=[tests_dir],
         verilog_sources=verilog_sources,
         toplevel=toplevel,
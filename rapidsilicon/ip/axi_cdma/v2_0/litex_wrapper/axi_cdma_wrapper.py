@@ -0,0 +1,54 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axi_cdma LiteX wrapper: IOs and module elaborated by axi_cdma_gen.py on --build.
+
+from litex_wrapper.axi_cdma_litex_wrapper import AXICDMA
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIInterface, AXILiteInterface
+
+# IOs / Interface ----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",   0, Pins(1)),
+        ("rst",   0, Pins(1)),
+        ("o_int", 0, Pins(1))
+        ]
+
+# AXI-CDMA Wrapper --------------------------------------------------------------------------------
+class AXICDMAWrapper(Module):
+    def __init__(self, platform, id_width, axi_addr_width, axi_data_width, axil_addr_width, axil_data_width):
+    
+        # Clocking
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+
+        # AXI
+        axi = AXIInterface(
+            id_width           = id_width,
+            data_width         = axi_data_width,
+            address_width      = axi_addr_width
+        )
+        
+        platform.add_extension(axi.get_ios("m_axi"))
+        self.comb += axi.connect_to_pads(platform.request("m_axi"), mode="master")
+        
+        # AXI-LITE 
+        axil = AXILiteInterface(
+            address_width      = axil_addr_width,
+            data_width         = axil_data_width
+        )
+        platform.add_extension(axil.get_ios("s_axil"))
+        self.comb += axil.connect_to_pads(platform.request("s_axil"), mode="slave")
+        
+        # AXI_CDMA
+        self.submodules.cdma = cdma = AXICDMA(platform, axi,axil)
+        self.comb += platform.request("o_int").eq(cdma.o_int)
@@ -3,8 +3,8 @@
 import itertools
 import logging
 import os
+import sys
 
-import cocotb_test.simulator
 import pytest
 
 import cocotb
@@ -16,6 +16,9 @@ from cocotbext.axi import AxiBus, AxiRam
 from cocotbext.axi.stream import define_stream
 from cocotbext.axi import AxiLiteBus, AxiLiteMaster, AxiLiteRam
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "lib"))
+from sim_support import sim_cache
+
 class TB(object):
     def __init__(self, dut):
         self.dut = dut
@@ -260,7 +263,7 @@ def test_axi_cdma(request, axi_data_width, unaligned):
     sim_build = os.path.join(tests_dir, "sim_build",
         request.node.name.replace('[', '-').replace(']', ''))
 
-    cocotb_test.simulator.run(
+    sim_cache.run(
         python_search=[tests_dir],
         verilog_sources=verilog_sources,
         toplevel=toplevel,
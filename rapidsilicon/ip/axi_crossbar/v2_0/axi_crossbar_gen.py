@@ -8,114 +8,7 @@ import os
 import sys
 import logging
 import argparse
-import math
 
-from datetime import datetime
-
-from litex_wrapper.axi_crossbar_litex_wrapper import AXICROSSBAR
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-from litex.soc.interconnect.axi import AXIInterface
-
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-def get_clkin_ios():
-    return [
-        ("ACLK",    0, Pins(1)),
-        ("ARESET",  0, Pins(1)),
-    ]
-# Slave interface clock/reset signals
-def get_clkin_ios_s(i):
-    return [
-        ("s{}_axi_aclk".format(i),     0, Pins(1)),
-        ("s{}_axi_areset".format(i),  0, Pins(1)),
-    ]
-
-# Master intrerface clock/reset signals
-def get_clkin_ios_m(j):
-    return [
-        ("m{}_axi_aclk".format(j),     0, Pins(1)),
-        ("m{}_axi_areset".format(j),  0, Pins(1)),
-    ]
-
-# AXI CROSSBAR Wrapper ----------------------------------------------------------------------------------
-class AXICROSSBARWrapper(Module):
-    def __init__(self, platform, m_count, s_count ,data_width, addr_width, s_id_width, aw_user_width, w_user_width, b_user_width, ar_user_width, r_user_width,
-                aw_user_en, w_user_en, b_user_en, ar_user_en, r_user_en,bram):
-        
-        # Clocking ---------------------------------------------------------------------------------
-        platform.add_extension(get_clkin_ios())
-        self.clock_domains.cd_sys  = ClockDomain()
-        self.comb += self.cd_sys.clk.eq(platform.request("ACLK"))
-        self.comb += self.cd_sys.rst.eq(platform.request("ARESET"))
-
-        # CLK for Slave Interfaces
-        for i in range (s_count):
-            platform.add_extension(get_clkin_ios_s(i))
-            self.clock_domains.cd_sys  = ClockDomain("s{}_axi_aclk".format(i))
-            self.comb += self.cd_sys.clk.eq(platform.request("s{}_axi_aclk".format(i)))
-            self.clock_domains.cd_sys  = ClockDomain("s{}_axi_areset".format(i))
-            self.comb += self.cd_sys.rst.eq(platform.request("s{}_axi_areset".format(i)))
-
-        # CLK for Master Interfaces
-        for j in range (m_count):
-            platform.add_extension(get_clkin_ios_m(j))
-            self.clock_domains.cd_sys  = ClockDomain("m{}_axi_aclk".format(j))
-            self.comb += self.cd_sys.clk.eq(platform.request("m{}_axi_aclk".format(j)))
-            self.clock_domains.cd_sys  = ClockDomain("m{}_axi_areset".format(j))
-            self.comb += self.cd_sys.rst.eq(platform.request("m{}_axi_areset".format(j)))
-
-        # Slave Interfaces
-        s_axis = []
-        for si_count in range(s_count):
-            s_axi = AXIInterface(data_width = data_width , address_width = addr_width, id_width = s_id_width, aw_user_width = aw_user_width,
-            w_user_width = w_user_width, b_user_width = b_user_width, ar_user_width = ar_user_width, r_user_width = r_user_width)
-            if si_count>9:
-                platform.add_extension(s_axi.get_ios("s{}_axi".format(si_count)))
-                self.comb += s_axi.connect_to_pads(platform.request("s{}_axi".format(si_count)), mode="slave")
-            else:
-                platform.add_extension(s_axi.get_ios("s0{}_axi".format(si_count)))
-                self.comb += s_axi.connect_to_pads(platform.request("s0{}_axi".format(si_count)), mode="slave")
-                
-            s_axis.append(s_axi)
-        
-        # Master Interfaces 
-        if s_count<2:
-            m_id_width = s_id_width
-        else:
-            m_id_width = (s_id_width+(math.ceil(math.log2(s_count)))) 
-            
-        m_axis = []  
-        for m_count in range(m_count):
-            m_axi = AXIInterface(data_width = data_width , address_width = addr_width, id_width = m_id_width, aw_user_width = aw_user_width,
-            w_user_width = w_user_width, b_user_width = b_user_width, ar_user_width = ar_user_width, r_user_width = r_user_width)
-            if m_count>9:
-                platform.add_extension(m_axi.get_ios("m{}_axi".format(m_count)))
-                self.comb += m_axi.connect_to_pads(platform.request("m{}_axi".format(m_count)), mode="master")
-            else:
-                platform.add_extension(m_axi.get_ios("m0{}_axi".format(m_count)))
-                self.comb += m_axi.connect_to_pads(platform.request("m0{}_axi".format(m_count)), mode="master")
-            
-            m_axis.append(m_axi)
-            
-        # AXI CROSSBAR
-        self.submodules.axi_crossbar = AXICROSSBAR(platform,
-            s_axi               = s_axis,
-            m_axi               = m_axis,
-            s_count             = s_count,
-            m_count             = m_count,
-            aw_user_en          = aw_user_en,
-            w_user_en           = w_user_en,
-            b_user_en           = b_user_en,
-            ar_user_en          = ar_user_en,
-            r_user_en           = r_user_en,
-            bram                = bram,
-            )
 
 # Build --------------------------------------------------------------------------------------------
 def main():
@@ -172,6 +65,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",                help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                       help="Build Directory")
     build_group.add_argument("--build-name",    default="axi_crossbar_wrapper",     help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -203,27 +97,6 @@ def main():
     if args.json_template:
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
 
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = AXICROSSBARWrapper(platform,
-        m_count       = args.m_count,
-        s_count       = args.s_count,
-        data_width    = args.data_width,
-        addr_width    = args.addr_width,
-        s_id_width    = args.s_id_width,
-        aw_user_en    = args.aw_user_en,
-        aw_user_width = args.aw_user_width,
-        w_user_en     = args.w_user_en,
-        w_user_width  = args.w_user_width,
-        b_user_en     = args.b_user_en,
-        b_user_width  = args.b_user_width,
-        ar_user_en    = args.ar_user_en,
-        ar_user_width = args.ar_user_width,
-        r_user_en     = args.r_user_en,
-        r_user_width  = args.r_user_width,
-        bram          = args.bram,
-    )
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -231,46 +104,45 @@ def main():
             build_name = args.build_name,
             version    = "v2_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version = "v2_0"
-        )
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "axi_crossbar", "v2_0", args.build_name, "src",args.build_name + "_" + "v2_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"CRSSBAR2\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="CRSSBAR2", ip_version="00000000_00000000_0000000000000001")
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v2_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.axi_crossbar_wrapper import AXICROSSBARWrapper
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = AXICROSSBARWrapper(platform,
+                m_count       = args.m_count,
+                s_count       = args.s_count,
+                data_width    = args.data_width,
+                addr_width    = args.addr_width,
+                s_id_width    = args.s_id_width,
+                aw_user_en    = args.aw_user_en,
+                aw_user_width = args.aw_user_width,
+                w_user_en     = args.w_user_en,
+                w_user_width  = args.w_user_width,
+                b_user_en     = args.b_user_en,
+                b_user_width  = args.b_user_width,
+                ar_user_en    = args.ar_user_en,
+                ar_user_width = args.ar_user_width,
+                r_user_en     = args.r_user_en,
+                r_user_width  = args.r_user_width,
+                bram          = args.bram,
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version = "v2_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
 
 if __name__ == "__main__":
     main()
@@ -9,171 +9,6 @@ import sys
 import logging
 import argparse
 
-from datetime import datetime
-
-from litex_wrapper.axi_dma_litex_wrapper import AXIDMA
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-from litex.soc.interconnect.axi import AXIInterface
-
-from litex.soc.interconnect.axi import AXIStreamInterface
-
-
-# IOs / Interface ----------------------------------------------------------------------------------
-def get_clkin_ios():
-    return [
-        ("clk", 0, Pins(1)),
-        ("rst", 0, Pins(1))
-    ]
-
-def get_axis_ios(axi_addr_width, len_width, axi_id_width, tag_width, axis_dest_width, axis_user_width):
-    return [
-        ("s_axis_read_desc", 0,
-            Subsignal("addr",   Pins(axi_addr_width)), 
-            Subsignal("len",    Pins(len_width)),
-            Subsignal("tag",    Pins(tag_width)), 
-            Subsignal("id",     Pins(axi_id_width)), 
-            Subsignal("dest",   Pins(axis_dest_width)), 
-            Subsignal("user",   Pins(axis_user_width)),
-            Subsignal("valid",  Pins(1)),
-            Subsignal("ready",  Pins(1))
-        ),
-        
-        ("m_axis_read_desc_status", 0,
-            Subsignal("tag",    Pins(tag_width)), 
-            Subsignal("error",  Pins(4)),
-            Subsignal("valid",  Pins(1))
-        ),
-        
-        ("s_axis_write_desc", 0,
-            Subsignal("addr",   Pins(axi_addr_width)), 
-            Subsignal("len",    Pins(len_width)), 
-            Subsignal("tag",    Pins(tag_width)), 
-            Subsignal("valid",  Pins(1)),
-            Subsignal("ready",  Pins(1))
-        ),
-        
-        ("m_axis_write_desc_status", 0,
-            Subsignal("len",    Pins(len_width)), 
-            Subsignal("tag",    Pins(tag_width)), 
-            Subsignal("id",     Pins(axi_id_width)), 
-            Subsignal("dest",   Pins(axis_dest_width)), 
-            Subsignal("user",   Pins(axis_user_width)), 
-            Subsignal("error",  Pins(4)),
-            Subsignal("valid",  Pins(1))
-        ),
-        
-        ("read_enable",     0, Pins(1)),
-        ("write_enable",    0, Pins(1)),
-        ("write_abort",     0, Pins(1))
-    ]
-    
-# AXI-DMA Wrapper --------------------------------------------------------------------------------
-class AXIDMAWrapper(Module):
-    def __init__(self, platform, axi_data_width, axi_addr_width, axi_id_width, axi_max_burst_len, 
-                axis_last_enable, axis_id_enable, axis_id_width, axis_dest_enable, axis_dest_width,
-                axis_user_enable, axis_user_width, len_width, tag_width, enable_sg, enable_unaligned):
-        
-        # Clocking
-        platform.add_extension(get_clkin_ios())
-        self.clock_domains.cd_sys = ClockDomain()
-        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
-        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
-        
-        # AXI
-        axi = AXIInterface(
-            data_width      = axi_data_width,
-            address_width   = axi_addr_width,
-            id_width        = axi_id_width,
-        )
-        m_axis = AXIStreamInterface(
-            data_width      = axi_data_width,
-            user_width      = axis_user_width,
-            dest_width      = axis_dest_width,
-            id_width        = axis_id_width
-        )
-        
-        s_axis = AXIStreamInterface(
-            data_width      = axi_data_width,
-            user_width      = axis_user_width,
-            dest_width      = axis_dest_width,
-            id_width        = axis_id_width
-        )
-        
-        platform.add_extension(axi.get_ios("m_axi"))
-        self.comb += axi.connect_to_pads(platform.request("m_axi"), mode="master")
-        
-        platform.add_extension(m_axis.get_ios("m_axis_read_data"))
-        self.comb += m_axis.connect_to_pads(platform.request("m_axis_read_data"), mode="master")
-        
-        platform.add_extension(s_axis.get_ios("s_axis_write_data"))
-        self.comb += s_axis.connect_to_pads(platform.request("s_axis_write_data"), mode="slave")
-        
-        # AXI_DMA
-        self.submodules.dma = dma = AXIDMA(platform, 
-            m_axi               = axi, 
-            m_axis              = m_axis,
-            s_axis              = s_axis, 
-            axi_max_burst_len   = axi_max_burst_len,
-            axis_last_enable    = axis_last_enable,
-            axis_id_enable      = axis_id_enable,
-            axis_dest_enable    = axis_dest_enable,
-            axis_user_enable    = axis_user_enable,            
-            len_width           = len_width,
-            tag_width           = tag_width,
-            enable_sg           = enable_sg,
-            enable_unaligned    = enable_unaligned
-            )
-        
-        # Descriptor IOs
-        platform.add_extension(get_axis_ios(axi_addr_width, len_width, axi_id_width, tag_width, axis_dest_width, axis_user_width))
-        s_desc_pads = platform.request("s_axis_read_desc")
-        self.comb += [
-            dma.s_axis_read_desc_addr.eq(s_desc_pads.addr),
-            dma.s_axis_read_desc_len.eq(s_desc_pads.len),
-            dma.s_axis_read_desc_tag.eq(s_desc_pads.tag),
-            dma.s_axis_read_desc_id.eq(s_desc_pads.id),
-            dma.s_axis_read_desc_dest.eq(s_desc_pads.dest),
-            dma.s_axis_read_desc_user.eq(s_desc_pads.user),
-            dma.s_axis_read_desc_valid.eq(s_desc_pads.valid),
-            s_desc_pads.ready.eq(dma.s_axis_read_desc_ready)
-        ]
-        
-        m_desc_pads = platform.request("m_axis_read_desc_status")
-        self.comb += [
-            m_desc_pads.tag.eq(dma.m_axis_read_desc_status_tag),
-            m_desc_pads.error.eq(dma.m_axis_read_desc_status_error),
-            m_desc_pads.valid.eq(dma.m_axis_read_desc_status_valid),
-        ]
-        
-        s_desc_pads = platform.request("s_axis_write_desc")
-        self.comb += [
-            dma.s_axis_write_desc_addr.eq(s_desc_pads.addr),
-            dma.s_axis_write_desc_len.eq(s_desc_pads.len),
-            dma.s_axis_write_desc_tag.eq(s_desc_pads.tag),
-            dma.s_axis_write_desc_valid.eq(s_desc_pads.valid),
-            s_desc_pads.ready.eq(dma.s_axis_write_desc_ready)
-        ]
-        
-        s_desc_pads = platform.request("m_axis_write_desc_status")
-        self.comb += [
-            s_desc_pads.len.eq(dma.m_axis_write_desc_status_len),
-            s_desc_pads.tag.eq(dma.m_axis_write_desc_status_tag),
-            s_desc_pads.id.eq(dma.m_axis_write_desc_status_id),
-            s_desc_pads.dest.eq(dma.m_axis_write_desc_status_dest),
-            s_desc_pads.user.eq(dma.m_axis_write_desc_status_user),
-            s_desc_pads.error.eq(dma.m_axis_write_desc_status_error),
-            s_desc_pads.valid.eq(dma.m_axis_write_desc_status_valid),
-        ]
-        
-        self.comb += dma.read_enable.eq(platform.request("read_enable"))
-        self.comb += dma.write_enable.eq(platform.request("write_enable"))
-        self.comb += dma.write_abort.eq(platform.request("write_abort"))
 
 # Build --------------------------------------------------------------------------------------------
 def main():
@@ -225,6 +60,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",            help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                   help="Build Directory")
     build_group.add_argument("--build-name",    default="axi_dma_wrapper",      help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -283,26 +119,6 @@ def main():
     if args.json_template:
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
 
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = AXIDMAWrapper(platform,
-        axi_data_width    = args.axi_data_width,
-        axi_addr_width    = args.axi_addr_width,
-        axi_id_width      = args.axi_id_width,
-        axi_max_burst_len = args.axi_max_burst_len,
-        axis_last_enable  = args.axis_last_enable,
-        axis_id_enable    = args.axis_id_enable,
-        axis_id_width     = args.axis_id_width,
-        axis_dest_enable  = args.axis_dest_enable,
-        axis_dest_width   = args.axis_dest_width,
-        axis_user_enable  = args.axis_user_enable,
-        axis_user_width   = args.axis_user_width,
-        len_width         = args.len_width,
-        tag_width         = args.tag_width,
-        enable_sg         = args.enable_sg,
-        enable_unaligned  = args.enable_unaligned
-    )
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -310,46 +126,44 @@ def main():
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version = "v1_0"
-        )
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "axi_dma", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"AXI_DMA\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="AXI_DMA", ip_version="00000000_00000000_0000000000000001")
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.axi_dma_wrapper import AXIDMAWrapper
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = AXIDMAWrapper(platform,
+                axi_data_width    = args.axi_data_width,
+                axi_addr_width    = args.axi_addr_width,
+                axi_id_width      = args.axi_id_width,
+                axi_max_burst_len = args.axi_max_burst_len,
+                axis_last_enable  = args.axis_last_enable,
+                axis_id_enable    = args.axis_id_enable,
+                axis_id_width     = args.axis_id_width,
+                axis_dest_enable  = args.axis_dest_enable,
+                axis_dest_width   = args.axis_dest_width,
+                axis_user_enable  = args.axis_user_enable,
+                axis_user_width   = args.axis_user_width,
+                len_width         = args.len_width,
+                tag_width         = args.tag_width,
+                enable_sg         = args.enable_sg,
+                enable_unaligned  = args.enable_unaligned
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version = "v1_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,168 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axi_dma LiteX wrapper: IOs and module elaborated by axi_dma_gen.py on --build.
+
+from litex_wrapper.axi_dma_litex_wrapper import AXIDMA
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIInterface
+
+from litex.soc.interconnect.axi import AXIStreamInterface
+
+
+# IOs / Interface ----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk", 0, Pins(1)),
+        ("rst", 0, Pins(1))
+    ]
+
+def get_axis_ios(axi_addr_width, len_width, axi_id_width, tag_width, axis_dest_width, axis_user_width):
+    return [
+        ("s_axis_read_desc", 0,
+            Subsignal("addr",   Pins(axi_addr_width)), 
+            Subsignal("len",    Pins(len_width)),
+            Subsignal("tag",    Pins(tag_width)), 
+            Subsignal("id",     Pins(axi_id_width)), 
+            Subsignal("dest",   Pins(axis_dest_width)), 
+            Subsignal("user",   Pins(axis_user_width)),
+            Subsignal("valid",  Pins(1)),
+            Subsignal("ready",  Pins(1))
+        ),
+        
+        ("m_axis_read_desc_status", 0,
+            Subsignal("tag",    Pins(tag_width)), 
+            Subsignal("error",  Pins(4)),
+            Subsignal("valid",  Pins(1))
+        ),
+        
+        ("s_axis_write_desc", 0,
+            Subsignal("addr",   Pins(axi_addr_width)), 
+            Subsignal("len",    Pins(len_width)), 
+            Subsignal("tag",    Pins(tag_width)), 
+            Subsignal("valid",  Pins(1)),
+            Subsignal("ready",  Pins(1))
+        ),
+        
+        ("m_axis_write_desc_status", 0,
+            Subsignal("len",    Pins(len_width)), 
+            Subsignal("tag",    Pins(tag_width)), 
+            Subsignal("id",     Pins(axi_id_width)), 
+            Subsignal("dest",   Pins(axis_dest_width)), 
+            Subsignal("user",   Pins(axis_user_width)), 
+            Subsignal("error",  Pins(4)),
+            Subsignal("valid",  Pins(1))
+        ),
+        
+        ("read_enable",     0, Pins(1)),
+        ("write_enable",    0, Pins(1)),
+        ("write_abort",     0, Pins(1))
+    ]
+    
+# AXI-DMA Wrapper --------------------------------------------------------------------------------
+class AXIDMAWrapper(Module):
+    def __init__(self, platform, axi_data_width, axi_addr_width, axi_id_width, axi_max_burst_len, 
+                axis_last_enable, axis_id_enable, axis_id_width, axis_dest_enable, axis_dest_width,
+                axis_user_enable, axis_user_width, len_width, tag_width, enable_sg, enable_unaligned):
+        
+        # Clocking
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+        
+        # AXI
+        axi = AXIInterface(
+            data_width      = axi_data_width,
+            address_width   = axi_addr_width,
+            id_width        = axi_id_width,
+        )
+        m_axis = AXIStreamInterface(
+            data_width      = axi_data_width,
+            user_width      = axis_user_width,
+            dest_width      = axis_dest_width,
+            id_width        = axis_id_width
+        )
+        
+        s_axis = AXIStreamInterface(
+            data_width      = axi_data_width,
+            user_width      = axis_user_width,
+            dest_width      = axis_dest_width,
+            id_width        = axis_id_width
+        )
+        
+        platform.add_extension(axi.get_ios("m_axi"))
+        self.comb += axi.connect_to_pads(platform.request("m_axi"), mode="master")
+        
+        platform.add_extension(m_axis.get_ios("m_axis_read_data"))
+        self.comb += m_axis.connect_to_pads(platform.request("m_axis_read_data"), mode="master")
+        
+        platform.add_extension(s_axis.get_ios("s_axis_write_data"))
+        self.comb += s_axis.connect_to_pads(platform.request("s_axis_write_data"), mode="slave")
+        
+        # AXI_DMA
+        self.submodules.dma = dma = AXIDMA(platform, 
+            m_axi               = axi, 
+            m_axis              = m_axis,
+            s_axis              = s_axis, 
+            axi_max_burst_len   = axi_max_burst_len,
+            axis_last_enable    = axis_last_enable,
+            axis_id_enable      = axis_id_enable,
+            axis_dest_enable    = axis_dest_enable,
+            axis_user_enable    = axis_user_enable,            
+            len_width           = len_width,
+            tag_width           = tag_width,
+            enable_sg           = enable_sg,
+            enable_unaligned    = enable_unaligned
+            )
+        
+        # Descriptor IOs
+        platform.add_extension(get_axis_ios(axi_addr_width, len_width, axi_id_width, tag_width, axis_dest_width, axis_user_width))
+        s_desc_pads = platform.request("s_axis_read_desc")
+        self.comb += [
+            dma.s_axis_read_desc_addr.eq(s_desc_pads.addr),
+            dma.s_axis_read_desc_len.eq(s_desc_pads.len),
+            dma.s_axis_read_desc_tag.eq(s_desc_pads.tag),
+            dma.s_axis_read_desc_id.eq(s_desc_pads.id),
+            dma.s_axis_read_desc_dest.eq(s_desc_pads.dest),
+            dma.s_axis_read_desc_user.eq(s_desc_pads.user),
+            dma.s_axis_read_desc_valid.eq(s_desc_pads.valid),
+            s_desc_pads.ready.eq(dma.s_axis_read_desc_ready)
+        ]
+        
+        m_desc_pads = platform.request("m_axis_read_desc_status")
+        self.comb += [
+            m_desc_pads.tag.eq(dma.m_axis_read_desc_status_tag),
+            m_desc_pads.error.eq(dma.m_axis_read_desc_status_error),
+            m_desc_pads.valid.eq(dma.m_axis_read_desc_status_valid),
+        ]
+        
+        s_desc_pads = platform.request("s_axis_write_desc")
+        self.comb += [
+            dma.s_axis_write_desc_addr.eq(s_desc_pads.addr),
+            dma.s_axis_write_desc_len.eq(s_desc_pads.len),
+            dma.s_axis_write_desc_tag.eq(s_desc_pads.tag),
+            dma.s_axis_write_desc_valid.eq(s_desc_pads.valid),
+            s_desc_pads.ready.eq(dma.s_axis_write_desc_ready)
+        ]
+        
+        s_desc_pads = platform.request("m_axis_write_desc_status")
+        self.comb += [
+            s_desc_pads.len.eq(dma.m_axis_write_desc_status_len),
+            s_desc_pads.tag.eq(dma.m_axis_write_desc_status_tag),
+            s_desc_pads.id.eq(dma.m_axis_write_desc_status_id),
+            s_desc_pads.dest.eq(dma.m_axis_write_desc_status_dest),
+            s_desc_pads.user.eq(dma.m_axis_write_desc_status_user),
+            s_desc_pads.error.eq(dma.m_axis_write_desc_status_error),
+            s_desc_pads.valid.eq(dma.m_axis_write_desc_status_valid),
+        ]
+        
+        self.comb += dma.read_enable.eq(platform.request("read_enable"))
+        self.comb += dma.write_enable.eq(platform.request("write_enable"))
+        self.comb += dma.write_abort.eq(platform.request("write_abort"))
@@ -22,11 +22,14 @@ THE SOFTWARE.
 
 """
 
+import csv
 import itertools
+import json
 import logging
 import os
+import sys
+from collections import deque
 
-import cocotb_test.simulator
 import pytest
 
 import cocotb
@@ -39,6 +42,9 @@ from cocotbext.axi import AxiBus, AxiRam
 from cocotbext.axi import AxiStreamBus, AxiStreamFrame, AxiStreamSource, AxiStreamSink
 from cocotbext.axi.stream import define_stream
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "lib"))
+from sim_support import sim_cache
+
 DescBus, DescTransaction, DescSource, DescSink, DescMonitor = define_stream("Desc",
     signals=["addr", "len", "tag", "valid", "ready"],
     optional_signals=["id", "dest", "user"]
@@ -208,13 +214,243 @@ async def run_test_read(dut, data_in=None, idle_inserter=None, backpressure_inse
     await RisingEdge(dut.clk)
 
 
+# Performance mode (PERF=1): back-to-back descriptors, per-descriptor latency (descriptor accepted to
+# status valid, in clock cycles) and sustained bandwidth from the m_axi channel handshakes.
+
+class PerfMonitor(object):
+    def __init__(self, dut, direction):
+        self.dut = dut
+        self.direction = direction
+
+        self.cycle = 0
+        self.pending = deque()
+        self.latencies = []
+        self.first_cycle = None
+        self.last_cycle = None
+        self.bursts = 0
+        self.max_burst = 0
+        self.beats = 0
+        self.bus_bytes = 0
+
+        self._task = cocotb.start_soon(self._run())
+
+    async def _run(self):
+        dut = self.dut
+        desc_valid = getattr(dut, f"s_axis_{self.direction}_desc_valid")
+        desc_ready = getattr(dut, f"s_axis_{self.direction}_desc_ready")
+        status_valid = getattr(dut, f"m_axis_{self.direction}_desc_status_valid")
+        if self.direction == "write":
+            a_valid, a_ready, a_len = dut.m_axi_awvalid, dut.m_axi_awready, dut.m_axi_awlen
+            d_valid, d_ready = dut.m_axi_wvalid, dut.m_axi_wready
+        else:
+            a_valid, a_ready, a_len = dut.m_axi_arvalid, dut.m_axi_arready, dut.m_axi_arlen
+            d_valid, d_ready = dut.m_axi_rvalid, dut.m_axi_rready
+        byte_lanes = len(dut.m_axi_wstrb)
+
+        while True:
+            await RisingEdge(dut.clk)
+            self.cycle += 1
+
+            if int(desc_valid.value) and int(desc_ready.value):
+                self.pending.append(self.cycle)
+                if self.first_cycle is None:
+                    self.first_cycle = self.cycle
+            if int(status_valid.value) and self.pending:
+                self.latencies.append(self.cycle - self.pending.popleft())
+                self.last_cycle = self.cycle
+            if int(a_valid.value) and int(a_ready.value):
+                self.bursts += 1
+                self.max_burst = max(self.max_burst, int(a_len.value)+1)
+            if int(d_valid.value) and int(d_ready.value):
+                self.beats += 1
+                if self.direction == "write":
+                    self.bus_bytes += bin(int(dut.m_axi_wstrb.value)).count("1")
+                else:
+                    self.bus_bytes += byte_lanes
+
+    def stop(self):
+        self._task.kill()
+
+
+def perf_config(tb):
+    byte_lanes = tb.axi_ram.write_if.byte_lanes
+    return {
+        "axi_data_width": byte_lanes*8,
+        "axi_max_burst_len": int(os.getenv("PARAM_AXI_MAX_BURST_LEN", "16")),
+        "enable_unaligned": int(os.getenv("PARAM_ENABLE_UNALIGNED", "0")),
+    }
+
+
+def perf_descriptors(tb, length):
+    # PERF_COUNT descriptors of length bytes, contiguous from 0x1000 (unaligned start address when
+    # ENABLE_UNALIGNED). Descriptors of a batch never overlap: the batch must fit the AXI RAM window.
+    byte_lanes = tb.axi_ram.write_if.byte_lanes
+    offset = 1 if int(os.getenv("PARAM_ENABLE_UNALIGNED", "0")) else 0
+    stride = (length + offset + byte_lanes-1) // byte_lanes * byte_lanes
+    count = int(os.getenv("PERF_COUNT", "8"))
+    window = 0xe000
+    if count*stride > window:
+        raise ValueError(f"PERF_COUNT={count} descriptors of {length} bytes ({count*stride} bytes) do not fit "
+            f"the {window} bytes AXI RAM window (at most {window // stride} descriptors of this length)")
+    descs = []
+    for n in range(count):
+        addr = 0x1000 + n*stride + offset
+        descs.append((addr, bytearray([(x + n) % 256 for x in range(length)])))
+    return descs
+
+
+def perf_result(tb, monitor, direction, length, descs, idle_inserter, backpressure_inserter):
+    byte_lanes = tb.axi_ram.write_if.byte_lanes
+    payload = sum(len(data) for addr, data in descs)
+    cycles = monitor.last_cycle - monitor.first_cycle + 1
+    latencies = monitor.latencies
+    result = dict(perf_config(tb))
+    result.update({
+        "direction": direction,
+        "idle": int(idle_inserter is not None),
+        "backpressure": int(backpressure_inserter is not None),
+        "length": length,
+        "descriptors": len(descs),
+        "payload_bytes": payload,
+        "cycles": cycles,
+        "bytes_per_cycle": payload / cycles,
+        "efficiency": payload / (cycles*byte_lanes),
+        "mb_per_s": payload / (cycles*10e-9) / 1e6,
+        "beats": monitor.beats,
+        "bus_bytes": monitor.bus_bytes,
+        "bursts": monitor.bursts,
+        "max_burst": monitor.max_burst,
+        "latency_min": min(latencies),
+        "latency_mean": sum(latencies) / len(latencies),
+        "latency_max": max(latencies),
+        "latencies": latencies,
+    })
+    tb.log.info("%s length %d: %.3f bytes/cycle (efficiency %.1f%%), latency min/mean/max %d/%.1f/%d cycles",
+        direction, length, result["bytes_per_cycle"], 100*result["efficiency"],
+        result["latency_min"], result["latency_mean"], result["latency_max"])
+    return result
+
+
+perf_results = []
+
+
+def write_perf_report(tb):
+    # <PERF_REPORT>_dw<width>_bl<burst_len>_ua<unaligned>.json/.csv (rewritten after each test).
+    config = perf_config(tb)
+    filename = "{}_dw{}_bl{}_ua{}".format(os.getenv("PERF_REPORT", "axi_dma_perf"),
+        config["axi_data_width"], config["axi_max_burst_len"], config["enable_unaligned"])
+    if os.path.dirname(filename):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename + ".json", "w") as f:
+        json.dump({"config": config, "results": perf_results}, f, indent=4)
+    with open(filename + ".csv", "w", newline="") as f:
+        fieldnames = [k for k in perf_results[0].keys() if k != "latencies"]
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(perf_results)
+    tb.log.info("performance report: %s.json/.csv", filename)
+
+
+def perf_lengths():
+    return [int(x) for x in os.getenv("PERF_LENGTHS", "16,64,256,1024,4096").split(",")]
+
+
+async def run_test_perf_write(dut, idle_inserter=None, backpressure_inserter=None):
+
+    tb = TB(dut)
+
+    tag_count = 2**len(tb.write_desc_source.bus.tag)
+
+    await tb.cycle_reset()
+
+    tb.set_idle_generator(idle_inserter)
+    tb.set_backpressure_generator(backpressure_inserter)
+
+    dut.write_enable.value = 1
+
+    for length in perf_lengths():
+        descs = perf_descriptors(tb, length)
+        monitor = PerfMonitor(dut, "write")
+
+        for n, (addr, data) in enumerate(descs):
+            await tb.write_desc_source.send(DescTransaction(addr=addr, len=len(data), tag=n % tag_count))
+            await tb.write_data_source.send(AxiStreamFrame(data, tid=n % tag_count))
+
+        for n in range(len(descs)):
+            status = await tb.write_desc_status_sink.recv()
+            assert int(status.tag) == n % tag_count
+            assert int(status.error) == 0
+
+        await RisingEdge(dut.clk)
+        monitor.stop()
+
+        for addr, data in descs:
+            assert tb.axi_ram.read(addr, len(data)) == data
+
+        perf_results.append(perf_result(tb, monitor, "write", length, descs, idle_inserter, backpressure_inserter))
+
+    write_perf_report(tb)
+
+    await RisingEdge(dut.clk)
+    await RisingEdge(dut.clk)
+
+
+async def run_test_perf_read(dut, idle_inserter=None, backpressure_inserter=None):
+
+    tb = TB(dut)
+
+    tag_count = 2**len(tb.read_desc_source.bus.tag)
+
+    await tb.cycle_reset()
+
+    tb.set_idle_generator(idle_inserter)
+    tb.set_backpressure_generator(backpressure_inserter)
+
+    dut.read_enable.value = 1
+
+    for length in perf_lengths():
+        descs = perf_descriptors(tb, length)
+        for addr, data in descs:
+            tb.axi_ram.write(addr, data)
+
+        monitor = PerfMonitor(dut, "read")
+
+        for n, (addr, data) in enumerate(descs):
+            await tb.read_desc_source.send(DescTransaction(addr=addr, len=len(data), tag=n % tag_count, id=n % tag_count))
+
+        for n in range(len(descs)):
+            status = await tb.read_desc_status_sink.recv()
+            assert int(status.tag) == n % tag_count
+            assert int(status.error) == 0
+
+        await RisingEdge(dut.clk)
+        monitor.stop()
+
+        for addr, data in descs:
+            read_data = await tb.read_data_sink.recv()
+            assert read_data.tdata == data
+
+        perf_results.append(perf_result(tb, monitor, "read", length, descs, idle_inserter, backpressure_inserter))
+
+    write_perf_report(tb)
+
+    await RisingEdge(dut.clk)
+    await RisingEdge(dut.clk)
+
+
+
 def cycle_pause():
     return itertools.cycle([1, 1, 1, 0])
 
 
 if cocotb.SIM_NAME:
 
-    for test in [run_test_write, run_test_read]:
+    if int(os.getenv("PERF", "0")):
+        tests = [run_test_perf_write, run_test_perf_read]
+    else:
+        tests = [run_test_write, run_test_read]
+
+    for test in tests:
 
         factory = TestFactory(test)
         factory.add_option("idle_inserter", [None, cycle_pause])
@@ -270,7 +506,65 @@ def test_axi_dma(request, axi_data_width, unaligned):
     sim_build = os.path.join(tests_dir, "sim_build",
         request.node.name.replace('[', '-').replace(']', ''))
 
-    cocotb_test.simulator.run(
+    sim_cache.run(
+        python_search=[tests_dir],
+        verilog_sources=verilog_sources,
+        toplevel=toplevel,
+        module=module,
+        parameters=parameters,
+        sim_build=sim_build,
+        extra_env=extra_env,
+    )
+
+@pytest.mark.skipif(not int(os.getenv("PERF", "0")), reason="performance sweep (PERF=1)")
+@pytest.mark.parametrize("unaligned", [0, 1])
+@pytest.mark.parametrize("axi_max_burst_len", [16, 64, 256])
+@pytest.mark.parametrize("axi_data_width", [32, 64, 128])
+def test_axi_dma_perf(request, axi_data_width, axi_max_burst_len, unaligned):
+    dut = "axi_dma"
+    module = os.path.splitext(os.path.basename(__file__))[0]
+    toplevel = dut
+
+    verilog_sources = [
+        os.path.join(rtl_dir, f"{dut}.v"),
+        os.path.join(rtl_dir, f"{dut}_rd.v"),
+        os.path.join(rtl_dir, f"{dut}_wr.v"),
+    ]
+
+    parameters = {}
+
+    axis_data_width = axi_data_width
+
+    parameters['AXI_DATA_WIDTH'] = axi_data_width
+    parameters['AXI_ADDR_WIDTH'] = 16
+    parameters['AXI_STRB_WIDTH'] = parameters['AXI_DATA_WIDTH'] // 8
+    parameters['AXI_ID_WIDTH'] = 8
+    parameters['AXI_MAX_BURST_LEN'] = axi_max_burst_len
+    parameters['AXIS_DATA_WIDTH'] = axis_data_width
+    parameters['AXIS_KEEP_ENABLE'] = int(parameters['AXIS_DATA_WIDTH'] > 8)
+    parameters['AXIS_KEEP_WIDTH'] = parameters['AXIS_DATA_WIDTH'] // 8
+    parameters['AXIS_LAST_ENABLE'] = 1
+    parameters['AXIS_ID_ENABLE'] = 1
+    parameters['AXIS_ID_WIDTH'] = 8
+    parameters['AXIS_DEST_ENABLE'] = 0
+    parameters['AXIS_DEST_WIDTH'] = 8
+    parameters['AXIS_USER_ENABLE'] = 1
+    parameters['AXIS_USER_WIDTH'] = 1
+    parameters['LEN_WIDTH'] = 20
+    parameters['TAG_WIDTH'] = 8
+    parameters['ENABLE_SG'] = 0
+    parameters['ENABLE_UNALIGNED'] = unaligned
+
+    extra_env = {f'PARAM_{k}': str(v) for k, v in parameters.items()}
+
+    # One report per configuration in sim_build/perf/ (idle/backpressure variants as rows).
+    extra_env['PERF'] = '1'
+    extra_env['PERF_REPORT'] = os.path.join(tests_dir, "sim_build", "perf", "axi_dma_perf")
+
+    sim_build = os.path.join(tests_dir, "sim_build",
+        request.node.name.replace('[', '-').replace(']', ''))
+
+    sim_cache.run(
         python_search=[tests_dir],
         verilog_sources=verilog_sources,
         toplevel=toplevel,
@@ -278,4 +572,4 @@ def test_axi_dma(request, axi_data_width, unaligned):
         parameters=parameters,
         sim_build=sim_build,
         extra_env=extra_env,
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,71 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axi_dpram LiteX wrapper: IOs and module elaborated by axi_dpram_gen.py on --build.
+
+from litex_wrapper.axi_dp_ram_litex_wrapper import AXIDPRAM
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIInterface
+
+
+# IOs / Interface ----------------------------------------------------------------------------------
+def get_clkin_a_ios():
+    return [
+        ("a_clk", 0, Pins(1)),
+        ("a_rst", 0, Pins(1))
+    ]
+    
+def get_clkin_b_ios():
+    return [
+        ("b_clk", 0, Pins(1)),
+        ("b_rst", 0, Pins(1))
+    ]
+    
+# AXI-DPRAM Wrapper --------------------------------------------------------------------------------
+class AXIDPRAMWrapper(Module):
+    def __init__(self, platform, data_width, addr_width, id_width, a_pip_out, b_pip_out, a_interleave, b_interleave):
+
+        # Clock Domain
+        self.clock_domains.cd_sys = ClockDomain()
+        
+        # AXI
+        s_axi_a = AXIInterface(
+            data_width      = data_width,
+            address_width   = addr_width,
+            id_width        = id_width,
+        )
+        
+        s_axi_b = AXIInterface(
+            data_width      = data_width,
+            address_width   = addr_width,
+            id_width        = id_width,
+        )
+        
+        platform.add_extension(s_axi_a.get_ios("s_axi_a"))
+        self.comb += s_axi_a.connect_to_pads(platform.request("s_axi_a"), mode="slave")
+        
+        platform.add_extension(s_axi_b.get_ios("s_axi_b"))
+        self.comb += s_axi_b.connect_to_pads(platform.request("s_axi_b"), mode="slave")
+        
+        # AXI-DPRAM -------------------------------------------------------------------------------
+        self.submodules.dpram = dpram = AXIDPRAM(platform, s_axi_a, s_axi_b, 
+            a_pipeline_output   =   a_pip_out, 
+            b_pipeline_output   =   b_pip_out, 
+            a_interleave        =   a_interleave, 
+            b_interleave        =   b_interleave, 
+            size                =   (2**addr_width)*(data_width/8)
+            )
+        
+        platform.add_extension(get_clkin_a_ios())
+        self.comb += dpram.a_clk.eq(platform.request("a_clk"))
+        self.comb += dpram.a_rst.eq(platform.request("a_rst"))
+        
+        platform.add_extension(get_clkin_b_ios())
+        self.comb += dpram.b_clk.eq(platform.request("b_clk"))
+        self.comb += dpram.b_rst.eq(platform.request("b_rst"))
@@ -9,82 +9,6 @@ import sys
 import logging
 import argparse
 
-from datetime import datetime
-
-from litex_wrapper.axi_fifo_litex_wrapper import AXIFIFO
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-from litex.soc.interconnect.axi import AXIInterface
-
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-def get_clkin_ios():
-    return [
-        ("clk",  0, Pins(1)),
-        ("rst",  0, Pins(1)),
-    ]
-    
-# AXI FIFO Wrapper ----------------------------------------------------------------------------------
-class AXIFIFOWrapper(Module):
-    def __init__(self, platform, data_width, addr_width, id_width, aw_user_en, aw_user_width,
-                w_user_en, w_user_width, b_user_en, b_user_width, ar_user_en, ar_user_width,
-                r_user_en, r_user_width, write_fifo_depth, read_fifo_depth, write_fifo_delay, 
-                read_fifo_delay):
-        
-        # Clocking 
-        platform.add_extension(get_clkin_ios())
-        self.clock_domains.cd_sys  = ClockDomain()
-        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
-        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
-
-        # AXI 
-        s_axi = AXIInterface(
-            data_width      = data_width,
-            address_width   = addr_width,
-            id_width        = id_width,
-            aw_user_width   = aw_user_width,
-            w_user_width    = w_user_width,
-            b_user_width    = b_user_width,
-            ar_user_width   = ar_user_width,
-            r_user_width    = r_user_width
-        )
-        
-        m_axi = AXIInterface(
-            data_width      = data_width,
-            address_width   = addr_width,
-            id_width        = id_width,
-            aw_user_width   = aw_user_width,
-            w_user_width    = w_user_width,
-            b_user_width    = b_user_width,
-            ar_user_width   = ar_user_width,
-            r_user_width    = r_user_width
-        )
-        
-        platform.add_extension(s_axi.get_ios("s_axi"))
-        self.comb += s_axi.connect_to_pads(platform.request("s_axi"), mode="slave")
-        
-        platform.add_extension(m_axi.get_ios("m_axi"))
-        self.comb += m_axi.connect_to_pads(platform.request("m_axi"), mode="master")
-
-        # AXI FIFO 
-        self.submodules += AXIFIFO(platform, 
-            s_axi               = s_axi,
-            m_axi               = m_axi,
-            aw_user_en          = aw_user_en,
-            w_user_en           = w_user_en,
-            b_user_en           = b_user_en,
-            ar_user_en          = ar_user_en,
-            r_user_en           = r_user_en,
-            write_fifo_depth    = write_fifo_depth,
-            read_fifo_depth     = read_fifo_depth,
-            write_fifo_delay    = write_fifo_delay,
-            read_fifo_delay     = read_fifo_delay
-            )
 
 # Build --------------------------------------------------------------------------------------------
 def main():
@@ -137,6 +61,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",            help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                   help="Build Directory")
     build_group.add_argument("--build-name",    default="axi_fifo_wrapper",     help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -217,28 +142,6 @@ def main():
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
         
 
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = AXIFIFOWrapper(platform,
-        data_width       = args.data_width,
-        addr_width       = args.addr_width,
-        id_width         = args.id_width,
-        aw_user_en       = args.aw_user_en,
-        aw_user_width    = args.aw_user_width,
-        w_user_en        = args.w_user_en,
-        w_user_width     = args.w_user_width,
-        b_user_en        = args.b_user_en,
-        b_user_width     = args.b_user_width,
-        ar_user_en       = args.ar_user_en,
-        ar_user_width    = args.ar_user_width,
-        r_user_en        = args.r_user_en,
-        r_user_width     = args.r_user_width,
-        write_fifo_depth = args.write_fifo_depth,
-        read_fifo_depth  = args.read_fifo_depth,
-        write_fifo_delay = args.write_fifo_delay,
-        read_fifo_delay  = args.read_fifo_delay,
-    )
-    
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -246,46 +149,46 @@ def main():
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version = "v1_0"
-        )
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "axi_fifo", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"AXI_FIFO\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="AXI_FIFO", ip_version="00000000_00000000_0000000000000001")
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.axi_fifo_wrapper import AXIFIFOWrapper
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = AXIFIFOWrapper(platform,
+                data_width       = args.data_width,
+                addr_width       = args.addr_width,
+                id_width         = args.id_width,
+                aw_user_en       = args.aw_user_en,
+                aw_user_width    = args.aw_user_width,
+                w_user_en        = args.w_user_en,
+                w_user_width     = args.w_user_width,
+                b_user_en        = args.b_user_en,
+                b_user_width     = args.b_user_width,
+                ar_user_en       = args.ar_user_en,
+                ar_user_width    = args.ar_user_width,
+                r_user_en        = args.r_user_en,
+                r_user_width     = args.r_user_width,
+                write_fifo_depth = args.write_fifo_depth,
+                read_fifo_depth  = args.read_fifo_depth,
+                write_fifo_delay = args.write_fifo_delay,
+                read_fifo_delay  = args.read_fifo_delay,
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version = "v1_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
 
 if __name__ == "__main__":
     main()
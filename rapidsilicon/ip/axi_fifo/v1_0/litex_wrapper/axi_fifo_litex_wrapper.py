@@ -8,19 +8,12 @@
 # LiteX wrapper around Alex Forencich Verilog-AXI's axi_fifo.v
 
 import os
-import datetime
 import logging
 
 from migen import *
 
 from litex.soc.interconnect.axi import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
-
 
 # AXI_FIFO ---------------------------------------------------------------------------------------
 class AXIFIFO(Module):
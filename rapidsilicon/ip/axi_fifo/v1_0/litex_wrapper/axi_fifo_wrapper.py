@@ -0,0 +1,79 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axi_fifo LiteX wrapper: IOs and module elaborated by axi_fifo_gen.py on --build.
+
+from litex_wrapper.axi_fifo_litex_wrapper import AXIFIFO
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIInterface
+
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1)),
+    ]
+    
+# AXI FIFO Wrapper ----------------------------------------------------------------------------------
+class AXIFIFOWrapper(Module):
+    def __init__(self, platform, data_width, addr_width, id_width, aw_user_en, aw_user_width,
+                w_user_en, w_user_width, b_user_en, b_user_width, ar_user_en, ar_user_width,
+                r_user_en, r_user_width, write_fifo_depth, read_fifo_depth, write_fifo_delay, 
+                read_fifo_delay):
+        
+        # Clocking 
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+
+        # AXI 
+        s_axi = AXIInterface(
+            data_width      = data_width,
+            address_width   = addr_width,
+            id_width        = id_width,
+            aw_user_width   = aw_user_width,
+            w_user_width    = w_user_width,
+            b_user_width    = b_user_width,
+            ar_user_width   = ar_user_width,
+            r_user_width    = r_user_width
+        )
+        
+        m_axi = AXIInterface(
+            data_width      = data_width,
+            address_width   = addr_width,
+            id_width        = id_width,
+            aw_user_width   = aw_user_width,
+            w_user_width    = w_user_width,
+            b_user_width    = b_user_width,
+            ar_user_width   = ar_user_width,
+            r_user_width    = r_user_width
+        )
+        
+        platform.add_extension(s_axi.get_ios("s_axi"))
+        self.comb += s_axi.connect_to_pads(platform.request("s_axi"), mode="slave")
+        
+        platform.add_extension(m_axi.get_ios("m_axi"))
+        self.comb += m_axi.connect_to_pads(platform.request("m_axi"), mode="master")
+
+        # AXI FIFO 
+        self.submodules += AXIFIFO(platform, 
+            s_axi               = s_axi,
+            m_axi               = m_axi,
+            aw_user_en          = aw_user_en,
+            w_user_en           = w_user_en,
+            b_user_en           = b_user_en,
+            ar_user_en          = ar_user_en,
+            r_user_en           = r_user_en,
+            write_fifo_depth    = write_fifo_depth,
+            read_fifo_depth     = read_fifo_depth,
+            write_fifo_delay    = write_fifo_delay,
+            read_fifo_delay     = read_fifo_delay
+            )
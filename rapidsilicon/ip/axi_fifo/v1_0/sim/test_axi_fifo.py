@@ -25,9 +25,9 @@ THE SOFTWARE.
 import itertools
 import logging
 import os
+import sys
 import random
 
-import cocotb_test.simulator
 import pytest
 
 import cocotb
@@ -37,6 +37,9 @@ from cocotb.regression import TestFactory
 
 from cocotbext.axi import AxiBus, AxiMaster, AxiRam
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "lib"))
+from sim_support import sim_cache
+
 
 class TB(object):
     def __init__(self, dut):
@@ -248,7 +251,7 @@ def test_axi_fifo(request, data_width, delay):
     sim_build = os.path.join(tests_dir, "sim_build",
         request.node.name.replace('[', '-').replace(']', ''))
 
-    cocotb_test.simulator.run(
+    sim_cache.run(
         python_search=[tests_dir],
         verilog_sources=verilog_sources,
         toplevel=toplevel,
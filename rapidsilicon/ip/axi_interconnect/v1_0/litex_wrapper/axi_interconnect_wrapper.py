@@ -0,0 +1,74 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axi_interconnect LiteX wrapper: IOs and module elaborated by axi_interconnect_gen.py on --build.
+
+from litex_wrapper.axi_interconnect_litex_wrapper import AXIINTERCONNECT
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIInterface
+
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1))
+    ]
+
+# AXI INTERCONNECT Wrapper -------------------------------------------------------------------------
+class AXIINTERCONNECTWrapper(Module):
+    def __init__(self, platform, m_count, s_count ,data_width, addr_width, id_width, aw_user_width, w_user_width, b_user_width,
+                ar_user_width, r_user_width, aw_user_en, w_user_en, b_user_en, ar_user_en, r_user_en):
+        
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+        
+        # Slave Interfaces
+        s_axis = []
+        for s_count in range(s_count):
+            s_axi = AXIInterface(data_width = data_width , address_width = addr_width, id_width = id_width, aw_user_width = aw_user_width,
+            w_user_width = w_user_width, b_user_width = b_user_width, ar_user_width = ar_user_width, r_user_width = r_user_width)
+            if s_count>9:
+                platform.add_extension(s_axi.get_ios("s{}_axi".format(s_count)))
+                self.comb += s_axi.connect_to_pads(platform.request("s{}_axi".format(s_count)), mode="slave")
+            else:
+                platform.add_extension(s_axi.get_ios("s0{}_axi".format(s_count)))
+                self.comb += s_axi.connect_to_pads(platform.request("s0{}_axi".format(s_count)), mode="slave")
+                
+            s_axis.append(s_axi)
+        
+        # Master Interfaces
+        m_axis = []    
+        for m_count in range(m_count):
+            m_axi = AXIInterface(data_width = data_width , address_width = addr_width, id_width = id_width, aw_user_width = aw_user_width,
+            w_user_width = w_user_width, b_user_width = b_user_width, ar_user_width = ar_user_width, r_user_width = r_user_width)
+            if m_count>9:
+                platform.add_extension(m_axi.get_ios("m{}_axi".format(m_count)))
+                self.comb += m_axi.connect_to_pads(platform.request("m{}_axi".format(m_count)), mode="master")
+            else:
+                platform.add_extension(m_axi.get_ios("m0{}_axi".format(m_count)))
+                self.comb += m_axi.connect_to_pads(platform.request("m0{}_axi".format(m_count)), mode="master")
+            
+            m_axis.append(m_axi)
+
+        # AXI-INTERCONNECT ----------------------------------------------------------------------------------
+        self.submodules.axi_interconnect = AXIINTERCONNECT(platform,
+            s_axi               = s_axis,
+            m_axi               = m_axis,
+            s_count             = s_count,
+            m_count             = m_count,
+            aw_user_en          = aw_user_en,
+            w_user_en           = w_user_en,
+            b_user_en           = b_user_en,
+            ar_user_en          = ar_user_en,
+            r_user_en           = r_user_en
+            )
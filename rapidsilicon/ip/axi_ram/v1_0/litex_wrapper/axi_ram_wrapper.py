@@ -0,0 +1,47 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axi_ram LiteX wrapper: IOs and module elaborated by axi_ram_gen.py on --build.
+
+from litex_wrapper.axi_ram_litex_wrapper import AXIRAM
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIInterface
+
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1)),
+    ]
+
+# AXI RAM Wrapper ----------------------------------------------------------------------------------
+class AXIRAMWrapper(Module):
+    def __init__(self, platform, data_width, addr_width, id_width, pip_out):
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+
+        # AXI --------------------------------------------------------------------------------------
+        axi = AXIInterface(
+            data_width    = data_width,
+            address_width = addr_width,
+            id_width      = id_width,
+        )
+        platform.add_extension(axi.get_ios("s_axi"))
+        self.comb += axi.connect_to_pads(platform.request("s_axi"), mode="slave")
+
+        # AXI-RAM ----------------------------------------------------------------------------------
+        self.submodules += AXIRAM(platform, axi,
+            pipeline_output   = pip_out, 
+            size              = (2**addr_width)*data_width//8
+            )
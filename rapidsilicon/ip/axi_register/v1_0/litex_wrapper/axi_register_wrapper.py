@@ -0,0 +1,81 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axi_register LiteX wrapper: IOs and module elaborated by axi_register_gen.py on --build.
+
+from litex_wrapper.axi_register_litex_wrapper import AXIREGISTER
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIInterface
+
+# IOs / Interface ----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk", 0, Pins(1)),
+        ("rst", 0, Pins(1)),
+    ]
+    
+# AXI-REGISTER Wrapper --------------------------------------------------------------------------------
+class AXIREGISTERWrapper(Module):
+    def __init__(self, platform, data_width, addr_width, id_width, aw_user_width, 
+                w_user_width, b_user_width, ar_user_width, r_user_width, 
+                aw_reg_type, w_reg_type, b_reg_type, ar_reg_type, r_reg_type):
+        
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+        
+        reg_type = {
+            "Bypass"        :   "0",
+            "Simple_Buffer" :   "1",
+            "Skid_Buffer"   :   "2"
+        }
+
+        # AXI-------------------------------------------------------------
+        s_axi = AXIInterface(
+            data_width      = data_width,
+            address_width   = addr_width,
+            id_width        = id_width,
+            aw_user_width   = aw_user_width,
+            w_user_width    = w_user_width,
+            b_user_width    = b_user_width,
+            ar_user_width   = ar_user_width,
+            r_user_width    = r_user_width
+        )
+        
+        m_axi = AXIInterface(
+            data_width      = data_width,
+            address_width   = addr_width,
+            id_width        = id_width,
+            aw_user_width   = aw_user_width,
+            w_user_width    = w_user_width,
+            b_user_width    = b_user_width,
+            ar_user_width   = ar_user_width,
+            r_user_width    = r_user_width
+        )
+        
+        # AXI Slave
+        platform.add_extension(s_axi.get_ios("s_axi"))
+        self.comb += s_axi.connect_to_pads(platform.request("s_axi"), mode="slave")
+        
+        # AXI Master
+        platform.add_extension(m_axi.get_ios("m_axi"))
+        self.comb += m_axi.connect_to_pads(platform.request("m_axi"), mode="master")
+        
+        # AXI-REGISTER -----------------------------------------------------
+        self.submodules += AXIREGISTER(platform, 
+            s_axi               =   s_axi,
+            m_axi               =   m_axi, 
+            aw_reg_type         =   reg_type[aw_reg_type],
+            w_reg_type          =   reg_type[w_reg_type],
+            b_reg_type          =   reg_type[b_reg_type],
+            ar_reg_type         =   reg_type[ar_reg_type],
+            r_reg_type          =   reg_type[r_reg_type],
+            size                =   (2**addr_width)*(data_width/8)
+            )
@@ -9,68 +9,6 @@ import sys
 import logging
 import argparse
 
-from datetime import datetime
-
-from litex_wrapper.axil_crossbar_litex_wrapper import AXILITECROSSBAR
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-from litex.soc.interconnect.axi import AXILiteInterface
-
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-def get_clkin_ios():
-    return [
-        ("clk",  0, Pins(1)),
-        ("rst",  0, Pins(1)),
-    ]
-
-# AXI LITE CROSSBAR ----------------------------------------------------------------------------------
-class AXILITECROSSBARWrapper(Module):
-    def __init__(self, platform, s_count, m_count, data_width, addr_width):
-        # Clocking ---------------------------------------------------------------------------------
-        platform.add_extension(get_clkin_ios())
-        self.clock_domains.cd_sys  = ClockDomain()
-        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
-        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
-
-        # Slave Interfaces
-        s_axils = []
-        for s_count in range(s_count):
-            s_axil = AXILiteInterface(data_width = data_width , address_width = addr_width)
-            if s_count>9:
-                platform.add_extension(s_axil.get_ios("s{}_axil".format(s_count)))
-                self.comb += s_axil.connect_to_pads(platform.request("s{}_axil".format(s_count)), mode="slave")
-            else:
-                platform.add_extension(s_axil.get_ios("s0{}_axil".format(s_count)))
-                self.comb += s_axil.connect_to_pads(platform.request("s0{}_axil".format(s_count)), mode="slave")
-                
-            s_axils.append(s_axil)
-        
-        # Master Interfaces
-        m_axils = []    
-        for m_count in range(m_count):
-            m_axil = AXILiteInterface(data_width = data_width , address_width = addr_width)
-            if m_count>9:
-                platform.add_extension(m_axil.get_ios("m{}_axil".format(m_count)))
-                self.comb += m_axil.connect_to_pads(platform.request("m{}_axil".format(m_count)), mode="master")
-            else:
-                platform.add_extension(m_axil.get_ios("m0{}_axil".format(m_count)))
-                self.comb += m_axil.connect_to_pads(platform.request("m0{}_axil".format(m_count)), mode="master")
-            
-            m_axils.append(m_axil)
-
-        # AXIL-CROSSBAR ----------------------------------------------------------------------------------
-        self.submodules += AXILITECROSSBAR (platform, 
-            s_axil      = s_axils,
-            m_axil      = m_axils,
-            s_count     = s_count,
-            m_count     = m_count
-            )
 
 # Build --------------------------------------------------------------------------------------------
 def main():
@@ -107,6 +45,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",                    help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                           help="Build Directory")
     build_group.add_argument("--build-name",    default="axil_crossbar_wrapper",        help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -137,15 +76,6 @@ def main():
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
 
 
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module     = AXILITECROSSBARWrapper(platform,
-        m_count    = args.m_count,
-        s_count    = args.s_count,
-        data_width = args.data_width,
-        addr_width = args.addr_width,
-    )
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -153,46 +83,33 @@ def main():
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version = "v1_0"
-        )
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "axil_crossbar", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"LCRSSBR1\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="LCRSSBR1", ip_version="00000000_00000000_0000000000000001")
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.axil_crossbar_wrapper import AXILITECROSSBARWrapper
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module     = AXILITECROSSBARWrapper(platform,
+                m_count    = args.m_count,
+                s_count    = args.s_count,
+                data_width = args.data_width,
+                addr_width = args.addr_width,
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version = "v1_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
 
 if __name__ == "__main__":
     main()
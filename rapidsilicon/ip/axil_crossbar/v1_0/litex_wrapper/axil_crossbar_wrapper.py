@@ -0,0 +1,65 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axil_crossbar LiteX wrapper: IOs and module elaborated by axil_crossbar_gen.py on --build.
+
+from litex_wrapper.axil_crossbar_litex_wrapper import AXILITECROSSBAR
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXILiteInterface
+
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1)),
+    ]
+
+# AXI LITE CROSSBAR ----------------------------------------------------------------------------------
+class AXILITECROSSBARWrapper(Module):
+    def __init__(self, platform, s_count, m_count, data_width, addr_width):
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+
+        # Slave Interfaces
+        s_axils = []
+        for s_count in range(s_count):
+            s_axil = AXILiteInterface(data_width = data_width , address_width = addr_width)
+            if s_count>9:
+                platform.add_extension(s_axil.get_ios("s{}_axil".format(s_count)))
+                self.comb += s_axil.connect_to_pads(platform.request("s{}_axil".format(s_count)), mode="slave")
+            else:
+                platform.add_extension(s_axil.get_ios("s0{}_axil".format(s_count)))
+                self.comb += s_axil.connect_to_pads(platform.request("s0{}_axil".format(s_count)), mode="slave")
+                
+            s_axils.append(s_axil)
+        
+        # Master Interfaces
+        m_axils = []    
+        for m_count in range(m_count):
+            m_axil = AXILiteInterface(data_width = data_width , address_width = addr_width)
+            if m_count>9:
+                platform.add_extension(m_axil.get_ios("m{}_axil".format(m_count)))
+                self.comb += m_axil.connect_to_pads(platform.request("m{}_axil".format(m_count)), mode="master")
+            else:
+                platform.add_extension(m_axil.get_ios("m0{}_axil".format(m_count)))
+                self.comb += m_axil.connect_to_pads(platform.request("m0{}_axil".format(m_count)), mode="master")
+            
+            m_axils.append(m_axil)
+
+        # AXIL-CROSSBAR ----------------------------------------------------------------------------------
+        self.submodules += AXILITECROSSBAR (platform, 
+            s_axil      = s_axils,
+            m_axil      = m_axils,
+            s_count     = s_count,
+            m_count     = m_count
+            )
@@ -25,10 +25,10 @@ THE SOFTWARE.
 import itertools
 import logging
 import os
+import sys
 import random
 import subprocess
 
-import cocotb_test.simulator
 import pytest
 
 import cocotb
@@ -38,6 +38,9 @@ from cocotb.regression import TestFactory
 
 from cocotbext.axi import AxiLiteBus, AxiLiteMaster, AxiLiteRam
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "lib"))
+from sim_support import sim_cache
+
 
 class TB(object):
     def __init__(self, dut):
@@ -255,7 +258,7 @@ def test_axil_crossbar(request, s_count, m_count, data_width):
     sim_build = os.path.join(tests_dir, "sim_build",
         request.node.name.replace('[', '-').replace(']', ''))
 
-    cocotb_test.simulator.run(
+    sim_cache.run(
         python_search=[tests_dir],
         verilog_sources=verilog_sources,
         toplevel=toplevel,
@@ -0,0 +1,61 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axil_eio LiteX wrapper: IOs and module elaborated by axil_eio_gen.py on --build.
+
+from litex_wrapper.axil_eio_litex_wrapper import AXILEIO
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXILiteInterface
+
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("S_AXI_ACLK",     0,  Pins(1)),
+        ("OP_CLK",         0,  Pins(1)),
+        ("IP_CLK",         0,  Pins(1)),
+        ("S_AXI_ARESETN",  0,  Pins(1))
+    ]
+
+def input_output_probes(input_probe_width, output_probe_width):
+    return [
+        ("probe_in",   0, Pins(input_probe_width)),
+        ("probe_out",  0, Pins(output_probe_width))
+    ]
+
+# AXIL_EIO Wrapper ----------------------------------------------------------------------------------
+class AXILEIOWrapper(Module):
+    def __init__(self, platform, data_width, addr_width, input_probe_width, output_probe_width, axi_input_clk_sync, axi_output_clk_sync):
+        
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        
+        # AXI-LITE
+        s_axi = AXILiteInterface(data_width = data_width, address_width = addr_width)
+        platform.add_extension(s_axi.get_ios("s_axil"))
+        self.comb += s_axi.connect_to_pads(platform.request("s_axil"), mode="slave")
+            
+        # AXIL_EIO
+        self.submodules.axi_eio = axi_eio = AXILEIO(platform, 
+                                                    s_axil              = s_axi,
+                                                    input_probe_width   = input_probe_width, 
+                                                    output_probe_width  = output_probe_width, 
+                                                    axi_input_clk_sync  = axi_input_clk_sync, 
+                                                    axi_output_clk_sync = axi_output_clk_sync
+                                                    )
+
+        self.comb += axi_eio.OP_CLK.eq(platform.request("OP_CLK"))
+        self.comb += axi_eio.IP_CLK.eq(platform.request("IP_CLK"))
+        self.comb += axi_eio.S_AXI_ACLK.eq(platform.request("S_AXI_ACLK"))
+        self.comb += axi_eio.S_AXI_ARESETN.eq(platform.request("S_AXI_ARESETN"))
+
+        platform.add_extension(input_output_probes(input_probe_width, output_probe_width))
+        self.comb += axi_eio.probe_in.eq(platform.request("probe_in"))
+        self.comb += platform.request("probe_out").eq(axi_eio.probe_out)
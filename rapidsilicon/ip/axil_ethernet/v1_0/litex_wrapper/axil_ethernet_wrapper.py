@@ -0,0 +1,55 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axil_ethernet LiteX wrapper: IOs and module elaborated by axil_ethernet_gen.py on --build.
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from liteeth_build import *
+from liteeth import phy as liteeth_phys
+
+# IOs ----------------------------------------------------------------------------------------------
+
+_io = [
+    # Clk / Rst
+    ("sys_clock", 0, Pins(1)),
+    ("sys_reset", 1, Pins(1)),
+
+    # Interrupt
+    ("interrupt", 0, Pins(1)),
+
+    # MII PHY Pads
+    ("mii_eth_clocks", 0,
+        Subsignal("tx", Pins(1)),
+        Subsignal("rx", Pins(1)),
+    ),
+    ("mii_eth", 0,
+        Subsignal("rst_n",   Pins(1)),
+        Subsignal("mdio",    Pins(1)),
+        Subsignal("mdc",     Pins(1)),
+        Subsignal("rx_dv",   Pins(1)),
+        Subsignal("rx_er",   Pins(1)),
+        Subsignal("rx_data", Pins(4)),
+        Subsignal("tx_en",   Pins(1)),
+        Subsignal("tx_data", Pins(4)),
+        Subsignal("col",     Pins(1)),
+        Subsignal("crs",     Pins(1))
+    ),
+]
+
+# Core ---------------------------------------------------------------------------------------------
+def LiteEthCore(platform, phy="mii", bus_endianness="big", ntxslots=2, nrxslots=2):
+    core_config = {
+        "phy"              : getattr(liteeth_phys, f"LiteEthPHY{phy.upper()}"),
+        "ntxslots"         : 2,
+        "nrxslots"         : 2,
+        "clk_freq"         : 100e6,
+        "core"             : "axi-lite",
+        "endianness"       : bus_endianness,
+    }
+    core = MACCore(platform, core_config)
+    return core
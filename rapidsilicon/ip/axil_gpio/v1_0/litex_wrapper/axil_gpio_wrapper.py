@@ -0,0 +1,55 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axil_gpio LiteX wrapper: IOs and module elaborated by axil_gpio_gen.py on --build.
+
+from litex_wrapper.axil_gpio_litex_wrapper import AXILITEGPIO
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXILiteInterface
+
+
+# IOs / Interface ----------------------------------------------------------------------------------
+def get_clkin_ios ():
+    return [
+        ("clk", 0, Pins(1)),
+        ("rstn", 0, Pins(1)),
+    ]
+
+def get_gpio_ios(data_width):
+    return [
+        ("gpin",    0, Pins(data_width)),
+        ("gpout",   0, Pins(data_width)),
+        ("int",     0, Pins(1)),
+    ]
+    
+# AXI-LITE-GPIO Wrapper --------------------------------------------------------------------------------
+class AXILITEGPIOWrapper(Module):
+    def __init__(self, platform, data_width, addr_width):
+        platform.add_extension(get_clkin_ios())
+        
+        self.clock_domains.cd_sys = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rstn"))
+        
+        # AXI-LITE 
+        axil = AXILiteInterface(
+            data_width      = data_width,
+            address_width   = addr_width
+        )
+        platform.add_extension(axil.get_ios("s_axil"))
+        self.comb += axil.connect_to_pads(platform.request("s_axil"), mode="slave")
+
+        # AXI-LITE-GPIO 
+        self.submodules.gpio = gpio = AXILITEGPIO(platform, s_axil=axil)
+        
+        # GPIO 
+        platform.add_extension(get_gpio_ios(data_width))
+        self.comb += gpio.gpin.eq(platform.request("gpin"))
+        self.comb += platform.request("gpout").eq(gpio.gpout)
+        self.comb += platform.request("int").eq(gpio.int)
@@ -0,0 +1,77 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axil_ocla LiteX wrapper: IOs and module elaborated by axil_ocla_gen.py on --build.
+
+from litex_wrapper.axil_ocla_litex_wrapper import AXILITEOCLA
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXILiteInterface
+
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_axiclknrst_ios():
+    return [
+        ("i_S_AXI_ACLK",      0, Pins(1)),
+        ("i_S_AXI_ARESETN",   0, Pins(1)),
+    ]
+
+def get_samplingclknrst_ios():
+    return [
+        ("i_sample_clk",  0, Pins(1)),
+        ("i_rstn",        0, Pins(1)),
+    ]    
+    
+def get_ocla_ios(nprobes,trigger_inputs):
+    return [
+        ("i_probes",          0, Pins(nprobes)),
+        ("i_trigger_input",   0, Pins(trigger_inputs)), 
+    ]
+
+# AXI LITE OCLA Wrapper ----------------------------------------------------------------------------------
+class AXILITEOCLAWrapper(Module):
+    def __init__(self, platform, address_width, data_width, nprobes, trigger_inputs, probe_widht,mem_depth, trigger_inputs_en):
+        
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_axiclknrst_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("i_S_AXI_ACLK"))
+        self.comb += self.cd_sys.rst.eq(platform.request("i_S_AXI_ARESETN"))
+
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_samplingclknrst_ios())
+        self.clock_domains.cd_sys  = ClockDomain("i_sample_clk")
+        self.comb += self.cd_sys.clk.eq(platform.request("i_sample_clk"))
+        self.clock_domains.cd_sys  = ClockDomain("i_rstn")
+        self.comb += self.cd_sys.rst.eq(platform.request("i_rstn"))
+
+        # AXI LITE --------------------------------------------------------------------------------------
+        s_axil = AXILiteInterface(
+            address_width       = address_width,
+            data_width          = data_width
+        )
+        platform.add_extension(s_axil.get_ios("s_axil"))
+        self.comb += s_axil.connect_to_pads(platform.request("s_axil"), mode="slave")
+
+        # AXI-LITE-OCLA ----------------------------------------------------------------------------------
+        self.submodules.ocla = ocla =  AXILITEOCLA(platform, 
+            s_axil             = s_axil,
+            nprobes          = nprobes,
+            trigger_inputs   = trigger_inputs,
+            probe_widht      = probe_widht,
+            mem_depth        = mem_depth,
+            trigger_inputs_en   = trigger_inputs_en
+            )
+        # OCLA Signals --------------------------------------------------------------------------------
+        # print (int(nprobes),int(trigger_inputs))
+        platform.add_extension(get_ocla_ios(nprobes,trigger_inputs))
+        
+        # Inputs
+        self.comb += ocla.probes_i.eq(platform.request("i_probes"))
+        if(trigger_inputs_en == True):
+            self.comb += ocla.trigger_input_i.eq(platform.request("i_trigger_input"))
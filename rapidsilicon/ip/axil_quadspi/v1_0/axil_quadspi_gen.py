@@ -8,13 +8,6 @@ import os
 import sys
 import argparse
 from pathlib import Path
-from datetime import datetime
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -51,6 +44,7 @@ def main():
     build_group.add_argument("--build",             action="store_true",        help="Build core.")
     build_group.add_argument("--build-dir",         default="./",               help="Build directory.")
     build_group.add_argument("--build-name",        default="axil_quadspi",     help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON parameters")
@@ -83,25 +77,6 @@ def main():
     # Export JSON Template (Optional) --------------------------------------------------------------
     if args.json_template:
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
-    # Create LiteSPI Core --------------------------------------------------------------------------
-    from litespi_generator import LiteSPICore, _io
-    platform = OSFPGAPlatform(io=_io, toolchain="raptor", device="gemini")
-
-    import logging
-    logging.basicConfig(level=logging.ERROR)
-
-    module   = LiteSPICore(platform,
-        module         = args.core_module,
-        mode           = args.core_mode,
-        rate           = args.core_rate,
-        divisor        = args.core_divisor,
-        bus_standard   = "axi-lite",
-        bus_endianness = args.core_bus_endianness,
-        with_master    = True,
-        sim            = (args.core_phy == "model"),
-    )
-    # Equivalent to ./litespi_gen.py --with-master --bus-standard=axi-lite --module=S25FL128L --mode=x4
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -109,46 +84,39 @@ def main():
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version = "v1_0"
-        )
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "axil_quadspi", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"AXILQSPI\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="AXILQSPI", ip_version="00000000_00000000_0000000000000001")
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litespi_generator import LiteSPICore, _io
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=_io, toolchain="raptor", device="gemini")
+
+            module   = LiteSPICore(platform,
+                module         = args.core_module,
+                mode           = args.core_mode,
+                rate           = args.core_rate,
+                divisor        = args.core_divisor,
+                bus_standard   = "axi-lite",
+                bus_endianness = args.core_bus_endianness,
+                with_master    = True,
+                sim            = (args.core_phy == "model"),
+            )
+            # Equivalent to ./litespi_gen.py --with-master --bus-standard=axi-lite --module=S25FL128L --mode=x4
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version = "v1_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
         
 if __name__ == "__main__":
     main()
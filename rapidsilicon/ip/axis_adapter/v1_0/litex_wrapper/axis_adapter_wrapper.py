@@ -0,0 +1,67 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axis_adapter LiteX wrapper: IOs and module elaborated by axis_adapter_gen.py on --build.
+
+from litex_wrapper.axis_adapter_litex_wrapper import AXISADAPTER
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIStreamInterface
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1)),
+    ]
+
+# AXIS_ADAPTER Wrapper ----------------------------------------------------------------------------------
+class AXISADAPTERWrapper(Module):
+    def __init__(self, platform, s_data_width, m_data_width, id_en, id_width, 
+                dest_en, dest_width, user_en, user_width):
+        
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+        
+        # AXI STREAM SLAVE -------------------------------------------------------------------------------
+        s_axis = AXIStreamInterface(
+            data_width = s_data_width,
+            user_width = user_width,
+            dest_width = dest_width,
+            id_width   = id_width,
+            keep_width = int((s_data_width+7)/8)
+        )
+        
+        # AXI STREAM MASTER -------------------------------------------------------------------------------
+        m_axis = AXIStreamInterface(
+            data_width = m_data_width,
+            user_width = user_width,
+            dest_width = dest_width,
+            id_width   = id_width,
+            keep_width = int((m_data_width+7)/8)
+        )
+        
+        # Input AXI
+        platform.add_extension(s_axis.get_ios("s_axis"))
+        self.comb += s_axis.connect_to_pads(platform.request("s_axis"), mode="slave")
+        
+        # Output AXI
+        platform.add_extension(m_axis.get_ios("m_axis"))
+        self.comb += m_axis.connect_to_pads(platform.request("m_axis"), mode="master")
+        
+        # AXIS-ADAPTER ----------------------------------------------------------------------------------
+        self.submodules += AXISADAPTER(platform,
+            m_axis          = m_axis,
+            s_axis          = s_axis,
+            id_en           = id_en,
+            dest_en         = dest_en,
+            user_en         = user_en
+            )
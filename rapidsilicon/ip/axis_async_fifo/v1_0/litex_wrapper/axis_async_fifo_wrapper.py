@@ -0,0 +1,119 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axis_async_fifo LiteX wrapper: IOs and module elaborated by axis_async_fifo_gen.py on --build.
+
+from litex_wrapper.axis_async_fifo_litex_wrapper import AXISASYNCFIFO
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIStreamInterface
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_m_ios():
+    return [
+        ("m_clk", 0, Pins(1)),
+        ("m_rst", 0, Pins(1))
+    ]
+    
+def get_clkin_s_ios():
+    return [
+        ("s_clk", 0, Pins(1)),
+        ("s_rst", 0, Pins(1))
+    ]
+    
+def get_slave_status_ios():
+    return [
+        ("s_status", 0,
+            Subsignal("overflow",   Pins(1)),
+            Subsignal("bad_frame",  Pins(1)),
+            Subsignal("good_frame", Pins(1)),
+        )]
+    
+def get_master_status_ios():
+    return [
+        ("m_status", 0,
+            Subsignal("overflow",   Pins(1)),
+            Subsignal("bad_frame",       Pins(1)),
+            Subsignal("good_frame",      Pins(1))    
+        )
+    ]
+
+# AXI_STREAM_FIFO Wrapper ----------------------------------------------------------------------------------
+class AXISASYNCFIFOWrapper(Module):
+    def __init__(self, platform, depth, data_width, last_en, id_en, id_width, 
+                dest_en, dest_width, user_en, user_width, ram_pipeline, out_fifo_en, frame_fifo, bad_frame_value, 
+                drop_bad_frame, drop_when_full):
+
+        # Clock Domain
+        self.clock_domains.cd_sys = ClockDomain()
+        
+        # AXI STREAM -------------------------------------------------------------------------------
+        s_axis = AXIStreamInterface(
+            data_width = data_width,
+            user_width = user_width,
+            dest_width = dest_width,
+            id_width   = id_width,
+            keep_width = int((data_width+7)/8)
+        )
+        
+        m_axis = AXIStreamInterface(
+            data_width = data_width,
+            user_width = user_width,
+            dest_width = dest_width,
+            id_width   = id_width,
+            keep_width = int((data_width+7)/8)
+        )
+        # Input AXI
+        platform.add_extension(s_axis.get_ios("s_axis"))
+        self.comb += s_axis.connect_to_pads(platform.request("s_axis"), mode="slave")
+        
+        # Output AXI
+        platform.add_extension(m_axis.get_ios("m_axis"))
+        self.comb += m_axis.connect_to_pads(platform.request("m_axis"), mode="master")
+
+        # AXIS-ASYNC-FIFO ----------------------------------------------------------------------------------
+        self.submodules.fifo = fifo = AXISASYNCFIFO(platform,
+            m_axis          = m_axis,
+            s_axis          = s_axis,
+            depth           = depth, 
+            last_en         = last_en,
+            id_en           = id_en,
+            dest_en         = dest_en,
+            user_en         = user_en,
+            ram_pipeline         = ram_pipeline,
+            frame_fifo      = frame_fifo,
+            out_fifo_en     = out_fifo_en,
+            bad_frame_value = bad_frame_value,
+            drop_bad_frame  = drop_bad_frame,
+            drop_when_full  = drop_when_full
+            )
+        
+        # FIFO Status Signals ----------------------------------------------------------------------
+        platform.add_extension(get_slave_status_ios())
+        fifo_pads = platform.request("s_status")
+        self.comb += [
+            fifo_pads.overflow.eq(fifo.s_status_overflow),
+            fifo_pads.bad_frame.eq(fifo.s_status_bad_frame),
+            fifo_pads.good_frame.eq(fifo.s_status_good_frame),
+        ]
+
+        platform.add_extension(get_master_status_ios())
+        fifo_pads = platform.request("m_status")
+        self.comb += [
+            fifo_pads.overflow.eq(fifo.m_status_overflow),
+            fifo_pads.bad_frame.eq(fifo.m_status_bad_frame),
+            fifo_pads.good_frame.eq(fifo.m_status_good_frame),
+        ]
+
+        platform.add_extension(get_clkin_m_ios())
+        self.comb += fifo.m_clk.eq(platform.request("m_clk"))
+        self.comb += fifo.m_rst.eq(platform.request("m_rst"))
+        
+        platform.add_extension(get_clkin_s_ios())
+        self.comb += fifo.s_clk.eq(platform.request("s_clk"))
+        self.comb += fifo.s_rst.eq(platform.request("s_rst"))
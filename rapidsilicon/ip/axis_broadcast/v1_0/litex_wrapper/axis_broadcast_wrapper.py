@@ -0,0 +1,68 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axis_broadcast LiteX wrapper: IOs and module elaborated by axis_broadcast_gen.py on --build.
+
+from litex_wrapper.axis_broadcast_litex_wrapper import AXISBROADCAST
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIStreamInterface
+
+
+# IOs / Interface ----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk", 0, Pins(1)),
+        ("rst", 0, Pins(1)),]
+
+# AXIS-BROADCAST Wrapper --------------------------------------------------------------------------------
+class AXIBROADCASTWrapper(Module):
+    def __init__(self, platform, m_count, data_width, last_en, id_en, id_width, dest_en, dest_width, user_en, user_width):
+
+        # Clocking
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+        
+        # Master Interfaces
+        m_axiss = []    
+        for m_count in range(m_count):
+            m_axis = AXIStreamInterface(data_width = data_width , id_width = id_width, user_width = user_width, dest_width = dest_width)
+            if m_count>9:
+                platform.add_extension(m_axis.get_ios("m{}_axis".format(m_count)))
+                self.comb += m_axis.connect_to_pads(platform.request("m{}_axis".format(m_count)), mode="master")
+            else:
+                platform.add_extension(m_axis.get_ios("m0{}_axis".format(m_count)))
+                self.comb += m_axis.connect_to_pads(platform.request("m0{}_axis".format(m_count)), mode="master")
+            
+            m_axiss.append(m_axis)
+            
+        # AXI STREAM SLAVE -------------------------------------------------------------------------------
+        s_axis = AXIStreamInterface(
+            data_width      = data_width,
+            id_width        = id_width,
+            user_width      = user_width,
+            dest_width      = dest_width,
+            keep_width      = int((data_width+7)/8)
+        )
+
+        # Input AXI
+        platform.add_extension(s_axis.get_ios("s_axis"))
+        self.comb += s_axis.connect_to_pads(platform.request("s_axis"), mode="slave")
+        
+        # AXIS-BROADCAST ----------------------------------------------------------------------------------
+        self.submodules += AXISBROADCAST(platform,
+            m_axis          = m_axiss,
+            s_axis          = s_axis,
+            m_count         = m_count,
+            last_en         = last_en,
+            id_en           = id_en,
+            dest_en         = dest_en,
+            user_en         = user_en
+            )
@@ -9,95 +9,6 @@ import sys
 import logging
 import argparse
 
-from datetime import datetime
-
-from litex_wrapper.axis_fifo_litex_wrapper import AXISTREAMFIFO
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-from litex.soc.interconnect.axi import AXIStreamInterface
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-def get_clkin_ios():
-    return [
-        ("clk",  0, Pins(1)),
-        ("rst",  0, Pins(1)),
-    ]
-
-def get_status_ios():
-    return [
-        ("status", 0,
-            Subsignal("overflow",   Pins(1)),
-            Subsignal("bad_frame",  Pins(1)),
-            Subsignal("good_frame", Pins(1)),
-            Subsignal("full",       Pins(1)),
-            Subsignal("empty",      Pins(1))    
-        )
-    ]
-
-# AXI_STREAM_FIFO Wrapper ----------------------------------------------------------------------------------
-class AXISTREAMFIFOWrapper(Module):
-    def __init__(self, platform, depth, data_width, last_en, id_en, id_width, 
-                dest_en, dest_width, user_en, user_width, pip_out, frame_fifo,
-                drop_bad_frame, drop_when_full):
-        
-        # Clocking ---------------------------------------------------------------------------------
-        platform.add_extension(get_clkin_ios())
-        self.clock_domains.cd_sys  = ClockDomain()
-        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
-        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
-        
-        # AXI STREAM -------------------------------------------------------------------------------
-        s_axis = AXIStreamInterface(
-            data_width = data_width,
-            user_width = user_width,
-            dest_width = dest_width,
-            id_width   = id_width
-        )
-        
-        m_axis = AXIStreamInterface(
-            data_width = data_width,
-            user_width = user_width,
-            dest_width = dest_width,
-            id_width   = id_width
-        )
-        # Input AXI
-        platform.add_extension(s_axis.get_ios("s_axis"))
-        self.comb += s_axis.connect_to_pads(platform.request("s_axis"), mode="slave")
-        
-        # Output AXI
-        platform.add_extension(m_axis.get_ios("m_axis"))
-        self.comb += m_axis.connect_to_pads(platform.request("m_axis"), mode="master")
-        
-        # AXIS-FIFO ----------------------------------------------------------------------------------
-        self.submodules.fifo = fifo = AXISTREAMFIFO(platform,
-            m_axis          = m_axis,
-            s_axis          = s_axis,
-            depth           = depth, 
-            last_en         = last_en,
-            id_en           = id_en,
-            dest_en         = dest_en,
-            user_en         = user_en,
-            pip_out         = pip_out,
-            frame_fifo      = frame_fifo,
-            drop_bad_frame  = drop_bad_frame,
-            drop_when_full  = drop_when_full
-            )
-        
-        # FIFO Status Signals ----------------------------------------------------------------------
-        platform.add_extension(get_status_ios())
-        fifo_pads = platform.request("status")
-        self.comb += [
-            fifo_pads.overflow.eq(fifo.status_overflow),
-            fifo_pads.bad_frame.eq(fifo.status_bad_frame),
-            fifo_pads.good_frame.eq(fifo.status_good_frame),
-            fifo_pads.full.eq(fifo.status_full),
-            fifo_pads.empty.eq(fifo.status_empty)
-        ]
 
 # Build --------------------------------------------------------------------------------------------
 def main():
@@ -147,6 +58,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",            help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                   help="Build Directory")
     build_group.add_argument("--build-name",    default="axis_fifo_wrapper",    help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -206,24 +118,6 @@ def main():
     if args.json_template:
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
 
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = AXISTREAMFIFOWrapper(platform,
-        depth          = args.depth,
-        data_width     = args.data_width,
-        last_en        = args.last_en,
-        id_en          = args.id_en,
-        id_width       = args.id_width,
-        dest_en        = args.dest_en,
-        dest_width     = args.dest_width,
-        user_en        = args.user_en,
-        user_width     = args.user_width,
-        pip_out        = args.pip_out,
-        frame_fifo     = args.frame_fifo,
-        drop_bad_frame = args.drop_bad_frame,
-        drop_when_full = args.drop_when_full,
-    )
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -231,46 +125,42 @@ def main():
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version = "v1_0"
-        )
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "axis_fifo", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"AXISFIFO\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="AXISFIFO", ip_version="00000000_00000000_0000000000000001")
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.axis_fifo_wrapper import AXISTREAMFIFOWrapper
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = AXISTREAMFIFOWrapper(platform,
+                depth          = args.depth,
+                data_width     = args.data_width,
+                last_en        = args.last_en,
+                id_en          = args.id_en,
+                id_width       = args.id_width,
+                dest_en        = args.dest_en,
+                dest_width     = args.dest_width,
+                user_en        = args.user_en,
+                user_width     = args.user_width,
+                pip_out        = args.pip_out,
+                frame_fifo     = args.frame_fifo,
+                drop_bad_frame = args.drop_bad_frame,
+                drop_when_full = args.drop_when_full,
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version = "v1_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,92 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axis_fifo LiteX wrapper: IOs and module elaborated by axis_fifo_gen.py on --build.
+
+from litex_wrapper.axis_fifo_litex_wrapper import AXISTREAMFIFO
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIStreamInterface
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1)),
+    ]
+
+def get_status_ios():
+    return [
+        ("status", 0,
+            Subsignal("overflow",   Pins(1)),
+            Subsignal("bad_frame",  Pins(1)),
+            Subsignal("good_frame", Pins(1)),
+            Subsignal("full",       Pins(1)),
+            Subsignal("empty",      Pins(1))    
+        )
+    ]
+
+# AXI_STREAM_FIFO Wrapper ----------------------------------------------------------------------------------
+class AXISTREAMFIFOWrapper(Module):
+    def __init__(self, platform, depth, data_width, last_en, id_en, id_width, 
+                dest_en, dest_width, user_en, user_width, pip_out, frame_fifo,
+                drop_bad_frame, drop_when_full):
+        
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+        
+        # AXI STREAM -------------------------------------------------------------------------------
+        s_axis = AXIStreamInterface(
+            data_width = data_width,
+            user_width = user_width,
+            dest_width = dest_width,
+            id_width   = id_width
+        )
+        
+        m_axis = AXIStreamInterface(
+            data_width = data_width,
+            user_width = user_width,
+            dest_width = dest_width,
+            id_width   = id_width
+        )
+        # Input AXI
+        platform.add_extension(s_axis.get_ios("s_axis"))
+        self.comb += s_axis.connect_to_pads(platform.request("s_axis"), mode="slave")
+        
+        # Output AXI
+        platform.add_extension(m_axis.get_ios("m_axis"))
+        self.comb += m_axis.connect_to_pads(platform.request("m_axis"), mode="master")
+        
+        # AXIS-FIFO ----------------------------------------------------------------------------------
+        self.submodules.fifo = fifo = AXISTREAMFIFO(platform,
+            m_axis          = m_axis,
+            s_axis          = s_axis,
+            depth           = depth, 
+            last_en         = last_en,
+            id_en           = id_en,
+            dest_en         = dest_en,
+            user_en         = user_en,
+            pip_out         = pip_out,
+            frame_fifo      = frame_fifo,
+            drop_bad_frame  = drop_bad_frame,
+            drop_when_full  = drop_when_full
+            )
+        
+        # FIFO Status Signals ----------------------------------------------------------------------
+        platform.add_extension(get_status_ios())
+        fifo_pads = platform.request("status")
+        self.comb += [
+            fifo_pads.overflow.eq(fifo.status_overflow),
+            fifo_pads.bad_frame.eq(fifo.status_bad_frame),
+            fifo_pads.good_frame.eq(fifo.status_good_frame),
+            fifo_pads.full.eq(fifo.status_full),
+            fifo_pads.empty.eq(fifo.status_empty)
+        ]
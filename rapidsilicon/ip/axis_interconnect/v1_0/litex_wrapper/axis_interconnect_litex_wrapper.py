@@ -8,19 +8,12 @@
 # LiteX wrapper around Alex Forencich Verilog-AXIS's axis_crosspoint.v
 
 import os
-import datetime
 import logging
 
 from migen import *
 
 from litex.soc.interconnect.axi import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
-
 # AXIS_INTERCONNECT ---------------------------------------------------------------------------------------
 class AXISTREAMINTERCONNECT(Module):
     def __init__(self, platform, s_axis, m_axis, m_count, s_count, last_en, id_en, dest_en, user_en, select_width):
@@ -0,0 +1,87 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axis_interconnect LiteX wrapper: IOs and module elaborated by axis_interconnect_gen.py on --build.
+
+import math
+
+from litex_wrapper.axis_interconnect_litex_wrapper import AXISTREAMINTERCONNECT
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIStreamInterface
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1)),
+    ]
+
+def get_control_ios(select_width, m_count):
+    return [
+        ("m{}_select".format(m_count), 0, Pins(select_width))
+    ]
+    
+# AXIS_INTERCONNECT Wrapper ----------------------------------------------------------------------------------
+class AXISTREAMINTERCONNECTWrapper(Module):
+    def __init__(self, platform, m_count, s_count, data_width, last_en, id_en, id_width, 
+                dest_en, dest_width, user_en, user_width):
+        
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+        
+        # Keep Width, Select_width Calculation
+        keep_width      = int((data_width+7)/8)
+        select_width    = math.ceil(math.log2(s_count))
+        
+        # Slave Interfaces
+        s_axiss = []
+        for s_count in range(s_count):
+            s_axis = AXIStreamInterface(data_width = data_width , user_width = user_width, id_width = id_width, dest_width = dest_width, keep_width = keep_width)
+            if s_count>9:
+                platform.add_extension(s_axis.get_ios("s{}_axis".format(s_count)))
+                self.comb += s_axis.connect_to_pads(platform.request("s{}_axis".format(s_count)), mode="slave")
+            else:
+                platform.add_extension(s_axis.get_ios("s0{}_axis".format(s_count)))
+                self.comb += s_axis.connect_to_pads(platform.request("s0{}_axis".format(s_count)), mode="slave")
+                
+            s_axiss.append(s_axis)
+            
+        # Master Interfaces
+        m_axiss = []
+        for m_count in range(m_count):
+            m_axis = AXIStreamInterface(data_width = data_width , user_width = user_width, id_width = id_width, dest_width = dest_width, keep_width = keep_width)
+            if m_count>9:
+                platform.add_extension(m_axis.get_ios("m{}_axis".format(m_count)))
+                self.comb += m_axis.connect_to_pads(platform.request("m{}_axis".format(m_count)), mode="master")
+            else:
+                platform.add_extension(m_axis.get_ios("m0{}_axis".format(m_count)))
+                self.comb += m_axis.connect_to_pads(platform.request("m0{}_axis".format(m_count)), mode="master")
+                
+            m_axiss.append(m_axis)
+        
+        # AXIS-INTERCONNECT ----------------------------------------------------------------------------------
+        self.submodules.interconnect = interconnect = AXISTREAMINTERCONNECT(platform,
+            m_axis          = m_axiss,
+            s_axis          = s_axiss,
+            s_count         = s_count,
+            m_count         = m_count, 
+            last_en         = last_en,
+            id_en           = id_en,
+            dest_en         = dest_en,
+            user_en         = user_en,
+            select_width    = select_width
+            )
+        
+        # Interconnect Control Signal ----------------------------------------------------------------------
+        for m_count in range(m_count+1):
+            platform.add_extension(get_control_ios(select_width, m_count))
+            self.comb += interconnect.select[m_count].eq(platform.request("m{}_select".format(m_count)))
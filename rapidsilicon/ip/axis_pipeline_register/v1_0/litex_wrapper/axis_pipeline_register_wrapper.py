@@ -0,0 +1,76 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axis_pipeline_register LiteX wrapper: IOs and module elaborated by axis_pipeline_register_gen.py on --build.
+
+from litex_wrapper.axis_pipeline_register_litex_wrapper import AXISPIPELINEREGISTER
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIStreamInterface
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1)),
+    ]
+
+# AXIS_PIPELINE_REGISTER Wrapper ----------------------------------------------------------------------------------
+class AXISPIPELINEREGISTERWrapper(Module):
+    def __init__(self, platform, data_width, last_en, id_en, id_width, 
+                dest_en, dest_width, user_en, user_width, reg_type, length
+                ):
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+        
+        # AXI STREAM -------------------------------------------------------------------------------
+        s_axis = AXIStreamInterface(
+            data_width = data_width,
+            user_width = user_width,
+            dest_width = dest_width,
+            id_width   = id_width,
+            keep_width = int((data_width+7)/8)
+        )
+        
+        m_axis = AXIStreamInterface(
+            data_width = data_width,
+            user_width = user_width,
+            dest_width = dest_width,
+            id_width   = id_width,
+            keep_width = int((data_width+7)/8)
+        )
+        
+        register_type = {
+            "Bypass"        :   "0",
+            "Simple_Buffer" :   "1",
+            "Skid_Buffer"   :   "2"
+        }
+        
+        # Input AXI
+        platform.add_extension(s_axis.get_ios("s_axis"))
+        self.comb += s_axis.connect_to_pads(platform.request("s_axis"), mode="slave")
+        
+        # Output AXI
+        platform.add_extension(m_axis.get_ios("m_axis"))
+        self.comb += m_axis.connect_to_pads(platform.request("m_axis"), mode="master")
+        
+        # AXIS-PIPELINE-REGISTER ----------------------------------------------------------------------------------
+        self.submodules += AXISPIPELINEREGISTER(platform,
+            m_axis          = m_axis,
+            s_axis          = s_axis,
+            last_en         = last_en,
+            id_en           = id_en,
+            dest_en         = dest_en,
+            user_en         = user_en,
+            reg_type        = register_type[reg_type],
+            length          = length
+            )
@@ -25,10 +25,10 @@ THE SOFTWARE.
 import itertools
 import logging
 import os
+import sys
 import random
 import subprocess
 
-import cocotb_test.simulator
 import pytest
 
 import cocotb
@@ -38,6 +38,9 @@ from cocotb.regression import TestFactory
 
 from cocotbext.axi import AxiStreamBus, AxiStreamFrame, AxiStreamSource, AxiStreamSink
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "lib"))
+from sim_support import sim_cache
+
 s_count = 4             # Edit these according to the configuration of the RTL Wrapper
 m_count = 4             # Edit these according to the configuration of the RTL Wrapper
 
@@ -375,7 +378,7 @@ def test_axis_ram_switch(request, s_count, m_count, s_data_width, m_data_width):
     sim_build = os.path.join(tests_dir, "sim_build",
         request.node.name.replace('[', '-').replace(']', ''))
 
-    cocotb_test.simulator.run(
+    sim_cache.run(
         python_search=[tests_dir],
         verilog_sources=verilog_sources,
         toplevel=toplevel,
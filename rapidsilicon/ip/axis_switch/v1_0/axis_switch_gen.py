@@ -10,146 +10,7 @@ import logging
 import argparse
 import math
 
-from datetime import datetime
 
-from litex_wrapper.axis_switch_litex_wrapper import AXISTREAMSWITCH
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-from litex.soc.interconnect.axi import AXIStreamInterface
-
-
-# Function to convert Binary to Decimal ---------------------------------------
-def bin2dec(n):
-    return int (n,2)
-
-# Function to convert Decimal to Binary ---------------------------------------
-def dec2bin(n):
-    return bin(n).replace("0b", "")
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-def get_clkin_ios():
-    return [
-        ("clk",  0, Pins(1)),
-        ("rst",  0, Pins(1)),
-    ]
-
-# AXI_STREAM_SWITCH Wrapper ----------------------------------------------------------------------------------
-class AXISTREAMSWITCHWrapper(Module):
-    def __init__(self, platform, s_count, m_count, data_width, 
-                id_enable, m_dest_width, user_enable, user_width, 
-                s_reg_type, m_reg_type, arb_type_round_robin, m_top,
-                arb_lsb_high_priority, update_tid, s_id_width, m_base
-                ):
-        # Clocking ---------------------------------------------------------------------------------
-        platform.add_extension(get_clkin_ios())
-        self.clock_domains.cd_sys  = ClockDomain()
-        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
-        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
-
-        reg_type = {
-            "Bypass"        :   "0",
-            "Simple_Buffer" :   "1",
-            "Skid_Buffer"   :   "2"
-        }
-        
-        s_dest_width    = m_dest_width + (math.ceil(math.log2(m_count)))
-        m_id_width      = s_id_width + (math.ceil(math.log2(s_count)))
-
-        # Computing bus width for M_CONNECT ----------------------------------
-        s_connect       = ''
-        for i in range (s_count):
-            s_connect += str(1)
-        m_connect = ''
-        for i in range (m_count):
-            m_connect += str(s_connect)
-        m_connect = bin2dec(m_connect)
-
-        # Computing KEEP_ENABLE and KEEP_WIDTH --------------------------------
-        keep_enable     = int(data_width>8)
-        keep_width      = int((data_width+7)/8)
-        
-        # Computing addresses for M_BASE --------------------------------------
-        temp = ''
-        for i in range (m_base, m_count):
-            zeroes = ''
-            for j in range (s_dest_width - len(dec2bin(i))):
-                zeroes += '0'
-            temp = zeroes + str(dec2bin(i)) + temp
-        m_base = bin2dec(temp)
-
-        # Computing addresses for M_TOP ----------------------------------------
-        temp = ''
-        for i in range (m_top, m_count):
-            zeroes = ''
-            for j in range (s_dest_width - len(dec2bin(i))):
-                zeroes += '0'
-            temp = zeroes + str(dec2bin(i)) + temp
-        m_top = bin2dec(temp)
-
-        # AXI STREAM -------------------------------------------------------------------------------
-        # Slave Interface ----------------
-        s_axiss = []
-        for i in range(s_count):
-            s_axis = AXIStreamInterface(
-                data_width = data_width,
-                user_width = user_width,
-                id_width   = s_id_width,
-                dest_width = s_dest_width
-            )            
-            if i>9:
-                platform.add_extension(s_axis.get_ios("s{}_axis".format(i)))
-                self.comb += s_axis.connect_to_pads(platform.request("s{}_axis".format(i)), mode="slave")
-            else:
-                platform.add_extension(s_axis.get_ios("s0{}_axis".format(i)))
-                self.comb += s_axis.connect_to_pads(platform.request("s0{}_axis".format(i)), mode="slave")
-            s_axiss.append(s_axis)
-
-        # Master Interface ---------------
-        m_axiss = []
-        for i in range(m_count):
-            m_axis = AXIStreamInterface(
-                data_width = data_width,
-                user_width = user_width,
-                id_width   = m_id_width,
-                dest_width = m_dest_width
-            )
-            if i>9:
-                platform.add_extension(m_axis.get_ios("m{}_axis".format(i)))
-                self.comb += m_axis.connect_to_pads(platform.request("m{}_axis".format(i)), mode="master")
-            else:
-                platform.add_extension(m_axis.get_ios("m0{}_axis".format(i)))
-                self.comb += m_axis.connect_to_pads(platform.request("m0{}_axis".format(i)), mode="master")
-            m_axiss.append(m_axis)
-
-        # AXIS-SWITCH -------------------------------------------------------------------------------
-        self.submodules.switch = AXISTREAMSWITCH(platform,
-            m_axis                  = m_axiss,
-            s_axis                  = s_axiss,
-            s_count                 = s_count,
-            m_count                 = m_count,
-            keep_enable             = keep_enable,
-            keep_width              = keep_width,
-            id_enable               = id_enable,
-            user_enable             = user_enable,
-            s_id_width              = s_id_width,
-            m_id_width              = m_id_width,
-            m_dest_width            = m_dest_width,
-            s_dest_width            = s_dest_width,
-            m_reg_type              = reg_type[m_reg_type],
-            s_reg_type              = reg_type[s_reg_type],
-            arb_type_round_robin    = arb_type_round_robin,
-            arb_lsb_high_priority   = arb_lsb_high_priority,
-            update_tid              = update_tid,
-            m_connect               = m_connect,
-            m_base                  = m_base,
-            m_top                   = m_top,
-            user_width              = user_width
-            )
 # Build --------------------------------------------------------------------------------------------
 def main():
     parser = argparse.ArgumentParser(description="AXIS SWITCH CORE")
@@ -208,6 +69,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",            help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                   help="Build Directory")
     build_group.add_argument("--build-name",    default="axis_switch_wrapper",  help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -255,34 +117,6 @@ def main():
     if args.json_template:
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
 
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    
-    m_base = args.m_base
-    m_top = args.m_top
-    if (m_base >= args.m_count):
-        m_base = 0
-    if (m_top >= args.m_count):
-        m_top = 0
-
-    module   = AXISTREAMSWITCHWrapper(platform,
-        s_count                 = args.s_count, 
-        m_count                 = args.m_count, 
-        data_width              = args.data_width, 
-        id_enable               = args.id_en,
-        s_id_width              = args.s_id_width,
-        m_dest_width            = args.m_dest_width,
-        user_enable             = args.user_en,
-        user_width              = args.user_width,
-        m_base                  = m_base,
-        m_top                   = m_top,
-        update_tid              = args.tid,
-        s_reg_type              = args.s_reg_type,
-        m_reg_type              = args.m_reg_type,
-        arb_type_round_robin    = args.type_round_robin,
-        arb_lsb_high_priority   = args.lsb_high_priority
-    )
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -291,46 +125,52 @@ def main():
             version    = "v1_0"
         )
         
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version     = "v1_0"
-        )
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "axis_switch", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"AXISSWTH\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="AXISSWTH", ip_version="00000000_00000000_0000000000000001")
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.axis_switch_wrapper import AXISTREAMSWITCHWrapper
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+
+            m_base = args.m_base
+            m_top = args.m_top
+            if (m_base >= args.m_count):
+                m_base = 0
+            if (m_top >= args.m_count):
+                m_top = 0
+
+            module   = AXISTREAMSWITCHWrapper(platform,
+                s_count                 = args.s_count,
+                m_count                 = args.m_count,
+                data_width              = args.data_width,
+                id_enable               = args.id_en,
+                s_id_width              = args.s_id_width,
+                m_dest_width            = args.m_dest_width,
+                user_enable             = args.user_en,
+                user_width              = args.user_width,
+                m_base                  = m_base,
+                m_top                   = m_top,
+                update_tid              = args.tid,
+                s_reg_type              = args.s_reg_type,
+                m_reg_type              = args.m_reg_type,
+                arb_type_round_robin    = args.type_round_robin,
+                arb_lsb_high_priority   = args.lsb_high_priority
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version     = "v1_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,145 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axis_switch LiteX wrapper: IOs and module elaborated by axis_switch_gen.py on --build.
+
+import math
+
+from litex_wrapper.axis_switch_litex_wrapper import AXISTREAMSWITCH
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIStreamInterface
+
+
+# Function to convert Binary to Decimal ---------------------------------------
+def bin2dec(n):
+    return int (n,2)
+
+# Function to convert Decimal to Binary ---------------------------------------
+def dec2bin(n):
+    return bin(n).replace("0b", "")
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1)),
+    ]
+
+# AXI_STREAM_SWITCH Wrapper ----------------------------------------------------------------------------------
+class AXISTREAMSWITCHWrapper(Module):
+    def __init__(self, platform, s_count, m_count, data_width, 
+                id_enable, m_dest_width, user_enable, user_width, 
+                s_reg_type, m_reg_type, arb_type_round_robin, m_top,
+                arb_lsb_high_priority, update_tid, s_id_width, m_base
+                ):
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+
+        reg_type = {
+            "Bypass"        :   "0",
+            "Simple_Buffer" :   "1",
+            "Skid_Buffer"   :   "2"
+        }
+        
+        s_dest_width    = m_dest_width + (math.ceil(math.log2(m_count)))
+        m_id_width      = s_id_width + (math.ceil(math.log2(s_count)))
+
+        # Computing bus width for M_CONNECT ----------------------------------
+        s_connect       = ''
+        for i in range (s_count):
+            s_connect += str(1)
+        m_connect = ''
+        for i in range (m_count):
+            m_connect += str(s_connect)
+        m_connect = bin2dec(m_connect)
+
+        # Computing KEEP_ENABLE and KEEP_WIDTH --------------------------------
+        keep_enable     = int(data_width>8)
+        keep_width      = int((data_width+7)/8)
+        
+        # Computing addresses for M_BASE --------------------------------------
+        temp = ''
+        for i in range (m_base, m_count):
+            zeroes = ''
+            for j in range (s_dest_width - len(dec2bin(i))):
+                zeroes += '0'
+            temp = zeroes + str(dec2bin(i)) + temp
+        m_base = bin2dec(temp)
+
+        # Computing addresses for M_TOP ----------------------------------------
+        temp = ''
+        for i in range (m_top, m_count):
+            zeroes = ''
+            for j in range (s_dest_width - len(dec2bin(i))):
+                zeroes += '0'
+            temp = zeroes + str(dec2bin(i)) + temp
+        m_top = bin2dec(temp)
+
+        # AXI STREAM -------------------------------------------------------------------------------
+        # Slave Interface ----------------
+        s_axiss = []
+        for i in range(s_count):
+            s_axis = AXIStreamInterface(
+                data_width = data_width,
+                user_width = user_width,
+                id_width   = s_id_width,
+                dest_width = s_dest_width
+            )            
+            if i>9:
+                platform.add_extension(s_axis.get_ios("s{}_axis".format(i)))
+                self.comb += s_axis.connect_to_pads(platform.request("s{}_axis".format(i)), mode="slave")
+            else:
+                platform.add_extension(s_axis.get_ios("s0{}_axis".format(i)))
+                self.comb += s_axis.connect_to_pads(platform.request("s0{}_axis".format(i)), mode="slave")
+            s_axiss.append(s_axis)
+
+        # Master Interface ---------------
+        m_axiss = []
+        for i in range(m_count):
+            m_axis = AXIStreamInterface(
+                data_width = data_width,
+                user_width = user_width,
+                id_width   = m_id_width,
+                dest_width = m_dest_width
+            )
+            if i>9:
+                platform.add_extension(m_axis.get_ios("m{}_axis".format(i)))
+                self.comb += m_axis.connect_to_pads(platform.request("m{}_axis".format(i)), mode="master")
+            else:
+                platform.add_extension(m_axis.get_ios("m0{}_axis".format(i)))
+                self.comb += m_axis.connect_to_pads(platform.request("m0{}_axis".format(i)), mode="master")
+            m_axiss.append(m_axis)
+
+        # AXIS-SWITCH -------------------------------------------------------------------------------
+        self.submodules.switch = AXISTREAMSWITCH(platform,
+            m_axis                  = m_axiss,
+            s_axis                  = s_axiss,
+            s_count                 = s_count,
+            m_count                 = m_count,
+            keep_enable             = keep_enable,
+            keep_width              = keep_width,
+            id_enable               = id_enable,
+            user_enable             = user_enable,
+            s_id_width              = s_id_width,
+            m_id_width              = m_id_width,
+            m_dest_width            = m_dest_width,
+            s_dest_width            = s_dest_width,
+            m_reg_type              = reg_type[m_reg_type],
+            s_reg_type              = reg_type[s_reg_type],
+            arb_type_round_robin    = arb_type_round_robin,
+            arb_lsb_high_priority   = arb_lsb_high_priority,
+            update_tid              = update_tid,
+            m_connect               = m_connect,
+            m_base                  = m_base,
+            m_top                   = m_top,
+            user_width              = user_width
+            )
@@ -0,0 +1,79 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# axis_uart LiteX wrapper: IOs and module elaborated by axis_uart_gen.py on --build.
+
+from litex_wrapper.axis_uart_litex_wrapper import AXISTREAMUART
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIStreamInterface
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1))
+    ]
+    
+def get_uart_ios():
+    return [
+        ("rxd",             0, Pins(1)),
+        ("txd",             0, Pins(1)), 
+        ("tx_busy",         0, Pins(1)),
+        ("rx_busy",         0, Pins(1)),
+        ("rx_overrun_error",0, Pins(1)),
+        ("rx_frame_error",  0, Pins(1)),
+        ("prescale",        0, Pins(16))       
+    ]
+    
+# AXI_STREAM_UART Wrapper ----------------------------------------------------------------------------------
+class AXISTREAMUARTWrapper(Module):
+    def __init__(self, platform, data_width):
+        
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())  
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+        
+        # AXI STREAM -------------------------------------------------------------------------------
+        s_axis = AXIStreamInterface(
+            data_width = data_width
+        )
+        
+        m_axis = AXIStreamInterface(
+            data_width = data_width
+        )
+        
+        # Input AXI
+        platform.add_extension(s_axis.get_ios("s_axis"))
+        self.comb += s_axis.connect_to_pads(platform.request("s_axis"), mode="slave")
+        
+        # Output AXI
+        platform.add_extension(m_axis.get_ios("m_axis"))
+        self.comb += m_axis.connect_to_pads(platform.request("m_axis"), mode="master")
+        
+        # AXIS-UART ----------------------------------------------------------------------------------
+        self.submodules.uart = uart = AXISTREAMUART(platform, 
+            m_axis  = m_axis,
+            s_axis  = s_axis
+            )
+        
+        # UART Signals--------------------------------------------------------------------------------
+        platform.add_extension(get_uart_ios())
+        
+        # Inputs
+        self.comb += uart.rxd.eq(platform.request("rxd"))
+        self.comb += uart.prescale.eq(platform.request("prescale"))
+        
+        # Outputs
+        self.comb += platform.request("txd").eq(uart.txd)
+        self.comb += platform.request("tx_busy").eq(uart.tx_busy)
+        self.comb += platform.request("rx_busy").eq(uart.rx_busy)
+        self.comb += platform.request("rx_overrun_error").eq(uart.rx_overrun_error)
+        self.comb += platform.request("rx_frame_error").eq(uart.rx_frame_error)
@@ -22,229 +22,17 @@ THE SOFTWARE.
 
 """
 
+import os
+import sys
+
 from myhdl import *
 
-skip_asserts = False
-
-class AXIStreamFrame(object):
-    def __init__(self, data=b'', keep=None, id=None, dest=None, user=None, last_cycle_user=None):
-        self.B = 0
-        self.N = 8
-        self.M = 1
-        self.WL = 8
-        self.data = b''
-        self.keep = None
-        self.id = 0
-        self.dest = 0
-        self.user = None
-        self.last_cycle_user = None
-
-        if type(data) in (bytes, bytearray):
-            self.data = bytearray(data)
-            self.keep = keep
-            self.id = id
-            self.dest = dest
-            self.user = user
-            self.last_cycle_user = last_cycle_user
-        elif type(data) is AXIStreamFrame:
-            self.N = data.N
-            self.WL = data.WL
-            if type(data.data) is bytearray:
-                self.data = bytearray(data.data)
-            else:
-                self.data = list(data.data)
-            if data.keep is not None:
-                self.keep = list(data.keep)
-            if data.id is not None:
-                if type(data.id) in (int, bool):
-                    self.id = data.id
-                else:
-                    self.id = list(data.id)
-            if data.dest is not None:
-                if type(data.dest) in (int, bool):
-                    self.dest = data.dest
-                else:
-                    self.dest = list(data.dest)
-            if data.user is not None:
-                if type(data.user) in (int, bool):
-                    self.user = data.user
-                else:
-                    self.user = list(data.user)
-            self.last_cycle_user = data.last_cycle_user
-        else:
-            self.data = list(data)
-            self.keep = keep
-            self.id = id
-            self.dest = dest
-            self.user = user
-            self.last_cycle_user = last_cycle_user
-
-    def build(self):
-        if self.data is None:
-            return
-
-        f = list(self.data)
-        tdata = []
-        tkeep = []
-        tid = []
-        tdest = []
-        tuser = []
-        i = 0
-
-        while len(f) > 0:
-            if self.B == 0:
-                data = 0
-                keep = 0
-                for j in range(self.M):
-                    data = data | (f.pop(0) << (j*self.WL))
-                    keep = keep | (1 << j)
-                    if len(f) == 0: break
-                tdata.append(data)
-
-                if self.keep is None:
-                    tkeep.append(keep)
-                else:
-                    tkeep.append(self.keep[i])
-            else:
-                # multiple tdata signals
-                data = 0
-                tdata.append(f.pop(0))
-                tkeep.append(0)
-
-            if self.id is None:
-                tid.append(0)
-            elif type(self.id) is int:
-                tid.append(self.id)
-            else:
-                tid.append(self.id[i])
-
-            if self.dest is None:
-                tdest.append(0)
-            elif type(self.dest) is int:
-                tdest.append(self.dest)
-            else:
-                tdest.append(self.dest[i])
-
-            if self.user is None:
-                tuser.append(0)
-            elif type(self.user) is int:
-                tuser.append(self.user)
-            else:
-                tuser.append(self.user[i])
-            i += 1
-
-        if self.last_cycle_user:
-            tuser[-1] = self.last_cycle_user
-
-        return tdata, tkeep, tid, tdest, tuser
-
-    def parse(self, tdata, tkeep, tid, tdest, tuser):
-        if tdata is None or tkeep is None or tuser is None:
-            return
-        if len(tdata) != len(tkeep) or len(tdata) != len(tid) or len(tdata) != len(tdest) or len(tdata) != len(tuser):
-            raise Exception("Invalid data")
-
-        self.data = []
-        self.keep = []
-        self.id = []
-        self.dest = []
-        self.user = []
-
-        if self.B == 0:
-            mask = 2**self.WL-1
-
-            for i in range(len(tdata)):
-                for j in range(self.M):
-                    if tkeep[i] & (1 << j):
-                        self.data.append((tdata[i] >> (j*self.WL)) & mask)
-                self.keep.append(tkeep[i])
-                self.id.append(tid[i])
-                self.dest.append(tdest[i])
-                self.user.append(tuser[i])
-        else:
-            for i in range(len(tdata)):
-                self.data.append(tdata[i])
-                self.keep.append(tkeep[i])
-                self.id.append(tid[i])
-                self.dest.append(tdest[i])
-                self.user.append(tuser[i])
-
-        if self.WL == 8:
-            self.data = bytearray(self.data)
-
-        self.last_cycle_user = self.user[-1]
-
-    def __eq__(self, other):
-        if not isinstance(other, AXIStreamFrame):
-            return False
-        if self.data != other.data:
-            return False
-        if self.keep is not None and other.keep is not None:
-            if self.keep != other.keep:
-                return False
-        if self.id is not None and other.id is not None:
-            if type(self.id) in (int, bool) and type(other.id) is list:
-                for k in other.id:
-                    if self.id != k:
-                        return False
-            elif type(other.id) in (int, bool) and type(self.id) is list:
-                for k in self.id:
-                    if other.id != k:
-                        return False
-            elif self.id != other.id:
-                return False
-        if self.dest is not None and other.dest is not None:
-            if type(self.dest) in (int, bool) and type(other.dest) is list:
-                for k in other.dest:
-                    if self.dest != k:
-                        return False
-            elif type(other.dest) in (int, bool) and type(self.dest) is list:
-                for k in self.dest:
-                    if other.dest != k:
-                        return False
-            elif self.dest != other.dest:
-                return False
-        if self.last_cycle_user is not None and other.last_cycle_user is not None:
-            if self.last_cycle_user != other.last_cycle_user:
-                return False
-            if self.user is not None and other.user is not None:
-                if type(self.user) in (int, bool) and type(other.user) is list:
-                    for k in other.user[:-1]:
-                        if self.user != k:
-                            return False
-                elif type(other.user) in (int, bool) and type(self.user) is list:
-                    for k in self.user[:-1]:
-                        if other.user != k:
-                            return False
-                elif self.user != other.user:
-                    return False
-        else:
-            if self.user is not None and other.user is not None:
-                if type(self.user) in (int, bool) and type(other.user) is list:
-                    for k in other.user:
-                        if self.user != k:
-                            return False
-                elif type(other.user) in (int, bool) and type(self.user) is list:
-                    for k in self.user:
-                        if other.user != k:
-                            return False
-                elif self.user != other.user:
-                    return False
-        return True
-
-    def __repr__(self):
-        return (
-                ('AXIStreamFrame(data=%s, ' % repr(self.data)) +
-                ('keep=%s, ' % repr(self.keep)) +
-                ('id=%s, ' % repr(self.id)) +
-                ('dest=%s, ' % repr(self.dest)) +
-                ('user=%s, ' % repr(self.user)) +
-                ('last_cycle_user=%s)' % repr(self.last_cycle_user))
-            )
-
-    def __iter__(self):
-        return self.data.__iter__()
+# AXIStreamFrame: shared codec of rapidsilicon/lib/sim_support (copied next to the testbenches in
+# IP builds).
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "lib"))
+from sim_support.axis_frame import AXIStreamFrame
 
+skip_asserts = False
 
 class AXIStreamSource(object):
     def __init__(self):
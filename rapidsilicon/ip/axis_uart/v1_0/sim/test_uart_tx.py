@@ -27,6 +27,7 @@ from myhdl import *
 import os
 
 import axis_ep
+from sim_support import sim_cache
 import uart_ep
 
 module = 'uart_tx'
@@ -85,7 +86,7 @@ def bench():
     )
 
     # DUT
-    if os.system(build_cmd):
+    if sim_cache.system(build_cmd, ["%s.vvp" % testbench], srcs):
         raise Exception("Error running build command")
     
     dut = Cosimulation(
@@ -9,40 +9,6 @@ import sys
 import logging
 import argparse
 
-from litex_wrapper.boot_clock_litex_wrapper import BOOT_CLOCK
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-def get_clkin_ios():
-    return [
-        ("clk",  0, Pins(1)),
-        ("rst",  0, Pins(1))
-    ]
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-
-def get_other_ios():
-    return [
-        ("O",  0, Pins(1)),
-    ]
-
-# AXI RAM Wrapper ----------------------------------------------------------------------------------
-class BOOTCLOCKWrapper(Module):
-    def __init__(self, platform, period):
-        self.clock_domains.cd_sys  = ClockDomain()
-
-
-        # Boot Clock ----------------------------------------------------------------------------------
-        self.submodules.boot_clock = boot_clock = BOOT_CLOCK(platform, period = period
-            )
-        
-        # Ports ---------------------------------------------------------------------------------
-        platform.add_extension(get_other_ios())
-        self.comb += platform.request("O").eq(boot_clock.O)
 
 # Build --------------------------------------------------------------------------------------------
 def main():
@@ -76,6 +42,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",            help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                   help="Build Directory")
     build_group.add_argument("--build-name",    default="boot_clock_wrapper",      help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -105,12 +72,6 @@ def main():
     if args.json_template:
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict , summary=summary)
 
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = BOOTCLOCKWrapper(platform,
-        period = args.period,
-    )
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -118,13 +79,27 @@ def main():
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version = "v1_0"
-        )
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.boot_clock_wrapper import BOOTCLOCKWrapper
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = BOOTCLOCKWrapper(platform,
+                period = args.period,
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version = "v1_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
 
 if __name__ == "__main__":
     main()
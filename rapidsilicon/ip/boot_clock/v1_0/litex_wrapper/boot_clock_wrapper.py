@@ -0,0 +1,39 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# boot_clock LiteX wrapper: IOs and module elaborated by boot_clock_gen.py on --build.
+
+from litex_wrapper.boot_clock_litex_wrapper import BOOT_CLOCK
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1))
+    ]
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+
+def get_other_ios():
+    return [
+        ("O",  0, Pins(1)),
+    ]
+
+# AXI RAM Wrapper ----------------------------------------------------------------------------------
+class BOOTCLOCKWrapper(Module):
+    def __init__(self, platform, period):
+        self.clock_domains.cd_sys  = ClockDomain()
+
+
+        # Boot Clock ----------------------------------------------------------------------------------
+        self.submodules.boot_clock = boot_clock = BOOT_CLOCK(platform, period = period
+            )
+        
+        # Ports ---------------------------------------------------------------------------------
+        platform.add_extension(get_other_ios())
+        self.comb += platform.request("O").eq(boot_clock.O)
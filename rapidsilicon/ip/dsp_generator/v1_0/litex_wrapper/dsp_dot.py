@@ -0,0 +1,65 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# Systolic dot product/MAC (--equation dot) schedule and output stage (pure Python, no migen): used
+# by the generator summary, RS_DSP_DOT (dsp_litex_generator.py) and the model (dsp_model.py).
+#
+# s_axis:  one beat per clock: tdata = a[0..N-1], b[0..N-1] (a[i] on bits i*a_width, b[i] after
+#          the N a operands), tuser[0]: clear (start a new sum with this beat), tlast: output the
+#          sum (a new sum starts on the next beat).
+# Chain:   lane i (one DSP38, registered inputs/product) receives its operands i clocks after lane
+#          i-1 (skew registers), its product is added to the partial sum of lane i-1 (systolic
+#          chain, one register per lane), last lane sum accumulated on DOT_ACC_WIDTH bits.
+# m_axis:  accumulated sum >> shift (rounded half up when rounding), saturated or wrapped to
+#          output_width bits, one beat per s_axis tlast.
+
+from litex_wrapper.dsp_tiling import operand_range
+
+# Dot Product --------------------------------------------------------------------------------------
+
+DOT_LENGTHS   = range(2, 65)
+DOT_SHIFTS    = range(0, 64)
+DOT_ACC_WIDTH = 64    # DSP38 accumulator width.
+
+def dot_ranges(a_width, b_width, length, signed):
+    # Range of one lane product and of each partial sum of the chain.
+    a = operand_range(a_width, signed)
+    b = operand_range(b_width, signed)
+    products = [x*y for x in a for y in b]
+    product  = (min(products), max(products))
+    return product, [((i + 1)*product[0], (i + 1)*product[1]) for i in range(length)]
+
+def dot_latency(length):
+    # Clocks from s_axis beat to m_axis beat: skew (length - 1), DSP38 input/product registers (2),
+    # first sum (1), accumulator (1), output FIFO (1).
+    return length + 4
+
+def dot_skew_registers(a_width, b_width, length):
+    return (a_width + b_width)*length*(length - 1)//2
+
+def dot_output(values, shift, rounding, saturation, output_width, signed):
+    # Output stage of accumulator values (int or Python integer NumPy array): DSP38-like shift right,
+    # round (adds bit shift - 1) and saturation, output_width bits pattern.
+    shifted = values >> shift
+    if rounding and shift:
+        shifted = shifted + ((values >> (shift - 1)) & 1)
+    if saturation:
+        low, high = operand_range(output_width, signed)
+        shifted = shifted.clip(low, high) if hasattr(shifted, "clip") else min(max(shifted, low), high)
+    return shifted & ((1 << output_width) - 1)
+
+def summary(a_width, b_width, length, shift, rounding, saturation, output_width):
+    return {
+        "Algorithm"                  : "Systolic Dot Product",
+        "Dot Product Length"         : str(length),
+        "Count of DSPs"              : str(length),
+        "Throughput (MACs/cycle)"    : str(length),
+        "Latency (clock cycles)"     : str(dot_latency(length)),
+        "Skew Registers (bits)"      : str(dot_skew_registers(a_width, b_width, length)),
+        "Output"                     : "{} bits, >> {}, {}, {}".format(output_width, shift, "Rounded" if rounding else "Truncated",
+            "Saturated" if saturation else "Wrapped"),
+    }
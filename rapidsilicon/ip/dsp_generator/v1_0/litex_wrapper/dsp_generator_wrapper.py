@@ -0,0 +1,127 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# dsp_generator LiteX wrapper: IOs and module elaborated by dsp_generator_gen.py on --build.
+
+from migen import *
+
+from litex.gen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIStreamInterface
+
+from litex_wrapper.dsp_litex_generator import *
+
+from litex_wrapper.dsp_tiling import equation_products, equation_z_width, tiled
+
+# IOs / Interface ----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",      0, Pins(1)),
+        ("reset",    0, Pins(1))
+    ]
+
+def get_ios(a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width, z_width):
+    return [
+        ("a",   0, Pins(a_width)),
+        ("b",   0, Pins(b_width)),
+        ("c",   0, Pins(c_width)),
+        ("d",   0, Pins(d_width)),
+        ("e",   0, Pins(e_width)),
+        ("f",   0, Pins(f_width)),
+        ("g",   0, Pins(g_width)),
+        ("h",   0, Pins(h_width)),
+        ("z",   0, Pins(z_width)),
+    ]
+
+# DSP Core -----------------------------------------------------------------------------------------
+def get_dsp_core(a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width, equation, reg_in, reg_out, unsigned, feature,
+    adder_stages=0, objective="DSPs"):
+    # DSP module of a configuration and its registered inputs (the Pipeline modules always register
+    # their inputs), also elaborated by sim/dsp_equivalence.py.
+    products = equation_products(equation, a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width)
+    z_width  = equation_z_width(equation, a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width)
+
+    # Adder tree pipelining (Base feature).
+    if (feature != "Base"):
+        adder_stages = 0
+
+    # DSP38 tiling: Base, sums of products and single DSP38 products (up to 20x18).
+    if tiled(equation, feature, a_width, b_width):
+        dsp = RS_DSP_MULT_TILED(products, z_width, equation, reg_in, reg_out, unsigned, adder_stages, objective)
+    elif (feature == "Enhanced"):
+        if (unsigned):
+            if ((a_width > 51 and a_width <=72) or (b_width > 51 and b_width <=72)):
+                dsp = RS_DSP_MULT54_enhance(a_width, b_width, equation, reg_in, reg_out, unsigned)
+            elif ((a_width > 34 and a_width <=51) or (b_width > 34 and b_width <=51)):
+                dsp = RS_DSP_MULT36_enhance(a_width, b_width, equation, reg_in, reg_out, unsigned)
+            elif ((a_width > 20 and a_width <=34) or (b_width > 18 and b_width <=34)):
+                dsp = RS_DSP_MULT20_enhance(a_width, b_width, equation, reg_in, reg_out, unsigned)
+        else:
+            if ((a_width > 48 and a_width <=72) or (b_width > 48 and b_width <=72)):
+                dsp = RS_DSP_MULT54_enhance(a_width, b_width, equation, reg_in, reg_out, unsigned)
+            elif ((a_width > 32 and a_width <=48) or (b_width > 32 and b_width <=48)):
+                dsp = RS_DSP_MULT36_enhance(a_width, b_width, equation, reg_in, reg_out, unsigned)
+            elif ((a_width > 20 and a_width <=32) or (b_width > 18 and b_width <=32)):
+                dsp = RS_DSP_MULT20_enhance(a_width, b_width, equation, reg_in, reg_out, unsigned)
+    elif (feature == "Pipeline"):
+        reg_in = True
+        if (unsigned):
+            if ((a_width > 54 and a_width <=72) or (b_width > 54 and b_width <=72)):
+                dsp = RS_DSP_MULT54_pipeline(a_width, b_width, equation, unsigned)
+            elif ((a_width > 36 and a_width <=54) or (b_width > 36 and b_width <=54)):
+                dsp = RS_DSP_MULT36_pipeline(a_width, b_width, equation, unsigned)
+            elif ((a_width > 20 and a_width <=36) or (b_width > 18 and b_width <=36)):
+                dsp = RS_DSP_MULT20_pipeline(a_width, b_width, equation, unsigned)
+        else:
+            if ((a_width > 51 and a_width <=72) or (b_width > 51 and b_width <=72)):
+                dsp = RS_DSP_MULT54_pipeline(a_width, b_width, equation, unsigned)
+            elif ((a_width > 34 and a_width <=51) or (b_width > 34 and b_width <=51)):
+                dsp = RS_DSP_MULT36_pipeline(a_width, b_width, equation, unsigned)
+            elif ((a_width > 20 and a_width <=34) or (b_width > 18 and b_width <=34)):
+                dsp = RS_DSP_MULT20_pipeline(a_width, b_width, equation, unsigned)
+    return dsp, reg_in
+
+class RS_DSP_Wrapper(Module):
+    def __init__(self, platform, a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width, equation, reg_in, reg_out, unsigned, feature,
+        adder_stages=0, objective="DSPs", length=8, shift=0, rounding=False, saturation=False, output_width=38):
+
+    # Clocking
+        self.clock_domains.cd_sys = ClockDomain()
+        platform.add_extension(get_clkin_ios())
+
+    # Systolic Dot Product (s_axis: a/b operands, tuser: clear, m_axis: sums)
+        if (equation == "dot"):
+            s_axis = AXIStreamInterface(data_width=length*(a_width + b_width), user_width=1)
+            m_axis = AXIStreamInterface(data_width=output_width)
+            platform.add_extension(s_axis.get_ios("s_axis"))
+            self.comb += s_axis.connect_to_pads(platform.request("s_axis"), mode="slave")
+            platform.add_extension(m_axis.get_ios("m_axis"))
+            self.comb += m_axis.connect_to_pads(platform.request("m_axis"), mode="master")
+            self.submodules.dsp = RS_DSP_DOT(s_axis, m_axis, a_width, b_width, length, unsigned, shift, rounding, saturation, output_width)
+            self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+            self.comb += self.cd_sys.rst.eq(platform.request("reset"))
+            return
+
+    # DSP
+        dsp, reg_in = get_dsp_core(a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width, equation, reg_in, reg_out, unsigned, feature,
+            adder_stages, objective)
+        self.submodules.dsp = dsp
+        z_width = equation_z_width(equation, a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width)
+        platform.add_extension(get_ios(a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width, z_width))
+        for x, _, y, _ in equation_products(equation, a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width):
+            self.comb += getattr(dsp, x).eq(platform.request(x))
+            self.comb += getattr(dsp, y).eq(platform.request(y))
+
+        # Clock/Reset
+        if (reg_in == 1 or reg_out == 1 or (feature == "Base" and adder_stages > 0)):
+            self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+            self.comb += self.cd_sys.rst.eq(platform.request("reset"))
+        # Registered Output
+        if (reg_out == 1 and feature == "Pipeline"):
+            self.sync += platform.request("z").eq(dsp.z)
+        else:
+            self.comb += platform.request("z").eq(dsp.z)
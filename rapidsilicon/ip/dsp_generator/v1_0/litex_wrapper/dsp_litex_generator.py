@@ -5,3232 +5,290 @@
 #
 # SPDX-License-Identifier: MIT
 
-import datetime
 import logging
 
 from migen import *
+from migen.genlib.fifo import SyncFIFO
 
 from litex.soc.interconnect.axi import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
+from litex_wrapper.dsp_tiling import DSP_A_WIDTH, DSP_B_WIDTH, bits_for_range, operand_range, plan as tiling_plan
+from litex_wrapper.dsp_dot import DOT_ACC_WIDTH, dot_latency, dot_ranges
 
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
+# RS_DSP_MULT_TILED --------------------------------------------------------------------------------
+class RS_DSP_MULT_TILED(Module):
+    # Sum of products (AxB, AxB+CxD, AxB+CxD+ExF+GxH) of any widths tiled on DSP38s by the tiling
+    # engine (dsp_tiling.py), partial products summed by a balanced adder tree with adder_stages
+    # register stages. Latency: reg_in + reg_out + adder stages.
+    def __init__(self, products, z_width, equation, reg_in, reg_out, unsigned, adder_stages=0, objective="DSPs"):
 
-# RS_DSP_MULT ---------------------------------------------------------------------------------------
-class RS_DSP_MULT(Module):
-    def __init__(self, a_width, b_width, equation, reg_in, reg_out, unsigned ):
-
-        # Get Parameters.
-        # ---------------------        
-        self.logger = logging.getLogger("\tDSP38")
-        
-        self.logger.propagate = True
-        
-        self.logger.info(f"=================== PARAMETERS ====================")
-
-        # Input A.
-        self.logger.info(f"INPUT_A      : {a_width}")
-
-        # Input B.
-        self.logger.info(f"INPUT_B      : {b_width}")
-        
-        # Registered Input.
-        self.logger.info(f"REG_IN       : {reg_in}")
-        
-        # Registered Output.
-        self.logger.info(f"REG_OUT      : {reg_out}")
-        
-        # Unsigned Input A.
-        self.logger.info(f"UNSIGNED     : {unsigned}")
-
-        # Equation.
-        self.logger.info(f"EQUATION     : {equation}")
-        
-        self.logger.info(f"===================================================")
-        
-        if (unsigned == 0):
-            self.a = Signal(bits_sign=(a_width, True))
-            self.b = Signal(bits_sign=(b_width, True))
-        else:
-            self.a = Signal(a_width)
-            self.b = Signal(b_width)
-        self.z = Signal(a_width + b_width)
-        
-        if (reg_in == 1 and reg_out == 0):
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN   =  "FALSE",
-                p_INPUT_REG_EN    =  "TRUE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.a,
-                i_B             = self.b,
-                o_Z             = self.z,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned,
-            )
-            
-        elif (reg_in == 0 and reg_out == 1):
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.a,
-                i_B             = self.b,
-                o_Z             = self.z,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned,
-            )
-            
-        elif (reg_in == 1 and reg_out == 1):
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.a,
-                i_B             = self.b,
-                o_Z             = self.z,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned,
-            )
-            
-        else:
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-
-                # IOs
-                i_A             = self.a,
-                i_B             = self.b,
-                o_Z             = self.z,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned,
-            )
-
-# RS_DSP_MULT ---------------------------------------------------------------------------------------
-class RS_DSP_MULT_ABCD(Module):
-    def __init__(self, a_width, b_width, c_width, d_width, equation, reg_in, reg_out, unsigned ):
-
-        # Get Parameters.
-        # ---------------------        
-        self.logger = logging.getLogger("\tDSP38")
-        
-        self.logger.propagate = False
-
-        # Input A.
-        self.logger.info(f"INPUT_A  : {a_width}")
-
-        # Input B.
-        self.logger.info(f"INPUT_B  : {b_width}")
-        
-        # Input C.
-        self.logger.info(f"INPUT_C  : {c_width}")
-        
-        # Input D.
-        self.logger.info(f"INPUT_D  : {d_width}")
-
-        # Equation.
-        self.logger.info(f"equation  : {equation}")
-
-        if ((a_width + b_width) > (c_width + d_width)):
-            z_width = a_width + b_width + 1
-        else:
-            z_width = c_width + d_width + 1
-        if(unsigned == 1):
-            self.a  = Signal(a_width)
-            self.b  = Signal(b_width)
-            self.c  = Signal(c_width)
-            self.d  = Signal(d_width)
-
-            self.z1 = Signal(a_width + b_width)
-            self.z2 = Signal(c_width + d_width)
-        else:
-            self.a  = Signal(bits_sign=(a_width, True))
-            self.b  = Signal(bits_sign=(b_width, True))
-            self.c  = Signal(bits_sign=(c_width, True))
-            self.d  = Signal(bits_sign=(d_width, True))
-
-            self.z1 = Signal(bits_sign=(a_width + b_width, True))
-            self.z2 = Signal(bits_sign=(c_width + d_width, True))
-        
-        self.z  = Signal(z_width)
-        self.comb += self.z.eq(self.z1 + self.z2)
-        
-        if (reg_in == 1 and reg_out == 0):
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK               = ClockSignal(),
-                i_RESET            = ResetSignal(),
-
-                # IOs
-                i_A             = self.a,
-                i_B             = self.b,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned,
-            )
-
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK               = ClockSignal(),
-                i_RESET            = ResetSignal(),
-
-                # IOs
-                i_A             = self.c,
-                i_B             = self.d,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned,
-            )
-            
-        elif (reg_in == 0 and reg_out == 1):
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                
-                # Reset
-                i_CLK               = ClockSignal(),
-                i_RESET            = ResetSignal(),
-
-                # IOs
-                i_A             = self.a,
-                i_B             = self.b,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned,
-            )
-
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                
-                # Reset
-                i_CLK               = ClockSignal(),
-                i_RESET            = ResetSignal(),
-
-                # IOs
-                i_A             = self.c,
-                i_B             = self.d,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned,
-            )
-            
-        elif (reg_in == 1 and reg_out == 1):
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.a,
-                i_B             = self.b,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned,
-            )
-
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.c,
-                i_B             = self.d,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned,
-            )
-            
-        else:
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-
-                # IOs
-                i_A             = self.a,
-                i_B             = self.b,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned,
-            )
-
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-
-                # IOs
-                i_A             = self.c,
-                i_B             = self.d,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned,
-            )
-            
-# RS_DSP_MULT ---------------------------------------------------------------------------------------
-class RS_DSP_MULT_ABCDEFGH(Module):
-    def __init__(self, a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width, equation, reg_in, reg_out, unsigned):
-
-        # Get Parameters.
-        # ---------------------        
-        self.logger = logging.getLogger("\tDSP38")
-        
-        self.logger.propagate = False
-
-        # Input A.
-        self.logger.info(f"INPUT_A  : {a_width}")
-
-        # Input B.
-        self.logger.info(f"INPUT_B  : {b_width}")
-        
-        # Input C.
-        self.logger.info(f"INPUT_C  : {c_width}")
-        
-        # Input D.
-        self.logger.info(f"INPUT_D  : {d_width}")
-        
-        # Input E.
-        self.logger.info(f"INPUT_E  : {e_width}")
-        
-        # Input F.
-        self.logger.info(f"INPUT_F  : {f_width}")
-        
-        # Input G.
-        self.logger.info(f"INPUT_G  : {g_width}")
-        
-        # Input H.
-        self.logger.info(f"INPUT_H  : {h_width}")
-
-        # Equation.
-        self.logger.info(f"equation  : {equation}")
-        if (unsigned):
-            self.a  = Signal(a_width)
-            self.b  = Signal(b_width)
-            self.c  = Signal(c_width)
-            self.d  = Signal(d_width)
-
-            self.e  = Signal(e_width)
-            self.f  = Signal(f_width)
-            self.g  = Signal(g_width)
-            self.h  = Signal(h_width)
-
-            self.z1 = Signal(a_width + b_width)
-            self.z2 = Signal(c_width + d_width)
-            self.z3 = Signal(e_width + f_width)
-            self.z4 = Signal(g_width + h_width)
-        else:
-            self.a  = Signal(bits_sign=(a_width, True))
-            self.b  = Signal(bits_sign=(b_width, True))
-            self.c  = Signal(bits_sign=(c_width, True))
-            self.d  = Signal(bits_sign=(d_width, True))
-            self.e  = Signal(bits_sign=(e_width, True))
-            self.f  = Signal(bits_sign=(f_width, True))
-            self.g  = Signal(bits_sign=(g_width, True))
-            self.h  = Signal(bits_sign=(h_width, True))
-        
-            self.z1 = Signal(bits_sign=(a_width + b_width, True))
-            self.z2 = Signal(bits_sign=(c_width + d_width, True))
-            self.z3 = Signal(bits_sign=(e_width + f_width, True))
-            self.z4 = Signal(bits_sign=(g_width + h_width, True))
-        
-        if ((a_width + b_width) > (c_width + d_width)):
-            z12_width = a_width + b_width + 1
-        else:
-            z12_width = c_width + d_width + 1
-        
-        if ((e_width + f_width) > (g_width + h_width)):
-            z34_width = e_width + f_width + 1
-        else:
-            z34_width = g_width + h_width + 1
-        
-        if (z12_width > z34_width):
-            z_width = z12_width
-        else:
-            z_width = z34_width
-        self.z  = Signal(z_width + 1)
-        self.comb += self.z.eq(self.z1 + self.z2 + self.z3 + self.z4)
-        
-        if (reg_in == 1 and reg_out == 0):
-            
-            
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.a,
-                i_B             = self.b,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.c,
-                i_B             = self.d,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-            
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.e,
-                i_B             = self.f,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-            
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.g,
-                i_B             = self.h,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-            
-        elif (reg_in == 0 and reg_out == 1):
-            
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.a,
-                i_B             = self.b,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.c,
-                i_B             = self.d,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-            
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.e,
-                i_B             = self.f,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-            
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.g,
-                i_B             = self.h,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-            
-        elif (reg_in == 1 and reg_out == 1):
-            
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.a,
-                i_B             = self.b,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.c,
-                i_B             = self.d,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-            
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.e,
-                i_B             = self.f,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-
-                # IOs
-                i_A             = self.g,
-                i_B             = self.h,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-            
-        else:
-            
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-
-                # IOs
-                i_A             = self.a,
-                i_B             = self.b,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-
-                # IOs
-                i_A             = self.c,
-                i_B             = self.d,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-            
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-
-                # IOs
-                i_A             = self.e,
-                i_B             = self.f,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-
-            self.specials += Instance("DSP38",
-
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-
-                # IOs
-                i_A             = self.g,
-                i_B             = self.h,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = unsigned,
-                i_UNSIGNED_B    = unsigned
-            )
-
-
-# RS_DSP_MULT ---------------------------------------------------------------------------------------
-class RS_DSP_MULT20(Module):
-    def __init__(self, a_width, b_width, equation, reg_in, reg_out, unsigned):
-
-        # Get Parameters.
-        # ---------------------        
-        self.logger = logging.getLogger("\tDSP38")
-        
-        self.logger.propagate = False
-
-        # Input A.
-        self.logger.info(f"INPUT_A  : {a_width}")
-
-        # Input B.
-        self.logger.info(f"INPUT_B  : {b_width}")
-
-        # Equation.
-        self.logger.info(f"equation  : {equation}")
-        
-        k = 18
-        
-        self.a = Signal(bits_sign=(a_width,True))
-        self.b = Signal(bits_sign=(b_width,True))
-        self.a3 = Signal(bits_sign=(36,True))
-        self.b3 = Signal(bits_sign=(36,True))
-        
-        self.comb += self.a3.eq(self.a)
-        self.comb += self.b3.eq(self.b)
-        
-        a0_sign = 1
-        a1_sign = 1
-        b0_sign = 1
-        b1_sign = 1
-
-        if (a_width > k and a_width <= k*2):
-            self.a0 = Cat(self.a3[0:k], Replicate(0,2))
-            if(unsigned):
-                self.a1 = Cat(self.a3[k:a_width], Replicate(0,k*2-a_width+1))
-            else:
-                a1_sign = 0
-                self.a1 = Cat(self.a3[k:a_width], Replicate(self.a3[a_width - 1],k*2-a_width+2))
-        if (a_width <= k):
-            self.a1 =  Replicate(0,20)
-            if(unsigned):
-                self.a0 = Cat(self.a3[0:a_width], Replicate(0,k-a_width+1))
-            else:
-                self.a0 = Cat(self.a3[0:a_width],  Replicate(self.a3[a_width - 1],k-a_width+2))
-                a0_sign = 0
-        else:
-            self.a0 = Signal()
-            self.a1 = Signal()
-              
-        if (b_width > k and b_width <= k*2):
-            self.b0 = self.b3[0:k]
-            if(unsigned):
-                self.b1 = Cat(self.b3[k:b_width], Replicate(0,k*2-b_width+1))
-            else:
-                b1_sign = 0
-                self.b1 = Cat(self.b3[k:b_width], Replicate(self.b3[b_width - 1],k*2-b_width+2))
-        if (b_width <= k):
-            self.b1 =  Replicate(0,18)
-            if(unsigned):
-                self.b0 = Cat(self.b3[0:b_width], Replicate(0,k-b_width+1))
-            else:
-                self.b0 = Cat(self.b3[0:b_width],  Replicate(self.b3[b_width - 1],k-b_width+2))
-                b0_sign = 0
-        else:
-            self.b0 = Signal()
-            self.b1 = Signal()
-
-        self.z1 = Signal(bits_sign=(38,True))
-        self.z2 = Signal(bits_sign=(38,True))
-        self.z3 = Signal(bits_sign=(38,True))
-        self.z4 = Signal(bits_sign=(38,True))
-        
-        self.mult2 = Signal(bits_sign=(39,True))
-        self.mult3 = Signal(bits_sign=(39+k,True))
-        self.mult4 = Signal(bits_sign=(a_width + b_width,True))
-        self.z = Signal(a_width + b_width)
-
-
-        self.comb += self.mult4.eq(self.z4 << 36)
-        self.comb += self.mult2.eq(self.z2 + self.z3)
-        self.comb += self.mult3.eq(self.mult2 << 18)
-        self.comb += self.z.eq(self.mult4 + self.mult3 + self.z1)
-        
-        
-        # Registered Output
-        if (reg_in == 0 and reg_out == 1):
-            
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b0,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b1,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b0,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b1,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            
-        elif (reg_in == 1 and reg_out == 1):
-
-            
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b0,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b1,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b0,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b1,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            
-        # Registered Input
-        elif (reg_in == 1 and reg_out == 0):
-            
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b0,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b1,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b0,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b1,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-        
-        else:
-            
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b0,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b1,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            # Module instance.
-            # ----------------
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b0,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b1,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            
-# RS_DSP_MULT ---------------------------------------------------------------------------------------
-class RS_DSP_MULT36(Module):
-    def __init__(self, a_width, b_width, equation, reg_in, reg_out, unsigned):
-
-        # Get Parameters.
-        # ---------------------        
-        self.logger = logging.getLogger("\tDSP38")
-        
-        self.logger.propagate = False
-
-        # Input A.
-        self.logger.info(f"INPUT_A  : {a_width}")
-
-        # Input B.
-        self.logger.info(f"INPUT_B  : {b_width}")
-
-        # Equation.
-        self.logger.info(f"equation  : {equation}")
-        
-        k = 18
-
-        self.a = Signal(bits_sign=(a_width,True))
-        self.b = Signal(bits_sign=(b_width,True))
-        self.a3 = Signal(bits_sign=(a_width,True))
-        self.b3 = Signal(bits_sign=(b_width,True))
-        
-        self.comb += self.a3.eq(self.a)
-        self.comb += self.b3.eq(self.b)
-
-        a0_sign = 1
-        a1_sign = 1
-        a2_sign = 1
-        b0_sign = 1
-        b1_sign = 1
-        b2_sign = 1
-  
-        if(a_width > k*2 and a_width <= k*3):
-            self.a0 = Cat(self.a3[0:k], Replicate(0,2))
-            self.a1 = Cat(self.a3[k:k*2], Replicate(0,2))
-            if (unsigned):
-                self.a2 = Cat(self.a3[k*2:a_width], Replicate(0,k*3-a_width+1))
-            else:
-                a2_sign = 0
-                self.a2 = Cat(self.a3[k*2:a_width], Replicate(self.a3[a_width - 1],k*3-a_width+2))
-        elif (a_width > k and a_width <= k*2):
-            self.a2 =  Replicate(0,20)
-            self.a0 = Cat(self.a3[0:k], Replicate(0,2))
-            if(unsigned):
-                self.a1 = Cat(self.a3[k:a_width], Replicate(0,k*2-a_width+1))
-            else:
-                a1_sign = 0
-                self.a1 = Cat(self.a3[k:a_width], Replicate(self.a3[a_width - 1],k*2-a_width+2))
-        elif (a_width <= k):
-            self.a1 =  Replicate(0,20)
-            self.a2 =  Replicate(0,20)
-            if(unsigned):
-                self.a0 = Cat(self.a3[0:a_width], Replicate(0,k-a_width+1))
-            else:
-                self.a0 = Cat(self.a3[0:a_width],  Replicate(self.a3[a_width - 1],k-a_width+2))
-                a0_sign = 0
-        else:
-            self.a0 = Signal()
-            self.a1 = Signal()
-            self.a2 = Signal()
-
-        if(b_width > k*2 and b_width <= k*3):
-            self.b0 = self.b3[0:k]
-            self.b1 = self.b3[k:k*2]
-            if (unsigned):
-                self.b2 = Cat(self.b3[k*2:b_width], Replicate(0,k*3-b_width+1))
-            else:
-                b2_sign = 0
-                self.b2 = Cat(self.b3[k*2:b_width], Replicate(self.b3[b_width - 1],k*3-b_width))
-        elif (b_width > k and b_width <= k*2):
-            self.b2 = Replicate(0,18)
-            self.b0 = self.b3[0:k]
-            if(unsigned):
-                self.b1 = Cat(self.b3[k:b_width], Replicate(0,k*2-b_width+1))
-            else:
-                b1_sign = 0
-                self.b1 = Cat(self.b3[k:b_width], Replicate(self.b3[b_width - 1],k*2-b_width))
-        elif (b_width <= k):
-            self.b1 =  Replicate(0,18)
-            self.b2 =  Replicate(0,18)
-            if(unsigned):
-                self.b0 = Cat(self.b3[0:b_width], Replicate(0,k-b_width+1))
-            else:
-                self.b0 = Cat(self.b3[0:b_width],  Replicate(self.b3[b_width - 1],k-b_width))
-                b0_sign = 0
-        else:
-            self.b0 = Signal()
-            self.b1 = Signal()
-            self.b2 = Signal()
-        
-
-        self.z1 = Signal(bits_sign=(38,True))
-        self.z2 = Signal(bits_sign=(38,True))
-        self.z3 = Signal(bits_sign=(38,True))
-        self.z4 = Signal(bits_sign=(38,True))
-        self.z5 = Signal(bits_sign=(38,True))
-        self.z6 = Signal(bits_sign=(38,True))
-        self.z7 = Signal(bits_sign=(38,True))
-        self.z8 = Signal(bits_sign=(38,True))
-        self.z9 = Signal(bits_sign=(38,True))
-        
-        self.mult3 = Signal(bits_sign=(39+k,True))
-        self.mult4 = Signal(bits_sign=(40+2*k,True))
-        self.mult5 = Signal(bits_sign=(39+3*k,True))
-        self.mult6 = Signal(bits_sign=(38+4*k,True))
-        self.z = Signal(a_width + b_width)
-
-        self.comb += self.mult6.eq(self.z9 << 4*k)
-        self.comb += self.mult5.eq((self.z7 + self.z8) << 3*k)
-        self.comb += self.mult4.eq((self.z4 + self.z5 + self.z6) << 2*k)
-        self.comb += self.mult3.eq((self.z2 + self.z3) << k)
-        self.comb += self.z.eq(self.mult6 + self.mult5 + self.mult4 + self.mult3 + self.z1)
-
-        # Module instance.
-        # ----------------
-        if (reg_in == 0 and reg_out == 1):
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b0,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b0,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b1,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b0,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b1,
-                o_Z             = self.z5,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b2,
-                o_Z             = self.z6,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b1,
-                o_Z             = self.z7,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b2,
-                o_Z             = self.z8,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b2,
-                o_Z             = self.z9,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-        elif (reg_in == 1 and reg_out == 1):
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b0,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b0,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b1,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b0,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b1,
-                o_Z             = self.z5,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b2,
-                o_Z             = self.z6,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b1,
-                o_Z             = self.z7,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b2,
-                o_Z             = self.z8,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b2,
-                o_Z             = self.z9,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-        elif (reg_in == 1 and reg_out == 0):
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b0,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b0,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b1,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b0,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b1,
-                o_Z             = self.z5,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b2,
-                o_Z             = self.z6,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b1,
-                o_Z             = self.z7,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b2,
-                o_Z             = self.z8,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b2,
-                o_Z             = self.z9,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-        else:
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b0,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b0,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b1,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b0,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b1,
-                o_Z             = self.z5,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b2,
-                o_Z             = self.z6,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b1,
-                o_Z             = self.z7,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b2,
-                o_Z             = self.z8,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b2,
-                o_Z             = self.z9,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-
-# RS_DSP_MULT ---------------------------------------------------------------------------------------
-class RS_DSP_MULT54(Module):
-    def __init__(self, a_width, b_width, equation, reg_in, reg_out, unsigned):
-
-        # Get Parameters.
-        # ---------------------        
-        self.logger = logging.getLogger("\tDSP38")
-        
-        self.logger.propagate = False
-
-        # Input A.
-        self.logger.info(f"INPUT_A  : {a_width}")
-
-        # Input B.
-        self.logger.info(f"INPUT_B  : {b_width}")
-
-        # Equation.
-        self.logger.info(f"equation  : {equation}")
-        
-        k = 18
-
-        self.a = Signal(bits_sign=(a_width,True))
-        self.b = Signal(bits_sign=(b_width,True))
-        self.a3 = Signal(bits_sign=(a_width,True))
-        self.b3 = Signal(bits_sign=(b_width,True))
-        
-        self.comb += self.a3.eq(self.a)
-        self.comb += self.b3.eq(self.b)
-
-        a0_sign = 1
-        a1_sign = 1
-        a2_sign = 1
-        a3_sign = 1
-        b0_sign = 1
-        b1_sign = 1
-        b2_sign = 1
-        b3_sign = 1     
-        
-        if(a_width > k*3 and a_width <= k*4):
-            self.a0 = Cat(self.a3[0:k], Replicate(0,2))
-            self.a1 = Cat(self.a3[k:k*2], Replicate(0,2))
-            self.a2 = Cat(self.a3[k*2:k*3], Replicate(0,2))
-            if (unsigned):
-                self.a4 = Cat(self.a3[k*3:a_width], Replicate(0,k*4-a_width+1))
-            else:
-                a3_sign = 0
-                self.a4 = Cat(self.a3[k*3:a_width], Replicate(self.a3[a_width - 1],k*4-a_width+2))
-        elif(a_width > k*2 and a_width <= k*3):
-            self.a0 = Cat(self.a3[0:k],  Replicate(0,2))
-            self.a1 = Cat(self.a3[k:k*2], Replicate(0,2))
-            self.a4 = Replicate(0,20)
-            if (unsigned):
-                self.a2 = Cat(self.a3[k*2:a_width], Replicate(0,k*3-a_width+1))
-            else:
-                a2_sign = 0
-                self.a2 = Cat(self.a3[k*2:a_width], Replicate(self.a3[a_width - 1],k*3-a_width+2))
-        elif (a_width > k and a_width <= k*2):
-            self.a2 =  Replicate(0,20)
-            self.a4 = Replicate(0,20)
-            self.a0 = Cat(self.a3[0:k],  Replicate(0,2))
-            if(unsigned):
-                self.a1 = Cat(self.a3[k:a_width], Replicate(0,k*2-a_width+1))
-            else:
-                a1_sign = 0
-                self.a1 = Cat(self.a3[k:a_width], Replicate(self.a3[a_width - 1],k*2-a_width+2))
-        elif (a_width <= k):
-            self.a1 =  Replicate(0,20)
-            self.a2 =  Replicate(0,20)
-            self.a4 = Replicate(0,20)
-            if(unsigned):
-                self.a0 = Cat(self.a3[0:a_width], Replicate(0,k-a_width+1))
-            else:
-                self.a0 = Cat(self.a3[0:a_width],  Replicate(self.a3[a_width - 1],k-a_width+2))
-                a0_sign = 0
-        else:
-            self.a0 = Signal()
-            self.a1 = Signal()
-            self.a2 = Signal()
-            self.a4 = Signal()
-
-        if(b_width > k*3 and b_width <= k*4):
-            self.b0 = self.b3[0:k]
-            self.b1 = self.b3[k:k*2]
-            self.b2 = self.b3[k*2:k*3]
-            if (unsigned):
-                self.b4 = Cat(self.b3[k*3:b_width], Replicate(0,k*4-b_width+1))
-            else:
-                b3_sign = 0
-                self.b4 = Cat(self.b3[k*3:b_width], Replicate(self.b3[b_width - 1],k*4-b_width))
-        elif(b_width > k*2 and b_width <= k*3):
-            self.b0 = self.b3[0:k]
-            self.b1 = self.b3[k:k*2]
-            self.b4 = Replicate(0,18)
-            if (unsigned):
-                self.b2 = Cat(self.b3[k*2:b_width], Replicate(0,k*3-b_width+1))
-            else:
-                b2_sign = 0
-                self.b2 = Cat(self.b3[k*2:b_width], Replicate(self.b3[b_width - 1],k*3-b_width))
-        elif (b_width > k and b_width <= k*2):
-            self.b2 =  Replicate(0,18)
-            self.b4 = Replicate(0,18)
-            self.b0 = self.b3[0:k]
-            if(unsigned):
-                self.b1 = Cat(self.b3[k:b_width], Replicate(0,k*2-b_width+1))
-            else:
-                b1_sign = 0
-                self.b1 = Cat(self.b3[k:b_width], Replicate(self.b3[b_width - 1],k*2-b_width))
-        elif (b_width <= k):
-            self.b1 =  Replicate(0,18)
-            self.b2 =  Replicate(0,18)
-            self.b4 = Replicate(0,18)
-            if(unsigned):
-                self.b0 = Cat(self.b3[0:b_width], Replicate(0,k-b_width+1))
-            else:
-                self.b0 = Cat(self.b3[0:b_width],  Replicate(self.b3[b_width - 1],k-b_width))
-                b0_sign = 0
-        else:
-            self.b0 = Signal()
-            self.b1 = Signal()
-            self.b2 = Signal()
-            self.b4 = Signal()
-
-        self.z1  = Signal(bits_sign=(38,True))
-        self.z2  = Signal(bits_sign=(38,True))
-        self.z3  = Signal(bits_sign=(38,True))
-        self.z4  = Signal(bits_sign=(38,True))
-        self.z5  = Signal(bits_sign=(38,True))
-        self.z6  = Signal(bits_sign=(38,True))
-        self.z7  = Signal(bits_sign=(38,True))
-        self.z8  = Signal(bits_sign=(38,True))
-        self.z9  = Signal(bits_sign=(38,True))
-        self.z10 = Signal(bits_sign=(38,True))
-        self.z11 = Signal(bits_sign=(38,True))
-        self.z12 = Signal(bits_sign=(38,True))
-        self.z13 = Signal(bits_sign=(38,True))
-        self.z14 = Signal(bits_sign=(38,True))
-        self.z15 = Signal(bits_sign=(38,True))
-        self.z16 = Signal(bits_sign=(38,True))
-
-        self.z = Signal(a_width + b_width)
-
-        self.mult1 = Signal(bits_sign=(38+6*k,True))
-        self.mult2 = Signal(bits_sign=(39+5*k,True))
-        self.mult3 = Signal(bits_sign=(40+4*k,True))
-        self.mult4 = Signal(bits_sign=(41+3*k,True))
-        self.mult5 = Signal(bits_sign=(40+2*k,True))
-        self.mult6 = Signal(bits_sign=(39+k,True))
-
-        self.comb += self.mult1.eq(self.z16 << 6*k)
-        self.comb += self.mult2.eq((self.z14 + self.z15) << 5*k)
-        self.comb += self.mult3.eq((self.z11 + self.z12 + self.z13) << 4*k)
-        self.comb += self.mult4.eq((self.z7 + self.z8 + self.z9 + self.z10) << 3*k)
-        self.comb += self.mult5.eq((self.z4 + self.z5 + self. z6) << 2*k)
-        self.comb += self.mult6.eq((self.z2 + self.z3) << k)
-        self.comb += self.z.eq(self.mult1 + self.mult2 + self.mult3 + self.mult4 + self.mult5 + self.mult6 + self.z1)
-
-        # Module instance.
-        # ----------------
-        if (reg_in == 0 and reg_out == 1):
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b0,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b1,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b0,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b0,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b1,
-                o_Z             = self.z5,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b2,
-                o_Z             = self.z6,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b0,
-                o_Z             = self.z7,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b1,
-                o_Z             = self.z8,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b2,
-                o_Z             = self.z9,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b4,
-                o_Z             = self.z10,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b1,
-                o_Z             = self.z11,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b2,
-                o_Z             = self.z12,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b4,
-                o_Z             = self.z13,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b2,
-                o_Z             = self.z14,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b4,
-                o_Z             = self.z15,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "FALSE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b4,
-                o_Z             = self.z16,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            
-        elif (reg_in == 1 and reg_out == 1):
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b0,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b1,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b0,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b0,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b1,
-                o_Z             = self.z5,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b2,
-                o_Z             = self.z6,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b0,
-                o_Z             = self.z7,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b1,
-                o_Z             = self.z8,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b2,
-                o_Z             = self.z9,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b4,
-                o_Z             = self.z10,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b1,
-                o_Z             = self.z11,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b2,
-                o_Z             = self.z12,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b4,
-                o_Z             = self.z13,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b2,
-                o_Z             = self.z14,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b4,
-                o_Z             = self.z15,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "TRUE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b4,
-                o_Z             = self.z16,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            
-        elif (reg_in == 1 and reg_out == 0):
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b0,
-                o_Z             = self.z1,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b1,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b0,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b0,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b1,
-                o_Z             = self.z5,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b2,
-                o_Z             = self.z6,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b0,
-                o_Z             = self.z7,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b1,
-                o_Z             = self.z8,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b2,
-                o_Z             = self.z9,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b4,
-                o_Z             = self.z10,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b1,
-                o_Z             = self.z11,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b2,
-                o_Z             = self.z12,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b4,
-                o_Z             = self.z13,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b2,
-                o_Z             = self.z14,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b4,
-                o_Z             = self.z15,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "TRUE",
-                # Reset
-                i_CLK           = ClockSignal(),
-                i_RESET        = ResetSignal(),
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b4,
-                o_Z             = self.z16,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-        else:
-            self.specials += Instance("DSP38",
-                    # Parameters.
-                    # -----------
-                    # Mode Bits to configure DSP 
-                    p_DSP_MODE     =  "MULTIPLY",
-                    p_OUTPUT_REG_EN = "FALSE",
-                    p_INPUT_REG_EN = "FALSE",
-                    # IOs
-                    i_A             = self.a0,
-                    i_B             = self.b0,
-                    o_Z             = self.z1,  
-                    i_FEEDBACK      = 0,
-                    i_UNSIGNED_A    = a0_sign,
-                    i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b1,
-                o_Z             = self.z2,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b0,
-                o_Z             = self.z3,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b0,
-                o_Z             = self.z4,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b1,
-                o_Z             = self.z5,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b2,
-                o_Z             = self.z6,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b0,
-                o_Z             = self.z7,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b0_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b1,
-                o_Z             = self.z8,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b2,
-                o_Z             = self.z9,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a0,
-                i_B             = self.b4,
-                o_Z             = self.z10,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a0_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b1,
-                o_Z             = self.z11,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b1_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a2,
-                i_B             = self.b2,
-                o_Z             = self.z12,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b2_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a1,
-                i_B             = self.b4,
-                o_Z             = self.z13,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a1_sign,
-                i_UNSIGNED_B    = b3_sign
-            )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b2,
-                o_Z             = self.z14,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b2_sign
+        # Get Parameters.
+        # ---------------------
+        self.logger = logging.getLogger("\tDSP38")
+
+        self.logger.propagate = True
+
+        self.logger.debug(f"=================== PARAMETERS ====================")
+
+        # Products.
+        self.logger.debug(f"PRODUCTS     : {products}")
+
+        # Registered Input/Output.
+        self.logger.debug(f"REG_IN       : {reg_in}")
+        self.logger.debug(f"REG_OUT      : {reg_out}")
+
+        # Unsigned Inputs.
+        self.logger.debug(f"UNSIGNED     : {unsigned}")
+
+        # Equation.
+        self.logger.debug(f"EQUATION     : {equation}")
+
+        # Adder Tree.
+        self.logger.debug(f"ADDER_STAGES : {adder_stages}")
+        self.logger.debug(f"OBJECTIVE    : {objective}")
+
+        self.logger.debug(f"===================================================")
+
+        signed       = not unsigned
+        self.z_width = z_width
+        self.plan    = plan = tiling_plan(products, signed, reg_in, reg_out, adder_stages, objective)
+        self.latency = plan["latency"]
+
+        # Operands.
+        for x, x_width, y, y_width in products:
+            setattr(self, x, Signal(bits_sign=(x_width, signed)))
+            setattr(self, y, Signal(bits_sign=(y_width, signed)))
+        self.z = Signal(z_width)
+
+        # Partial Products.
+        nodes = []
+        for tile in sorted(plan["tiles"], key=lambda t: t["shift"]):
+            x = self.operand_slice(*tile["x"])
+            y = self.operand_slice(*tile["y"])
+            p = Signal(bits_sign=bits_for_range(*tile["range"]))
+            if tile["dsp"]:
+                self.add_dsp(x, y, p, reg_in, reg_out)
+            else:
+                self.add_fabric(x, y, p, reg_in, reg_out)
+            nodes.append((p, tile["shift"]) + tuple(tile["range"]))
+
+        # Adder Tree.
+        for level in range(1, plan["levels"] + 1):
+            nodes = [self.add_node(*nodes[i:i + 2]) for i in range(0, len(nodes), 2)]
+            if level in plan["registered"]:
+                nodes = [self.register_node(node) for node in nodes]
+        z, shift, _, _ = nodes[0]
+        self.comb += self.z.eq(z << shift)
+
+    def operand_slice(self, name, offset, width, signed):
+        s = Signal(bits_sign=(width, signed))
+        self.comb += s.eq(getattr(self, name)[offset:offset + width])
+        return s
+
+    def add_dsp(self, x, y, p, reg_in, reg_out):
+        # x on A (20-bit), y on B (18-bit), sign-extended when signed (UNSIGNED_A/B = 0).
+        a = Signal(bits_sign=(DSP_A_WIDTH, x.signed))
+        b = Signal(bits_sign=(DSP_B_WIDTH, y.signed))
+        z = Signal(38)
+        self.comb += [a.eq(x), b.eq(y), p.eq(z[:len(p)])]
+        clocking = {}
+        if (reg_in or reg_out):
+            clocking = dict(i_CLK=ClockSignal(), i_RESET=ResetSignal())
+        # Module instance.
+        # ----------------
+        self.specials += Instance("DSP38",
+            # Parameters.
+            # -----------
+            # Mode Bits to configure DSP
+            p_DSP_MODE      = "MULTIPLY",
+            p_OUTPUT_REG_EN = "TRUE" if reg_out else "FALSE",
+            p_INPUT_REG_EN  = "TRUE" if reg_in  else "FALSE",
+
+            # IOs
+            i_A             = a,
+            i_B             = b,
+            o_Z             = z,
+            i_FEEDBACK      = 0,
+            i_UNSIGNED_A    = not x.signed,
+            i_UNSIGNED_B    = not y.signed,
+            **clocking
+        )
+
+    def add_fabric(self, x, y, p, reg_in, reg_out):
+        # Narrow partial product in fabric, registered as the DSP38s are.
+        if reg_in:
+            x_reg = Signal.like(x)
+            y_reg = Signal.like(y)
+            self.sync += [x_reg.eq(x), y_reg.eq(y)]
+            x, y = x_reg, y_reg
+        if reg_out:
+            self.sync += p.eq(x*y)
+        else:
+            self.comb += p.eq(x*y)
+
+    def add_node(self, n0, n1=None):
+        # (signal, shift, low, high): value = signal << shift, signal in [low, high], truncated to the
+        # z_width - shift bits of the result (sum modulo 2^z_width) when wider.
+        if n1 is None:
+            return n0
+        v0, s0, l0, h0 = n0
+        v1, s1, l1, h1 = n1
+        shift = min(s0, s1)
+        low   = (l0 << (s0 - shift)) + (l1 << (s1 - shift))
+        high  = (h0 << (s0 - shift)) + (h1 << (s1 - shift))
+        width, signed = bits_for_range(low, high)
+        if width > self.z_width - shift:
+            width, signed = self.z_width - shift, False
+            low, high     = 0, (1 << width) - 1
+        s = Signal(bits_sign=(width, signed))
+        self.comb += s.eq((v0 << (s0 - shift)) + (v1 << (s1 - shift)))
+        return (s, shift, low, high)
+
+    def register_node(self, node):
+        v, shift, low, high = node
+        r = Signal.like(v)
+        self.sync += r.eq(v)
+        return (r, shift, low, high)
+
+# RS_DSP_DOT ---------------------------------------------------------------------------------------
+class RS_DSP_DOT(Module):
+    # Systolic dot product/MAC of length a/b operand pairs per s_axis beat (dsp_dot.py), one beat per
+    # clock, sums accumulated until tlast (tuser[0]: clear) and output on m_axis (output FIFO, input
+    # ready when it has room for all the sums in flight).
+    def __init__(self, s_axis, m_axis, a_width, b_width, length, unsigned, shift=0, rounding=False, saturation=False, output_width=38):
+
+        # Get Parameters.
+        # ---------------------
+        self.logger = logging.getLogger("\tDSP38")
+
+        self.logger.propagate = True
+
+        self.logger.debug(f"=================== PARAMETERS ====================")
+        self.logger.debug(f"A_WIDTH      : {a_width}")
+        self.logger.debug(f"B_WIDTH      : {b_width}")
+        self.logger.debug(f"LENGTH       : {length}")
+        self.logger.debug(f"UNSIGNED     : {unsigned}")
+        self.logger.debug(f"SHIFT        : {shift}")
+        self.logger.debug(f"ROUNDING     : {rounding}")
+        self.logger.debug(f"SATURATION   : {saturation}")
+        self.logger.debug(f"OUTPUT_WIDTH : {output_width}")
+        self.logger.debug(f"===================================================")
+
+        signed       = not unsigned
+        self.latency = latency = dot_latency(length)
+        depth        = latency + 2
+        product_range, sum_ranges = dot_ranges(a_width, b_width, length, signed)
+
+        # Input: one beat per clock when the output FIFO has room for all sums in flight.
+        self.submodules.fifo = fifo = SyncFIFO(output_width + 1, depth)
+        inflight = Signal(max=depth + 1)
+        accept   = Signal()
+        output   = Signal()
+        self.comb += [
+            s_axis.ready.eq(((fifo.level + inflight) < depth) & ~ResetSignal()),
+            accept.eq(s_axis.valid & s_axis.ready),
+        ]
+        self.sync += [
+            If(accept & s_axis.last & ~output,
+                inflight.eq(inflight + 1)
+            ).Elif(output & ~(accept & s_axis.last),
+                inflight.eq(inflight - 1)
             )
+        ]
+
+        # Control (valid, clear, last) delayed to the last partial sum: skew + DSP38 registers + sum.
+        control = [Signal(3, name=f"control_{i}") for i in range(length + 2)]
+        self.sync += control[0].eq(Cat(accept, s_axis.user[0], s_axis.last))
+        for i in range(1, length + 2):
+            self.sync += control[i].eq(control[i - 1])
+
+        # Systolic Chain.
+        partial = None
+        for i in range(length):
+            # Operands of lane i, skewed by i clocks (invalid beats are multiplied too: dropped by control).
+            a = Signal(bits_sign=(a_width, signed), name=f"a_{i}")
+            b = Signal(bits_sign=(b_width, signed), name=f"b_{i}")
+            self.comb += [
+                a.eq(s_axis.data[i*a_width:(i + 1)*a_width]),
+                b.eq(s_axis.data[length*a_width + i*b_width:length*a_width + (i + 1)*b_width]),
+            ]
+            for k in range(i):
+                a_skew = Signal.like(a, name=f"a_{i}_skew_{k}")
+                b_skew = Signal.like(b, name=f"b_{i}_skew_{k}")
+                self.sync += [a_skew.eq(a), b_skew.eq(b)]
+                a, b = a_skew, b_skew
+
+            # Lane product (DSP38 input and output registers), operands sign-extended when signed.
+            dsp_a = Signal(bits_sign=(DSP_A_WIDTH, signed), name=f"dsp_a_{i}")
+            dsp_b = Signal(bits_sign=(DSP_B_WIDTH, signed), name=f"dsp_b_{i}")
+            z     = Signal(38, name=f"z_{i}")
+            p     = Signal(bits_sign=bits_for_range(*product_range), name=f"p_{i}")
+            self.comb += [dsp_a.eq(a), dsp_b.eq(b), p.eq(z[:len(p)])]
+            # Module instance.
+            # ----------------
             self.specials += Instance("DSP38",
                 # Parameters.
                 # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
+                # Mode Bits to configure DSP
+                p_DSP_MODE      = "MULTIPLY",
+                p_OUTPUT_REG_EN = "TRUE",
+                p_INPUT_REG_EN  = "TRUE",
+
+                # Reset
+                i_CLK           = ClockSignal(),
+                i_RESET         = ResetSignal(),
+
                 # IOs
-                i_A             = self.a2,
-                i_B             = self.b4,
-                o_Z             = self.z15,  
+                i_A             = dsp_a,
+                i_B             = dsp_b,
+                o_Z             = z,
                 i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a2_sign,
-                i_UNSIGNED_B    = b3_sign
+                i_UNSIGNED_A    = unsigned,
+                i_UNSIGNED_B    = unsigned
             )
-            self.specials += Instance("DSP38",
-                # Parameters.
-                # -----------
-                # Mode Bits to configure DSP 
-                p_DSP_MODE     =  "MULTIPLY",
-                p_OUTPUT_REG_EN = "FALSE",
-                p_INPUT_REG_EN = "FALSE",
-                # IOs
-                i_A             = self.a4,
-                i_B             = self.b4,
-                o_Z             = self.z16,  
-                i_FEEDBACK      = 0,
-                i_UNSIGNED_A    = a3_sign,
-                i_UNSIGNED_B    = b3_sign
+
+            # Partial sum of lanes 0..i (one register per lane).
+            s = Signal(bits_sign=bits_for_range(*sum_ranges[i]), name=f"sum_{i}")
+            self.sync += s.eq(p if (partial is None) else partial + p)
+            partial = s
+
+        # Accumulator: new sum on clear or after tlast.
+        valid, clear, last = control[-1][0], control[-1][1], control[-1][2]
+        acc  = Signal(bits_sign=(DOT_ACC_WIDTH, signed))
+        done = Signal(reset=1)
+        self.sync += [
+            If(valid,
+                acc.eq(Mux(clear | done, 0, acc) + partial),
+                done.eq(last)
+            ),
+            output.eq(valid & last)
+        ]
+
+        # Output: shift right, round, saturate (DSP38 SHIFT_RIGHT/ROUND/SATURATE).
+        shifted = Signal(bits_sign=(DOT_ACC_WIDTH + 1, signed))
+        result  = Signal(output_width)
+        if (rounding and shift):
+            self.comb += shifted.eq((acc >> shift) + acc[shift - 1])
+        else:
+            self.comb += shifted.eq(acc >> shift)
+        low, high = operand_range(output_width, signed)
+        if saturation:
+            self.comb += If(shifted > high,
+                result.eq(high & ((1 << output_width) - 1))
+            ).Elif(shifted < low,
+                result.eq(low & ((1 << output_width) - 1))
+            ).Else(
+                result.eq(shifted)
             )
+        else:
+            self.comb += result.eq(shifted)
+        self.comb += [
+            fifo.we.eq(output),
+            fifo.din.eq(Cat(result, 1)),
+            m_axis.valid.eq(fifo.readable),
+            fifo.re.eq(m_axis.ready),
+            Cat(m_axis.data, m_axis.last).eq(fifo.dout),
+        ]
 
 # RS_DSP_MULT ---------------------------------------------------------------------------------------
 class RS_DSP_MULT20_pipeline(Module):
@@ -3240,16 +298,16 @@ class RS_DSP_MULT20_pipeline(Module):
         # ---------------------        
         self.logger = logging.getLogger("\tDSP38")
         
-        self.logger.propagate = False
+        self.logger.propagate = True
 
         # Input A.
-        self.logger.info(f"INPUT_A  : {a_width}")
+        self.logger.debug(f"INPUT_A  : {a_width}")
 
         # Input B.
-        self.logger.info(f"INPUT_B  : {b_width}")
+        self.logger.debug(f"INPUT_B  : {b_width}")
 
         # Equation.
-        self.logger.info(f"EQUATION  : {equation}")
+        self.logger.debug(f"EQUATION  : {equation}")
         
         if(unsigned == 1):
             k = 18
@@ -3276,7 +334,7 @@ class RS_DSP_MULT20_pipeline(Module):
               self.a0 = Cat(self.a[0:k], Replicate(0, 3))
               a1_sign = 0
               self.a1 = Cat(self.a[k:a_width], Replicate(self.a[a_width - 1],k*2-a_width+3))
-        if (a_width <= k):
+        elif (a_width <= k):
             self.a1 =  Replicate(0,20)
             if(unsigned):
                 self.a0 = Cat(self.a[0:a_width], Replicate(0,k-a_width+1))
@@ -3295,7 +353,7 @@ class RS_DSP_MULT20_pipeline(Module):
               self.b0 = Cat(self.b[0:k], Replicate(0,1))
               b1_sign = 0
               self.b1 = Cat(self.b[k:b_width], Replicate(self.b[b_width - 1],k*2-b_width+1))
-        if (b_width <= k):
+        elif (b_width <= k):
             self.b1 =  Replicate(0,18)
             if(unsigned):
                 self.b0 = Cat(self.b[0:b_width], Replicate(0,k-b_width+1))
@@ -3405,16 +463,16 @@ class RS_DSP_MULT36_pipeline(Module):
         # ---------------------        
         self.logger = logging.getLogger("\tDSP38")
         
-        self.logger.propagate = False
+        self.logger.propagate = True
 
         # Input A.
-        self.logger.info(f"INPUT_A  : {a_width}")
+        self.logger.debug(f"INPUT_A  : {a_width}")
 
         # Input B.
-        self.logger.info(f"INPUT_B  : {b_width}")
+        self.logger.debug(f"INPUT_B  : {b_width}")
 
         # Equation.
-        self.logger.info(f"EQUATION  : {equation}")
+        self.logger.debug(f"EQUATION  : {equation}")
         
         if (unsigned == False):
             k = 17
@@ -3710,16 +768,16 @@ class RS_DSP_MULT54_pipeline(Module):
         # ---------------------        
         self.logger = logging.getLogger("\tDSP38")
         
-        self.logger.propagate = False
+        self.logger.propagate = True
 
         # Input A.
-        self.logger.info(f"INPUT_A  : {a_width}")
+        self.logger.debug(f"INPUT_A  : {a_width}")
 
         # Input B.
-        self.logger.info(f"INPUT_B  : {b_width}")
+        self.logger.debug(f"INPUT_B  : {b_width}")
 
         # Equation.
-        self.logger.info(f"EQUATION  : {equation}")
+        self.logger.debug(f"EQUATION  : {equation}")
         
         if(unsigned == False):
             k = 17
@@ -4133,16 +1191,16 @@ class RS_DSP_MULT20_enhance(Module):
         # ---------------------        
         self.logger = logging.getLogger("\tDSP38")
         
-        self.logger.propagate = False
+        self.logger.propagate = True
 
         # Input A.
-        self.logger.info(f"INPUT_A  : {a_width}")
+        self.logger.debug(f"INPUT_A  : {a_width}")
 
         # Input B.
-        self.logger.info(f"INPUT_B  : {b_width}")
+        self.logger.debug(f"INPUT_B  : {b_width}")
 
         # Equation.
-        self.logger.info(f"EQUATION  : {equation}")
+        self.logger.debug(f"EQUATION  : {equation}")
         
         if (unsigned == True):
             k = 17
@@ -4165,7 +1223,7 @@ class RS_DSP_MULT20_enhance(Module):
               self.a0 = Cat(self.a[0:k], Replicate(0,4))
               a1_sign = 0
               self.a1 = Cat(self.a[k:a_width], Replicate(self.a[a_width - 1],k*2-a_width+4))
-        if (a_width <= k):
+        elif (a_width <= k):
             self.a1 =  Replicate(0,20)
             if(unsigned):
                 self.a0 = Cat(self.a[0:a_width], Replicate(0,k-a_width+1))
@@ -4184,7 +1242,7 @@ class RS_DSP_MULT20_enhance(Module):
               b1_sign = 0
               self.b0 = Cat(self.b[0:k], Replicate(0, 2))
               self.b1 = Cat(self.b[k:b_width], Replicate(self.b[b_width - 1],k*2-b_width+2))
-        if (b_width <= k):
+        elif (b_width <= k):
             self.b1 =  Replicate(0,18)
             if(unsigned):
                 self.b0 = Cat(self.b[0:b_width], Replicate(0,k-b_width+1))
@@ -4466,16 +1524,16 @@ class RS_DSP_MULT36_enhance(Module):
         # ---------------------        
         self.logger = logging.getLogger("\tDSP38")
         
-        self.logger.propagate = False
+        self.logger.propagate = True
 
         # Input A.
-        self.logger.info(f"INPUT_A  : {a_width}")
+        self.logger.debug(f"INPUT_A  : {a_width}")
 
         # Input B.
-        self.logger.info(f"INPUT_B  : {b_width}")
+        self.logger.debug(f"INPUT_B  : {b_width}")
 
         # Equation.
-        self.logger.info(f"EQUATION  : {equation}")
+        self.logger.debug(f"EQUATION  : {equation}")
         if(unsigned == True):
             k = 17
         else:
@@ -5012,16 +2070,16 @@ class RS_DSP_MULT54_enhance(Module):
         # ---------------------        
         self.logger = logging.getLogger("\tDSP38")
         
-        self.logger.propagate = False
+        self.logger.propagate = True
 
         # Input A.
-        self.logger.info(f"INPUT_A  : {a_width}")
+        self.logger.debug(f"INPUT_A  : {a_width}")
 
         # Input B.
-        self.logger.info(f"INPUT_B  : {b_width}")
+        self.logger.debug(f"INPUT_B  : {b_width}")
 
         # Equation.
-        self.logger.info(f"EQUATION  : {equation}")
+        self.logger.debug(f"EQUATION  : {equation}")
         
         if(unsigned == True):
             k = 17
@@ -0,0 +1,129 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# DSP generator bit-accurate reference model (NumPy, no migen): predicts z of the generated wrapper
+# from the generator parameters, vectorized over the operand vectors (Python integer NumPy arrays:
+# products up to 72x72 do not fit int64).
+#
+# z:        sum of products of the operands (signed: two's complement of their width) modulo
+#           2^z_width, as an unsigned z_width bits pattern.
+# Timing:   operands held for interval clocks, z of a vector valid latency clocks after its last
+#           clock (interval 1: latency clocks after the operands).
+# Tiled:    interval 1, latency reg_in + reg_out + adder stages (dsp_tiling.py plan).
+# Enhanced: interval 1, latency reg_in + reg_out.
+# Pipeline: RS_DSP_MULT*_pipeline time-multiplex their DSP38s on a free-running 2/3/4 phases
+#           counter: operands held for 2 counter periods (whatever the phase they arrive on), then z
+#           on the wrapper output register (reg_out: latency 1).
+# Dot:      systolic dot product (dsp_dot.py), sums of the s_axis beats accumulated on DOT_ACC_WIDTH
+#           bits until tlast (tuser[0]: clear), one m_axis beat per tlast, latency dot_latency.
+
+import numpy as np
+
+from litex_wrapper.dsp_tiling import equation_products, equation_z_width, plan, tiled
+from litex_wrapper.dsp_dot import DOT_ACC_WIDTH, dot_latency, dot_output
+
+# Pipeline -----------------------------------------------------------------------------------------
+
+def pipeline_phases(a_width, b_width, unsigned):
+    # Counter phases of the RS_DSP_MULT20/36/54_pipeline module selected by the wrapper.
+    # (a_width, b_width) ranges (low, high] of each module, largest first.
+    limits = [(54, 54, 72, 4), (36, 36, 54, 3), (20, 18, 36, 2)] if unsigned else [(51, 51, 72, 4), (34, 34, 51, 3), (20, 18, 34, 2)]
+    for a_low, b_low, high, phases in limits:
+        if (a_low < a_width <= high) or (b_low < b_width <= high):
+            return phases
+    return 0
+
+# DSP Model ----------------------------------------------------------------------------------------
+
+class DSPModel:
+    def __init__(self, a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width, equation, reg_in, reg_out, unsigned, feature,
+        adder_stages=0, objective="DSPs"):
+        self.signed   = not unsigned
+        self.products = equation_products(equation, a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width)
+        self.z_width  = equation_z_width(equation, a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width)
+
+        # Implementation and timing (see dsp_generator_wrapper.get_dsp_core).
+        if tiled(equation, feature, a_width, b_width):
+            self.core     = "Tiled"
+            stages        = adder_stages if (feature == "Base") else 0
+            self.interval = 1
+            self.latency  = plan(self.products, self.signed, reg_in, reg_out, stages, objective)["latency"]
+        elif (feature == "Enhanced"):
+            self.core     = "Enhanced"
+            self.interval = 1
+            self.latency  = int(bool(reg_in)) + int(bool(reg_out))
+        else:
+            self.core     = "Pipeline"
+            self.interval = 2*pipeline_phases(a_width, b_width, unsigned)
+            self.latency  = 0
+        # Wrapper output register (Pipeline feature).
+        if (feature == "Pipeline") and reg_out:
+            self.latency += 1
+
+    def operand(self, values, width):
+        values = np.asarray(values, dtype=object) & ((1 << width) - 1)
+        if self.signed:
+            sign = 1 << (width - 1)
+            return (values ^ sign) - sign
+        return values
+
+    def process(self, **operands):
+        # z of each vector of operands (a=..., b=..., c=... arrays of the same length, ints taken
+        # modulo 2^width: signed or unsigned values of the operand width).
+        z = 0
+        for x, x_width, y, y_width in self.products:
+            z = z + self.operand(operands[x], x_width)*self.operand(operands[y], y_width)
+        return np.asarray(z, dtype=object) & ((1 << self.z_width) - 1)
+
+# Dot Model ----------------------------------------------------------------------------------------
+
+class DotModel:
+    def __init__(self, a_width, b_width, length, unsigned, shift=0, rounding=False, saturation=False, output_width=38):
+        self.a_width      = a_width
+        self.b_width      = b_width
+        self.length       = length
+        self.signed       = not unsigned
+        self.shift        = shift
+        self.rounding     = rounding
+        self.saturation   = saturation
+        self.output_width = output_width
+        self.latency      = dot_latency(length)
+        self.reset()
+
+    def reset(self):
+        # Accumulator and new sum flag (set after reset and tlast).
+        self.acc  = 0
+        self.done = True
+
+    def wrap(self, values, width):
+        values = values & ((1 << width) - 1)
+        if self.signed:
+            sign = 1 << (width - 1)
+            return (values ^ sign) - sign
+        return values
+
+    def process(self, a, b, clear, last):
+        # m_axis tdata (output_width bits patterns) for s_axis beats: a/b (beats x length operands,
+        # values of the operand width), clear/last (tuser[0]/tlast of each beat), continuing from
+        # previous calls (a sum without tlast is kept for the next call).
+        if len(last) == 0:
+            return np.zeros(0, dtype=object)
+        a     = self.wrap(np.asarray(a, dtype=object), self.a_width)
+        b     = self.wrap(np.asarray(b, dtype=object), self.b_width)
+        clear = np.asarray(clear, dtype=bool)
+        last  = np.asarray(last, dtype=bool)
+        dots  = (a*b).sum(axis=1)
+
+        # Sums: running sum restarted on clear and after tlast (first beat: previous call state).
+        start    = clear | np.concatenate([[self.done], last[:-1]])
+        running  = np.cumsum(dots)
+        index    = np.maximum.accumulate(np.where(start, np.arange(len(dots)), -1))
+        previous = np.where(index >= 0, np.concatenate([[0], running])[np.maximum(index, 0)], -self.acc)
+        sums     = self.wrap(running - previous, DOT_ACC_WIDTH)
+        self.acc  = sums[-1]
+        self.done = bool(last[-1])
+        return dot_output(sums[last], self.shift, self.rounding, self.saturation, self.output_width, self.signed)
@@ -0,0 +1,164 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# DSP38 multiplier tiling engine (pure Python, no migen): decomposes the products of a sum of products
+# (AxB, AxB+CxD, AxB+CxD+ExF+GxH, any widths up to 72x72, signed or unsigned) into DSP38 partial
+# products (20x18) and narrow fabric partial products, and plans the adder tree that sums them.
+# Used by the generator summary and by RS_DSP_MULT_TILED (dsp_litex_generator.py).
+#
+# Operand slices: DSP port width unsigned slices from the LSB, sign (signed operands) in the top slice.
+# Tile:           (x slice, y slice) partial product, x on the DSP38 A input (20-bit) and y on the B
+#                 input (18-bit), weight 2^(x offset + y offset).
+# Cost model:     DSP38 count vs adder tree depth (logic levels between registers: fmax). Each product
+#                 is tiled in both orientations, with narrow top slices (<= FABRIC_MAX_WIDTH bits) on
+#                 DSP38s or absorbed by one fabric partial product (saves a row/column of DSP38s, costs
+#                 one fabric adder level), the best combination for the objective is kept.
+
+import math
+import itertools
+
+# DSP38 --------------------------------------------------------------------------------------------
+
+DSP_A_WIDTH      = 20
+DSP_B_WIDTH      = 18
+FABRIC_MAX_WIDTH = 2    # Widest slice absorbed in fabric (DSPs objective).
+
+OBJECTIVES   = ["DSPs", "Fmax"]
+ADDER_STAGES = range(0, 8)
+
+# Operands -----------------------------------------------------------------------------------------
+
+def operand_range(width, signed):
+    if signed:
+        return (-(1 << (width - 1)), (1 << (width - 1)) - 1)
+    return (0, (1 << width) - 1)
+
+def slices(width, signed, port_width):
+    # (offset, width, signed) slices of an operand on a DSP38 port.
+    offsets = list(range(0, width, port_width))
+    return [(o, min(port_width, width - o), signed and (o + port_width >= width)) for o in offsets]
+
+def bits_for_range(low, high):
+    # (width, signed) of the narrowest signal holding [low, high].
+    if low >= 0:
+        return (max(high.bit_length(), 1), False)
+    return (max(high.bit_length(), (-low - 1).bit_length()) + 1, True)
+
+# Tiles --------------------------------------------------------------------------------------------
+
+def tile(x, y, xs, ys, dsp):
+    # x/y: operand names, xs/ys: (offset, width, signed) slices.
+    products = [a*b for a in operand_range(xs[1], xs[2]) for b in operand_range(ys[1], ys[2])]
+    return {
+        "x"     : (x,) + tuple(xs),
+        "y"     : (y,) + tuple(ys),
+        "shift" : xs[0] + ys[0],
+        "range" : (min(products), max(products)),
+        "dsp"   : dsp,
+    }
+
+def product_tilings(x, x_width, y, y_width, signed):
+    # Candidate tilings of x*y: both orientations, narrow top slices on DSP38s or in fabric.
+    candidates = []
+    for (p, p_width), (q, q_width) in [((x, x_width), (y, y_width)), ((y, y_width), (x, x_width))]:
+        p_slices = slices(p_width, signed, DSP_A_WIDTH)
+        q_slices = slices(q_width, signed, DSP_B_WIDTH)
+        for p_fabric, q_fabric in itertools.product([False, True], repeat=2):
+            if p_fabric and not (len(p_slices) > 1 and p_slices[-1][1] <= FABRIC_MAX_WIDTH):
+                continue
+            if q_fabric and not (len(q_slices) > 1 and q_slices[-1][1] <= FABRIC_MAX_WIDTH):
+                continue
+            p_dsp = p_slices[:-1] if p_fabric else p_slices
+            q_dsp = q_slices[:-1] if q_fabric else q_slices
+            tiles = [tile(p, q, ps, qs, True) for ps in p_dsp for qs in q_dsp]
+            # Fabric: top slice of p times all of q, then top slice of q times the rest of p.
+            if p_fabric:
+                tiles.append(tile(p, q, p_slices[-1], (0, q_width, signed), False))
+            if q_fabric:
+                rest = p_slices[-1][0] if p_fabric else p_width
+                tiles.append(tile(p, q, (0, rest, signed and not p_fabric), q_slices[-1], False))
+            candidates.append(tiles)
+    return candidates
+
+# Adder Tree ---------------------------------------------------------------------------------------
+
+def adder_levels(terms):
+    return math.ceil(math.log2(terms)) if terms > 1 else 0
+
+def stage_levels(levels, stages):
+    # Adder tree levels followed by a register (stages spread evenly, last one on the tree output).
+    return [round(k*levels/stages) for k in range(1, stages + 1)] if stages else []
+
+def critical_levels(levels, registered, fabric):
+    # Logic levels of the slowest register to register path (a fabric partial product counts as one
+    # adder level before the tree).
+    bounds = [0] + registered + ([levels] if levels not in registered else [])
+    longest = max([b - a for a, b in zip(bounds, bounds[1:])] + [0])
+    first   = registered[0] if registered else levels
+    return max(longest, first + (1 if fabric else 0))
+
+# Plan ---------------------------------------------------------------------------------------------
+
+def plan(products, signed, reg_in=False, reg_out=False, adder_stages=0, objective="DSPs"):
+    # products: [(x, x_width, y, y_width)]. Returns the tiles of the best tiling for objective with its
+    # cost: DSP38/fabric partial product counts, adder tree levels, registered levels and latency.
+    best = None
+    for tiling in itertools.product(*[product_tilings(x, xw, y, yw, signed) for x, xw, y, yw in products]):
+        tiles   = [t for product in tiling for t in product]
+        dsps    = sum(t["dsp"] for t in tiles)
+        fabric  = len(tiles) - dsps
+        levels  = adder_levels(len(tiles))
+        depth   = levels + (1 if fabric else 0)
+        cost    = (dsps, depth) if objective == "DSPs" else (depth, dsps)
+        if (best is None) or (cost < best[0]):
+            best = (cost, tiles, dsps, fabric, levels)
+    _, tiles, dsps, fabric, levels = best
+    stages     = min(adder_stages, levels)
+    registered = stage_levels(levels, stages)
+    return {
+        "tiles"      : tiles,
+        "dsps"       : dsps,
+        "fabric"     : fabric,
+        "levels"     : levels,
+        "registered" : registered,
+        "critical"   : critical_levels(levels, registered, fabric),
+        "latency"    : int(bool(reg_in)) + int(bool(reg_out)) + stages,
+    }
+
+def equation_products(equation, a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width):
+    products = [("a", a_width, "b", b_width)]
+    if equation in ["AxB+CxD", "AxB+CxD+ExF+GxH"]:
+        products.append(("c", c_width, "d", d_width))
+    if equation == "AxB+CxD+ExF+GxH":
+        products += [("e", e_width, "f", f_width), ("g", g_width, "h", h_width)]
+    return products
+
+def tiled(equation, feature, a_width, b_width):
+    # Sums of products, Base feature and single DSP38 products (up to 20x18) use the tiling engine,
+    # larger Enhanced/Pipeline products the RS_DSP_MULT*_enhance/_pipeline modules.
+    return (equation != "AxB") or (feature == "Base") or ((a_width <= DSP_A_WIDTH) and (b_width <= DSP_B_WIDTH))
+
+def equation_z_width(equation, a_width, b_width, c_width, d_width, e_width, f_width, g_width, h_width):
+    # Output width: products width, +1 bit per level of sum (z is the sum modulo 2^z_width).
+    z_ab = a_width + b_width
+    if equation == "AxB":
+        return z_ab
+    z_cd = c_width + d_width
+    if equation == "AxB+CxD":
+        return max(z_ab, z_cd) + 1
+    z_ef = e_width + f_width
+    z_gh = g_width + h_width
+    return max(z_ab, z_cd, z_ef, z_gh) + 2
+
+def summary(plan):
+    return {
+        "Count of DSPs"             : str(plan["dsps"]),
+        "Fabric Partial Products"   : str(plan["fabric"]),
+        "Adder Tree Levels"         : str(plan["levels"]),
+        "Adder Levels per Stage"    : str(plan["critical"]),
+        "Latency (clock cycles)"    : str(plan["latency"]),
+    }
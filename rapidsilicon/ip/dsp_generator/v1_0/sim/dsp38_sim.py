@@ -0,0 +1,161 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# DSP38 behavioral stand-in for the migen simulator (port of DSP38.v): DSP38 Instances are black
+# boxes for migen, use_dsp38_sim(module) makes the Instance("DSP38", ...) calls of a generator module
+# elaborate DSP38Sim modules instead, so generated netlists can be simulated without a Verilog
+# simulator (see dsp_equivalence.py).
+
+from migen import *
+from migen.fhdl.specials import Special
+
+# DSP38 --------------------------------------------------------------------------------------------
+
+def sign_extend(value, width, target=64):
+    return Cat(value, Replicate(value[width - 1], target - width))
+
+class DSP38Sim(Module):
+    def __init__(self, DSP_MODE="MULTIPLY_ACCUMULATE", COEFF=(0, 0, 0, 0), OUTPUT_REG_EN="TRUE", INPUT_REG_EN="TRUE", ports={}):
+        mac = (DSP_MODE == "MULTIPLY_ACCUMULATE")
+
+        # Inputs (unconnected inputs at 0).
+        def port(name, width):
+            s = Signal(width, name=name.lower())
+            self.comb += s.eq(ports.get(name, 0))
+            return s
+        A, B, acc_fir, feedback, load_acc = port("A", 20), port("B", 18), port("ACC_FIR", 6), port("FEEDBACK", 3), port("LOAD_ACC", 1)
+        saturate, shift_right, rnd, subtract = port("SATURATE", 1), port("SHIFT_RIGHT", 6), port("ROUND", 1), port("SUBTRACT", 1)
+        unsigned_a, unsigned_b = port("UNSIGNED_A", 1), port("UNSIGNED_B", 1)
+
+        # Input registers (shift/round/saturate: 2 stages in MULTIPLY_ACCUMULATE).
+        regs = {}
+        for name, sig in [("a", A), ("b", B), ("acc_fir", acc_fir), ("feedback", feedback), ("load_acc", load_acc),
+            ("subtract", subtract), ("unsigned_a", unsigned_a), ("unsigned_b", unsigned_b)]:
+            regs[name] = Signal(len(sig), reset=int(name.startswith("unsigned")), name=name + "_reg")
+            self.sync += regs[name].eq(sig)
+        delayed = {}
+        for name, sig in [("shift_right", shift_right), ("round", rnd), ("saturate", saturate)]:
+            reg1 = Signal(len(sig), name=name + "_reg1")
+            reg2 = Signal(len(sig), name=name + "_reg2")
+            self.sync += [reg1.eq(sig), reg2.eq(reg1)]
+            delayed[name] = (sig, reg1, reg2)
+        if INPUT_REG_EN == "TRUE":
+            a, b, acc_fir, feedback, load_acc = regs["a"], regs["b"], regs["acc_fir"], regs["feedback"], regs["load_acc"]
+            subtract, unsigned_a, unsigned_b  = regs["subtract"], regs["unsigned_a"], regs["unsigned_b"]
+            shift_right, rnd, saturate = [delayed[n][2 if mac else 1] for n in ["shift_right", "round", "saturate"]]
+        else:
+            a, b = A, B
+            shift_right, rnd, saturate = [delayed[n][1 if mac else 0] for n in ["shift_right", "round", "saturate"]]
+
+        # Feedback paths.
+        accumulator = Signal((64, True))
+        add_sub_in  = Signal((64, True))
+        mult_a      = Signal(20)
+        mult_b      = Signal(18)
+        a_shifted   = Signal((64, True))
+        self.comb += If(unsigned_a,
+            a_shifted.eq(a << acc_fir)
+        ).Else(
+            a_shifted.eq(sign_extend(a, 20) << acc_fir)
+        )
+        cases = {
+            0: [mult_a.eq(a), mult_b.eq(b), add_sub_in.eq(accumulator)],
+            1: [mult_a.eq(a), mult_b.eq(b), add_sub_in.eq(0)],
+            2: [mult_a.eq(a), mult_b.eq(0), add_sub_in.eq(a_shifted)],
+            3: [mult_a.eq(accumulator), mult_b.eq(b), add_sub_in.eq(a_shifted)],
+        }
+        for i in range(4):
+            cases[4 + i] = [mult_a.eq(COEFF[i]), mult_b.eq(b), add_sub_in.eq(a_shifted)]
+        self.comb += Case(feedback, cases)
+
+        # Multiplier/Adder-Subtractor/Accumulator.
+        ma = Signal((21, True))
+        mb = Signal((19, True))
+        mult_out    = Signal((64, True))
+        add_sub_out = Signal((64, True))
+        self.comb += [
+            If(unsigned_a, ma.eq(mult_a)).Else(ma.eq(sign_extend(mult_a, 20, 21))),
+            If(unsigned_b, mb.eq(mult_b)).Else(mb.eq(sign_extend(mult_b, 18, 19))),
+            mult_out.eq(ma*mb),
+            If(subtract,
+                add_sub_out.eq(add_sub_in - mult_out)
+            ).Else(
+                add_sub_out.eq(add_sub_in + mult_out)
+            )
+        ]
+        self.sync += If(load_acc, accumulator.eq(add_sub_out))
+
+        # Shift/Round/Saturate.
+        pre_shift   = Signal((64, True))
+        shifted     = Signal((64, True))
+        round_shift = Signal(6)
+        rounded     = Signal((64, True))
+        z_out       = Signal(38)
+        self.comb += [
+            pre_shift.eq(accumulator if mac else add_sub_out),
+            shifted.eq(pre_shift >> shift_right),
+            round_shift.eq(shift_right - 1),
+            rounded.eq(shifted + (rnd & (shift_right != 0) & (pre_shift >> round_shift)[0])),
+        ]
+        if DSP_MODE == "MULTIPLY":
+            self.comb += z_out.eq(mult_out)
+        else:
+            self.comb += If(saturate,
+                If(unsigned_a & unsigned_b,
+                    If(rounded < 0, z_out.eq(0)
+                    ).Elif(rounded > 0x3fffffffff, z_out.eq(0x3fffffffff)
+                    ).Else(z_out.eq(rounded))
+                ).Else(
+                    If(rounded > 0x1fffffffff, z_out.eq(0x1fffffffff)
+                    ).Elif(rounded < -0x2000000000, z_out.eq(0x2000000000)
+                    ).Else(z_out.eq(rounded))
+                )
+            ).Else(z_out.eq(rounded))
+
+        # Output register.
+        z_out_reg = Signal(38)
+        dly_b     = Signal(18)
+        self.sync += [z_out_reg.eq(z_out), dly_b.eq(B)]
+        if "Z" in ports:
+            self.comb += ports["Z"].eq(z_out_reg if OUTPUT_REG_EN == "TRUE" else z_out)
+        if "DLY_B" in ports:
+            self.comb += ports["DLY_B"].eq(dly_b)
+
+# Instance Substitution ----------------------------------------------------------------------------
+
+class _Elaborated(Special):
+    # Placeholder returned to "self.specials +=": the stand-in is added as a submodule instead.
+    def iter_expressions(self):
+        return iter([])
+
+def parameter(value):
+    return getattr(value, "value", value)
+
+def use_dsp38_sim(module):
+    # Replace module.Instance: DSP38 Instances become DSP38Sim submodules (collected in the returned
+    # list: add them to the simulated top), other Instances are not supported.
+    stand_ins = []
+    def instance(of, **kwargs):
+        assert of == "DSP38", f"{of} has no simulation stand-in"
+        params = {k[2:]: parameter(v) for k, v in kwargs.items() if k.startswith("p_")}
+        ports  = {k[2:]: v for k, v in kwargs.items() if k.startswith(("i_", "o_"))}
+        stand_ins.append(DSP38Sim(
+            DSP_MODE      = params.get("DSP_MODE", "MULTIPLY_ACCUMULATE"),
+            COEFF         = tuple(int(params.get(f"COEFF_{i}", 0)) for i in range(4)),
+            OUTPUT_REG_EN = params.get("OUTPUT_REG_EN", "TRUE"),
+            INPUT_REG_EN  = params.get("INPUT_REG_EN", "TRUE"),
+            ports         = ports,
+        ))
+        return _Elaborated()
+    module.Instance = instance
+    return stand_ins
+
+def remove_placeholders(module):
+    # Drop the placeholders of a module (and its submodules) before simulation.
+    fragment = module.get_fragment()
+    fragment.specials = set(s for s in fragment.specials if not isinstance(s, _Elaborated))
+    return fragment
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# DSP generator equivalence harness: elaborates dsp_generator configurations (the DSP module of
+# the wrapper, DSP38s replaced by the dsp38_sim.py stand-in), simulates batches of random operand
+# vectors with the migen simulator and compares z with the reference model (dsp_model.py).
+#
+# Configurations: (a_width, b_width, feature, reg_in, reg_out, unsigned) over the modules width
+# boundaries, plus AxB+CxD/AxB+CxD+ExF+GxH (Base) and dot products (AXI-Stream, back-to-back beats
+# then random tvalid gaps/tready backpressure, latency and beat interval measured), --configs random
+# ones of the sweep (0: all).
+# Report: per configuration mismatches and simulation throughput (vectors/s), exit code 1 on
+# mismatch.
+#
+# ./dsp_equivalence.py --configs 16 --vectors 64 --seed 1
+
+import os
+import sys
+import time
+import random
+import argparse
+import itertools
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from migen import *
+from migen.sim import run_simulation
+
+from litex.soc.interconnect.axi import AXIStreamInterface
+
+import litex_wrapper.dsp_litex_generator as dsp_litex_generator
+
+from litex_wrapper.dsp_generator_wrapper import get_dsp_core
+from litex_wrapper.dsp_model import DSPModel, DotModel
+
+from dsp38_sim import use_dsp38_sim, remove_placeholders
+
+# Configurations -----------------------------------------------------------------------------------
+
+FEATURES  = ["Base", "Enhanced", "Pipeline"]
+EQUATIONS = ["AxB", "AxB+CxD", "AxB+CxD+ExF+GxH", "dot"]
+
+# Widths around the DSP38 ports and the RS_DSP_MULT*_enhance/_pipeline ranges.
+WIDTHS = [1, 7, 18, 19, 20, 21, 30, 34, 35, 36, 37, 48, 51, 52, 54, 55, 64, 68, 72]
+
+def max_width(feature, unsigned):
+    # Widest operand of a feature (dsp_generator_gen.py choices).
+    if (feature == "Enhanced"):
+        return 68 if unsigned else 64
+    if (feature == "Pipeline") and not unsigned:
+        return 68
+    return 72
+
+def sweep():
+    configs = []
+    for feature, unsigned, (reg_in, reg_out) in itertools.product(FEATURES, [True, False], itertools.product([False, True], repeat=2)):
+        if (feature == "Pipeline") and not reg_in:
+            continue  # Pipeline always registers its inputs.
+        limit  = max_width(feature, unsigned)
+        widths = [w for w in WIDTHS if w <= limit]
+        for a_width, b_width in itertools.product(widths, repeat=2):
+            configs.append(dict(equation="AxB", feature=feature, unsigned=unsigned, reg_in=reg_in, reg_out=reg_out,
+                widths=(a_width, b_width) + (1,)*6, adder_stages=0))
+        if (feature == "Base"):
+            for equation, adder_stages in itertools.product(EQUATIONS[1:3], [0, 2]):
+                for widths in [(20, 18)*4, (7, 30, 36, 19, 1, 52, 21, 18), (72, 72, 72, 72, 18, 20, 34, 35)]:
+                    configs.append(dict(equation=equation, feature=feature, unsigned=unsigned, reg_in=reg_in, reg_out=reg_out,
+                        widths=widths, adder_stages=adder_stages))
+    for unsigned, length, (a_width, b_width), (shift, rounding, saturation, output_width) in itertools.product([True, False], [2, 5, 16],
+        [(20, 18), (7, 3)], [(0, False, False, 38), (6, True, True, 16), (3, False, True, 64), (4, True, False, 9)]):
+        configs.append(dict(equation="dot", feature="Base", unsigned=unsigned, reg_in=True, reg_out=True, widths=(a_width, b_width) + (1,)*6,
+            adder_stages=0, dot=dict(length=length, shift=shift, rounding=rounding, saturation=saturation, output_width=output_width)))
+    return configs
+
+# Vectors ------------------------------------------------------------------------------------------
+
+def operand_vectors(rng, width, unsigned, count):
+    # Random values of the operand width with its corner values (0, 1, min, max, -1) first.
+    low, high = (0, (1 << width) - 1) if unsigned else (-(1 << (width - 1)), (1 << (width - 1)) - 1)
+    corners   = sorted(set(v for v in [0, 1, low, high, -1] if low <= v <= high))
+    return (corners + [rng.randint(low, high) for _ in range(count)])[:count]
+
+# Equivalence --------------------------------------------------------------------------------------
+
+def run(config, vectors, rng):
+    if (config["equation"] == "dot"):
+        return run_dot(config, vectors, rng)
+    params = dict(equation=config["equation"], reg_in=config["reg_in"], reg_out=config["reg_out"], unsigned=config["unsigned"],
+        feature=config["feature"], adder_stages=config["adder_stages"])
+    model = DSPModel(*config["widths"], **params)
+
+    # DSP module of the wrapper (with the Pipeline output register) on DSP38 stand-ins.
+    stand_ins   = use_dsp38_sim(dsp_litex_generator)
+    dsp, reg_in = get_dsp_core(*config["widths"], **params)
+    top = Module()
+    top.clock_domains.cd_sys = ClockDomain()
+    top.submodules.dsp = dsp
+    top.submodules += stand_ins
+    z = Signal(len(dsp.z))
+    if (config["feature"] == "Pipeline") and config["reg_out"]:
+        top.sync += z.eq(dsp.z)
+    else:
+        top.comb += z.eq(dsp.z)
+    fragment = remove_placeholders(top)
+
+    # Operands held for interval clocks, z of vector i read latency clocks after its last clock.
+    operands = {}
+    for x, x_width, y, y_width in model.products:
+        operands[x] = operand_vectors(rng, x_width, config["unsigned"], vectors)
+        operands[y] = operand_vectors(rng, y_width, config["unsigned"], vectors)
+    expected = model.process(**operands)
+    samples  = {(i + 1)*model.interval - 1 + model.latency: i for i in range(vectors)}
+    results  = {}
+    def generator():
+        for cycle in range(vectors*model.interval + model.latency):
+            i = min(cycle//model.interval, vectors - 1)
+            for name, values in operands.items():
+                yield getattr(dsp, name).eq(values[i])
+            yield
+            if cycle in samples:
+                results[samples[cycle]] = (yield z) & ((1 << model.z_width) - 1)
+
+    start = time.perf_counter()
+    run_simulation(fragment, generator())
+    duration = time.perf_counter() - start
+
+    mismatches = [i for i in range(vectors) if results[i] != expected[i]]
+    first = None
+    if mismatches:
+        i = mismatches[0]
+        first = {**{x: operands[x][i] for x in operands}, "z": hex(results[i]), "expected": hex(expected[i])}
+    return {
+        "core"       : model.core,
+        "latency"    : model.latency,
+        "interval"   : model.interval,
+        "mismatches" : len(mismatches),
+        "first"      : first,
+        "throughput" : vectors/duration,
+    }
+
+def run_dot(config, vectors, rng):
+    # vectors: s_axis beats (random clear/tlast, last beat with tlast).
+    a_width, b_width = config["widths"][:2]
+    dot    = config["dot"]
+    length = dot["length"]
+    model  = DotModel(a_width, b_width, unsigned=config["unsigned"], **dot)
+
+    stand_ins = use_dsp38_sim(dsp_litex_generator)
+    s_axis = AXIStreamInterface(data_width=length*(a_width + b_width), user_width=1)
+    m_axis = AXIStreamInterface(data_width=dot["output_width"])
+    top = Module()
+    top.clock_domains.cd_sys = ClockDomain()
+    top.submodules.dsp = dsp_litex_generator.RS_DSP_DOT(s_axis, m_axis, a_width, b_width, unsigned=config["unsigned"], **dot)
+    top.submodules += stand_ins
+    fragment = remove_placeholders(top)
+
+    a = [operand_vectors(rng, a_width, config["unsigned"], vectors) for _ in range(length)]
+    b = [operand_vectors(rng, b_width, config["unsigned"], vectors) for _ in range(length)]
+    for lane in a + b:
+        rng.shuffle(lane)
+    clear = [rng.random() < 0.1 for _ in range(vectors)]
+    last  = [rng.random() < 0.3 for _ in range(vectors - 1)] + [True]
+    data  = [sum(((a[i][k] & ((1 << a_width) - 1)) << (i*a_width)) | ((b[i][k] & ((1 << b_width) - 1)) << (length*a_width + i*b_width))
+        for i in range(length)) for k in range(vectors)]
+    expected = model.process([[a[i][k] for i in range(length)] for k in range(vectors)], [[b[i][k] for i in range(length)] for k in range(vectors)],
+        clear, last)
+
+    # First half back-to-back (tvalid/tready always set), then random tvalid gaps and backpressure.
+    beats    = []
+    accepted = []
+    results  = []
+    def source():
+        cycle = 0
+        for k in range(vectors):
+            while (k >= vectors//2) and (rng.random() < 0.3):
+                yield s_axis.valid.eq(0)
+                yield
+                cycle += 1
+            yield s_axis.data.eq(data[k])
+            yield s_axis.user.eq(clear[k])
+            yield s_axis.last.eq(last[k])
+            yield s_axis.valid.eq(1)
+            yield
+            cycle += 1
+            while not (yield s_axis.ready):
+                yield
+                cycle += 1
+            beats.append(cycle)
+            if last[k]:
+                accepted.append(cycle)
+        yield s_axis.valid.eq(0)
+    def sink():
+        cycle = 0
+        while len(results) < len(expected):
+            ready = (len(beats) < vectors//2) or (rng.random() < 0.7)
+            yield m_axis.ready.eq(ready)
+            yield
+            cycle += 1
+            if ready and (yield m_axis.valid):
+                results.append((cycle, (yield m_axis.data), (yield m_axis.last)))
+
+    start = time.perf_counter()
+    run_simulation(fragment, [source(), sink()])
+    duration = time.perf_counter() - start
+
+    mismatches = [i for i in range(len(expected)) if (results[i][1] != expected[i]) or not results[i][2]]
+    latency    = min(cycle - accept for (cycle, _, _), accept in zip(results, accepted))
+    half       = beats[:vectors//2]
+    first = None
+    if mismatches:
+        i = mismatches[0]
+        first = {"sum": i, "z": hex(results[i][1]), "expected": hex(expected[i])}
+    if latency != model.latency:
+        mismatches.append("latency")
+        first = first or {"latency": latency, "expected": model.latency}
+    return {
+        "core"       : "Dot",
+        "latency"    : latency,
+        "interval"   : round((half[-1] - half[0])/(len(half) - 1), 2) if (len(half) > 1) else 1,
+        "mismatches" : len(mismatches),
+        "first"      : first,
+        "throughput" : vectors/duration,
+    }
+
+def config_name(config):
+    if (config["equation"] == "dot"):
+        dot = config["dot"]
+        return "{:8} {:15} {:24} {:8} >>{} {}{} {} bits".format(config["feature"], f"dot {dot['length']}", "x".join(str(w) for w in config["widths"][:2]),
+            "unsigned" if config["unsigned"] else "signed", dot["shift"], "R" if dot["rounding"] else "T", "S" if dot["saturation"] else "W",
+            dot["output_width"])
+    widths = config["widths"][:2*(1 + config["equation"].count("+"))]
+    return "{:8} {:15} {:24} {:8} {}/{} stages={}".format(config["feature"], config["equation"], "x".join(str(w) for w in widths),
+        "unsigned" if config["unsigned"] else "signed", int(config["reg_in"]), int(config["reg_out"]), config["adder_stages"])
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="DSP generator equivalence (generated netlists vs reference model).")
+    parser.add_argument("--configs", type=int, default=24,   help="Random configurations of the sweep (0: all).")
+    parser.add_argument("--vectors", type=int, default=64,   help="Random operand vectors per configuration.")
+    parser.add_argument("--seed",    type=int, default=0,    help="Random seed.")
+    parser.add_argument("--feature", default=None, choices=FEATURES, help="Only sweep this feature.")
+    parser.add_argument("--equation", default=None, choices=EQUATIONS, help="Only sweep this equation.")
+    args = parser.parse_args()
+
+    rng     = random.Random(args.seed)
+    configs = [c for c in sweep() if (args.feature in [None, c["feature"]]) and (args.equation in [None, c["equation"]])]
+    if args.configs:
+        configs = rng.sample(configs, min(args.configs, len(configs)))
+
+    failures = 0
+    print("{:75} {:8} {:>7} {:>8} {:>10} {:>10}".format("Configuration (feature, equation, widths, sign, reg_in/reg_out)", "Core", "Latency", "Interval", "Mismatches", "Vectors/s"))
+    for config in configs:
+        result = run(config, args.vectors, rng)
+        print("{:75} {:8} {:>7} {:>8} {:>10} {:>10.1f}".format(config_name(config), result["core"], result["latency"], result["interval"],
+            result["mismatches"], result["throughput"]))
+        if result["mismatches"]:
+            failures += 1
+            print(f"    first mismatch: {result['first']}")
+    print(f"{len(configs) - failures}/{len(configs)} configurations match the model ({args.vectors} vectors each, seed {args.seed}).")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
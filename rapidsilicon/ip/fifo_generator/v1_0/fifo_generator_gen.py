@@ -9,53 +9,9 @@ import sys
 import logging
 import argparse
 from pathlib import Path
-from datetime import datetime
 import math
 
-from litex_wrapper.fifo_litex_generator import *
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-# Making the read and write data widths into their own buses
-def divide_n_bit_numbers(number):
-    # Convert the number to a binary string
-    binary_string = '0' * number
-    buses = []
-
-    for i in range(0, len(binary_string), 36):
-        bus = binary_string[i:i+36]
-        buses.append(bus)
-    if (len(buses[-1]) < 36 and len(buses[-1]) > 18):
-        for i in range(len(binary_string) - len(buses[-1]), len(binary_string), 18):
-            bus = binary_string[i:i+18]
-            buses.append(bus)
-        buses.pop(-3)
-    
-    return buses
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-
-def get_clkin_ios(data_width_write, data_width_read):
-    return [
-        ("clk",        0,  Pins(1)),
-        ("rst",        0,  Pins(1)),
-		("wrt_clock",  0,  Pins(1)),
-        ("rd_clock",   0,  Pins(1)),
-        ("din",        0,  Pins(data_width_write)),
-        ("dout",       0,  Pins(data_width_read)),
-        ("wr_en",      0,  Pins(1)),
-        ("rd_en",      0,  Pins(1)),
-        ("full",       0,  Pins(1)),
-        ("empty",      0,  Pins(1)),
-        ("underflow",  0,  Pins(1)),
-        ("overflow",   0,  Pins(1)),
-        ("prog_full",  0,  Pins(1)),
-        ("prog_empty", 0,  Pins(1))
-    ]
+from litex_wrapper.fifo_bram_planner import max_memory, plan_fifo, plan_summary, clock_cycles_to_obtain_desired_output
 
 # Data Width Read Limitations ---------------------------------------------------------------------
 
@@ -85,91 +41,6 @@ def calculate_multiples(number, limit):
     return multiples
 
 
-# Checking the number of clocks for the output to appear -------------------------------------------
-def clock_cycles_to_obtain_desired_output(desired_output_size, max_output_per_block):
-    if(max_output_per_block < 36):
-        max_output_per_block = 36
-    if desired_output_size <= max_output_per_block:
-        # If the desired size can be obtained from a single block, return 1 clock cycle
-        return 1
-    else:
-        # Calculate the number of clock cycles required to obtain the desired size
-        return (desired_output_size + max_output_per_block - 1) // max_output_per_block
-    
-# Counting the total number of FIFOs used ---------------------------------------------------------
-def total_BRAM(data_width, depth):
-    remaining_memory = 0
-    num_18K = 0
-    num_36K = 0
-    num_9K = 0
-    while remaining_memory < data_width * depth:
-        for i, bus in enumerate(divide_n_bit_number(data_width, depth)):
-            if (len(bus) <= 9):
-                memory = 1024
-                remaining_memory = remaining_memory + (len(bus) * memory)
-                num_9K = num_9K + 1
-            elif (len(bus) <= 18):
-                memory = 1024
-                num_18K = num_18K + 1
-                remaining_memory = remaining_memory + (len(bus) * memory)
-            elif (len(bus) <= 36):
-                memory = 1024
-                num_36K = num_36K + 1
-                remaining_memory = remaining_memory + (len(bus) * memory)
-    return(num_36K + num_18K/2 + num_9K/4)
-
-# Making the read and write data widths into their own buses
-def divide_n_bit_number(number, depth):
-    # Convert the number to a binary string
-    binary_string = '0' * number
-    buses = []
-
-    for i in range(0, len(binary_string), 36):
-        bus = binary_string[i:i+36]
-        buses.append(bus)
-    if (len(buses[-1]) < 36 and len(buses[-1]) > 18 and depth > 1024):
-        for i in range(len(binary_string) - len(buses[-1]), len(binary_string), 18):
-            bus = binary_string[i:i+18]
-            buses.append(bus)
-        buses.pop(-3)
-    
-    return buses
-
-# FIFO Generator ----------------------------------------------------------------------------------
-class FIFOGenerator(Module):
-    def __init__(self, platform, data_width_write, data_width_read, synchronous, full_threshold, empty_threshold, depth, first_word_fall_through, empty_value, full_value, builtin_fifo):
-        # Clocking ---------------------------------------------------------------------------------
-        platform.add_extension(get_clkin_ios(data_width_write, data_width_read))
-        self.clock_domains.cd_sys  = ClockDomain()
-        self.clock_domains.cd_wrt	= ClockDomain()
-        self.clock_domains.cd_rd	= ClockDomain()
-
-        SYNCHRONOUS = {
-            True    :   "SYNCHRONOUS",
-            False   :   "ASYNCHRONOUS"
-        }
-	
-        self.submodules.fifo = fifo = FIFO(data_width_write, data_width_read, SYNCHRONOUS[synchronous], full_threshold, empty_threshold, depth, first_word_fall_through, empty_value, full_value, builtin_fifo)
-    
-        self.comb += fifo.din.eq(platform.request("din"))
-        self.comb += platform.request("dout").eq(fifo.dout)
-        if (full_threshold):
-            self.comb += platform.request("prog_full").eq(fifo.prog_full)
-        if (empty_threshold):
-            self.comb += platform.request("prog_empty").eq(fifo.prog_empty)
-        if(synchronous):
-            self.comb += self.cd_sys.clk.eq(platform.request("clk"))
-        else:
-            self.comb += self.cd_wrt.clk.eq(platform.request("wrt_clock"))
-            self.comb += self.cd_rd.clk.eq(platform.request("rd_clock"))
-        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
-        self.comb += fifo.wren.eq(platform.request("wr_en"))
-        self.comb += fifo.rden.eq(platform.request("rd_en"))   
-        self.comb += platform.request("full").eq(fifo.full)
-        self.comb += platform.request("empty").eq(fifo.empty)
-        self.comb += platform.request("underflow").eq(fifo.underflow)
-        self.comb += platform.request("overflow").eq(fifo.overflow)        
-            
 # Build --------------------------------------------------------------------------------------------
 def main():
     parser = argparse.ArgumentParser(description="FIFO")
@@ -219,6 +90,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",    help="Build Core")
     build_group.add_argument("--build-dir",     default="./",           help="Build Directory")
     build_group.add_argument("--build-name",    default="FIFO_generator", help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -241,36 +113,8 @@ def main():
         else:
             data_width_read  = args.data_width
             data_width_write = args.data_width
-        buses_write = divide_n_bit_numbers(data_width_write)
-        remaining_memory = 0
-        prev_rem = 0
-        num_9K = 0
-        num_18K = 0
-        total_mem = 0
-        while total_BRAM(data_width_write, remaining_memory/data_width_write) < 128:
-            for i, bus in enumerate(buses_write):
-                if (len(bus) <= 9):
-                    memory = 1024
-                    remaining_memory = remaining_memory + (len(bus) * memory)
-                    num_9K = num_9K + 1
-                    if (num_9K == 4):
-                        total_mem = total_mem + 1
-                        num_9K = 0
-                elif (len(bus) <= 18):
-                    memory = 1024
-                    num_18K = num_18K + 1
-                    remaining_memory = remaining_memory + (len(bus) * memory)
-                    if (num_18K == 2):
-                        total_mem = total_mem + 1
-                        num_18K = 0
-                elif (len(bus) <= 36):
-                    memory = 1024
-                    remaining_memory = remaining_memory + (len(bus) * memory)
-                    total_mem = total_mem + 1
-                if (total_BRAM(data_width_write, remaining_memory/data_width_write) < 128):
-                    prev_rem = remaining_memory
-                else:
-                    prev_rem = prev_rem
+        # Largest Built-in FIFO fitting in the device BRAMs.
+        prev_rem, remaining_memory = max_memory(data_width_write)
             
     details =  {   "IP details": {
     'Name' : 'FIFO Generator',
@@ -409,7 +253,9 @@ def main():
             data_width_write = args.data_width_write
         else:
             data_width_write = args.data_width
-        summary["Count of FIFOs"] = math.ceil(total_BRAM(data_width_write, depth) * 2) / 2
+        plan = plan_fifo(data_width_write, args.data_width_read if args.asymmetric else args.data_width, depth, args.synchronous, args.builtin_fifo)
+        summary["Count of FIFOs"] = plan["bram"]
+        summary.update(plan_summary(plan))
     if (args.empty_threshold):
         summary["Programmable Empty"] = "Programmble Empty will be asserted at data count %s" % args.empty_value
     if (args.full_threshold):
@@ -426,21 +272,6 @@ def main():
         data_width_read  = args.data_width
         data_width_write = args.data_width
 
-    # Create Generator -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = FIFOGenerator(platform,
-        data_width_read   				= data_width_read,
-        data_width_write                = data_width_write,
-        synchronous     				= args.synchronous,
-        full_threshold  				= args.full_threshold,
-        empty_threshold 				= args.empty_threshold,
-        depth           				= depth,
-        full_value                      = args.full_value,
-        empty_value                     = args.empty_value,
-        first_word_fall_through         = args.first_word_fall_through,
-        builtin_fifo                    = args.builtin_fifo
-    )
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -448,57 +279,45 @@ def main():
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version     = "v1_0"
-        )
 
-        # IP_ID Parameter
-        now = datetime.datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "fifo_generator", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"FIFOGEN\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(\n".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="FIFOGEN", ip_version="00000000_00000000_0000000000000001")
+
+        # DEPTH localparam (after ports declaration).
+        def add_depth_localparam(content):
+            pos = content.find(");")
+            if pos != -1:
+                content = content[:pos + 2] + "\n\nlocalparam DEPTH = {};".format(depth) + content[pos + 2:]
+            return content
+        rs_builder.add_wrapper_transform(add_depth_localparam)
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.fifo_generator_wrapper import FIFOGenerator
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = FIFOGenerator(platform,
+                data_width_read   				= data_width_read,
+                data_width_write                = data_width_write,
+                synchronous     				= args.synchronous,
+                full_threshold  				= args.full_threshold,
+                empty_threshold 				= args.empty_threshold,
+                depth           				= depth,
+                full_value                      = args.full_value,
+                empty_value                     = args.empty_value,
+                first_word_fall_through         = args.first_word_fall_through,
+                builtin_fifo                    = args.builtin_fifo
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version     = "v1_0"
+            )
 
-        with open(wrapper, "r") as file:
-            file_content = file.read()
-        pos = file_content.find(");")
-        if pos != -1:
-            updated_content = file_content[:pos + 2] + "\n\nlocalparam DEPTH = {};".format(depth) + file_content[pos + 2:]
-
-            # Write the updated content back to the file
-            with open(os.path.join(wrapper), "w") as file:
-                file.write(updated_content)
-        
         build_name = args.build_name.rsplit( ".", 1 )[ 0 ]
         file = os.path.join(args.build_dir, "rapidsilicon/ip/fifo_generator/v1_0", build_name, "sim/testbench.v")
         file = Path(file)
@@ -534,6 +353,9 @@ def main():
             text = text.replace("== 0", "<= 1")
             file.write_text(text)
 
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
+
 if __name__ == "__main__":
     main()
     
\ No newline at end of file
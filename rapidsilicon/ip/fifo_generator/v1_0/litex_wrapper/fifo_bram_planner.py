@@ -0,0 +1,139 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2023 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# FIFO Generator BRAM planner: primitive tiling of a FIFO (pure Python, no migen). Used by the
+# generator for --json-template summaries/choices and by the LiteX FIFO to build its primitives.
+
+import math
+
+from functools import lru_cache
+
+# Primitives ---------------------------------------------------------------------------------------
+
+# FIFO36K/FIFO18KX2 primitives are used 1024 words deep, data buses of up to 36/18/9 bits.
+PRIMITIVE_DEPTH = 1024
+PRIMITIVE_WIDTH = 36
+
+# Device BRAM36 count (limits the depth choices of the Built-in FIFO).
+MAX_BRAM = 128
+
+# Bus Split ----------------------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def bus_widths(width, depth=None):
+    # 36-bit buses, a last bus of 19-35 bits is split in 18-bit + remaining bits buses (always when
+    # depth is None, only for FIFOs deeper than one primitive otherwise).
+    buses = [PRIMITIVE_WIDTH]*(width // PRIMITIVE_WIDTH)
+    if width % PRIMITIVE_WIDTH:
+        buses.append(width % PRIMITIVE_WIDTH)
+    if (18 < buses[-1] < 36) and (depth is None or depth > PRIMITIVE_DEPTH):
+        last = buses.pop()
+        buses += [18, last - 18]
+    return tuple(buses)
+
+def repeat_buses(buses, count):
+    # buses repeated up to count buses (shorter side of asymmetric FIFOs).
+    if len(buses) >= count:
+        return buses
+    return buses*(count // len(buses)) + buses[:count % len(buses)]
+
+def wide_bus_count(buses, depth):
+    # Buses on 36-bit primitive ports (18-bit and wider ones of single row FIFOs).
+    return sum(1 for bus in buses if (bus >= 18 and depth < PRIMITIVE_DEPTH) or (bus == 36 and depth >= PRIMITIVE_DEPTH))
+
+# Primitive Count ----------------------------------------------------------------------------------
+
+def rows(width, depth):
+    # Number of PRIMITIVE_DEPTH deep rows of buses holding width x depth bits (depth can be a float).
+    target = width*depth
+    n = max(0, math.ceil(depth/PRIMITIVE_DEPTH))
+    while n*width*PRIMITIVE_DEPTH < target:
+        n += 1
+    while (n > 0) and ((n - 1)*width*PRIMITIVE_DEPTH >= target):
+        n -= 1
+    return n
+
+@lru_cache(maxsize=4096)
+def primitive_count(width, depth):
+    # (36-bit, 18-bit, 9-bit) bus primitives of a width x depth FIFO.
+    n     = rows(width, depth)
+    buses = bus_widths(width, depth)
+    return (
+        n*sum(1 for bus in buses if bus > 18),
+        n*sum(1 for bus in buses if 9 < bus <= 18),
+        n*sum(1 for bus in buses if bus <= 9),
+    )
+
+def total_bram(width, depth):
+    # BRAM36 equivalent: FIFO18KX2 halves hold 18-bit buses, 9-bit buses use a quarter.
+    num_36K, num_18K, num_9K = primitive_count(width, depth)
+    return num_36K + num_18K/2 + num_9K/4
+
+@lru_cache(maxsize=4096)
+def max_memory(width, max_bram=MAX_BRAM):
+    # Explore FIFO size bus by bus until max_bram is reached: returns (largest size fitting in
+    # max_bram, explored size) in bits.
+    remaining_memory = 0
+    prev_rem         = 0
+    while total_bram(width, remaining_memory/width) < max_bram:
+        for bus in bus_widths(width):
+            remaining_memory += bus*PRIMITIVE_DEPTH
+            if total_bram(width, remaining_memory/width) < max_bram:
+                prev_rem = remaining_memory
+    return prev_rem, remaining_memory
+
+# Latency ------------------------------------------------------------------------------------------
+
+def clock_cycles_to_obtain_desired_output(desired_output_size, max_output_per_block=PRIMITIVE_WIDTH):
+    # Read clocks to assemble a desired_output_size word from max_output_per_block (>= 36) buses.
+    max_output_per_block = max(max_output_per_block, PRIMITIVE_WIDTH)
+    return math.ceil(desired_output_size/max_output_per_block)
+
+# Plan ---------------------------------------------------------------------------------------------
+
+@lru_cache(maxsize=4096)
+def plan_fifo(data_width_write, data_width_read, depth, synchronous=True, builtin_fifo=True):
+    buses_write = bus_widths(data_width_write, depth)
+    buses_read  = bus_widths(data_width_read)
+    if data_width_write < data_width_read:
+        clocks_for_output = int(clock_cycles_to_obtain_desired_output(data_width_read)/len(buses_write))
+        read_latency      = clock_cycles_to_obtain_desired_output(data_width_read, data_width_write)
+    else:
+        clocks_for_output = 1
+        read_latency      = 1
+    num_36K, num_18K, num_9K = primitive_count(data_width_write, depth)
+    return {
+        "buses_write"       : buses_write,
+        "buses_read"        : buses_read,
+        # 36-bit port buses: write/read buses, write buses repeated to the read bus count.
+        "data_36_write"     : wide_bus_count(buses_write, depth),
+        "data_36_read"      : wide_bus_count(buses_read, depth),
+        "data_36"           : wide_bus_count(repeat_buses(buses_write, len(buses_read)), depth),
+        "rows"              : math.ceil(depth/PRIMITIVE_DEPTH),
+        "num_36K"           : num_36K,
+        "num_18K"           : num_18K,
+        "num_9K"            : num_9K,
+        # FIFO36K count (18-bit/9-bit buses share primitives).
+        "total_mem"         : num_36K + math.ceil(num_18K/2) + math.ceil(num_9K/4),
+        # BRAM36 equivalent (half BRAM granularity, none for Distributed RAM FIFOs).
+        "bram"              : math.ceil((num_36K + num_18K/2 + num_9K/4)*2)/2 if builtin_fifo else 0,
+        "clocks_for_output" : clocks_for_output,
+        "read_latency"      : read_latency,
+        # Asynchronous FIFOs: 2 flops pointer synchronizers in each clock domain.
+        "flags_latency"     : 1 if synchronous else 2,
+    }
+
+def plan_summary(plan):
+    tiling = []
+    for count, name in [(plan["num_36K"], "36-bit"), (plan["num_18K"], "18-bit"), (plan["num_9K"], "9-bit")]:
+        if count:
+            tiling.append(f"{count} x {name}")
+    return {
+        "BRAM Tiling"                  : ", ".join(tiling) + f" bus primitives ({plan['rows']} x {PRIMITIVE_DEPTH} words)",
+        "FIFO36K Primitives"           : plan["total_mem"],
+        "Flags Latency (clock cycles)" : plan["flags_latency"],
+    }
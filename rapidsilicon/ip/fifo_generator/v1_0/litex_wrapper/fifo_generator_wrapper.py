@@ -0,0 +1,67 @@
+#
+# This file is Copyright (c) 2023 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# fifo_generator LiteX wrapper: IOs and module elaborated by fifo_generator_gen.py on --build.
+
+from litex_wrapper.fifo_litex_generator import *
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+
+def get_clkin_ios(data_width_write, data_width_read):
+    return [
+        ("clk",        0,  Pins(1)),
+        ("rst",        0,  Pins(1)),
+		("wrt_clock",  0,  Pins(1)),
+        ("rd_clock",   0,  Pins(1)),
+        ("din",        0,  Pins(data_width_write)),
+        ("dout",       0,  Pins(data_width_read)),
+        ("wr_en",      0,  Pins(1)),
+        ("rd_en",      0,  Pins(1)),
+        ("full",       0,  Pins(1)),
+        ("empty",      0,  Pins(1)),
+        ("underflow",  0,  Pins(1)),
+        ("overflow",   0,  Pins(1)),
+        ("prog_full",  0,  Pins(1)),
+        ("prog_empty", 0,  Pins(1))
+    ]
+
+# FIFO Generator ----------------------------------------------------------------------------------
+class FIFOGenerator(Module):
+    def __init__(self, platform, data_width_write, data_width_read, synchronous, full_threshold, empty_threshold, depth, first_word_fall_through, empty_value, full_value, builtin_fifo):
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios(data_width_write, data_width_read))
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.clock_domains.cd_wrt	= ClockDomain()
+        self.clock_domains.cd_rd	= ClockDomain()
+
+        SYNCHRONOUS = {
+            True    :   "SYNCHRONOUS",
+            False   :   "ASYNCHRONOUS"
+        }
+	
+        self.submodules.fifo = fifo = FIFO(data_width_write, data_width_read, SYNCHRONOUS[synchronous], full_threshold, empty_threshold, depth, first_word_fall_through, empty_value, full_value, builtin_fifo)
+    
+        self.comb += fifo.din.eq(platform.request("din"))
+        self.comb += platform.request("dout").eq(fifo.dout)
+        if (full_threshold):
+            self.comb += platform.request("prog_full").eq(fifo.prog_full)
+        if (empty_threshold):
+            self.comb += platform.request("prog_empty").eq(fifo.prog_empty)
+        if(synchronous):
+            self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        else:
+            self.comb += self.cd_wrt.clk.eq(platform.request("wrt_clock"))
+            self.comb += self.cd_rd.clk.eq(platform.request("rd_clock"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+        self.comb += fifo.wren.eq(platform.request("wr_en"))
+        self.comb += fifo.rden.eq(platform.request("rd_en"))   
+        self.comb += platform.request("full").eq(fifo.full)
+        self.comb += platform.request("empty").eq(fifo.empty)
+        self.comb += platform.request("underflow").eq(fifo.underflow)
+        self.comb += platform.request("overflow").eq(fifo.overflow)
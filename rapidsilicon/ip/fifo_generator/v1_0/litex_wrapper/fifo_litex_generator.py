@@ -6,52 +6,13 @@
 # SPDX-License-Identifier: MIT
 #
 
-import datetime
 import logging
 import math
 from migen.genlib.fifo import SyncFIFO, AsyncFIFOBuffered
 from migen import *
 
+from litex_wrapper.fifo_bram_planner import plan_fifo
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
-
-# Making the read and write data widths into their own buses
-def divide_n_bit_number(number, depth):
-    # Convert the number to a binary string
-    binary_string = '0' * number
-    buses = []
-
-    for i in range(0, len(binary_string), 36):
-        bus = binary_string[i:i+36]
-        buses.append(bus)
-    if (len(buses[-1]) < 36 and len(buses[-1]) > 18 and depth > 1024):
-        for i in range(len(binary_string) - len(buses[-1]), len(binary_string), 18):
-            bus = binary_string[i:i+18]
-            buses.append(bus)
-        buses.pop(-3)
-    
-    return buses
-
-# Making the read and write data widths into their own buses no depth
-def divide_n_bit_number_no_depth(number):
-    # Convert the number to a binary string
-    binary_string = '0' * number
-    buses = []
-
-    for i in range(0, len(binary_string), 36):
-        bus = binary_string[i:i+36]
-        buses.append(bus)
-    if (len(buses[-1]) < 36 and len(buses[-1]) > 18):
-        for i in range(len(binary_string) - len(buses[-1]), len(binary_string), 18):
-            bus = binary_string[i:i+18]
-            buses.append(bus)
-        buses.pop(-3)
-    
-    return buses
 
 # Checking the bit length for a certain decimal number
 def decimal_to_binary(decimal_number):
@@ -59,16 +20,6 @@ def decimal_to_binary(decimal_number):
     binary_length = len(binary_string)
     return binary_length
 
-# Checking the number of clocks for the output to appear
-def clock_cycles_to_obtain_desired_output(desired_output_size):
-    max_output_per_block = 36
-    if desired_output_size <= max_output_per_block:
-        # If the desired size can be obtained from a single block, return 1 clock cycle
-        return 1
-    else:
-        # Calculate the number of clock cycles required to obtain the desired size
-        return (desired_output_size + max_output_per_block - 1) // max_output_per_block
-
 # FIFO Generator ---------------------------------------------------------------------------------------
 class FIFO(Module):
     def __init__(self, data_width_write, data_width_read, synchronous, full_threshold, empty_threshold, depth, first_word_fall_through, empty_value, full_value, builtin_fifo):
@@ -92,12 +43,15 @@ class FIFO(Module):
         self.logger.info(f"DEPTH    : {depth}")
         self.logger.info(f"===================================================")
 
-        buses_write = divide_n_bit_number(data_width_write, depth)
+        # BRAM Plan (buses are handled as strings of their width below).
+        plan = plan_fifo(data_width_write, data_width_read, depth, SYNCHRONOUS[synchronous], builtin_fifo)
+        buses_write = ["0"*width for width in plan["buses_write"]]
         buses_write_og = buses_write
-        buses_read = divide_n_bit_number_no_depth(data_width_read)
+        buses_read = ["0"*width for width in plan["buses_read"]]
         buses_read_og = buses_read
-        data_36_write = sum(1 for item in buses_write if ((len(item) >= 18 and depth < 1024) or (len(item) == 36 and depth >= 1024)))
-        data_36_read = sum(1 for item in buses_read if ((len(item) >= 18 and depth < 1024) or (len(item) == 36 and depth >= 1024)))
+        data_36_write = plan["data_36_write"]
+        data_36_read = plan["data_36_read"]
+        data_36 = plan["data_36"]
         # Check which list is shorter
         if len(buses_write) < len(buses_read):
             repeat_count = len(buses_read) // len(buses_write)
@@ -107,46 +61,23 @@ class FIFO(Module):
             buses_read = buses_read * repeat_count + buses_read[:len(buses_write) % len(buses_read)]
         write_div_read = int(data_width_write/data_width_read)/len(buses_write)
         write_div_read = decimal_to_binary(int(write_div_read))
-        size_bram = 36864
-        # print(buses_write_og)
-        # print(buses_read_og)
-        data_36 = sum(1 for item in buses_write if ((len(item) >= 18 and depth < 1024) or (len(item) == 36 and depth >= 1024)))
-        total_mem = math.ceil((data_width_write * depth) / size_bram)
-        remaining_memory = 0
-        depth_mem = 18432
-        num_9K = 0
-        num_18K = 0
-        num_36K = 0
+        num_9K = plan["num_9K"]
+        num_18K = plan["num_18K"]
+        num_36K = plan["num_36K"]
+        total_mem = plan["total_mem"]
         old_count18K_read = 0
         one_time = 1
         self.prev_empty = Signal()
         old_count9K_read = 0
         if (data_width_write < data_width_read):
-            clocks_for_output = int(clock_cycles_to_obtain_desired_output(data_width_read)/len(buses_write_og))
+            clocks_for_output = plan["clocks_for_output"]
             clocks_for_output_bin = decimal_to_binary(clocks_for_output)
             self.rden_int_count = Signal(int(clocks_for_output))
             self.din_count = Signal(int(clocks_for_output))
         else:
             clocks_for_output = 1
-        while remaining_memory < data_width_write * depth:
-            for i, bus_write in enumerate(buses_write_og):
-                # if (remaining_memory < data_width * depth):
-                if (len(bus_write) <= 9):
-                    memory = 1024
-                    remaining_memory = remaining_memory + (len(bus_write) * memory)
-                    num_9K = num_9K + 1
-                elif (len(bus_write) <= 18):
-                    memory = 1024
-                    num_18K = num_18K + 1
-                    remaining_memory = remaining_memory + (len(bus_write) * memory)
-                elif (len(bus_write) <= 36):
-                    memory = 1024
-                    num_36K = num_36K + 1
-                    remaining_memory = remaining_memory + (len(bus_write) * memory)
-        total_mem = num_36K + math.ceil(num_18K/2) + math.ceil(num_9K/4)
-        # print(num_36K, math.ceil(num_18K/2), math.ceil(num_9K/4), total_mem)
         memory = 1024
-        instances = math.ceil(depth / memory)
+        instances = plan["rows"]
         if(SYNCHRONOUS[synchronous]):
             if (data_width_write >= data_width_read):
                 self.counter = Signal(math.ceil(math.log2((data_width_write/data_width_read)*depth)) + 1, reset=0)
@@ -218,17 +149,17 @@ class FIFO(Module):
 
         # Using Block RAM
         if (builtin_fifo):
-            self.rden_int           = Array(Signal() for _ in range(total_mem * 2))
-            self.wren_int           = Array(Signal() for _ in range(total_mem * 2))
-            self.empty_int          = Array(Signal() for _ in range(total_mem * 2))
-            self.full_int           = Array(Signal() for _ in range(total_mem * 2))
-            self.almost_empty_int   = Array(Signal() for _ in range(total_mem * 2))
-            self.almost_full_int    = Array(Signal() for _ in range(total_mem * 2))
-            self.prog_full_int      = Array(Signal() for _ in range(total_mem * 2))
-            self.prog_empty_int     = Array(Signal() for _ in range(total_mem * 2))
-            self.dout_int           = Array(Signal() for _ in range(total_mem * 2))
-            self.underflow_int      = Array(Signal() for _ in range(total_mem * 2))
-            self.overflow_int       = Array(Signal() for _ in range(total_mem * 2))
+            self.rden_int           = Array(Signal(name=f"rden_int_{k}") for k in range(total_mem * 2))
+            self.wren_int           = Array(Signal(name=f"wren_int_{k}") for k in range(total_mem * 2))
+            self.empty_int          = Array(Signal(name=f"empty_int_{k}") for k in range(total_mem * 2))
+            self.full_int           = Array(Signal(name=f"full_int_{k}") for k in range(total_mem * 2))
+            self.almost_empty_int   = Array(Signal(name=f"almost_empty_int_{k}") for k in range(total_mem * 2))
+            self.almost_full_int    = Array(Signal(name=f"almost_full_int_{k}") for k in range(total_mem * 2))
+            self.prog_full_int      = Array(Signal(name=f"prog_full_int_{k}") for k in range(total_mem * 2))
+            self.prog_empty_int     = Array(Signal(name=f"prog_empty_int_{k}") for k in range(total_mem * 2))
+            self.dout_int           = Array(Signal(36, name=f"dout_int_{k}") for k in range(total_mem * 2))
+            self.underflow_int      = Array(Signal(name=f"underflow_int_{k}") for k in range(total_mem * 2))
+            self.overflow_int       = Array(Signal(name=f"overflow_int_{k}") for k in range(total_mem * 2))
             count = 0
             mem = 0
             k36_flag = 0
@@ -253,18 +184,6 @@ class FIFO(Module):
                 depth_read = (data_width_write/data_width_read)*depth
             else:
                 depth_read = depth/clocks_for_output
-            for k in range(total_mem * 2):
-                self.rden_int[k]           = Signal(name=f"rden_int_{k}")
-                self.wren_int[k]           = Signal(name=f"wren_int_{k}")
-                self.empty_int[k]          = Signal(name=f"empty_int_{k}")  
-                self.full_int[k]           = Signal(name=f"full_int_{k}")
-                self.prog_full_int[k]      = Signal(name=f"prog_full_int_{k}")  
-                self.prog_empty_int[k]     = Signal(name=f"prog_empty_int_{k}")
-                self.almost_empty_int[k]   = Signal(name=f"almost_empty_int_{k}")
-                self.almost_full_int[k]    = Signal(name=f"almost_full_int_{k}")
-                self.dout_int[k]           = Signal(36, name=f"dout_int_{k}")
-                self.underflow_int[k]      = Signal(name=f"underflow_int_{k}")
-                self.overflow_int[k]       = Signal(name=f"overflow_int_{k}")
 
             for k in range(total_mem):
                 j = 0
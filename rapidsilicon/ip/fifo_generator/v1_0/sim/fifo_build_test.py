@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# FIFO generator build test: elaborates the LiteX FIFO (litex_wrapper/fifo_litex_generator.py) on
+# Built-in FIFO configurations with 36-bit and wider buses (symmetric, asymmetric, synchronous and
+# asynchronous, single and multi row depths) and a Distributed RAM one. --convert also converts them
+# to Verilog (slow). Exit code 1 if any configuration fails.
+#
+# ./fifo_build_test.py --convert
+
+import os
+import sys
+import time
+import argparse
+import traceback
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from migen.fhdl.verilog import convert
+
+from litex_wrapper.fifo_litex_generator import FIFO
+
+# Configurations -----------------------------------------------------------------------------------
+
+# (data_width_write, data_width_read, synchronous, depth, builtin_fifo)
+CONFIGS = [
+    (36,  36,  "SYNCHRONOUS",  1024, True),
+    (72,  72,  "SYNCHRONOUS",  1024, True),
+    (72,  36,  "SYNCHRONOUS",  1024, True),
+    (36,  72,  "SYNCHRONOUS",  2048, True),
+    (144, 144, "SYNCHRONOUS",  1024, True),
+    (36,  36,  "ASYNCHRONOUS", 1024, True),
+    (40,  40,  "ASYNCHRONOUS", 2048, True),
+    (72,  36,  "ASYNCHRONOUS", 1024, True),
+    (36,  72,  "ASYNCHRONOUS", 1024, True),
+    (144, 144, "ASYNCHRONOUS", 1024, True),
+    (72,  72,  "ASYNCHRONOUS", 1024, False),
+]
+
+def build(data_width_write, data_width_read, synchronous, depth, builtin_fifo, verilog=False):
+    full_value  = depth - 2
+    empty_value = 2
+    fifo = FIFO(data_width_write, data_width_read, synchronous, True, True, depth, False, empty_value, full_value, builtin_fifo)
+    if verilog:
+        convert(fifo, ios={fifo.din, fifo.dout})
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="FIFO generator build test")
+    parser.add_argument("--convert", action="store_true", help="Also convert to Verilog")
+    args = parser.parse_args()
+
+    failed = 0
+    for config in CONFIGS:
+        name  = "{}->{} {} x{} {}".format(config[0], config[1], config[2].lower(), config[3],
+            "builtin" if config[4] else "distributed")
+        start = time.perf_counter()
+        try:
+            build(*config, verilog=args.convert)
+            status = "OK"
+        except Exception:
+            traceback.print_exc()
+            status  = "FAILED"
+            failed += 1
+        print(f"{name:<40} {status:<6} {time.perf_counter() - start:8.2f}s", flush=True)
+
+    print(f"{len(CONFIGS) - failed}/{len(CONFIGS)} configurations OK.")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
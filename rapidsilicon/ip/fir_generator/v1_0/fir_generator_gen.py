@@ -8,17 +8,12 @@ import os
 import sys
 import logging
 import argparse
+import json
 from pathlib import Path
-from datetime import datetime
 import math
 
-from litex_wrapper.fir_litex_generator import *
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
+from litex_wrapper.fir_coefficients import extract_numbers, fixed_point_taps
+from litex_wrapper.fir_structures import STRUCTURES, DECIMATION_FACTORS, INTERPOLATION_FACTORS, TDM_CHANNELS, rate_factor, resources, structure_error, tdm_schedule
 
 # Checking if the file provided is in valid format
 
@@ -27,51 +22,10 @@ def is_valid_extension(file_path):
     valid_extensions = ['.txt', '.hex']
     return file_extension.lower() in valid_extensions
 
-# IOs/Interfaces -----------------------------------------------------------------------------------
-
-def get_clkin_ios(data_in, data_out):
-    return [
-        ("clk",         0,  Pins(1)),
-        ("rst",         0,  Pins(1)),
-		("data_in",     0,  Pins(data_in)),
-        ("data_out",    0,  Pins(data_out)),
-        ("ready",       0,  Pins(1))
-    ]
-
 # Check if any number in the list is a float with a non-zero fractional part
 def has_fractional_number(numbers):
     return any(isinstance(number, float) and not number.is_integer() for number in numbers)
 
-# FIR Generator ----------------------------------------------------------------------------------
-class FIRGenerator(Module):
-    def __init__(self, platform, input_width, coefficients, coefficients_file, coefficient_fractional_bits, signed, optimization, number_of_coefficients, coefficient_width, input_fractional_bits, truncated_output, output_data_width):
-        # Clocking ---------------------------------------------------------------------------------
-        if (optimization == "Area" and coefficients_file):
-            non_zero_elements = [element for element in extract_numbers(coefficients, coefficients_file) if element != 0]
-            coefficient_width = 20
-            bit_growth = int(coefficient_width + math.ceil(math.log2(len(non_zero_elements))) if len(non_zero_elements) > 0 else 0)
-        elif (coefficients == "" or len(extract_numbers(coefficients, coefficients_file)) <= 0):
-            bit_growth = 0
-        else:
-            abs_sum = sum(abs(coeff) for coeff in extract_numbers(coefficients, coefficients_file))
-            bit_growth = math.ceil(math.log2(abs_sum))
-
-        platform.add_extension(get_clkin_ios(input_width, min(input_width + bit_growth, 38) if not truncated_output else output_data_width))
-        self.clock_domains.cd_sys  = ClockDomain()
-        if(optimization == "Area"):
-            self.clock_domains.cd_fast	= ClockDomain()
-	
-        self.submodules.fir = fir = FIR(input_width, coefficients, coefficients_file, coefficient_fractional_bits, signed, optimization, number_of_coefficients, coefficient_width, input_fractional_bits, truncated_output, output_data_width)
-    
-        self.comb += fir.data_in.eq(platform.request("data_in"))
-        if (optimization == "Area"):
-            self.sync += platform.request("data_out").eq(fir.data_out)
-        else:
-            self.comb += platform.request("data_out").eq(fir.data_out)
-        self.comb += platform.request("ready").eq(fir.ready)
-        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
-        self.comb += self.cd_sys.rst.eq(platform.request("rst"))    
-            
 # Build --------------------------------------------------------------------------------------------
 def main():
     parser = argparse.ArgumentParser(description="FIR")
@@ -96,6 +50,7 @@ def main():
     # Core string parameters.
     core_string_param_group = parser.add_argument_group(title="Core string parameters")
     core_string_param_group.add_argument("--optimization",     type=str,      default="Area",      choices=["Performance","Area"],    help="Choose what optimization is required")
+    core_string_param_group.add_argument("--structure",        type=str,      default="Direct",    choices=STRUCTURES,                help="Filter structure: Direct, Symmetric (linear-phase taps folding), Polyphase Decimator/Interpolator (fixed coefficients)")
     
     # Core range value parameters.
     core_range_param_group = parser.add_argument_group(title="Core range parameters")
@@ -105,6 +60,11 @@ def main():
     core_range_param_group.add_argument("--coefficient_width",  type=int,   default=2,  	choices=range(1,21),   help="Bit width for the coefficients")
     core_range_param_group.add_argument("--coefficient_fractional_bits",  type=int,   default=0,  	choices=range(0,21),   help="Fractional Bit Width of the coefficients")
     core_range_param_group.add_argument("--output_data_width",  type=int,   default=2,  	choices=range(0,39),   help="Output Data Bit Width")
+    core_range_param_group.add_argument("--decimation_factor",  type=int,   default=2,  	choices=DECIMATION_FACTORS,   help="Polyphase Decimator output rate divider (M)")
+    core_range_param_group.add_argument("--interpolation_factor",  type=int,   default=2,  	choices=INTERPOLATION_FACTORS,   help="Polyphase Interpolator output rate multiplier (L)")
+    core_range_param_group.add_argument("--channels",  type=int,   default=1,  	choices=TDM_CHANNELS,   help="Number of Channels (> 1: channels interleaved on AXI-Stream, tdest: channel id)")
+    core_range_param_group.add_argument("--clock_frequency",  type=int,   default=250,  	choices=range(1,1001),   help="Multi-channel Clock Frequency (MHz)")
+    core_range_param_group.add_argument("--sample_rate",  type=int,   default=1000,  	choices=range(1,1000001),   help="Multi-channel Aggregate Sample Rate of all channels (kSPS)")
 
     # Core file path parameters.
     core_file_path_group = parser.add_argument_group(title="Core file path parameters")
@@ -123,6 +83,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",    help="Build Core")
     build_group.add_argument("--build-dir",     default="./",           help="Build Directory")
     build_group.add_argument("--build-name",    default="FIR_generator", help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -142,6 +103,10 @@ def main():
     if args.json:
         args = rs_builder.import_args_from_json(parser=parser, json_filename=args.json)
         rs_builder.import_ip_details_json(build_dir=args.build_dir ,details=details , build_name = args.build_name, version = "v1_0")
+        if (args.channels > 1):
+            args.structure = "Direct"
+        if (args.structure != "Direct" or args.channels > 1):
+            args.optimization = "Performance"
         if (args.optimization == "Area"):
             if (not args.coefficients_file):
                 option_strings_to_remove = ['--number_of_coefficients']
@@ -153,11 +118,11 @@ def main():
             if (not args.coefficients_file):
                 option_strings_to_remove = ['--number_of_coefficients']
                 parser._actions = [action for action in parser._actions if action.option_strings and action.option_strings[0] not in option_strings_to_remove]
-                parser._actions[4].choices = range(1, 20 - args.input_width + 1)
-                parser._actions[5].choices = range(0, 20 - args.input_width + 1)
-            else:
                 parser._actions[5].choices = range(1, 20 - args.input_width + 1)
                 parser._actions[6].choices = range(0, 20 - args.input_width + 1)
+            else:
+                parser._actions[6].choices = range(1, 20 - args.input_width + 1)
+                parser._actions[7].choices = range(0, 20 - args.input_width + 1)
         if (args.coefficients_file == False):
             option_strings_to_remove = ['--file_path']
             parser._actions = [action for action in parser._actions if action.option_strings and action.option_strings[0] not in option_strings_to_remove]
@@ -175,6 +140,34 @@ def main():
             dep_dict.update({
                 'output_data_width' : 'True'
             })
+        if (args.structure != "Direct" or args.channels > 1):
+            dep_dict.update({
+                'optimization' : 'True'
+            })
+        if (args.channels > 1):
+            dep_dict.update({
+                'structure' : 'True'
+            })
+        else:
+            dep_dict.update({
+                'clock_frequency' : 'True',
+                'sample_rate'     : 'True'
+            })
+        if (args.structure != "Polyphase Decimator"):
+            dep_dict.update({
+                'decimation_factor' : 'True'
+            })
+        if (args.structure != "Polyphase Interpolator"):
+            dep_dict.update({
+                'interpolation_factor' : 'True'
+            })
+
+    # Symmetric/Polyphase structures and multi-channel (TDM, Direct only) are fixed coefficient DSP38
+    # chains (Performance).
+    if (args.channels > 1):
+        args.structure = "Direct"
+    if (args.structure != "Direct" or args.channels > 1):
+        args.optimization = "Performance"
     if (not args.coefficients_file):
         coefficients = args.coefficients
     else:
@@ -230,6 +223,34 @@ def main():
         else:
             summary ["Optimization"] = "Performance"
             summary ["Number of DSPs"] = len(extract_numbers(coefficients, args.coefficients_file))
+
+    # Structure: DSP38/BRAM usage and throughput (Area coefficients file: number_of_coefficients taps).
+    if (args.optimization == "Area" and args.coefficients_file):
+        taps = range(args.number_of_coefficients)
+    else:
+        taps = fixed_point_taps(extract_numbers(coefficients, args.coefficients_file), args.coefficient_width, args.coefficient_fractional_bits, args.signed)
+    factor          = rate_factor(args.structure, args.decimation_factor, args.interpolation_factor)
+    structure_usage = resources(args.structure, args.optimization, taps, args.input_width, factor, args.channels, args.clock_frequency, args.sample_rate)
+    structure_issue = structure_error(args.structure, taps, args.input_width, args.channels, args.clock_frequency, args.sample_rate)
+    summary ["Structure"] = args.structure
+    if (args.channels > 1):
+        tdm = tdm_schedule(max(len(taps), 1), args.clock_frequency, args.sample_rate)
+        summary ["Channels"]              = f"{args.channels} (AXI-Stream, tdest: channel id)"
+        summary ["Clock Frequency"]       = f"{args.clock_frequency} MHz"
+        summary ["Aggregate Sample Rate"] = f"{args.sample_rate} kSPS"
+        if (tdm is not None):
+            summary ["Clocks per Sample"]   = tdm["clocks_per_sample"]
+            summary ["Delay Line Memories"] = f"{tdm['dsps']} x {args.channels*tdm['clocks_per_sample']} words of {args.input_width} bits (BRAM or distributed RAM)"
+    elif (args.structure == "Polyphase Decimator"):
+        summary ["Decimation Factor"] = args.decimation_factor
+    elif (args.structure == "Polyphase Interpolator"):
+        summary ["Interpolation Factor"] = args.interpolation_factor
+    if (structure_issue is not None):
+        summary ["Structure Error"] = structure_issue
+    summary ["Number of DSPs"]       = structure_usage["dsps"]
+    summary ["Number of BRAMs"]      = structure_usage["brams"] if (args.channels == 1) else f"{structure_usage['brams']} if the delay line memories are mapped to BRAM"
+    summary ["Delay Line Registers"] = f"{structure_usage['registers']} flip-flops"
+    summary ["Throughput"]           = structure_usage["throughput"]
     if (args.truncated_output):
         summary ["Output Fractional Bits"] = f"{args.input_fractional_bits + args.coefficient_fractional_bits - max(0, (args.input_width + bit_growth) - args.output_data_width) if args.input_fractional_bits + args.coefficient_fractional_bits - max(0, (args.input_width + bit_growth) - args.output_data_width) > 0 else 0}"
         summary ["Output Rounding"] = "Truncation Applied."
@@ -241,90 +262,69 @@ def main():
     if args.json_template:
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
 
-    # Create Generator -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = FIRGenerator(platform,
-            input_width                   = args.input_width,
-            coefficients                  = coefficients,
-            coefficients_file             = args.coefficients_file,
-            coefficient_fractional_bits   = args.coefficient_fractional_bits,
-            signed                        = args.signed,
-            optimization                  = args.optimization,
-            number_of_coefficients        = args.number_of_coefficients,
-            coefficient_width             = args.coefficient_width,
-            input_fractional_bits         = args.input_fractional_bits,
-            truncated_output              = args.truncated_output,
-            output_data_width             = args.output_data_width
-    )
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
+        if (structure_issue is not None):
+            raise ValueError(structure_issue)
         rs_builder.prepare(
             build_dir  = args.build_dir,
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version    = "v1_0"
-        )
-
-        # IP_ID Parameter
-        now = datetime.datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "fir_generator", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"FIRGEN\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(\n".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
 
-        if (args.optimization == "Area"):
-            with open(wrapper, 'r') as file:
-                lines = file.readlines()
-
-            # Find the line number containing "endmodule"
-            endmodule_line_number = None
-            for i, line in enumerate(lines):
-                if "endmodule" in line:
-                    endmodule_line_number = i
-            if (args.coefficients_file):
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="FIRGEN", ip_version="00000000_00000000_0000000000000001")
+
+        # Coefficients initialization from file (before last "endmodule").
+        if (args.optimization == "Area") and (args.coefficients_file):
+            def add_coefficients_readmem(content):
+                lines = content.splitlines(keepends=True)
+                endmodule_line_number = None
+                for i, line in enumerate(lines):
+                    if "endmodule" in line:
+                        endmodule_line_number = i
                 read_mem = """
 initial begin
     $readmemh("{}", coefficients);
 end
 """.format(args.file_path)
-
                 lines.insert(endmodule_line_number, f"{read_mem}\n")
-                # Write the modified content back to the file
-                with open(wrapper, 'w') as file:
-                    file.writelines(lines)
+                return "".join(lines)
+            rs_builder.add_wrapper_transform(add_coefficients_readmem)
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.fir_generator_wrapper import FIRGenerator
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = FIRGenerator(platform,
+                    input_width                   = args.input_width,
+                    coefficients                  = coefficients,
+                    coefficients_file             = args.coefficients_file,
+                    coefficient_fractional_bits   = args.coefficient_fractional_bits,
+                    signed                        = args.signed,
+                    optimization                  = args.optimization,
+                    number_of_coefficients        = args.number_of_coefficients,
+                    coefficient_width             = args.coefficient_width,
+                    input_fractional_bits         = args.input_fractional_bits,
+                    truncated_output              = args.truncated_output,
+                    output_data_width             = args.output_data_width,
+                    structure                     = args.structure,
+                    decimation_factor             = args.decimation_factor,
+                    interpolation_factor          = args.interpolation_factor,
+                    channels                      = args.channels,
+                    clock_frequency               = args.clock_frequency,
+                    sample_rate                   = args.sample_rate
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version    = "v1_0"
+            )
 
         build_name = args.build_name.rsplit( ".", 1 )[ 0 ]
         file = os.path.join(args.build_dir, "rapidsilicon/ip/fir_generator/v1_0", build_name, "sim/testbench.v")
@@ -349,6 +349,35 @@ end
             text = text.replace("forever #5", "forever #%s" % str(((1/input_maximum)/2) * 1000))
             file.write_text(text)
 
+        # Reference model parameters (sim/test_fir_generator.py).
+        model_config = {
+            "parameters" : {
+                "input_width"                 : args.input_width,
+                "coefficients"                : coefficients,
+                "coefficients_file"           : args.coefficients_file,
+                "coefficient_fractional_bits" : args.coefficient_fractional_bits,
+                "signed"                      : args.signed,
+                "optimization"                : args.optimization,
+                "number_of_coefficients"      : args.number_of_coefficients,
+                "coefficient_width"           : args.coefficient_width,
+                "input_fractional_bits"       : args.input_fractional_bits,
+                "truncated_output"            : args.truncated_output,
+                "output_data_width"           : args.output_data_width,
+                "structure"                   : args.structure,
+                "decimation_factor"           : args.decimation_factor,
+                "interpolation_factor"        : args.interpolation_factor,
+                "channels"                    : args.channels,
+                "clock_frequency"             : args.clock_frequency,
+                "sample_rate"                 : args.sample_rate,
+            },
+            "clock_period_ns" : (1000/input_maximum) if (args.optimization == "Area") else (1000/args.clock_frequency) if (args.channels > 1) else 10,
+        }
+        with open(os.path.join(os.path.dirname(file), "fir_model.json"), "w") as f:
+            json.dump(model_config, f, indent=4)
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
+
 if __name__ == "__main__":
     main()
     
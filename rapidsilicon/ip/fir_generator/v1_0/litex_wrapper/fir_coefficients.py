@@ -0,0 +1,67 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2023 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# FIR coefficients parsing and quantization (no migen/LiteX dependency: also used for arguments
+# validation and by the reference model).
+
+import re
+
+# Extracting Numbers from the string obtained from the generator
+def extract_numbers(input_string, coefficients_file):
+    if (not coefficients_file):
+        # Use a regular expression to find all numbers (positive or negative)
+        # that are separated by commas or whitespaces
+        pattern = r'[-+]?(?:0[xX][\dA-Fa-f]+|\d*\.?\d+)'
+        numbers = re.findall(pattern, input_string)
+
+        # Convert the found strings to numbers (float, int, or hex)
+        converted_numbers = []
+        for num in numbers:
+            if '.' in num:
+                converted_numbers.append(float(num))
+            elif 'x' in num.lower():
+                converted_numbers.append(int(num, 16))
+            else:
+                converted_numbers.append(int(num))
+        return converted_numbers
+    else:
+        try:
+            with open(input_string, 'r') as file:
+                content = file.read()
+                # Use regular expression to find all numbers (positive or negative)
+                numbers = [int(num, 16) if 'x' in num.lower() else float(num) if '.' in num else int(num) for num in re.findall(r'[-+]?(?:0[xX][\dA-Fa-f]+|\d*\.?\d+)', content)]
+                return numbers
+        except FileNotFoundError:
+            return []
+
+# Converting fractional or signed number into fixed binary and then back to decimal
+def decimal_to_fixed_point(decimal_number, integer=4, fraction=4, signed=False):
+    integer_part = bin(int(abs(decimal_number)))[2:]
+    binary_integer = integer_part.zfill(integer)
+    fractional_part = bin(int((abs(decimal_number) - int(abs(decimal_number))) * 2**fraction))[2:]
+    binary_fraction = fractional_part.zfill(fraction)
+    if (fraction != 0):
+        binary_result = str(binary_integer) + str(binary_fraction)
+    else:
+        binary_result = str(binary_integer)
+    if (decimal_number < 0):
+        inverted_bits = ''.join('1' if bit == '0' else '0' for bit in binary_result)
+        binary_result = bin(int(inverted_bits, 2) + 1)[2:]
+
+    if (len(binary_result) < 20 and signed):
+        sign_bit = binary_result[0]
+        sign_extension = sign_bit * (20 - len(binary_result))
+        binary_result = sign_extension + binary_result
+    return int(binary_result, 2)
+
+# Fixed point taps (DSP38 20-bit A/COEFF values, as signed integers when signed)
+def fixed_point_taps(coefficients, coefficient_width, fractional_bits, signed):
+    taps = []
+    for coefficient in coefficients:
+        tap = decimal_to_fixed_point(coefficient, coefficient_width - fractional_bits, fractional_bits, signed) & 0xFFFFF
+        taps.append(tap - (1 << 20) if (signed and tap & 0x80000) else tap)
+    return taps
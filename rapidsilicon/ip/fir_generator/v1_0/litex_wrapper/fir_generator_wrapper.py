@@ -0,0 +1,98 @@
+#
+# This file is Copyright (c) 2023 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# fir_generator LiteX wrapper: IOs and module elaborated by fir_generator_gen.py on --build.
+
+import math
+
+from litex_wrapper.fir_litex_generator import *
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIStreamInterface
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+
+def get_clkin_ios(data_in, data_out):
+    return [
+        ("clk",         0,  Pins(1)),
+        ("rst",         0,  Pins(1)),
+		("data_in",     0,  Pins(data_in)),
+        ("data_out",    0,  Pins(data_out)),
+        ("ready",       0,  Pins(1))
+    ]
+
+# Multi-channel (TDM): s_axis/m_axis instead of data_in/data_out.
+def get_tdm_ios():
+    return [
+        ("clk",         0,  Pins(1)),
+        ("rst",         0,  Pins(1)),
+        ("ready",       0,  Pins(1))
+    ]
+
+# Polyphase Decimator: data_out_valid (one output every decimation_factor clocks).
+# Polyphase Interpolator: data_in_ready (data_in sampled every interpolation_factor clocks).
+def get_structure_ios(structure):
+    if (structure == "Polyphase Decimator"):
+        return [("data_out_valid", 0, Pins(1))]
+    if (structure == "Polyphase Interpolator"):
+        return [("data_in_ready",  0, Pins(1))]
+    return []
+
+# FIR Generator ----------------------------------------------------------------------------------
+class FIRGenerator(Module):
+    def __init__(self, platform, input_width, coefficients, coefficients_file, coefficient_fractional_bits, signed, optimization, number_of_coefficients, coefficient_width, input_fractional_bits, truncated_output, output_data_width,
+        structure="Direct", decimation_factor=2, interpolation_factor=2, channels=1, clock_frequency=0, sample_rate=0):
+        # Clocking ---------------------------------------------------------------------------------
+        if (optimization == "Area" and coefficients_file):
+            non_zero_elements = [element for element in extract_numbers(coefficients, coefficients_file) if element != 0]
+            coefficient_width = 20
+            bit_growth = int(coefficient_width + math.ceil(math.log2(len(non_zero_elements))) if len(non_zero_elements) > 0 else 0)
+        elif (coefficients == "" or len(extract_numbers(coefficients, coefficients_file)) <= 0):
+            bit_growth = 0
+        else:
+            abs_sum = sum(abs(coeff) for coeff in extract_numbers(coefficients, coefficients_file))
+            bit_growth = math.ceil(math.log2(abs_sum))
+
+        self.clock_domains.cd_sys  = ClockDomain()
+        if (channels > 1):
+            # Multi-channel (TDM) --------------------------------------------------------------------
+            platform.add_extension(get_tdm_ios())
+            s_axis = AXIStreamInterface(data_width=input_width, dest_width=math.ceil(math.log2(channels)))
+            m_axis = AXIStreamInterface(data_width=min(input_width + bit_growth, 38) if not truncated_output else output_data_width, dest_width=math.ceil(math.log2(channels)))
+            platform.add_extension(s_axis.get_ios("s_axis"))
+            self.comb += s_axis.connect_to_pads(platform.request("s_axis"), mode="slave")
+            platform.add_extension(m_axis.get_ios("m_axis"))
+            self.comb += m_axis.connect_to_pads(platform.request("m_axis"), mode="master")
+
+            self.submodules.fir = fir = FIRTDM(s_axis, m_axis, input_width, coefficients, coefficients_file, coefficient_fractional_bits, signed, number_of_coefficients,
+                coefficient_width, truncated_output, output_data_width, channels, clock_frequency, sample_rate)
+            self.comb += platform.request("ready").eq(fir.ready)
+            self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+            self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+            return
+
+        platform.add_extension(get_clkin_ios(input_width, min(input_width + bit_growth, 38) if not truncated_output else output_data_width))
+        platform.add_extension(get_structure_ios(structure))
+        if(optimization == "Area"):
+            self.clock_domains.cd_fast	= ClockDomain()
+	
+        self.submodules.fir = fir = FIR(input_width, coefficients, coefficients_file, coefficient_fractional_bits, signed, optimization, number_of_coefficients, coefficient_width, input_fractional_bits, truncated_output, output_data_width,
+            structure, decimation_factor, interpolation_factor)
+    
+        self.comb += fir.data_in.eq(platform.request("data_in"))
+        if (optimization == "Area"):
+            self.sync += platform.request("data_out").eq(fir.data_out)
+        else:
+            self.comb += platform.request("data_out").eq(fir.data_out)
+        self.comb += platform.request("ready").eq(fir.ready)
+        if (structure == "Polyphase Decimator"):
+            self.comb += platform.request("data_out_valid").eq(fir.data_out_valid)
+        elif (structure == "Polyphase Interpolator"):
+            self.comb += platform.request("data_in_ready").eq(fir.data_in_ready)
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
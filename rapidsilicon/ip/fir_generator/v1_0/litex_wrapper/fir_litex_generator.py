@@ -6,79 +6,20 @@
 # SPDX-License-Identifier: MIT
 #
 
-import datetime
 import logging
 import math
 from migen import *
-import re
-
-# Extracting Numbers from the string obtained from the generator
-def extract_numbers(input_string, coefficients_file):
-    if (not coefficients_file):
-        # Use a regular expression to find all numbers (positive or negative)
-        # that are separated by commas or whitespaces
-        pattern = r'[-+]?(?:0[xX][\dA-Fa-f]+|\d*\.?\d+)'
-        numbers = re.findall(pattern, input_string)
-
-        # Convert the found strings to numbers (float, int, or hex)
-        converted_numbers = []
-        for num in numbers:
-            if '.' in num:
-                converted_numbers.append(float(num))
-            elif 'x' in num.lower():
-                converted_numbers.append(int(num, 16))
-            else:
-                converted_numbers.append(int(num))
-        return converted_numbers
-    else:
-        try:
-            with open(input_string, 'r') as file:
-                content = file.read()
-                # Use regular expression to find all numbers (positive or negative)
-                numbers = [int(num, 16) if 'x' in num.lower() else float(num) if '.' in num else int(num) for num in re.findall(r'[-+]?(?:0[xX][\dA-Fa-f]+|\d*\.?\d+)', content)]
-                return numbers
-        except FileNotFoundError:
-            return []
-    
-
-# Converting fractional or signed number into fixed binary and then back to decimal
-def decimal_to_fixed_point(decimal_number, integer=4, fraction=4, signed=False):
-    integer_part = bin(int(abs(decimal_number)))[2:]
-    binary_integer = integer_part.zfill(integer)
-    fractional_part = bin(int((abs(decimal_number) - int(abs(decimal_number))) * 2**fraction))[2:]
-    binary_fraction = fractional_part.zfill(fraction)
-    if (fraction != 0):
-        binary_result = str(binary_integer) + str(binary_fraction)
-    else:
-        binary_result = str(binary_integer)
-    if (decimal_number < 0):
-        inverted_bits = ''.join('1' if bit == '0' else '0' for bit in binary_result)
-        binary_result = bin(int(inverted_bits, 2) + 1)[2:]
-
-    if (len(binary_result) < 20 and signed):
-        sign_bit = binary_result[0]
-        sign_extension = sign_bit * (20 - len(binary_result))
-        binary_result = sign_extension + binary_result
-    return int(binary_result, 2)
-
-# Find the multiplier and divisor
-def find_x_y(result, x_range=(16, 1000), y_range=(1, 63)):
-    for x in range(x_range[0], x_range[1] + 1):
-        for y in range(y_range[0], y_range[1] + 1):
-            if x / y == result:
-                return x, y
-
-    return 0, 0
-
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
+from migen.genlib.fifo import SyncFIFO
+
+from litex_wrapper.fir_coefficients import extract_numbers, decimal_to_fixed_point, fixed_point_taps
+from litex_wrapper.fir_structures import folded_taps, polyphase_taps, rate_factor, symmetry, tdm_schedule
+
+from pll_solver import best_solution
 
 # FIR Generator ---------------------------------------------------------------------------------------
 class FIR(Module):
-    def __init__(self, input_width, coefficients, coefficients_file, fractional_bits, signed, optimization, number_of_coefficients, coefficient_width, input_fractional_bits, truncated_output, output_data_width):
+    def __init__(self, input_width, coefficients, coefficients_file, fractional_bits, signed, optimization, number_of_coefficients, coefficient_width, input_fractional_bits, truncated_output, output_data_width,
+        structure="Direct", decimation_factor=2, interpolation_factor=2):
 
         if (coefficients != ""):
             coefficients = extract_numbers(coefficients, coefficients_file)
@@ -101,13 +42,29 @@ class FIR(Module):
         self.logger.info(f"DATA_WIDTH_IN       : {input_width}")
         self.logger.info(f"DATA_WIDTH_OUT       : {min(input_width + bit_growth, 38) if not truncated_output else output_data_width}")
         self.logger.info(f"COEFFICIENTS       : {coefficients}")
+        self.logger.info(f"STRUCTURE       : {structure}")
 
         self.logger.info(f"===================================================")
 
         self.data_in = Signal(bits_sign=(input_width, True if signed else False))
         self.data_out = Signal(bits_sign=(min(input_width + bit_growth, 38) if not truncated_output else output_data_width, True if signed else False))
 
-        if (optimization == "Performance"):
+        # Data Out: DSP38 Z bits (full width with bit growth or truncated MSBs).
+        full_width = min(input_width + bit_growth, 38)
+        z_out = slice(0, full_width) if not truncated_output else slice(full_width - output_data_width, full_width)
+
+        if (structure != "Direct" and len(coefficients) > 0):
+            taps   = fixed_point_taps(list(reversed(coefficients)), coefficient_width, fractional_bits, signed)
+            factor = rate_factor(structure, decimation_factor, interpolation_factor)
+            self.ready = Signal()
+            self.comb += self.ready.eq(~ResetSignal())
+            if (structure == "Symmetric"):
+                self.add_symmetric(taps, input_width, signed, z_out)
+            elif (structure == "Polyphase Decimator"):
+                self.add_polyphase_decimator(taps, factor, signed, z_out)
+            else:
+                self.add_polyphase_interpolator(taps, factor, input_width, signed, z_out)
+        elif (optimization == "Performance"):
             self.z = Array(Signal() for _ in range (len(coefficients)))
             self.delay_b = Array(Signal() for _ in range (len(coefficients)))
             self.ready = Signal()
@@ -316,7 +273,9 @@ class FIR(Module):
             self.input_coeff = Signal(20)
             if (coefficients_file):
                 self.comb += self.input_coeff.eq(Mux(self.ready, self.port.dat_r, 0))
-            multiplier, divisor = find_x_y(number_of_coefficients)
+            # Fast clock = number_of_coefficients x input clock (ratio only, input clock range in summary).
+            pll_solution = best_solution(1, number_of_coefficients, check_limits=False)
+            multiplier, divisor = pll_solution["pll_mult"], pll_solution["pll_div"]
             self.comb += self.feedback.eq(Mux(self.count == 0, C(1, 3), C(0, 3)))
 
             self.specials += Instance("DSP38",
@@ -357,4 +316,310 @@ class FIR(Module):
                 o_SERDES_FAST_CLK   = ClockSignal("fast"),
                 o_LOCK              = self.ready
             )
-            
\ No newline at end of file
+            
+    # DSP38 Chain ----------------------------------------------------------------------------------
+    # Transposed chain as in Performance: A of each DSP38 is the previous Z[19:0] (2 clocks per DSP38),
+    # last DSP38 saturates without output register. stages: (B, FEEDBACK, [COEFF_0..3]).
+    def add_dsp_chain(self, stages, signed):
+        z = [Signal(bits_sign=(38, True if signed else False), name=f"z_{i}") for i in range(len(stages))]
+        for i, (b, feedback, coeffs) in enumerate(stages):
+            last   = (i == len(stages) - 1)
+            coeffs = {f"p_COEFF_{k}" : C(coeff & 0xFFFFF, 20) for k, coeff in enumerate(coeffs)}
+            self.specials += Instance("DSP38",
+                # Mode Bits to configure DSP
+                p_DSP_MODE      = "MULTIPLY_ADD_SUB",
+                p_OUTPUT_REG_EN = "FALSE" if last else "TRUE",
+                p_INPUT_REG_EN  = "TRUE",
+                **coeffs,
+
+                # Reset
+                i_CLK           = ClockSignal(),
+                i_RESET         = ResetSignal(),
+
+                # IOs
+                i_A             = C(0, 20) if (i == 0) else z[i - 1][0:20],
+                i_B             = b,
+                o_Z             = z[i],
+                i_FEEDBACK      = feedback,
+                i_UNSIGNED_A    = not signed,
+                i_UNSIGNED_B    = not signed,
+                i_LOAD_ACC      = 1,
+                i_ACC_FIR       = C(0, 6),
+                i_ROUND         = 0,
+                i_SATURATE      = last,
+                i_SHIFT_RIGHT   = C(0, 6),
+                i_SUBTRACT      = 0
+            )
+        return z[-1]
+
+    # Symmetric ------------------------------------------------------------------------------------
+    # DSP38 i multiplies tap m by x[n-m] +/- x[n-mirror] (registered fabric pre-adder): with 2 clocks per
+    # DSP38 on the chain, its operands are the delay line taps 3*i and N-1+i.
+    def add_symmetric(self, taps, input_width, signed, z_out):
+        stages = folded_taps(taps)
+        sign   = symmetry(taps)
+        delay  = [self.data_in] + [Signal(bits_sign=(input_width, True if signed else False), name=f"delay_{q}") for q in range(1, len(taps) + len(stages) - 1)]
+        for q in range(1, len(delay)):
+            self.sync += delay[q].eq(delay[q - 1])
+        chain = []
+        for i, (tap, m, mirror) in enumerate(stages):
+            pre_add = Signal(bits_sign=(18, True if signed else False), name=f"pre_add_{i}")
+            if mirror is None:
+                self.sync += pre_add.eq(delay[3*i])
+            elif sign > 0:
+                self.sync += pre_add.eq(delay[3*i] + delay[len(taps) - 1 + i])
+            else:
+                self.sync += pre_add.eq(delay[3*i] - delay[len(taps) - 1 + i])
+            chain.append((pre_add, C(4, 3), [tap]))
+        self.comb += self.data_out.eq(self.add_dsp_chain(chain, signed)[z_out])
+
+    # Polyphase Decimator --------------------------------------------------------------------------
+    # Transposed polyphase: every DSP38 multiplies data_in by one tap of its block per clock and
+    # accumulates the factor taps of the block, starting each output from the previous DSP38 block
+    # sum (A, FEEDBACK 4: COEFF_0 tap). Last DSP38 holds an output every factor clocks.
+    def add_polyphase_decimator(self, taps, factor, signed, z_out):
+        blocks = polyphase_taps(taps, factor)
+        self.data_out_valid = Signal()
+        phase = Signal(max=factor)
+        self.sync += If(phase == (factor - 1), phase.eq(0)).Else(phase.eq(phase + 1))
+        z = [Signal(bits_sign=(38, True if signed else False), name=f"z_{j}") for j in range(len(blocks))]
+        for j in range(len(blocks)):
+            block = blocks[len(blocks) - 1 - j]
+            last  = (j == len(blocks) - 1)
+            carry = C(0, 20) if (j == 0) else z[j - 1][0:20]
+            a     = Signal(20, name=f"a_{j}")
+            self.comb += Case(phase, {
+                **{r : a.eq(block[factor - 1 - r] & 0xFFFFF) for r in range(1, factor)},
+                "default" : a.eq(carry),
+            })
+            self.specials += Instance("DSP38",
+                # Mode Bits to configure DSP
+                p_DSP_MODE      = "MULTIPLY_ACCUMULATE",
+                p_OUTPUT_REG_EN = "FALSE",
+                p_INPUT_REG_EN  = "FALSE",
+                p_COEFF_0       = C(block[factor - 1] & 0xFFFFF, 20),
+
+                # Reset
+                i_CLK           = ClockSignal(),
+                i_RESET         = ResetSignal(),
+
+                # IOs
+                i_A             = a,
+                i_B             = self.data_in,
+                o_Z             = z[j],
+                i_FEEDBACK      = Mux(phase == 0, C(4, 3), C(0, 3)),
+                i_UNSIGNED_A    = not signed,
+                i_UNSIGNED_B    = not signed,
+                i_LOAD_ACC      = 1,
+                i_ACC_FIR       = C(0, 6),
+                i_ROUND         = 0,
+                i_SATURATE      = last,
+                i_SHIFT_RIGHT   = C(0, 6),
+                i_SUBTRACT      = 0
+            )
+        self.sync += [
+            self.data_out_valid.eq(phase == 0),
+            If(phase == 0,
+                self.data_out.eq(z[-1][z_out])
+            )
+        ]
+
+    # Polyphase Interpolator -----------------------------------------------------------------------
+    # data_in is sampled every factor clocks (data_in_ready) and held, DSP38 i of the chain selects the
+    # tap of the output phase with FEEDBACK (COEFF_0..3) and multiplies the sample i blocks older
+    # (held sample delayed by i*(factor - 2) clocks, the chain itself delays by 2 clocks per DSP38).
+    def add_polyphase_interpolator(self, taps, factor, input_width, signed, z_out):
+        blocks = polyphase_taps(taps, factor)
+        self.data_in_ready = Signal()
+        phase = Signal(max=factor)
+        self.sync += If(phase == (factor - 1), phase.eq(0)).Else(phase.eq(phase + 1))
+        self.comb += self.data_in_ready.eq(phase == 0)
+        hold  = [Signal(bits_sign=(input_width, True if signed else False), name=f"hold_{q}") for q in range(1 + (len(blocks) - 1)*(factor - 2))]
+        self.sync += If(phase == 0, hold[0].eq(self.data_in))
+        for q in range(1, len(hold)):
+            self.sync += hold[q].eq(hold[q - 1])
+        chain = []
+        for i in range(len(blocks)):
+            block    = len(blocks) - 1 - i
+            delay    = 2*block
+            feedback = Signal(3, name=f"feedback_{i}")
+            self.comb += Case(phase, {p : feedback.eq(4 + (p - 1 + delay) % factor) for p in range(factor)})
+            chain.append((hold[block*(factor - 2)], feedback, blocks[block]))
+        self.comb += self.data_out.eq(self.add_dsp_chain(chain, signed)[z_out])
+
+# FIR Multi-channel (TDM) ---------------------------------------------------------------------------
+# Channels interleaved on AXI-Stream (tdest: channel id), one sample every T clocks. DSP38 b (MAC)
+# accumulates taps b*T..b*T+T-1 of a sample, starting from DSP38 b-1 sum (A, FEEDBACK 4: COEFF_0 tap)
+# T clocks after it. Per channel delay lines are split in one memory per DSP38 (channels x T words,
+# circular per channel): each sample shifts the oldest word of a memory into the next one.
+#
+# DSP38 b window, s: start (token: channel, pointer, tlast from DSP38 b-1 or s_axis):
+#   s       : read oldest word (passed to DSP38 b+1).
+#   s+1     : MAC tap 0 on the newest word (sample or DSP38 b-1 oldest word), written over the oldest.
+#   s+1+r   : MAC tap r (r = 1..T-1) on the word read at s+r.
+#   s+T     : DSP38 b+1 start (next window of DSP38 b may start too), s+T+1: sum on Z.
+class FIRTDM(Module):
+    def __init__(self, s_axis, m_axis, input_width, coefficients, coefficients_file, fractional_bits, signed, number_of_coefficients,
+        coefficient_width, truncated_output, output_data_width, channels, clock_frequency, sample_rate):
+
+        values = extract_numbers(coefficients, coefficients_file) if (coefficients != "") else []
+        bit_growth = math.ceil(math.log2(sum(abs(coeff) for coeff in values))) if len(values) > 0 else 0
+        schedule   = tdm_schedule(max(len(values), 1), clock_frequency, sample_rate)
+        T          = schedule["clocks_per_sample"]
+        blocks     = polyphase_taps(fixed_point_taps(values, coefficient_width, fractional_bits, signed), T)
+
+        self.logger = logging.getLogger("FIR")
+        self.logger.propagate = True
+        self.logger.info(f"=================== PARAMETERS ====================")
+        self.logger.info(f"DATA_WIDTH_IN       : {input_width}")
+        self.logger.info(f"CHANNELS       : {channels}")
+        self.logger.info(f"DSPS       : {len(blocks)}")
+        self.logger.info(f"CLOCKS_PER_SAMPLE       : {T}")
+        self.logger.info(f"===================================================")
+
+        full_width = min(input_width + bit_growth, 38)
+        z_out  = slice(0, full_width) if not truncated_output else slice(full_width - output_data_width, full_width)
+        dsps   = len(blocks)
+        depth  = dsps + 2
+        self.ready = Signal()
+        self.comb += self.ready.eq(~ResetSignal())
+
+        # Tokens (start pulse, channel, pointer, tlast) of each DSP38 window (dsps: output).
+        start   = [Signal(name=f"start_{b}") for b in range(dsps + 1)]
+        channel = [Signal(max=max(channels, 2), name=f"channel_{b}") for b in range(dsps + 1)]
+        pointer = [Signal(max=max(T, 2), name=f"pointer_{b}") for b in range(dsps + 1)]
+        last    = [Signal(name=f"last_{b}") for b in range(dsps + 1)]
+        newest  = [Signal(input_width, name=f"newest_{b}") for b in range(dsps)]
+
+        # Input: one sample every T clocks, when the output FIFO has room for all windows in flight.
+        self.submodules.fifo = fifo = SyncFIFO(len(m_axis.data) + len(m_axis.dest) + 1, depth)
+        pointers = Array(Signal(max=max(T, 2), name=f"channel_pointer_{c}") for c in range(channels))
+        busy     = Signal(max=max(T, 2))
+        inflight = Signal(max=depth + 1)
+        accept   = Signal()
+        output   = Signal()
+        self.comb += [
+            s_axis.ready.eq((busy == 0) & ((fifo.level + inflight) < depth) & ~ResetSignal()),
+            accept.eq(s_axis.valid & s_axis.ready),
+        ]
+        self.sync += [
+            start[0].eq(accept),
+            If(accept,
+                busy.eq(T - 1),
+                newest[0].eq(s_axis.data),
+                channel[0].eq(s_axis.dest),
+                last[0].eq(s_axis.last),
+                pointer[0].eq(Mux(pointers[s_axis.dest] == 0, T - 1, pointers[s_axis.dest] - 1)),
+                pointers[s_axis.dest].eq(Mux(pointers[s_axis.dest] == 0, T - 1, pointers[s_axis.dest] - 1)),
+            ).Elif(busy != 0,
+                busy.eq(busy - 1)
+            ),
+            If(accept & ~output,
+                inflight.eq(inflight + 1)
+            ).Elif(output & ~accept,
+                inflight.eq(inflight - 1)
+            )
+        ]
+
+        z = [Signal(bits_sign=(38, True if signed else False), name=f"z_{b}") for b in range(dsps)]
+        for b in range(dsps):
+            block = blocks[b]
+            last_dsp = (b == dsps - 1)
+
+            # Delay line memory (channels x T words).
+            memory = Memory(input_width, channels*T)
+            read   = memory.get_port()
+            write  = memory.get_port(write_capable=True)
+            self.specials += memory, read, write
+
+            # MAC window: active from s+1 to s+T, tap r.
+            mac = Signal(name=f"mac_{b}")
+            tap = Signal(max=max(T, 2), name=f"tap_{b}")
+            self.sync += [
+                If(start[b],
+                    mac.eq(1),
+                    tap.eq(0)
+                ).Elif(mac,
+                    If(tap == (T - 1),
+                        mac.eq(0)
+                    ).Else(
+                        tap.eq(tap + 1)
+                    )
+                )
+            ]
+
+            # Memory: oldest word read at s, word r + 1 read on tap r, newest word written on tap 0.
+            offset = Signal(max=2*T, name=f"offset_{b}")
+            self.comb += [
+                offset.eq(pointer[b] + tap + 1),
+                If(start[b],
+                    read.adr.eq(channel[b]*T + pointer[b])
+                ).Elif(offset >= T,
+                    read.adr.eq(channel[b]*T + offset - T)
+                ).Else(
+                    read.adr.eq(channel[b]*T + offset)
+                ),
+                write.adr.eq(channel[b]*T + pointer[b]),
+                write.dat_w.eq(newest[b]),
+                write.we.eq(mac & (tap == 0)),
+            ]
+
+            # Next DSP38 window: oldest word and token, started at s+T.
+            self.sync += [
+                start[b + 1].eq(mac & (tap == (T - 2))),
+                If(mac & (tap == (T - 2)),
+                    channel[b + 1].eq(channel[b]),
+                    pointer[b + 1].eq(pointer[b]),
+                    last[b + 1].eq(last[b])
+                ),
+            ]
+            if not last_dsp:
+                self.sync += If(mac & (tap == 0), newest[b + 1].eq(read.dat_r))
+
+            # DSP38 operands: tap 0: COEFF_0 x newest word + previous DSP38 sum, tap r: A x word r.
+            a_in = Signal(20, name=f"a_{b}")
+            b_in = Signal(bits_sign=(18, True if signed else False), name=f"b_{b}")
+            data = Signal(bits_sign=(input_width, True if signed else False), name=f"data_{b}")
+            self.comb += [
+                Case(tap, {
+                    **{r : a_in.eq(block[r] & 0xFFFFF) for r in range(1, T)},
+                    "default" : a_in.eq(C(0, 20) if (b == 0) else z[b - 1][0:20]),
+                }),
+                data.eq(Mux(tap == 0, newest[b], read.dat_r)),
+                b_in.eq(data),
+            ]
+            self.specials += Instance("DSP38",
+                # Mode Bits to configure DSP
+                p_DSP_MODE      = "MULTIPLY_ACCUMULATE",
+                p_OUTPUT_REG_EN = "FALSE",
+                p_INPUT_REG_EN  = "FALSE",
+                p_COEFF_0       = C(block[0] & 0xFFFFF, 20),
+
+                # Reset
+                i_CLK           = ClockSignal(),
+                i_RESET         = ResetSignal(),
+
+                # IOs
+                i_A             = a_in,
+                i_B             = b_in,
+                o_Z             = z[b],
+                i_FEEDBACK      = Mux(tap == 0, C(4, 3), C(0, 3)),
+                i_UNSIGNED_A    = not signed,
+                i_UNSIGNED_B    = not signed,
+                i_LOAD_ACC      = mac,
+                i_ACC_FIR       = C(0, 6),
+                i_ROUND         = 0,
+                i_SATURATE      = last_dsp,
+                i_SHIFT_RIGHT   = C(0, 6),
+                i_SUBTRACT      = 0
+            )
+
+        # Output: last DSP38 sum (s+T+1) to the FIFO with its channel/tlast.
+        self.sync += output.eq(start[dsps])
+        self.comb += [
+            fifo.we.eq(output),
+            fifo.din.eq(Cat(z[-1][z_out], channel[dsps], last[dsps])),
+            m_axis.valid.eq(fifo.readable),
+            fifo.re.eq(m_axis.ready),
+            Cat(m_axis.data, m_axis.dest, m_axis.last).eq(fifo.dout),
+        ]
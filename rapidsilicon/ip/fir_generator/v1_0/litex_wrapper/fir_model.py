@@ -0,0 +1,212 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# FIR generator bit-accurate reference model (NumPy, no migen): predicts data_out of the generated
+# wrapper from the generator parameters, one vectorized pass per tap (no per-sample Python loop).
+#
+# Performance: transposed DSP38 chain, each partial sum is passed to the next DSP38 on its 20-bit A
+#              input (truncated, sign-extended when signed), last DSP38 saturates to 38 bits.
+# Area:        single DSP38 accumulating all taps at the fast clock (64-bit accumulator, 38 bits
+#              saturation), B input is the zero-extended input_width bits delay line.
+#
+# Structures (litex_wrapper/fir_structures.py), DSP38 partial sums passed on A as in Performance:
+# Symmetric:   one DSP38 per pair of taps on pre-added samples (x[n-m] +/- x[n-(N-1-m)]).
+# Polyphase:   one DSP38 per block of factor taps (64-bit accumulation within a block). Decimator
+#              outputs are computed for every input sample (the IP outputs one every factor clocks),
+#              Interpolator outputs are factor values (output phases) per input sample.
+# TDM:         channels > 1, per channel delay lines, one DSP38 per block of clocks_per_sample taps
+#              (first taps first, 64-bit accumulation within a block).
+
+import math
+
+import numpy as np
+
+from litex_wrapper.fir_coefficients import extract_numbers, decimal_to_fixed_point
+from litex_wrapper.fir_structures import folded_taps, polyphase_taps, rate_factor, tdm_schedule
+
+# DSP38 --------------------------------------------------------------------------------------------
+
+DSP_A_WIDTH = 20
+DSP_B_WIDTH = 18
+DSP_Z_WIDTH = 38
+
+def to_signed(values, width):
+    # Two's complement interpretation of the width LSBs (NumPy arrays or ints).
+    sign = 1 << (width - 1)
+    return ((values & ((1 << width) - 1)) ^ sign) - sign
+
+def saturate(values, signed):
+    if signed:
+        return np.clip(values, -(1 << (DSP_Z_WIDTH - 1)), (1 << (DSP_Z_WIDTH - 1)) - 1)
+    return np.clip(values, 0, (1 << DSP_Z_WIDTH) - 1)
+
+# Coefficients -------------------------------------------------------------------------------------
+
+def readmemh_words(filename, width=DSP_A_WIDTH):
+    # Coefficients memory content ($readmemh of the coefficients file, Area optimization).
+    words = []
+    with open(filename, "r") as f:
+        for line in f:
+            for word in line.split("//")[0].split():
+                words.append(int(word.replace("_", ""), 16) & ((1 << width) - 1))
+    return words
+
+def bit_growth(values, optimization, coefficients_file, coefficient_width):
+    # Same bit growth as the FIR module (data_out width = min(input_width + bit_growth, 38)).
+    if (optimization == "Area" and coefficients_file):
+        non_zero_elements = [element for element in values if element != 0]
+        return int(coefficient_width + math.ceil(math.log2(len(non_zero_elements))) if len(non_zero_elements) > 0 else 0)
+    if (len(values) <= 0):
+        return 0
+    return math.ceil(math.log2(sum(abs(coeff) for coeff in values)))
+
+# FIR Model ----------------------------------------------------------------------------------------
+
+class FIRModel:
+    def __init__(self, input_width, coefficients, coefficients_file, coefficient_fractional_bits, signed, optimization,
+        number_of_coefficients, coefficient_width, input_fractional_bits, truncated_output, output_data_width,
+        structure="Direct", decimation_factor=2, interpolation_factor=2, channels=1, clock_frequency=0, sample_rate=0):
+        self.input_width  = input_width
+        self.signed       = bool(signed)
+        self.optimization = "Performance" if (structure != "Direct" or channels > 1) else optimization
+        self.structure    = "TDM" if (channels > 1) else structure
+        self.factor       = rate_factor(structure, decimation_factor, interpolation_factor)
+        self.channels     = channels
+
+        # Taps (coefficient of x[n-m] at index m) as DSP38 A input values.
+        values = extract_numbers(coefficients, coefficients_file) if coefficients != "" else []
+        if (self.optimization == "Area" and coefficients_file):
+            coefficient_width = DSP_A_WIDTH
+            words = readmemh_words(coefficients)[:number_of_coefficients]
+            taps  = words + [0]*(number_of_coefficients - len(words))
+        else:
+            integer = coefficient_width - coefficient_fractional_bits
+            taps    = [decimal_to_fixed_point(c, integer, coefficient_fractional_bits, self.signed) for c in values]
+        if len(taps) == 0:
+            raise ValueError("FIR model requires at least one coefficient")
+        self.taps = [to_signed(t, DSP_A_WIDTH) if self.signed else t & ((1 << DSP_A_WIDTH) - 1) for t in taps]
+
+        # data_out: bits [start:stop] of the DSP38 Z output (Python/migen slice semantics).
+        full_width = min(input_width + bit_growth(values, self.optimization, coefficients_file, coefficient_width), DSP_Z_WIDTH)
+        if truncated_output:
+            self.output_width = output_data_width
+            self.start, self.stop, _ = slice(full_width - output_data_width, full_width).indices(DSP_Z_WIDTH)
+        else:
+            self.output_width = full_width
+            self.start, self.stop, _ = slice(0, full_width).indices(DSP_Z_WIDTH)
+
+        # Cycles from data_in sampling to data_out (Area: depends on PLL lock/fast clock phase,
+        # Polyphase: on the output phase after reset).
+        if structure == "Symmetric":
+            self.latency = 2*len(folded_taps(self.taps)) - 1
+        elif structure != "Direct":
+            self.latency = None
+        elif optimization == "Performance":
+            self.latency = max(len(self.taps) - 1, 1)
+        else:
+            self.latency = None
+
+        # Samples history needed by the structure (delay line/polyphase blocks).
+        if self.structure == "TDM":
+            self.factor = tdm_schedule(len(self.taps), clock_frequency, sample_rate)["clocks_per_sample"]
+            self.latency = None
+        if self.structure in ["Polyphase Decimator", "Polyphase Interpolator", "TDM"]:
+            self.blocks = polyphase_taps(self.taps, self.factor)
+        if self.structure in ["Polyphase Decimator", "TDM"]:
+            self.history_length = len(self.blocks)*self.factor - 1
+        elif structure == "Polyphase Interpolator":
+            self.history_length = len(self.blocks) - 1
+        else:
+            self.history_length = len(self.taps) - 1
+
+        self.reset()
+
+    def reset(self):
+        # Delay line (DSP38 B input values) of the last history_length samples, zero after reset
+        # (one per channel with TDM).
+        self.history   = np.zeros(self.history_length, dtype=np.int64)
+        self.histories = [self.history]*self.channels
+
+    def dsp_b(self, samples):
+        samples = np.asarray(samples, dtype=np.int64)
+        if self.optimization == "Performance":
+            # data_in/DLY_B chain: input_width signal sign-extended on B.
+            return to_signed(samples, self.input_width) if self.signed else samples & ((1 << self.input_width) - 1)
+        # Unsigned input_width delay line zero-extended on B (negative only when input_width is 18).
+        b = samples & ((1 << self.input_width) - 1)
+        return to_signed(b, DSP_B_WIDTH) if self.signed else b
+
+    def chain(self, acc):
+        # Partial sum passed to the next DSP38 on its 20-bit A input.
+        return to_signed(acc, DSP_A_WIDTH) if self.signed else acc & ((1 << DSP_A_WIDTH) - 1)
+
+    def accumulate(self, b):
+        # DSP38 Z output (38-bit pattern) for each sample of b (preceded by the delay line), factor
+        # outputs per sample (output phases) with the Polyphase Interpolator.
+        n       = len(b)
+        ntaps   = len(self.taps)
+        history = self.history_length
+        x       = np.concatenate([self.history, b])
+        delayed = lambda m: x[history - m:history - m + n]   # x[n-m].
+        acc     = np.zeros(n, dtype=np.int64)
+        if self.structure == "Symmetric":
+            for tap, m, mirror in folded_taps(self.taps):
+                if mirror is None:
+                    pre_add = delayed(m)
+                elif tap == self.taps[mirror]:
+                    pre_add = delayed(m) + delayed(mirror)
+                else:
+                    pre_add = delayed(m) - delayed(mirror)
+                acc = self.chain(acc) + tap*pre_add
+            acc = saturate(acc, self.signed)
+        elif self.structure in ["Polyphase Decimator", "TDM"]:
+            order = range(len(self.blocks)) if (self.structure == "TDM") else reversed(range(len(self.blocks)))
+            for block in order:
+                acc = self.chain(acc)
+                for r, tap in enumerate(self.blocks[block]):
+                    acc += tap*delayed(block*self.factor + r)
+            acc = saturate(acc, self.signed)
+        elif self.structure == "Polyphase Interpolator":
+            phases = []
+            for phase in range(self.factor):
+                acc = np.zeros(n, dtype=np.int64)
+                for block in reversed(range(len(self.blocks))):
+                    acc = self.chain(acc) + self.blocks[block][phase]*delayed(block)
+                phases.append(saturate(acc, self.signed))
+            acc = np.stack(phases, axis=1).reshape(-1)
+        elif self.optimization == "Performance":
+            # Transposed chain: stage of tap m adds taps[m]*x[n-m] to the previous stage Z[19:0].
+            for m in reversed(range(ntaps)):
+                acc = self.chain(acc) + self.taps[m]*delayed(m)
+            if ntaps > 1:
+                acc = saturate(acc, self.signed)
+        else:
+            for m in range(ntaps):
+                acc += self.taps[m]*delayed(m)
+            acc = saturate(acc, self.signed)
+        self.history = x[len(x) - history:] if history > 0 else self.history
+        return acc & ((1 << DSP_Z_WIDTH) - 1)
+
+    def process(self, samples, channels=None):
+        # data_out values (signed when signed) for data_in samples, continuing from previous calls
+        # (factor values per sample with the Polyphase Interpolator, channels: tdest of each sample
+        # with TDM).
+        if self.structure == "TDM":
+            samples  = np.asarray(samples, dtype=np.int64)
+            channels = np.asarray(channels)
+            z = np.zeros(len(samples), dtype=np.int64)
+            for channel in range(self.channels):
+                index = np.flatnonzero(channels == channel)
+                self.history = self.histories[channel]
+                z[index] = self.accumulate(self.dsp_b(samples[index]))
+                self.histories[channel] = self.history
+        else:
+            z = self.accumulate(self.dsp_b(samples))
+        bits = (z >> self.start) & ((1 << max(self.stop - self.start, 0)) - 1)
+        if self.signed:
+            return to_signed(bits, self.output_width)
+        return bits & ((1 << self.output_width) - 1)
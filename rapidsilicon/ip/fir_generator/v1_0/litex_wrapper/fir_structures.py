@@ -0,0 +1,151 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# FIR structures: taps folding/polyphase decomposition and DSP38/BRAM/delay line usage of each
+# structure (pure Python, no migen): used by the generator summary, the FIR module and the model.
+#
+# Direct:                 one DSP38 per tap (Performance) or one DSP38 at N x the input clock (Area).
+# Symmetric:              linear-phase taps (c[m] = +/-c[N-1-m]) pre-added in fabric, one DSP38 per
+#                         pair of taps, one sample per clock.
+# Polyphase Decimator:    decimate-by-M, one DSP38 per M taps accumulating at the input clock, one
+#                         output every M clocks.
+# Polyphase Interpolator: interpolate-by-L, one DSP38 per L taps (phases on COEFF_0..3), one input
+#                         every L clocks, one output per clock.
+# Multi-channel (TDM):    channels interleaved on AXI-Stream (tdest: channel), one DSP38 per block of
+#                         T taps accumulating at the clock (T clocks per sample), per channel delay
+#                         lines in one memory per DSP38 (see tdm_schedule).
+
+import math
+
+# Structures ---------------------------------------------------------------------------------------
+
+STRUCTURES = ["Direct", "Symmetric", "Polyphase Decimator", "Polyphase Interpolator"]
+
+DECIMATION_FACTORS        = range(2, 17)
+INTERPOLATION_FACTORS     = range(2, 5)    # DSP38 COEFF_0..3 (FEEDBACK 4..7).
+SYMMETRIC_MAX_INPUT_WIDTH = 17             # Pre-adder output on the 18-bit B input.
+
+def rate_factor(structure, decimation_factor, interpolation_factor):
+    if structure == "Polyphase Decimator":
+        return decimation_factor
+    if structure == "Polyphase Interpolator":
+        return interpolation_factor
+    return 1
+
+# Symmetric ----------------------------------------------------------------------------------------
+
+def symmetry(taps):
+    # 1: symmetric, -1: antisymmetric, 0: not linear-phase.
+    n = len(taps)
+    if all(taps[m] == taps[n - 1 - m] for m in range(n)):
+        return 1
+    if all(taps[m] == -taps[n - 1 - m] for m in range(n)):
+        return -1
+    return 0
+
+def folded_taps(taps):
+    # (tap, m, mirror) per DSP38: tap*(x[n-m] +/- x[n-mirror]), mirror is None on the middle tap
+    # (odd number of taps, dropped when antisymmetric: zero).
+    n      = len(taps)
+    stages = [(taps[m], m, n - 1 - m) for m in range(n//2)]
+    if (n % 2) and (symmetry(taps) > 0):
+        stages.append((taps[n//2], n//2, None))
+    return stages
+
+# Polyphase ----------------------------------------------------------------------------------------
+
+def polyphase_taps(taps, factor):
+    # Taps zero-padded to a multiple of factor, in blocks of factor taps: blocks[b][r] = taps[b*factor + r]
+    # (Decimator: DSP38 of block b accumulates its factor taps, Interpolator: r is the output phase).
+    blocks = math.ceil(len(taps)/factor)
+    padded = list(taps) + [0]*(blocks*factor - len(taps))
+    return [padded[b*factor:(b + 1)*factor] for b in range(blocks)]
+
+# Multi-channel (TDM) -----------------------------------------------------------------------------
+
+TDM_CHANNELS              = range(1, 65)
+TDM_MIN_CLOCKS_PER_SAMPLE = 2    # Delay line memory read/write turnaround.
+
+def tdm_schedule(number_of_taps, clock_frequency, sample_rate):
+    # Minimum DSP38 count for an aggregate sample_rate (kSPS, all channels) at clock_frequency (MHz):
+    # each DSP38 does one tap per clock, so T = clock/sample_rate clocks per sample cover T taps per
+    # DSP38. Taps are then balanced on the DSP38s (fewest clocks per sample for that DSP38 count).
+    # None if the sample rate needs less than TDM_MIN_CLOCKS_PER_SAMPLE clocks per sample.
+    clocks_per_sample = (clock_frequency*1000)//sample_rate
+    if clocks_per_sample < TDM_MIN_CLOCKS_PER_SAMPLE:
+        return None
+    dsps = math.ceil(number_of_taps/clocks_per_sample)
+    clocks_per_sample = max(math.ceil(number_of_taps/dsps), TDM_MIN_CLOCKS_PER_SAMPLE)
+    return {
+        "dsps"              : dsps,
+        "clocks_per_sample" : clocks_per_sample,
+        "max_sample_rate"   : clock_frequency*1000/clocks_per_sample,  # kSPS.
+    }
+
+def tdm_memory_brams(channels, clocks_per_sample, input_width):
+    # RS_TDP36K count of one delay line memory (channels x clocks_per_sample words of input_width
+    # bits) if mapped to BRAM, narrowest 36Kb mode holding input_width bits.
+    depth = channels*clocks_per_sample
+    for mode_depth, mode_width in [(32768, 1), (16384, 2), (8192, 4), (4096, 9), (2048, 18), (1024, 36)]:
+        if input_width <= mode_width:
+            return math.ceil(depth/mode_depth)
+    return 0
+
+# Checks -------------------------------------------------------------------------------------------
+
+def structure_error(structure, taps, input_width, channels=1, clock_frequency=0, sample_rate=0):
+    # Reason why taps cannot be implemented with structure, None if they can.
+    if len(taps) == 0:
+        return None
+    if (channels > 1) and (tdm_schedule(len(taps), clock_frequency, sample_rate) is None):
+        return f"Aggregate sample rate exceeds the multi-channel capacity ({clock_frequency*1000//TDM_MIN_CLOCKS_PER_SAMPLE} kSPS at {clock_frequency} MHz)."
+    if structure == "Symmetric":
+        if symmetry(taps) == 0:
+            return "Symmetric structure requires symmetric or antisymmetric coefficients (linear-phase)."
+        if input_width > SYMMETRIC_MAX_INPUT_WIDTH:
+            return f"Symmetric structure requires an input width of {SYMMETRIC_MAX_INPUT_WIDTH} bits or less (pre-adder on the 18-bit DSP38 B input)."
+    return None
+
+# Resources ----------------------------------------------------------------------------------------
+
+def resources(structure, optimization, taps, input_width, factor=1, channels=1, clock_frequency=0, sample_rate=0):
+    # DSP38s, BRAMs, fabric delay line flip-flops and throughput of a structure.
+    n = len(taps)
+    brams = 0
+    tdm   = tdm_schedule(max(n, 1), clock_frequency, sample_rate) if (channels > 1) else None
+    if tdm is not None:
+        dsps       = tdm["dsps"]
+        brams      = dsps*tdm_memory_brams(channels, tdm["clocks_per_sample"], input_width)
+        registers  = 0
+        throughput = f"1 sample every {tdm['clocks_per_sample']} clocks: {tdm['max_sample_rate']:.6g} kSPS aggregate, {tdm['max_sample_rate']/channels:.6g} kSPS per channel"
+    elif structure == "Symmetric":
+        stages     = len(folded_taps(taps))
+        dsps       = stages
+        registers  = max(n + stages - 2, 0)*input_width + stages*18
+        throughput = "1 sample per clock"
+    elif structure == "Polyphase Decimator":
+        dsps       = math.ceil(n/factor)
+        registers  = 0
+        throughput = f"1 input sample per clock, 1 output sample every {factor} clocks"
+    elif structure == "Polyphase Interpolator":
+        dsps       = math.ceil(n/factor)
+        registers  = (1 + (dsps - 1)*(factor - 2))*input_width if dsps else 0
+        throughput = f"1 input sample every {factor} clocks, 1 output sample per clock"
+    elif optimization == "Area":
+        dsps       = 1
+        registers  = n*input_width
+        throughput = f"1 sample per clock (DSP38 at {n} x the input clock)"
+    else:
+        dsps       = n
+        registers  = 0
+        throughput = "1 sample per clock"
+    return {
+        "dsps"       : dsps,
+        "brams"      : brams,
+        "registers"  : registers,
+        "throughput" : throughput,
+    }
@@ -0,0 +1,165 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# FIR generator golden model test: drives random samples into the generated wrapper and compares
+# data_out cycle by cycle with the reference model (litex_wrapper/fir_model.py) configured from the
+# fir_model.json parameters written by fir_generator_gen.py on --build. Multi-channel (TDM) wrappers
+# are driven on s_axis with random channels (tdest) and m_axis is compared in order with the model.
+
+import os
+import sys
+import json
+import logging
+
+import numpy as np
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, ReadOnly, Timer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litex_wrapper.fir_model import FIRModel
+
+# Parameters ---------------------------------------------------------------------------------------
+
+tests_dir   = os.path.abspath(os.path.dirname(__file__))
+params_file = os.environ.get("FIR_MODEL_PARAMS", os.path.join(tests_dir, "fir_model.json"))
+samples     = int(os.environ.get("FIR_SAMPLES", "10000"))
+seed        = int(os.environ.get("FIR_SEED", "0"))
+
+def random_samples(rng, input_width, signed, count):
+    if signed:
+        return rng.integers(-(1 << (input_width - 1)), 1 << (input_width - 1), size=count)
+    return rng.integers(0, 1 << input_width, size=count)
+
+def find_latency(expected, observed, max_latency):
+    # Cycles between data_in and data_out: first offset where the whole observed tail matches.
+    for latency in range(max_latency + 1):
+        n = min(len(observed) - latency, len(expected))
+        if (n > 0) and np.array_equal(observed[latency:latency + n], expected[:n]):
+            return latency
+    return None
+
+async def reset(dut):
+    # Reset and wait for ready (PLL lock in Area).
+    dut.rst.value = 1
+    for _ in range(4):
+        await RisingEdge(dut.clk)
+    dut.rst.value = 0
+    while True:
+        await RisingEdge(dut.clk)
+        await ReadOnly()
+        if dut.ready.value.is_resolvable and dut.ready.value.integer:
+            break
+    await RisingEdge(dut.clk)
+
+async def tdm_test(dut, model, log):
+    # s_axis: random samples/channels with random tvalid gaps (tlast on the last sample), m_axis:
+    # random tready. Outputs are in input order, tdest/tlast follow their sample.
+    rng      = np.random.default_rng(seed)
+    stimulus = random_samples(rng, model.input_width, model.signed, samples)
+    channels = rng.integers(0, model.channels, size=samples)
+    expected = model.process(stimulus, channels)
+    dut.s_axis_tvalid.value = 0
+    dut.s_axis_tlast.value  = 0
+    dut.s_axis_tdata.value  = 0
+    dut.s_axis_tdest.value  = 0
+    dut.m_axis_tready.value = 0
+    await reset(dut)
+
+    observed = []
+    sent     = 0
+    for _ in range(samples*(model.factor + 2)*4 + 100):
+        if (sent < samples) and (rng.random() < 0.8):
+            dut.s_axis_tvalid.value = 1
+            dut.s_axis_tdata.value  = int(stimulus[sent]) & ((1 << model.input_width) - 1)
+            dut.s_axis_tdest.value  = int(channels[sent])
+            dut.s_axis_tlast.value  = int(sent == samples - 1)
+        else:
+            dut.s_axis_tvalid.value = 0
+        dut.m_axis_tready.value = int(rng.random() < 0.8)
+        await ReadOnly()
+        accepted = dut.s_axis_tvalid.value.integer and dut.s_axis_tready.value.integer
+        if dut.m_axis_tvalid.value.integer and dut.m_axis_tready.value.integer:
+            data = dut.m_axis_tdata.value
+            observed.append((data.signed_integer if model.signed else data.integer,
+                dut.m_axis_tdest.value.integer, dut.m_axis_tlast.value.integer))
+        await RisingEdge(dut.clk)
+        sent += accepted
+        if len(observed) == samples:
+            break
+
+    assert len(observed) == samples, f"{len(observed)} outputs for {samples} samples"
+    for i, (data, dest, last) in enumerate(observed):
+        assert (data, dest, last) == (expected[i], channels[i], int(i == samples - 1)), \
+            f"output {i}: (data, tdest, tlast) = {(data, dest, last)}, expected {(expected[i], channels[i], int(i == samples - 1))}"
+    log.info(f"{samples} samples on {model.channels} channels match the reference model ({model.factor} clocks per sample)")
+
+# Test ---------------------------------------------------------------------------------------------
+
+@cocotb.test()
+async def fir_golden_model_test(dut):
+    log = logging.getLogger("cocotb.tb")
+    log.setLevel(logging.INFO)
+
+    with open(params_file, "r") as f:
+        config = json.load(f)
+    model  = FIRModel(**config["parameters"])
+    signed = model.signed
+
+    cocotb.start_soon(Clock(dut.clk, config["clock_period_ns"], units="ns").start())
+
+    if model.structure == "TDM":
+        await tdm_test(dut, model, log)
+        return
+
+    # Reset (data_in at 0: model delay line starts empty).
+    dut.data_in.value = 0
+    await reset(dut)
+
+    # Stimulus/capture: one sample per clock (sampled when data_in_ready with the Polyphase
+    # Interpolator), data_out sampled after each edge (when data_out_valid with the Decimator).
+    decimator    = (model.structure == "Polyphase Decimator")
+    interpolator = (model.structure == "Polyphase Interpolator")
+    rng      = np.random.default_rng(seed)
+    stimulus = random_samples(rng, model.input_width, signed, samples)
+    flush    = 2*len(model.taps) + 8
+    sampled  = []
+    observed = []
+    ready    = dut.data_in_ready.value.integer if interpolator else 1
+    for value in list(stimulus) + [0]*flush:
+        dut.data_in.value = int(value) & ((1 << model.input_width) - 1)
+        if ready:
+            sampled.append(value)
+        await RisingEdge(dut.clk)
+        await ReadOnly()
+        if interpolator:
+            ready = dut.data_in_ready.value.integer
+        if (not decimator) or dut.data_out_valid.value.integer:
+            data_out = dut.data_out.value
+            if not data_out.is_resolvable:
+                observed.append(None)
+            else:
+                observed.append(data_out.signed_integer if signed else data_out.integer)
+        await Timer(1, units="ps")
+
+    expected = model.process(np.array(sampled, dtype=np.int64))
+    observed = np.array([0 if v is None else v for v in observed], dtype=np.int64)
+
+    if decimator:
+        # One output of every decimation_factor: output phase set by the reset release.
+        for phase in range(model.factor):
+            latency = find_latency(expected[phase::model.factor], observed, flush)
+            if latency is not None:
+                break
+    else:
+        latency = find_latency(expected, observed, flush*model.factor)
+    assert latency is not None, f"data_out does not match the reference model (first values: {observed[:8]} vs {expected[:8]})"
+    if model.latency is not None:
+        assert latency == model.latency, f"latency {latency} cycles, expected {model.latency}"
+    log.info(f"{samples} samples match the reference model ({model.structure}, latency: {latency} {'outputs' if decimator else 'cycles'})")
@@ -9,76 +9,6 @@ import sys
 import logging
 import argparse
 
-from datetime import datetime
-
-from litex_wrapper.i2c_master_litex_wrapper import I2CMASTER
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-from litex.soc.interconnect.axi import AXILiteInterface
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-def get_clkin_ios():
-    return [
-        ("clk",  0, Pins(1)),
-        ("rst",  0, Pins(1)),
-    ]
-    
-def get_i2c_ios():
-    return [
-        ("i2c", 0,
-            Subsignal("scl_i", Pins(1)),
-            Subsignal("scl_o", Pins(1)),
-            Subsignal("scl_t", Pins(1)),
-            Subsignal("sda_i", Pins(1)),
-            Subsignal("sda_o", Pins(1)),
-            Subsignal("sda_t", Pins(1)),    
-        )
-    ]
-
-# I2C Master Wrapper ----------------------------------------------------------------------------------
-class I2CMASTERWrapper(Module):
-    def __init__(self, platform, default_prescale, fixed_prescale, cmd_fifo, cmd_addr_width, write_fifo, write_addr_width, read_fifo, read_addr_width):
-        
-        # Clocking ---------------------------------------------------------------------------------
-        platform.add_extension(get_clkin_ios())
-        self.clock_domains.cd_sys  = ClockDomain()
-        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
-        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
-
-        # AXI LITE ----------------------------------------------------------------------------------
-        axil = AXILiteInterface()
-        platform.add_extension(axil.get_ios("s_axil"))
-        self.comb += axil.connect_to_pads(platform.request("s_axil"), mode="slave")
-
-        # I2C_MASTER ----------------------------------------------------------------------------------
-        self.submodules.i2c_master = i2c_master = I2CMASTER(platform, axil,
-            default_prescale    = default_prescale, 
-            fixed_prescale      = fixed_prescale,
-            cmd_fifo            = cmd_fifo,
-            cmd_addr_width      = cmd_addr_width,
-            write_fifo          = write_fifo,
-            write_addr_width    = write_addr_width,
-            read_fifo           = read_fifo,
-            read_addr_width     = read_addr_width
-            )
-        
-        # I2C Signals --------------------------------
-        platform.add_extension(get_i2c_ios())
-        i2c_pads = platform.request("i2c")
-        self.comb += [
-            i2c_master.i2c_scl_i.eq(i2c_pads.scl_i),
-            i2c_pads.scl_o.eq(i2c_master.i2c_scl_o),
-            i2c_pads.scl_t.eq(i2c_master.i2c_scl_t),
-
-            i2c_master.i2c_sda_i.eq(i2c_pads.sda_i),
-            i2c_pads.sda_o.eq(i2c_master.i2c_sda_o),
-            i2c_pads.sda_t.eq(i2c_master.i2c_sda_t),
-        ]
 
 # Build --------------------------------------------------------------------------------------------
 def main():
@@ -120,6 +50,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",            help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                	help="Build Directory")
     build_group.add_argument("--build-name",    default="i2c_master_wrapper",   help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -153,19 +84,6 @@ def main():
     if args.json_template:
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
 
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = I2CMASTERWrapper(platform,
-        default_prescale = args.default_prescale,
-        fixed_prescale   = args.fixed_prescale,
-        cmd_fifo         = args.cmd_fifo,
-        cmd_addr_width   = args.cmd_addr_width,
-        write_fifo       = args.write_fifo,
-        write_addr_width = args.write_addr_width,
-        read_fifo        = args.read_fifo,
-        read_addr_width  = args.read_addr_width,
-    )
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -173,46 +91,37 @@ def main():
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version = "v1_0"
-        )
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "i2c_master", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"I2C_MSTR\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="I2C_MSTR", ip_version="00000000_00000000_0000000000000001")
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.i2c_master_wrapper import I2CMASTERWrapper
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = I2CMASTERWrapper(platform,
+                default_prescale = args.default_prescale,
+                fixed_prescale   = args.fixed_prescale,
+                cmd_fifo         = args.cmd_fifo,
+                cmd_addr_width   = args.cmd_addr_width,
+                write_fifo       = args.write_fifo,
+                write_addr_width = args.write_addr_width,
+                read_fifo        = args.read_fifo,
+                read_addr_width  = args.read_addr_width,
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version = "v1_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,73 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# i2c_master LiteX wrapper: IOs and module elaborated by i2c_master_gen.py on --build.
+
+from litex_wrapper.i2c_master_litex_wrapper import I2CMASTER
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXILiteInterface
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1)),
+    ]
+    
+def get_i2c_ios():
+    return [
+        ("i2c", 0,
+            Subsignal("scl_i", Pins(1)),
+            Subsignal("scl_o", Pins(1)),
+            Subsignal("scl_t", Pins(1)),
+            Subsignal("sda_i", Pins(1)),
+            Subsignal("sda_o", Pins(1)),
+            Subsignal("sda_t", Pins(1)),    
+        )
+    ]
+
+# I2C Master Wrapper ----------------------------------------------------------------------------------
+class I2CMASTERWrapper(Module):
+    def __init__(self, platform, default_prescale, fixed_prescale, cmd_fifo, cmd_addr_width, write_fifo, write_addr_width, read_fifo, read_addr_width):
+        
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+
+        # AXI LITE ----------------------------------------------------------------------------------
+        axil = AXILiteInterface()
+        platform.add_extension(axil.get_ios("s_axil"))
+        self.comb += axil.connect_to_pads(platform.request("s_axil"), mode="slave")
+
+        # I2C_MASTER ----------------------------------------------------------------------------------
+        self.submodules.i2c_master = i2c_master = I2CMASTER(platform, axil,
+            default_prescale    = default_prescale, 
+            fixed_prescale      = fixed_prescale,
+            cmd_fifo            = cmd_fifo,
+            cmd_addr_width      = cmd_addr_width,
+            write_fifo          = write_fifo,
+            write_addr_width    = write_addr_width,
+            read_fifo           = read_fifo,
+            read_addr_width     = read_addr_width
+            )
+        
+        # I2C Signals --------------------------------
+        platform.add_extension(get_i2c_ios())
+        i2c_pads = platform.request("i2c")
+        self.comb += [
+            i2c_master.i2c_scl_i.eq(i2c_pads.scl_i),
+            i2c_pads.scl_o.eq(i2c_master.i2c_scl_o),
+            i2c_pads.scl_t.eq(i2c_master.i2c_scl_t),
+
+            i2c_master.i2c_sda_i.eq(i2c_pads.sda_i),
+            i2c_pads.sda_o.eq(i2c_master.i2c_sda_o),
+            i2c_pads.sda_t.eq(i2c_master.i2c_sda_t),
+        ]
@@ -8,19 +8,12 @@
 # LiteX wrapper around Alex Forencich verilog-i2c's i2c_slave_axil_master.v
 
 import os
-import datetime
 import logging
 
 from migen import *
 
 from litex.soc.interconnect.axi import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
-
 # I2C_SLAVE  -------------------------------------------------------------------------------------
 class I2CSLAVE(Module):
     def __init__(self, platform, m_axil, filter_len):
@@ -0,0 +1,85 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# i2c_slave LiteX wrapper: IOs and module elaborated by i2c_slave_gen.py on --build.
+
+from litex_wrapper.i2c_slave_litex_wrapper import I2CSLAVE
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXILiteInterface
+
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1)),
+    ]
+    
+def get_i2c_ios():
+    return [
+        ("i2c", 0,
+            Subsignal("scl_i", Pins(1)),
+            Subsignal("scl_o", Pins(1)),
+            Subsignal("scl_t", Pins(1)),
+            Subsignal("sda_i", Pins(1)),
+            Subsignal("sda_o", Pins(1)),
+            Subsignal("sda_t", Pins(1)),    
+        ),
+        ("busy",             0, Pins(1)),
+        ("bus_addressed",    0, Pins(1)), 
+        ("bus_active",       0, Pins(1)),
+        ("enable",           0, Pins(1)),
+        ("device_address",   0, Pins(7))   
+    ]
+    
+# I2C SLAVE Wrapper ---------------------------------------------------------------------------------
+class I2CSLAVEWrapper(Module):
+    def __init__(self, platform, data_width, addr_width, filter_len):
+        
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+        self.comb += self.cd_sys.rst.eq(platform.request("rst"))
+
+        # AXI LITE ----------------------------------------------------------------------------------
+        axil = AXILiteInterface(
+            data_width      = data_width,
+            address_width   = addr_width
+        )
+        platform.add_extension(axil.get_ios("m_axil"))
+        self.comb += axil.connect_to_pads(platform.request("m_axil"), mode="master")
+
+        # I2C_SLAVE ----------------------------------------------------------------------------------
+        self.submodules.i2c_slave = i2c_slave = I2CSLAVE(platform, 
+            m_axil        = axil,
+            filter_len    = filter_len
+            )
+        
+        # I2C Signals---------------------------------------------------------------------------------
+        platform.add_extension(get_i2c_ios())
+        i2c_pads = platform.request("i2c")
+        self.comb += [
+            i2c_slave.i2c_scl_i.eq(i2c_pads.scl_i),
+            i2c_pads.scl_o.eq(i2c_slave.i2c_scl_o),
+            i2c_pads.scl_t.eq(i2c_slave.i2c_scl_t),
+
+            i2c_slave.i2c_sda_i.eq(i2c_pads.sda_i),
+            i2c_pads.sda_o.eq(i2c_slave.i2c_sda_o),
+            i2c_pads.sda_t.eq(i2c_slave.i2c_sda_t),
+        ]
+        
+        # Configuration
+        self.comb += i2c_slave.enable.eq(platform.request("enable"))
+        self.comb += i2c_slave.device_address.eq(platform.request("device_address"))
+        
+        # Status
+        self.comb += platform.request("busy").eq(i2c_slave.busy)
+        self.comb += platform.request("bus_addressed").eq(i2c_slave.bus_addressed)
+        self.comb += platform.request("bus_active").eq(i2c_slave.bus_active)
@@ -0,0 +1,64 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# jtag_to_axi LiteX wrapper: IOs and module elaborated by jtag_to_axi_gen.py on --build.
+
+from litex_wrapper.jtag_to_axi_litex_wrapper import JTAGAXI
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+from litex.soc.interconnect.axi import AXIInterface
+
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("ACLK",    0, Pins(1)),
+        ("ARESET",  0, Pins(1))
+    ]
+
+def jtag_interface():
+    return [
+    
+        ("JTAG_TCK",   0, Pins(1)),
+        ("JTAG_TMS",   0, Pins(1)),
+        ("JTAG_TDI",   0, Pins(1)),
+        ("JTAG_TDO",   0, Pins(1)),
+        ("JTAG_TRST",  0, Pins(1)),
+    ]
+
+# JTAG to AXI Wrapper ----------------------------------------------------------------------------------
+class JTAG2AXIWrapper(Module):
+    def __init__(self, platform, data_width, addr_width, s_id_width, aw_user_width, w_user_width, b_user_width, ar_user_width, r_user_width):
+        
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios())
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.comb += self.cd_sys.clk.eq(platform.request("ACLK"))
+        self.comb += self.cd_sys.rst.eq(platform.request("ARESET"))
+    
+        m_id_width = s_id_width
+        m_axis = []  
+
+        m_axi = AXIInterface(data_width = data_width , address_width = addr_width, id_width = m_id_width, aw_user_width = aw_user_width,
+        w_user_width = w_user_width, b_user_width = b_user_width, ar_user_width = ar_user_width, r_user_width = r_user_width)
+
+        platform.add_extension(m_axi.get_ios("m_axi"))
+        self.comb += m_axi.connect_to_pads(platform.request("m_axi"), mode="master")
+            
+        m_axis.append(m_axi)
+            
+        # JTAG2AXI
+        self.submodules.jtag_axi =jtag_axi = JTAGAXI(platform,
+            m_axi               = m_axis
+            )
+        platform.add_extension(jtag_interface())
+        self.comb += jtag_axi.JTAG_TCK.eq(platform.request("JTAG_TCK"))
+        self.comb += jtag_axi.JTAG_TMS.eq(platform.request("JTAG_TMS"))
+        self.comb += jtag_axi.JTAG_TDI.eq(platform.request("JTAG_TDI"))
+        self.comb += platform.request("JTAG_TDO").eq(jtag_axi.JTAG_TDO)
+        self.comb += jtag_axi.JTAG_TRST.eq(platform.request("JTAG_TRST"))
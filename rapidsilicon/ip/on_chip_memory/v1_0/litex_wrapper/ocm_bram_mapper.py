@@ -0,0 +1,75 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# On Chip Memory BRAM mapper: RS_TDP36K tiling of a write_depth x data_width memory (pure Python, no
+# migen). Used by the generator for --json-template summaries and by the LiteX OCM to build its
+# primitives and INIT vectors.
+
+import math
+
+from functools import lru_cache
+
+# Primitives ---------------------------------------------------------------------------------------
+
+# RS_TDP36K aspect ratios: depth : (data width, read/write mode bits).
+ASPECT_RATIOS = {
+    1024  : (36, "110"),
+    2048  : (18, "010"),
+    4096  : (9,  "100"),
+    8192  : (4,  "001"),
+    16384 : (2,  "011"),
+    32768 : (1,  "101"),
+}
+
+# Rows tiling: 1024x36 primitives rows, one per 1024 addresses (read data muxed on registered address).
+PRIMITIVE_DEPTH = 1024
+
+# Mapping objectives: fewest primitives (then fewest rows) or fewest rows (then fewest primitives).
+OBJECTIVES = ["Primitives", "Latency"]
+
+# Mapping ------------------------------------------------------------------------------------------
+
+def tiling(data_width, depth, rows, tiled):
+    width, mode = ASPECT_RATIOS[depth]
+    columns     = math.ceil(data_width/width)
+    return {
+        "depth"      : depth,           # Addresses per primitive.
+        "width"      : width,           # Data bits per primitive.
+        "mode"       : mode,
+        "columns"    : columns,         # Primitives along data bits (LSB first).
+        "rows"       : rows,            # Primitives along addresses (read data mux inputs).
+        "primitives" : columns*rows,
+        "tiled"      : tiled,           # Rows tiling (vs single row aspect ratio).
+    }
+
+def candidates(data_width, write_depth):
+    # Tilings the OCM implements: a single row of primitives with an aspect ratio deep enough for
+    # write_depth, or rows of 1024x36 primitives (also used for depths below 1024).
+    mappings = []
+    for depth in ASPECT_RATIOS:
+        if (depth >= write_depth) and (depth > PRIMITIVE_DEPTH or write_depth == PRIMITIVE_DEPTH):
+            mappings.append(tiling(data_width, depth, 1, tiled=False))
+    if write_depth != PRIMITIVE_DEPTH:
+        mappings.append(tiling(data_width, PRIMITIVE_DEPTH, math.ceil(write_depth/PRIMITIVE_DEPTH), tiled=True))
+    return mappings
+
+@lru_cache(maxsize=4096)
+def map_memory(data_width, write_depth, objective="Primitives"):
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown BRAM mapping objective: {objective}")
+    def cost(mapping):
+        if objective == "Primitives":
+            return (mapping["primitives"], mapping["rows"], mapping["depth"])
+        return (mapping["rows"], mapping["primitives"], mapping["depth"])
+    return min(candidates(data_width, write_depth), key=cost)
+
+def mapping_summary(mapping):
+    rows    = f"{mapping['rows']} row"       + ("s" if mapping["rows"]    > 1 else "")
+    columns = f"{mapping['columns']} column" + ("s" if mapping["columns"] > 1 else "")
+    return {
+        "BRAM Mapping" : f"{rows} x {columns} of {mapping['depth']}x{mapping['width']} RS_TDP36K",
+    }
@@ -0,0 +1,113 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# On Chip Memory initialization loader: packs a .hex/.bin init file into the INIT bit-vectors of the
+# RS_TDP36K primitives (pure Python, no migen).
+
+import zlib
+import hashlib
+
+from functools import lru_cache
+
+# Primitives ---------------------------------------------------------------------------------------
+
+# RS_TDP36K INIT: 36864 bits, 2 x 18432-bit halves of 1024 x 18-bit entries (one entry of each half
+# per 36-bit word in 1024x36 mode).
+INIT_WIDTH  = 36864
+ENTRY_WIDTH = 18
+
+# Init File ----------------------------------------------------------------------------------------
+
+INIT_FILE_BASES = {".hex": 16, ".bin": 2}
+
+def read_init_file(file_path, file_extension):
+    # One word per line (blank lines are skipped), returns the words as integers.
+    base = INIT_FILE_BASES[file_extension]
+    with open(file_path, "rb") as f:
+        return [int(word, base) for word in f.read().split()]
+
+# Entry Layout -------------------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def entry_layout(slice_width):
+    # INIT entries of a primitive for a data slice width: (addresses per upper/lower entries pair,
+    # [upper half entry, lower half entry]) with each entry bit (MSB first) given as (address offset,
+    # slice bit (MSB first)) or None for unused ("x") parity bits.
+    if slice_width == 36:
+        # 1024x36: bits 35:18 in the upper half, bits 17:0 in the lower half.
+        return 1, ([(0, i) for i in range(18)], [(0, 18 + i) for i in range(18)])
+    if slice_width == 18:
+        # 2048x18: odd addresses in the upper half, even addresses in the lower half.
+        return 2, ([(0, i) for i in range(18)], [(1, i) for i in range(18)])
+    if slice_width == 9:
+        # 4096x9: 2 words per entry, parity bits on top: {w1[8], w0[8], w1[7:0], w0[7:0]}.
+        entry = [(0, 0), (1, 0)] + [(0, i) for i in range(1, 9)] + [(1, i) for i in range(1, 9)]
+        return 4, (entry, [(address + 2, i) for address, i in entry])
+    # 8192x4/16384x2/32768x1: 4/8/16 words per entry, unused parity bits.
+    words = 16//slice_width
+    entry = [(u//slice_width, u%slice_width) for u in range(16)]
+    return 2*words, ([None, None] + entry, [None, None] + [(address + words, i) for address, i in entry])
+
+# INIT Vectors -------------------------------------------------------------------------------------
+
+def init_vectors(words, data_width, mapping):
+    # INIT bit-vector strings (MSB first, "x" on addresses not in words) of the primitives of a BRAM
+    # mapping (see ocm_bram_mapper), ordered by column (data bits, LSB first) then row (addresses):
+    # words are masked to data_width bits and padded with "0" up to the primitives width.
+    slice_width = mapping["width"]
+    columns     = mapping["columns"]
+    rows        = mapping["rows"]
+    depth       = mapping["depth"]
+    width = slice_width*columns
+    mask  = (1 << data_width) - 1
+    fmt   = f"0{width}b"
+
+    # Bit matrix: width bytes per address (MSB first, from the last address), x on unused addresses.
+    size   = rows*depth
+    matrix = "".join([format(word & mask, fmt) for word in words[size-1::-1]])
+    matrix = ("x"*(size*width - len(matrix)) + matrix).encode()
+
+    # Each INIT entry bit is a strided (one per entry) slice of the bit matrix.
+    stride, halves = entry_layout(slice_width)
+    half_width     = INIT_WIDTH//2
+    vectors = []
+    for column in range(columns):
+        start = (columns - 1 - column)*slice_width
+        for row in range(rows):
+            base   = (rows - 1 - row)*depth*width + start
+            end    = (rows - row)*depth*width
+            vector = bytearray(b"x"*INIT_WIDTH)
+            for half, entry in enumerate(halves):
+                for n, bit in enumerate(entry):
+                    if bit is not None:
+                        address, i = bit
+                        vector[half*half_width + n:(half + 1)*half_width:ENTRY_WIDTH] = \
+                            matrix[base + address*width + i:end:stride*width]
+            vectors.append(vector.decode())
+    return vectors
+
+# Init Cache ---------------------------------------------------------------------------------------
+
+# Packed INIT vectors are cached (see IP_Cache) on init file content, memory geometry, BRAM mapping and
+# loader source: unrelated parameter changes (memory_type, common_clk...) skip parsing/packing.
+
+def init_cache_key(file_path, data_width, write_depth, mapping):
+    h = hashlib.sha256()
+    for filename in [__file__, file_path]:
+        with open(filename, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    h.update(repr((data_width, write_depth, sorted(mapping.items()))).encode())
+    return h.hexdigest()
+
+def dump_init_vectors(line_count, vectors):
+    return zlib.compress("\n".join([str(line_count)] + vectors).encode(), 1)
+
+def load_init_vectors(content):
+    # Returns (init file line count, INIT vectors).
+    lines = zlib.decompress(content).decode().split("\n")
+    return int(lines[0]), lines[1:]
@@ -8,418 +8,56 @@
 # LiteX wrapper around on chip memory.
 
 import math
-import datetime
 import logging
 
 from migen import *
 
 from litex.soc.interconnect.axi import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
+from litex_wrapper import ocm_bram_mapper, ocm_init_loader
 
 # On Chip Memory ------------------------------------------------------------------------------------------
 class OCM(Module):
-    def memory_converter(self, file_path, file_extension):
+    def memory_init(self, file_path, file_extension):
+        # INIT bit-vectors of the RS_TDP36K primitives ("x" without init file, see ocm_init_loader),
+        # restored from/stored to init_cache when provided.
+        self.line_count = 0
         if file_path == "":
             return "x"
-        binary_data = []
-        with open(file_path, "r") as f:
-            file_content = f.readlines()
-            line_count = 0
-            self.logger.info(f"========== MEMORY INITIALIZATION STARTED ==========")
-            logging.info("Reading Memory File")
-            if (file_extension == ".hex"):
-                logging.info("Found (.hex) File")
-                logging.info("Processing")
-            elif (file_extension == ".bin"):
-                logging.info("Found (.bin) File")
-                logging.info("Processing")
-            else:
-                logging.error("Memory Initialization Failed. Invalid File Format")
-            
-            for line in file_content:
-                line_count += 1
-                if (file_extension == ".hex"):
-                    mem_file_data = int(line.strip(), 16)
-                    binary = format(mem_file_data, 'b') # hexadecimal to binary conversion
-                    binary_data.append(binary)
-                    self.binary_data    = binary_data
-                    self.line_count     = line_count
-                elif (file_extension == ".bin"):
-                    mem_file_data = int(line.strip(), 2) # binary(0b10101) to binary(10101) conversion
-                    binary = format(mem_file_data, 'b')
-                    binary_data.append(binary)
-                    self.binary_data    = binary_data
-                    self.line_count     = line_count
-                else:
-                    exit
-                    self.binary_data    = 0
-                    self.line_count     = 0
-            return binary_data
-    
-    def memory_init(self, file_path, file_extension):
-        self.memory_converter(file_path, file_extension)
-        
-        sram = {}
-        result = []
-        
-        # Empty File Path
-        if (file_path == "") or (self.line_count == 0):
+        self.logger.info(f"========== MEMORY INITIALIZATION STARTED ==========")
+        logging.info("Reading Memory File")
+        if file_extension not in ocm_init_loader.INIT_FILE_BASES:
+            logging.error("Memory Initialization Failed. Invalid File Format")
             return "x"
-        
-        # If File Path Exists
-        if self.write_depth in [1024, 2048, 4096, 8192, 16384, 32768]:
-            
-            # 1K Memory Initialization
-            if (self.write_depth == 1024):
-                if (len(self.binary_data) > self.write_depth):
-                    lines = self.write_depth
-                else:
-                    lines = self.line_count
-
-                for i in range(lines):
-                    if self.data_width % 36 == 0:
-                            if len(self.binary_data[i]) < self.data_width:
-                                self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                            else:
-                                self.binary_data[i] = self.binary_data[i]
-                    else:
-                        temp = self.data_width % 36
-                        self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                        self.binary_data[i] = '0' * (36 - temp) + self.binary_data[i]
-                
-                # Appending 'x' on vacant addresses
-                x_data = self.write_depth - self.line_count
-                if lines == self.line_count:
-                    for i in range(x_data):
-                        self.binary_data.append((self.data_width + (36-(self.data_width % 36))) * 'x')
-
-                for j in range(self.m-1, -1, -1):
-                    sram1 = f"sram1_{j}"
-                    sram2 = f"sram2_{j}"
-                    data1 = f"ram_data1_{j}"
-                    data2 = f"ram_data2_{j}"
-                    sram_result = f"result_{j}"
-                    sram[sram1] = []
-                    sram[sram2] = []
-                    sram[data1] = []
-                    sram[data2] = []
-                    sram[sram_result] = []
-
-                    for i in range(1024): # 1024 * (1-line per iteration) = 1024 addresses
-                        bits = self.binary_data[i*1][j*36:(j*36)+36]  # Extract 36 bits from the binary data
-                        sram[sram1].append(bits[:18]) # Extracting First 18 bits from binary data
-                        sram[sram2].append(bits[18:]) # Extracting Next 18 bits from binary data
-
-                    sram[data1] = "".join(sram[sram1][::-1]) # inverting indexing of list
-                    sram[data2] = "".join(sram[sram2][::-1]) # inverting indexing of list
-                    sram[sram_result] = sram[data1] + sram[data2]
-                    result.append(sram[sram_result])
+        logging.info(f"Found ({file_extension}) File")
+        cache_key = None
+        if self.init_cache is not None:
+            cache_key = ocm_init_loader.init_cache_key(file_path, self.data_width, self.write_depth, self.mapping)
+            content   = self.init_cache.get(cache_key)
+            if content is not None:
+                logging.info(f"Memory Init Cache: hit ({cache_key[:16]})")
+                self.line_count, result = ocm_init_loader.load_init_vectors(content)
                 logging.info("Memory Initialized Successfully !!!")
                 self.logger.info(f"===================================================")
                 return result
-            
-            # 2K Memory Initialization
-            elif (self.write_depth == 2048):
-                if (self.line_count) > 2048:
-                    if (len(self.binary_data) > self.write_depth):
-                        lines = self.write_depth
-                else:
-                    lines = self.line_count
-                
-                for i in range(lines):
-                    if self.data_width % 18 == 0:
-                        if len(self.binary_data[i]) < self.data_width:
-                            self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                        else:
-                            self.binary_data[i] = self.binary_data[i]
-                    else:
-                        temp = self.data_width % 18
-                        self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                        self.binary_data[i] = '0' * (18 - temp) + self.binary_data[i]
-                
-                # Appending 'x' on vacant addresses
-                x_data = self.write_depth - self.line_count
-                if lines == self.line_count:
-                    for i in range(x_data):
-                        self.binary_data.append((self.data_width + (18-(self.data_width % 18))) * 'x')
-                        
-                for j in range(self.m-1, -1, -1):
-                    sram1 = f"sram1_{j}"
-                    sram2 = f"sram2_{j}"
-                    data1 = f"ram_data1_{j}"
-                    data2 = f"ram_data2_{j}"
-                    sram_result = f"result_{j}"
-                    sram[sram1] = []
-                    sram[sram2] = []
-                    sram[data1] = []
-                    sram[data2] = []
-                    sram[sram_result] = []
-                    for i in range(2048): # 2048 * (1-line per iteration) = 2048 addresses
-                        if i % 2 == 0:
-                            sram[sram1].append(self.binary_data[(i*1)][(j*18):(j*18)+18])
-                        else:
-                            sram[sram2].append(self.binary_data[(i*1)][(j*18):(j*18)+18])
-                            
-                    sram[data1] = "".join(sram[sram1][::-1]) 
-                    sram[data2] = "".join(sram[sram2][::-1])
-                    sram[sram_result] = sram[data2] + sram[data1]
-                    result.append(sram[sram_result])
-                logging.info("Memory Initialized Successfully !!!")
-                self.logger.info(f"===================================================")
-                return result
-
-            # 4K Memory Initialization
-            elif (self.write_depth == 4096):
-                if (len(self.binary_data) > self.write_depth):
-                    lines = self.write_depth
-                else:
-                    lines = self.line_count
-
-                for i in range(lines):
-                    if self.data_width % 9 == 0:
-                        if len(self.binary_data[i]) < self.data_width:
-                            self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                        else:
-                            self.binary_data[i] = self.binary_data[i]
-                    else:
-                        temp = self.data_width % 9
-                        self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                        self.binary_data[i] = '0' * (9 - temp) + self.binary_data[i]
-                
-                # Appending 'x' on vacant addresses
-                x_data = self.write_depth - self.line_count
-                if lines == self.line_count:
-                    for i in range(x_data):
-                        self.binary_data.append((self.data_width + (9-(self.data_width % 9))) * 'x')
-                
-                for j in range(self.m-1, -1, -1):
-                    sram1 = f"sram1_{j}"
-                    sram2 = f"sram2_{j}"
-                    data1 = f"ram_data1_{j}"
-                    data2 = f"ram_data2_{j}"
-                    sram_result = f"result_{j}"
-                    sram[sram1] = []
-                    sram[sram2] = []
-                    sram[data1] = []
-                    sram[data2] = []
-                    sram[sram_result] = []
-                    for i in range(2048): # 2048 * (2-lines per iteration) = 4096 addresses
-                        if i % 2 == 0:
-                            sram[sram1].append(self.binary_data[(i*2)+1][(j*9)] + self.binary_data[(i*2)+0][(j*9)] + self.binary_data[(i*2)+1][(j*9)+1:(j*9)+9] + self.binary_data[(i*2)+0][(j*9)+1:(j*9)+9])
-                        else:
-                            sram[sram2].append(self.binary_data[(i*2)+1][(j*9)] + self.binary_data[(i*2)+0][(j*9)] + self.binary_data[(i*2)+1][(j*9)+1:(j*9)+9] + self.binary_data[(i*2)+0][(j*9)+1:(j*9)+9])
-                    
-                    sram[data1] = "".join(sram[sram1][::-1]) 
-                    sram[data2] = "".join(sram[sram2][::-1])
-                    sram[sram_result] = sram[data2] + sram[data1]
-                    result.append(sram[sram_result])
-                logging.info("Memory Initialized Successfully !!!")
-                self.logger.info(f"===================================================")
-                return result
-
-            # 8K Memory
-            elif (self.write_depth == 8192):
-                if (len(self.binary_data) > self.write_depth):
-                    lines = self.write_depth
-                else:
-                    lines = self.line_count
-                
-                for i in range(lines):
-                    if self.data_width % 4 == 0:
-                        if len(self.binary_data[i]) < self.data_width:
-                            self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                        else:
-                            self.binary_data[i] = self.binary_data[i]
-                    else:
-                        temp = self.data_width % 4
-                        self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                        self.binary_data[i] = '0' * (4 - temp) + self.binary_data[i]
-                
-                # Appending 'x' on vacant addresses
-                x_data = self.write_depth - self.line_count
-                if lines == self.line_count:
-                    for i in range(x_data):
-                        self.binary_data.append((self.data_width + (4-(self.data_width % 4))) * 'x')
-                        
-                for j in range(self.m-1, -1, -1):
-                    sram1 = f"sram1_{j}"
-                    sram2 = f"sram2_{j}"
-                    data1 = f"ram_data1_{j}"
-                    data2 = f"ram_data2_{j}"
-                    sram_result = f"result_{j}"
-                    
-                    sram[sram1] = []
-                    sram[sram2] = []
-                    sram[data1] = []
-                    sram[data2] = []
-                    sram[sram_result] = []
-                    
-                    for i in range(2048): # 2048 * (4-lines per iteration) = 8192 addresses
-                        if i % 2 == 0:
-                            sram[sram1].append("xx" + self.binary_data[(i*4)+3][(j*4):(j*4)+4]+self.binary_data[(i*4)+2][(j*4):(j*4)+4]+self.binary_data[(i*4)+1][(j*4):(j*4)+4]+self.binary_data[(i*4)][(j*4):(j*4)+4])
-                        else:
-                            sram[sram2].append("xx" + self.binary_data[(i*4)+3][(j*4):(j*4)+4]+self.binary_data[(i*4)+2][(j*4):(j*4)+4]+self.binary_data[(i*4)+1][(j*4):(j*4)+4]+self.binary_data[(i*4)][(j*4):(j*4)+4])
-
-                    sram[data1] = "".join(sram[sram1][::-1]) 
-                    sram[data2] = "".join(sram[sram2][::-1])
-                    sram[sram_result] = sram[data2] + sram[data1]
-                    result.append(sram[sram_result])
-                logging.info("Memory Initialized Successfully !!!")
-                self.logger.info(f"===================================================")
-                return result
-                
-            # 16K Memory
-            elif (self.write_depth == 16384):
-                if (len(self.binary_data) > self.write_depth):
-                    lines = self.write_depth
-                else:
-                    lines = self.line_count
-
-                for i in range(lines):
-                    if self.data_width % 4 == 0:
-                        valid_data_width = self.data_width
-                        if len(self.binary_data[i]) < self.data_width:
-                            self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                        else:
-                            self.binary_data[i] = self.binary_data[i]
-                    else:
-                        temp = self.data_width % 2
-                        self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                        self.binary_data[i] = '0' * (2 - temp) + self.binary_data[i]
-                        valid_data_width = (self.data_width + (4-(self.data_width % 4)))
-                
-                # Appending 'x' on vacant addresses
-                x_data = self.write_depth - self.line_count
-                if lines == self.line_count:
-                    for i in range(x_data):
-                        self.binary_data.append(valid_data_width * 'x')
-                
-                for j in range(self.m-1, -1, -1):
-                    sram1 = f"sram1_{j}"
-                    sram2 = f"sram2_{j}"
-                    data1 = f"ram_data1_{j}"
-                    data2 = f"ram_data2_{j}"
-                    sram_result = f"result_{j}"
-                    sram[sram1] = []
-                    sram[sram2] = []
-                    sram[data1] = []
-                    sram[data2] = []
-                    sram[sram_result] = []
-                    for i in range(2048): # 2048 * (8-lines per iteration) = 16384 addresses
-                        if i % 2 == 0:
-                            sram[sram1].append("xx" + self.binary_data[(i*8)+7][(j*2):(j*2)+2] + self.binary_data[(i*8)+6][(j*2):(j*2)+2] + self.binary_data[(i*8)+5][(j*2):(j*2)+2] + self.binary_data[(i*8)+4][(j*2):(j*2)+2] + self.binary_data[(i*8)+3][(j*2):(j*2)+2]+self.binary_data[(i*8)+2][(j*2):(j*2)+2]+self.binary_data[(i*8)+1][(j*2):(j*2)+2]+self.binary_data[(i*8)][(j*2):(j*2)+2])
-                        else:
-                            sram[sram2].append("xx" + self.binary_data[(i*8)+7][(j*2):(j*2)+2] + self.binary_data[(i*8)+6][(j*2):(j*2)+2] + self.binary_data[(i*8)+5][(j*2):(j*2)+2] + self.binary_data[(i*8)+4][(j*2):(j*2)+2] + self.binary_data[(i*8)+3][(j*2):(j*2)+2]+self.binary_data[(i*8)+2][(j*2):(j*2)+2]+self.binary_data[(i*8)+1][(j*2):(j*2)+2]+self.binary_data[(i*8)][(j*2):(j*2)+2])
-                    sram[data1] = "".join(sram[sram1][::-1]) 
-                    sram[data2] = "".join(sram[sram2][::-1])
-                    sram[sram_result] = sram[data2] + sram[data1]
-                    result.append(sram[sram_result])
-                logging.info("Memory Initialized Successfully !!!")
-                self.logger.info(f"===================================================")
-                return result
-            
-            # 32K Memory
-            elif (self.write_depth == 32768):
-                if (len(self.binary_data) > self.write_depth):
-                    lines = self.write_depth
-                else:
-                    lines = self.line_count
-
-                for i in range(lines):
-                    if len(self.binary_data[i]) < self.data_width:
-                        self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                
-                # Appending 'x' on vacant addresses
-                x_data = self.write_depth - self.line_count
-                if lines == self.line_count:
-                    for i in range(x_data):
-                        self.binary_data.append(self.data_width * 'x')
-                for j in range(self.m-1, -1, -1):
-                    sram1 = f"sram1_{j}"
-                    sram2 = f"sram2_{j}"
-                    data1 = f"ram_data1_{j}"
-                    data2 = f"ram_data2_{j}"
-                    sram_result = f"result_{j}"
-                    sram[sram1] = []
-                    sram[sram2] = []
-                    sram[data1] = []
-                    sram[data2] = []
-                    sram[sram_result] = []
-                    for i in range(2048): # 2048 * (16-lines per iteration) = 32768 addresses
-                        if i % 2 == 0:
-                            sram[sram1].append("xx" + self.binary_data[(i*16)+15][(j*1):(j*1)+1] + self.binary_data[(i*16)+14][(j*1):(j*1)+1] + self.binary_data[(i*16)+13][(j*1):(j*1)+1] + self.binary_data[(i*16)+12][(j*1):(j*1)+1] + self.binary_data[(i*16)+11][(j*1):(j*1)+1] + self.binary_data[(i*16)+10][(j*1):(j*1)+1] + self.binary_data[(i*16)+9][(j*1):(j*1)+1] + self.binary_data[(i*16)+8][(j*1):(j*1)+1] + self.binary_data[(i*16)+7][(j*1):(j*1)+1] + self.binary_data[(i*16)+6][(j*1):(j*1)+1] + self.binary_data[(i*16)+5][(j*1):(j*1)+1] + self.binary_data[(i*16)+4][(j*1):(j*1)+1] + self.binary_data[(i*16)+3][(j*1):(j*1)+1]+self.binary_data[(i*16)+2][(j*1):(j*1)+1]+self.binary_data[(i*16)+1][(j*1):(j*1)+1]+self.binary_data[(i*16)][(j*1):(j*1)+1])
-                        else:
-                            sram[sram2].append("xx" + self.binary_data[(i*16)+15][(j*1):(j*1)+1] + self.binary_data[(i*16)+14][(j*1):(j*1)+1] + self.binary_data[(i*16)+13][(j*1):(j*1)+1] + self.binary_data[(i*16)+12][(j*1):(j*1)+1] + self.binary_data[(i*16)+11][(j*1):(j*1)+1] + self.binary_data[(i*16)+10][(j*1):(j*1)+1] + self.binary_data[(i*16)+9][(j*1):(j*1)+1] + self.binary_data[(i*16)+8][(j*1):(j*1)+1] + self.binary_data[(i*16)+7][(j*1):(j*1)+1] + self.binary_data[(i*16)+6][(j*1):(j*1)+1] + self.binary_data[(i*16)+5][(j*1):(j*1)+1] + self.binary_data[(i*16)+4][(j*1):(j*1)+1] + self.binary_data[(i*16)+3][(j*1):(j*1)+1]+self.binary_data[(i*16)+2][(j*1):(j*1)+1]+self.binary_data[(i*16)+1][(j*1):(j*1)+1]+self.binary_data[(i*16)][(j*1):(j*1)+1])
-                    
-                    sram[data1] = "".join(sram[sram1][::-1]) 
-                    sram[data2] = "".join(sram[sram2][::-1])
-                    sram[sram_result] = sram[data2] + sram[data1]
-                    result.append(sram[sram_result])
-                logging.info("Memory Initialized Successfully !!!")
-                self.logger.info(f"===================================================")
-                return result
-        
-        # Other Memory Size Initialization
-        else:
-            lines = self.line_count
-            
-            for i in range(lines):
-                if self.data_width % 36 == 0:
-                    valid_data_width = self.data_width
-                    if len(self.binary_data[i]) < self.data_width:
-                        self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                    else:
-                        self.binary_data[i] = self.binary_data[i]
-                else:
-                    temp = self.data_width % 36
-                    self.binary_data[i] = '0' * (self.data_width - len(self.binary_data[i])) + self.binary_data[i]
-                    self.binary_data[i] = '0' * (36 - temp) + self.binary_data[i]
-                    valid_data_width = (self.data_width + (36-(self.data_width % 36)))
-                
-            valid_depth = self.write_depth + (1024-(self.write_depth % 1024))
-            x_data = valid_depth - self.line_count # Appending 'x' on vacant addresses
-            k = 0
-            for i in range(x_data):
-                self.binary_data.append(valid_data_width * 'x')
-                
-            for x in range(self.n-1,-1,-1): # on data_width
-                for j in range(self.m): # on depth
-                    sram1 = f"sram1_{j}"
-                    sram2 = f"sram2_{j}"
-                    bits = f"bits_{k}"
-                    data1 = f"ram_data1_{k}"
-                    data2 = f"ram_data2_{k}"
-                    sram_result = f"result_{k}"
+            logging.info(f"Memory Init Cache: miss ({cache_key[:16]})")
+        logging.info("Processing")
+        words = ocm_init_loader.read_init_file(file_path, file_extension)
+        self.line_count = len(words)
+        if self.line_count == 0:
+            return "x"
+        result = ocm_init_loader.init_vectors(words, self.data_width, self.mapping)
+        if cache_key is not None:
+            self.init_cache.put(cache_key, ocm_init_loader.dump_init_vectors(self.line_count, result))
+        logging.info("Memory Initialized Successfully !!!")
+        self.logger.info(f"===================================================")
+        return result
 
-                    sram[sram1] = []
-                    sram[sram2] = []
-                    sram[bits] = []
-                    sram[data1] = []
-                    sram[data2] = []
-                    sram[sram_result] = []
-                    k=k+1 # to manage mxn 
-                    
-                    for i in range(1024): # 1024 * (1-line per iteration) = 1024 addresses
-                        sram[bits].append(self.binary_data[i+(j*1024)][x*36:(x*36)+36]) # working 
-                        sram[sram1].append(sram[bits][i][:18]) # Extracting First 18 bits from binary data
-                        sram[sram2].append(sram[bits][i][18:]) # Extracting Next 18 bits from binary data
-                    sram[data1] = "".join(sram[sram1][::-1]) # inverting indexing of SRAM1
-                    sram[data2] = "".join(sram[sram2][::-1]) # inverting indexing of SRAM2
-                    sram[sram_result] = sram[data1] + sram[data2]
-                    result.append(sram[sram_result])
-            logging.info("Memory Initialized Successfully !!!")
-            self.logger.info(f"===================================================")
-            return result
-    
-    def __init__(self, platform, data_width, memory_type, common_clk, write_depth, bram, file_path, file_extension):
+    def __init__(self, platform, data_width, memory_type, common_clk, write_depth, bram, file_path, file_extension, bram_mapping="Primitives", init_cache=None):
         
         self.write_depth = write_depth
         self.data_width  = data_width
+        self.init_cache  = init_cache
         
         # Get/Check Parameters.
         # ---------------------
@@ -448,52 +86,22 @@ class OCM(Module):
         self.din_B     = Signal(data_width)
         self.dout_B    = Signal(data_width)
         
-        # OCM Instances.
-        # if (write_depth % 1024 ==0):
-        if (write_depth == 1024):
-            m = math.ceil(data_width/36)
-            n = 1  
-        elif (write_depth == 2048):
-            m = math.ceil(data_width/18)
-            n = 1
-        elif (write_depth == 4096):
-            m = math.ceil(data_width/9)
-            n = 1
-        elif (write_depth == 8192):
-            m = math.ceil(data_width/4)
-            n = 1
-        elif (write_depth == 16384):
-            m = math.ceil(data_width/2)
-            n = 1
-        elif (write_depth == 32768):
-            m = math.ceil(data_width/1)
-            n = 1
-                
+        # OCM Instances: single row of aspect ratio primitives (m columns) or rows tiling of 1024x36
+        # primitives (m rows, n columns), see ocm_bram_mapper.
+        self.mapping = mapping = ocm_bram_mapper.map_memory(data_width, write_depth, bram_mapping)
+        if mapping["tiled"]:
+            bram_depth = None
+            m = mapping["rows"]
+            n = mapping["columns"]
         else:
-            if (write_depth > 1024):
-                m = write_depth / 1024
-                temp = int(m/1)
-                if (temp*1 != m):
-                    m = int(m)+1
-                else:
-                    m = int(m)
-            else:
-                m = write_depth / 1024
-                m = math.ceil(m)
-            if (data_width > 36):
-                n = data_width / 36
-                temp = int(n/1)
-                if (temp*1 != n):
-                    n = int(n)+1
-                else:
-                    n = int(n)
-            else:
-                n = data_width / 36
-                n = math.ceil(n)
+            bram_depth = mapping["depth"]
+            m = mapping["columns"]
+            n = 1
         self.m = m
         self.n = n
         
         if (bram == 1):
+            self.logger.info(f"BRAM MAPPING     : {ocm_bram_mapper.mapping_summary(mapping)['BRAM Mapping']} ({bram_mapping})")
             self.logger.info(f"NUMBER OF BRAMS  : {m*n}")
             
         self.logger.info(f"===================================================")
@@ -527,16 +135,16 @@ class OCM(Module):
             self.bram_out_A = [Signal(36*n) for i in range(m)]
             self.bram_out_B = [Signal(36*n) for i in range(m)]
 
-            if (write_depth == 1024 or write_depth == 2048 or write_depth == 4096 or write_depth == 8192 or write_depth == 16384 or write_depth == 32768):
+            if (bram_depth == 1024 or bram_depth == 2048 or bram_depth == 4096 or bram_depth == 8192 or bram_depth == 16384 or bram_depth == 32768):
                 # Single Port RAM
                 if (memory_type == "Single_Port"):
                     self.comb += If((self.wen_A == 1), self.wen_A1.eq(1))
                     for i in range(m):
-                        if (write_depth <= 1024):
+                        if (bram_depth <= 1024):
                             self.comb += self.dout_A[(i*36):((i*36)+36)].eq(Cat(self.bram_out_A[i][0:36]))
-                        elif (write_depth == 2048):
+                        elif (bram_depth == 2048):
                             self.comb += self.dout_A[(i*18):((i*18)+18)].eq(Cat(self.bram_out_A[i][0:18]))
-                        elif (write_depth == 4096):
+                        elif (bram_depth == 4096):
                             if data_width > 8:
                                 if (m == (i+1)):
                                     if (y == i*9):
@@ -548,22 +156,22 @@ class OCM(Module):
                             else:
                                 self.comb += self.dout_A[(i*9):((i*9)+9)].eq(Cat(self.bram_out_A[i][0:data_width]))
                                 
-                        elif (write_depth == 8192):
+                        elif (bram_depth == 8192):
                             self.comb += self.dout_A[(i*4):((i*4)+4)].eq(Cat(self.bram_out_A[i][0:4]))
-                        elif (write_depth == 16384):
+                        elif (bram_depth == 16384):
                             self.comb += self.dout_A[(i*2):((i*2)+2)].eq(Cat(self.bram_out_A[i][0:2]))
-                        elif (write_depth == 32768):
+                        elif (bram_depth == 32768):
                             self.comb += self.dout_A[(i*1):((i*1)+1)].eq(Cat(self.bram_out_A[i][0:1]))
                             
                 # Simple Dual Port RAM
                 elif (memory_type == "Simple_Dual_Port"):
                     self.comb += If((self.wen_A == 1), self.wen_A1.eq(1)).Else(self.wen_A1.eq(0))
                     for i in range(m):
-                        if (write_depth <= 1024):
+                        if (bram_depth <= 1024):
                             self.comb += self.dout_B[(i*36):((i*36)+36)].eq(Cat(self.bram_out_B[i][0:36]))
-                        elif (write_depth > 1024 and write_depth <= 2048):
+                        elif (bram_depth > 1024 and bram_depth <= 2048):
                             self.comb += self.dout_B[(i*18):((i*18)+18)].eq(Cat(self.bram_out_B[i][0:18]))
-                        elif (write_depth > 2048 and write_depth <= 4096):
+                        elif (bram_depth > 2048 and bram_depth <= 4096):
                             if data_width > 8:
                                 if (m == (i+1)):
                                     if (y == i*9):
@@ -574,11 +182,11 @@ class OCM(Module):
                                     self.comb += self.dout_B[(i*9):((i*9)+9)].eq(Cat(self.bram_out_B[i][0:8], self.bram_out_B[i][16]))
                             else:
                                 self.comb += self.dout_B[(i*9):((i*9)+9)].eq(Cat(self.bram_out_B[i][0:data_width]))
-                        elif (write_depth > 4096 and write_depth <= 8192):
+                        elif (bram_depth > 4096 and bram_depth <= 8192):
                             self.comb += self.dout_B[(i*4):((i*4)+4)].eq(Cat(self.bram_out_B[i][0:4]))
-                        elif (write_depth == 16384):
+                        elif (bram_depth == 16384):
                             self.comb += self.dout_B[(i*2):((i*2)+2)].eq(Cat(self.bram_out_B[i][0:2]))
-                        elif (write_depth == 32768):
+                        elif (bram_depth == 32768):
                             self.comb += self.dout_B[(i*1):((i*1)+1)].eq(Cat(self.bram_out_B[i][0:1]))
                 
                 # True Dual Port RAM
@@ -586,13 +194,13 @@ class OCM(Module):
                     self.comb += If((self.wen_A == 1), self.wen_A1.eq(1)).Else(self.wen_A1.eq(0))
                     self.comb += If((self.wen_B == 1), self.wen_B1.eq(1)).Else(self.wen_B1.eq(0))
                     for i in range(m):
-                        if (write_depth <= 1024):
+                        if (bram_depth <= 1024):
                             self.comb += self.dout_B[(i*36):((i*36)+36)].eq(Cat(self.bram_out_B[i][0:36]))
                             self.comb += self.dout_A[(i*36):((i*36)+36)].eq(Cat(self.bram_out_A[i][0:36]))
-                        elif (write_depth > 1024 and write_depth <= 2048):
+                        elif (bram_depth > 1024 and bram_depth <= 2048):
                             self.comb += self.dout_A[(i*18):((i*18)+18)].eq(Cat(self.bram_out_A[i][0:18]))
                             self.comb += self.dout_B[(i*18):((i*18)+18)].eq(Cat(self.bram_out_B[i][0:18]))
-                        elif (write_depth > 2048 and write_depth <= 4096):
+                        elif (bram_depth > 2048 and bram_depth <= 4096):
                             if data_width > 8:
                                 if (m == (i+1)):
                                     if (y == i*9):
@@ -607,13 +215,13 @@ class OCM(Module):
                             else:
                                 self.comb += self.dout_A[(i*9):((i*9)+9)].eq(Cat(self.bram_out_A[i][0:data_width]))
                                 self.comb += self.dout_B[(i*9):((i*9)+9)].eq(Cat(self.bram_out_B[i][0:data_width]))
-                        elif (write_depth > 4096 and write_depth <= 8192):
+                        elif (bram_depth > 4096 and bram_depth <= 8192):
                             self.comb += self.dout_A[(i*4):((i*4)+4)].eq(Cat(self.bram_out_A[i][0:4]))
                             self.comb += self.dout_B[(i*4):((i*4)+4)].eq(Cat(self.bram_out_B[i][0:4]))
-                        elif (write_depth == 16384):
+                        elif (bram_depth == 16384):
                             self.comb += self.dout_A[(i*2):((i*2)+2)].eq(Cat(self.bram_out_A[i][0:2]))
                             self.comb += self.dout_B[(i*2):((i*2)+2)].eq(Cat(self.bram_out_B[i][0:2]))
-                        elif (write_depth == 32768):
+                        elif (bram_depth == 32768):
                             self.comb += self.dout_A[(i*1):((i*1)+1)].eq(Cat(self.bram_out_A[i][0:1]))
                             self.comb += self.dout_B[(i*1):((i*1)+1)].eq(Cat(self.bram_out_B[i][0:1]))
             else:
@@ -725,8 +333,8 @@ class OCM(Module):
                             write_data_A1   = self.din_A[(i*36):((i*36)+18)]
                             write_data_A2   = self.din_A[((i*36)+18):((i*36)+36)]
                     
-                    # if (write_depth % 1024 == 0):
-                    if (write_depth == 1024):
+                    # if (bram_depth % 1024 == 0):
+                    if (bram_depth == 1024):
                         w_mode_a1 = "110"
                         w_mode_b1 = "000"
                         w_mode_a2 = "110"
@@ -737,7 +345,7 @@ class OCM(Module):
                         r_mode_b2 = "000"
                         split     = '0'
                         address = Cat(Replicate(0,5), self.addr_A[0:msb])
-                    elif (write_depth == 2048):
+                    elif (bram_depth == 2048):
                         w_mode_a1 = "010"
                         w_mode_b1 = "000"
                         w_mode_a2 = "010"
@@ -748,7 +356,7 @@ class OCM(Module):
                         r_mode_b2 = "000"
                         split     = '0'
                         address = Cat(Replicate(0,4), self.addr_A[0:msb])
-                    elif (write_depth == 4096):
+                    elif (bram_depth == 4096):
                         w_mode_a1 = "100"
                         w_mode_b1 = "000"
                         w_mode_a2 = "100"
@@ -759,7 +367,7 @@ class OCM(Module):
                         r_mode_b2 = "000"
                         split     = '0'
                         address = Cat(Replicate(0,3), self.addr_A[0:msb])
-                    elif (write_depth == 8192):
+                    elif (bram_depth == 8192):
                         w_mode_a1 = "001"
                         w_mode_b1 = "000"
                         w_mode_a2 = "001"
@@ -770,7 +378,7 @@ class OCM(Module):
                         r_mode_b2 = "000"
                         split     = '0'
                         address = Cat(Replicate(0,2), self.addr_A[0:msb])
-                    elif (write_depth == 16384):
+                    elif (bram_depth == 16384):
                         w_mode_a1 = "011"
                         w_mode_b1 = "000"
                         w_mode_a2 = "011"
@@ -781,7 +389,7 @@ class OCM(Module):
                         r_mode_b2 = "000"
                         split     = '0'
                         address = Cat(Replicate(0,1), self.addr_A[0:msb])
-                    elif (write_depth == 32768):
+                    elif (bram_depth == 32768):
                         w_mode_a1 = "101"
                         w_mode_b1 = "000"
                         w_mode_a2 = "101"
@@ -890,7 +498,7 @@ class OCM(Module):
                         if (file_path == "") or (self.line_count == 0):
                             value = 'x'
                         else:
-                            if write_depth in [1024, 2048, 4096, 8192, 16384, 32768]:
+                            if bram_depth in [1024, 2048, 4096, 8192, 16384, 32768]:
                                 value = init[j]
                             else:
                                 value = init[k]
@@ -898,7 +506,7 @@ class OCM(Module):
                                 
                         init_i = Instance.PreformattedParam("36864'b{}".format(value))
                         
-                        if (write_depth == 1024):
+                        if (bram_depth == 1024):
                             if (m == (j+1)):
                                 if (z > 18):
                                     write_data_A1   = self.din_A[(j*36):((j*36)+18)]
@@ -911,11 +519,11 @@ class OCM(Module):
                                     write_data_A1   = self.din_A[(j*36):((j*36)+18)]
                                     write_data_A2   = self.din_A[((j*36)+18):((j*36)+36)]
 
-                        elif (write_depth == 2048):
+                        elif (bram_depth == 2048):
                             write_data_A1 = self.din_A[(j*18):((j*18)+18)]
                             write_data_A2 = 0
                             
-                        elif (write_depth == 4096):
+                        elif (bram_depth == 4096):
                             if data_width > 8:
                                 if (m == (j+1)):
                                     if (y == (j+1)*9):
@@ -931,20 +539,20 @@ class OCM(Module):
                                 write_data_A1 = self.din_A[0:data_width]
                                 write_data_A2 = 0
                             
-                        elif (write_depth == 8192):
+                        elif (bram_depth == 8192):
                             write_data_A1 = self.din_A[(j*4):((j*4)+4)]
                             write_data_A2 = 0
                         
-                        if (write_depth == 16384):
+                        if (bram_depth == 16384):
                             write_data_A1 = self.din_A[(j*2):((j*2)+2)]
                             write_data_A2 = 0
                             
-                        if (write_depth == 32768):
+                        if (bram_depth == 32768):
                             write_data_A1 = self.din_A[(j*1):((j*1)+1)]
                             write_data_A2 = 0
                             
                         # for j in range(m):
-                        if (write_depth == 1024 or write_depth == 2048 or write_depth == 4096 or write_depth == 8192 or write_depth == 16384 or write_depth == 32768):
+                        if (bram_depth == 1024 or bram_depth == 2048 or bram_depth == 4096 or bram_depth == 8192 or bram_depth == 16384 or bram_depth == 32768):
                             wen = self.wen_A1
                         else:
                             wen = self.wen_A1[j]
@@ -996,8 +604,8 @@ class OCM(Module):
                             write_data_A1   = self.din_A[(i*36):((i*36)+18)]
                             write_data_A2   = self.din_A[((i*36)+18):((i*36)+36)]
                     
-                    # if (write_depth % 1024 == 0):
-                    if (write_depth == 1024):
+                    # if (bram_depth % 1024 == 0):
+                    if (bram_depth == 1024):
                         w_mode_a1 = "110"
                         w_mode_b1 = "110"
                         w_mode_a2 = "110"
@@ -1009,7 +617,7 @@ class OCM(Module):
                         split     = '0'
                         address_A = Cat(Replicate(0,5), self.addr_A[0:msb])
                         address_B = Cat(Replicate(0,5), self.addr_B[0:msb])
-                    elif (write_depth == 2048):
+                    elif (bram_depth == 2048):
                         w_mode_a1 = "010"
                         w_mode_b1 = "010"
                         w_mode_a2 = "010"
@@ -1021,7 +629,7 @@ class OCM(Module):
                         split     = '0'
                         address_A = Cat(Replicate(0,4), self.addr_A[0:msb])
                         address_B = Cat(Replicate(0,4), self.addr_B[0:msb])
-                    elif (write_depth == 4096):
+                    elif (bram_depth == 4096):
                         w_mode_a1 = "100"
                         w_mode_b1 = "100"
                         w_mode_a2 = "100"
@@ -1033,7 +641,7 @@ class OCM(Module):
                         split     = '0'
                         address_A = Cat(Replicate(0,3), self.addr_A[0:msb])
                         address_B = Cat(Replicate(0,3), self.addr_B[0:msb])
-                    elif (write_depth == 8192):
+                    elif (bram_depth == 8192):
                         w_mode_a1 = "001"
                         w_mode_b1 = "001"
                         w_mode_a2 = "001"
@@ -1045,7 +653,7 @@ class OCM(Module):
                         split     = '0'
                         address_A = Cat(Replicate(0,2), self.addr_A[0:msb])
                         address_B = Cat(Replicate(0,2), self.addr_B[0:msb])
-                    elif (write_depth == 16384):
+                    elif (bram_depth == 16384):
                         w_mode_a1 = "011"
                         w_mode_b1 = "011"
                         w_mode_a2 = "011"
@@ -1057,7 +665,7 @@ class OCM(Module):
                         split     = '0'
                         address_A = Cat(Replicate(0,1), self.addr_A[0:msb])
                         address_B = Cat(Replicate(0,1), self.addr_B[0:msb])
-                    elif (write_depth == 32768):
+                    elif (bram_depth == 32768):
                         w_mode_a1 = "101"
                         w_mode_b1 = "101"
                         w_mode_a2 = "101"
@@ -1197,7 +805,7 @@ class OCM(Module):
                         if (file_path == ""):
                             value = 'x'
                         else:
-                            if write_depth in [1024, 2048, 4096, 8192, 16384, 32768]:
+                            if bram_depth in [1024, 2048, 4096, 8192, 16384, 32768]:
                                 value = init[j]
                             else:
                                 value = init[k]
@@ -1205,7 +813,7 @@ class OCM(Module):
                             
                         init_i = Instance.PreformattedParam("36864'b{}".format(value))
                         
-                        if (write_depth == 1024):
+                        if (bram_depth == 1024):
                             if (m == (j+1)):
                                 if (z > 18):
                                     write_data_A1   = self.din_A[(j*36):((j*36)+18)]
@@ -1218,11 +826,11 @@ class OCM(Module):
                                     write_data_A1   = self.din_A[(j*36):((j*36)+18)]
                                     write_data_A2   = self.din_A[((j*36)+18):((j*36)+36)]
                                     
-                        elif (write_depth == 2048):
+                        elif (bram_depth == 2048):
                                 write_data_A1 = self.din_A[(j*18):((j*18)+18)]
                                 write_data_A2 = 0
                             
-                        elif (write_depth == 4096):
+                        elif (bram_depth == 4096):
                             if data_width > 8:
                                 if (m == (j+1)):
                                     if (y == (j+1)*9):
@@ -1238,20 +846,20 @@ class OCM(Module):
                                 write_data_A1 = self.din_A[0:data_width]
                                 write_data_A2 = 0
                             
-                        elif (write_depth == 8192):
+                        elif (bram_depth == 8192):
                             write_data_A1 = self.din_A[(j*4):((j*4)+4)]
                             write_data_A2 = 0
                         
-                        if (write_depth == 16384):
+                        if (bram_depth == 16384):
                             write_data_A1 = self.din_A[(j*2):((j*2)+2)]
                             write_data_A2 = 0
                             
-                        if (write_depth == 32768):
+                        if (bram_depth == 32768):
                             write_data_A1 = self.din_A[(j*1):((j*1)+1)]
                             write_data_A2 = 0
                             
                         # for j in range(m):
-                        if (write_depth == 1024 or write_depth == 2048 or write_depth == 4096 or write_depth == 8192 or write_depth == 16384 or write_depth == 32768):
+                        if (bram_depth == 1024 or bram_depth == 2048 or bram_depth == 4096 or bram_depth == 8192 or bram_depth == 16384 or bram_depth == 32768):
                             wen = self.wen_A1
                         else:
                             wen = self.wen_A1[j]
@@ -1341,8 +949,8 @@ class OCM(Module):
                             write_data_B2   = self.din_B[((i*36)+18):((i*36)+36)]
 
                     # Mode_Bits
-                    # if (write_depth % 1024 == 0):
-                    if (write_depth == 1024):
+                    # if (bram_depth % 1024 == 0):
+                    if (bram_depth == 1024):
                         w_mode_a1 = "110"
                         w_mode_b1 = "110"
                         w_mode_a2 = "110"
@@ -1354,7 +962,7 @@ class OCM(Module):
                         split     = '0'
                         address_A = Cat(Replicate(0,5), self.addr_A[0:msb])
                         address_B = Cat(Replicate(0,5), self.addr_B[0:msb])
-                    elif (write_depth == 2048):
+                    elif (bram_depth == 2048):
                         w_mode_a1 = "010"
                         w_mode_b1 = "010"
                         w_mode_a2 = "010"
@@ -1366,7 +974,7 @@ class OCM(Module):
                         split     = '0'
                         address_A = Cat(Replicate(0,4), self.addr_A[0:msb])
                         address_B = Cat(Replicate(0,4), self.addr_B[0:msb])
-                    elif (write_depth == 4096):
+                    elif (bram_depth == 4096):
                         w_mode_a1 = "100"
                         w_mode_b1 = "100"
                         w_mode_a2 = "100"
@@ -1378,7 +986,7 @@ class OCM(Module):
                         split     = '0'
                         address_A = Cat(Replicate(0,3), self.addr_A[0:msb])
                         address_B = Cat(Replicate(0,3), self.addr_B[0:msb])
-                    elif (write_depth == 8192):
+                    elif (bram_depth == 8192):
                         w_mode_a1 = "001"
                         w_mode_b1 = "001"
                         w_mode_a2 = "001"
@@ -1390,7 +998,7 @@ class OCM(Module):
                         split     = '0'
                         address_A = Cat(Replicate(0,2), self.addr_A[0:msb])
                         address_B = Cat(Replicate(0,2), self.addr_B[0:msb])
-                    elif (write_depth == 16384):
+                    elif (bram_depth == 16384):
                         w_mode_a1 = "011"
                         w_mode_b1 = "011"
                         w_mode_a2 = "011"
@@ -1402,7 +1010,7 @@ class OCM(Module):
                         split     = '0'
                         address_A = Cat(Replicate(0,1), self.addr_A[0:msb])
                         address_B = Cat(Replicate(0,1), self.addr_B[0:msb])
-                    elif (write_depth == 32768):
+                    elif (bram_depth == 32768):
                         w_mode_a1 = "101"
                         w_mode_b1 = "101"
                         w_mode_a2 = "101"
@@ -1546,14 +1154,14 @@ class OCM(Module):
                         if (file_path == ""):
                             value = 'x'
                         else:
-                            if write_depth in [1024, 2048, 4096, 8192, 16384, 32768]:
+                            if bram_depth in [1024, 2048, 4096, 8192, 16384, 32768]:
                                 value = init[j]
                             else:
                                 value = init[k]
                                 k=k+1
                         init_i = Instance.PreformattedParam("36864'b{}".format(value))
                         
-                        if (write_depth == 1024):
+                        if (bram_depth == 1024):
                             if (m == (j+1)):
                                 if (z > 18):
                                     write_data_A1   = self.din_A[(j*36):((j*36)+18)]
@@ -1572,13 +1180,13 @@ class OCM(Module):
                                     write_data_B1   = self.din_B[(j*36):((j*36)+18)]
                                     write_data_B2   = self.din_B[((j*36)+18):((j*36)+36)]
                                     
-                        elif (write_depth == 2048):
+                        elif (bram_depth == 2048):
                                 write_data_A1 = self.din_A[(j*18):((j*18)+18)]
                                 write_data_A2 = 0
                                 write_data_B1 = self.din_B[(j*18):((j*18)+18)]
                                 write_data_B2 = 0
                             
-                        elif (write_depth == 4096):
+                        elif (bram_depth == 4096):
                             if data_width > 8:
                                 if (m == (j+1)):
                                     if (y == (j+1)*9):
@@ -1602,26 +1210,26 @@ class OCM(Module):
                                 write_data_B1 = self.din_B[0:data_width]
                                 write_data_B2 = 0
                             
-                        elif (write_depth == 8192):
+                        elif (bram_depth == 8192):
                             write_data_A1 = self.din_A[(j*4):((j*4)+4)]
                             write_data_A2 = 0
                             write_data_B1 = self.din_B[(j*4):((j*4)+4)]
                             write_data_B2 = 0
                         
-                        if (write_depth == 16384):
+                        if (bram_depth == 16384):
                             write_data_A1 = self.din_A[(j*2):((j*2)+2)]
                             write_data_A2 = 0
                             write_data_B1 = self.din_B[(j*2):((j*2)+2)]
                             write_data_B2 = 0
                             
-                        if (write_depth == 32768):
+                        if (bram_depth == 32768):
                             write_data_A1 = self.din_A[(j*1):((j*1)+1)]
                             write_data_A2 = 0
                             write_data_B1 = self.din_B[(j*1):((j*1)+1)]
                             write_data_B2 = 0
                             
                         # for j in range(m):
-                        if (write_depth == 1024 or write_depth == 2048 or write_depth == 4096 or write_depth == 8192 or write_depth == 16384 or write_depth == 32768):
+                        if (bram_depth == 1024 or bram_depth == 2048 or bram_depth == 4096 or bram_depth == 8192 or bram_depth == 16384 or bram_depth == 32768):
                             wen_A = self.wen_A1
                             wen_B = self.wen_B1
                         else:
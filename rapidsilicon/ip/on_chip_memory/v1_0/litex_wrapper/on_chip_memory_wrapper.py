@@ -0,0 +1,93 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# on_chip_memory LiteX wrapper: IOs and module elaborated by on_chip_memory_gen.py on --build.
+
+import math
+
+from litex_wrapper.on_chip_memory_litex_wrapper import *
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+
+def get_clkin_ios(data_width, write_depth):
+    return [
+        ("clk",     0, Pins(1)),
+        ("clk_A",   0, Pins(1)),
+        ("clk_B",   0, Pins(1)),
+        ("rst",     0, Pins(1)),
+        
+        ("addr_A",  0, Pins(math.ceil(math.log2(write_depth)))),
+        ("addr_B",  0, Pins(math.ceil(math.log2(write_depth)))),
+        
+        ("din_A",   0, Pins(data_width)),
+        ("din_B",   0, Pins(data_width)),
+        
+        ("dout_A",  0, Pins(data_width)),
+        ("dout_B",  0, Pins(data_width)),
+        
+        ("wen_A",   0, Pins(1)),
+        ("ren_A",   0, Pins(1)),
+        
+        ("wen_B",   0, Pins(1)),
+        ("ren_B",   0, Pins(1))
+    ]
+
+# on_chip_memory Wrapper ----------------------------------------------------------------------------------
+class OCMWrapper(Module):
+    def __init__(self, platform, data_width, memory_type, common_clk, write_depth, bram, file_path, file_extension, bram_mapping="Primitives", init_cache=None):
+        # Clocking ---------------------------------------------------------------------------------
+        platform.add_extension(get_clkin_ios(data_width, write_depth))
+        self.clock_domains.cd_sys  = ClockDomain()
+        self.clock_domains.cd_clk1  = ClockDomain()
+        self.clock_domains.cd_clk2  = ClockDomain()
+        self.submodules.sp = ram = OCM(platform, data_width, memory_type, common_clk, write_depth, bram, file_path, file_extension, bram_mapping, init_cache)
+        
+        # Single Port RAM
+        if (memory_type == "Single_Port"):
+            self.comb += ram.addr_A.eq(platform.request("addr_A"))
+            self.comb += ram.din_A.eq(platform.request("din_A"))
+            self.comb += platform.request("dout_A").eq(ram.dout_A)
+            self.comb += self.cd_sys.clk.eq(platform.request("clk_A"))
+            self.comb += ram.wen_A.eq(platform.request("wen_A"))
+            self.comb += ram.ren_A.eq(platform.request("ren_A"))
+        
+        # Simple Dual Port RAM
+        elif (memory_type == "Simple_Dual_Port"):
+            self.comb += ram.addr_A.eq(platform.request("addr_A"))
+            self.comb += ram.din_A.eq(platform.request("din_A"))
+            self.comb += ram.addr_B.eq(platform.request("addr_B"))
+            self.comb += ram.wen_A.eq(platform.request("wen_A"))
+            self.comb += ram.ren_B.eq(platform.request("ren_B"))
+            self.comb += platform.request("dout_B").eq(ram.dout_B)
+            # Common Clock
+            if (common_clk == 1):
+                self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+            else:
+                self.comb += self.cd_clk1.clk.eq(platform.request("clk_A"))
+                self.comb += self.cd_clk2.clk.eq(platform.request("clk_B"))
+                
+        # True Dual Port
+        elif (memory_type == "True_Dual_Port"):
+            self.comb += ram.addr_A.eq(platform.request("addr_A"))
+            self.comb += ram.din_A.eq(platform.request("din_A"))
+            self.comb += ram.addr_B.eq(platform.request("addr_B"))
+            self.comb += ram.din_B.eq(platform.request("din_B"))
+            self.comb += ram.wen_A.eq(platform.request("wen_A"))
+            self.comb += ram.ren_A.eq(platform.request("ren_A"))
+            self.comb += ram.wen_B.eq(platform.request("wen_B"))
+            self.comb += ram.ren_B.eq(platform.request("ren_B"))
+            self.comb += platform.request("dout_A").eq(ram.dout_A)
+            self.comb += platform.request("dout_B").eq(ram.dout_B)
+            # Common Clock
+            if (common_clk == 1):
+                self.comb += self.cd_sys.clk.eq(platform.request("clk"))
+            else:
+                self.comb += self.cd_clk1.clk.eq(platform.request("clk_A"))
+                self.comb += self.cd_clk2.clk.eq(platform.request("clk_B"))
@@ -10,97 +10,8 @@ import logging
 import argparse
 import math
 
-from datetime import datetime
+from litex_wrapper.ocm_bram_mapper import OBJECTIVES, map_memory, mapping_summary
 
-from datetime import datetime
-
-from litex_wrapper.on_chip_memory_litex_wrapper import *
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-
-def get_clkin_ios(data_width, write_depth):
-    return [
-        ("clk",     0, Pins(1)),
-        ("clk_A",   0, Pins(1)),
-        ("clk_B",   0, Pins(1)),
-        ("rst",     0, Pins(1)),
-        
-        ("addr_A",  0, Pins(math.ceil(math.log2(write_depth)))),
-        ("addr_B",  0, Pins(math.ceil(math.log2(write_depth)))),
-        
-        ("din_A",   0, Pins(data_width)),
-        ("din_B",   0, Pins(data_width)),
-        
-        ("dout_A",  0, Pins(data_width)),
-        ("dout_B",  0, Pins(data_width)),
-        
-        ("wen_A",   0, Pins(1)),
-        ("ren_A",   0, Pins(1)),
-        
-        ("wen_B",   0, Pins(1)),
-        ("ren_B",   0, Pins(1))
-    ]
-
-# on_chip_memory Wrapper ----------------------------------------------------------------------------------
-class OCMWrapper(Module):
-    def __init__(self, platform, data_width, memory_type, common_clk, write_depth, bram, file_path, file_extension):
-        # Clocking ---------------------------------------------------------------------------------
-        platform.add_extension(get_clkin_ios(data_width, write_depth))
-        self.clock_domains.cd_sys  = ClockDomain()
-        self.clock_domains.cd_clk1  = ClockDomain()
-        self.clock_domains.cd_clk2  = ClockDomain()
-        self.submodules.sp = ram = OCM(platform, data_width, memory_type, common_clk, write_depth, bram, file_path, file_extension)
-        
-        # Single Port RAM
-        if (memory_type == "Single_Port"):
-            self.comb += ram.addr_A.eq(platform.request("addr_A"))
-            self.comb += ram.din_A.eq(platform.request("din_A"))
-            self.comb += platform.request("dout_A").eq(ram.dout_A)
-            self.comb += self.cd_sys.clk.eq(platform.request("clk_A"))
-            self.comb += ram.wen_A.eq(platform.request("wen_A"))
-            self.comb += ram.ren_A.eq(platform.request("ren_A"))
-        
-        # Simple Dual Port RAM
-        elif (memory_type == "Simple_Dual_Port"):
-            self.comb += ram.addr_A.eq(platform.request("addr_A"))
-            self.comb += ram.din_A.eq(platform.request("din_A"))
-            self.comb += ram.addr_B.eq(platform.request("addr_B"))
-            self.comb += ram.wen_A.eq(platform.request("wen_A"))
-            self.comb += ram.ren_B.eq(platform.request("ren_B"))
-            self.comb += platform.request("dout_B").eq(ram.dout_B)
-            # Common Clock
-            if (common_clk == 1):
-                self.comb += self.cd_sys.clk.eq(platform.request("clk"))
-            else:
-                self.comb += self.cd_clk1.clk.eq(platform.request("clk_A"))
-                self.comb += self.cd_clk2.clk.eq(platform.request("clk_B"))
-                
-        # True Dual Port
-        elif (memory_type == "True_Dual_Port"):
-            self.comb += ram.addr_A.eq(platform.request("addr_A"))
-            self.comb += ram.din_A.eq(platform.request("din_A"))
-            self.comb += ram.addr_B.eq(platform.request("addr_B"))
-            self.comb += ram.din_B.eq(platform.request("din_B"))
-            self.comb += ram.wen_A.eq(platform.request("wen_A"))
-            self.comb += ram.ren_A.eq(platform.request("ren_A"))
-            self.comb += ram.wen_B.eq(platform.request("wen_B"))
-            self.comb += ram.ren_B.eq(platform.request("ren_B"))
-            self.comb += platform.request("dout_A").eq(ram.dout_A)
-            self.comb += platform.request("dout_B").eq(ram.dout_B)
-            # Common Clock
-            if (common_clk == 1):
-                self.comb += self.cd_sys.clk.eq(platform.request("clk"))
-            else:
-                self.comb += self.cd_clk1.clk.eq(platform.request("clk_A"))
-                self.comb += self.cd_clk2.clk.eq(platform.request("clk_B"))
-            
 # Build --------------------------------------------------------------------------------------------
 def main():
     parser = argparse.ArgumentParser(description="ON CHIP MEMORY")
@@ -109,7 +20,7 @@ def main():
     common_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", "lib")
     sys.path.append(common_path)
 
-    from common import IP_Builder
+    from common import IP_Builder, IP_Cache
 
     # Parameter Dependency dictionary
     #                Ports     :    Dependency
@@ -125,6 +36,7 @@ def main():
     # Core string value parameters.
     core_string_param_group = parser.add_argument_group(title="Core string parameters")
     core_string_param_group.add_argument("--memory_type",    type=str,   default="Single_Port",   choices=["Single_Port", "Simple_Dual_Port", "True_Dual_Port"],   help="RAM Type")
+    core_string_param_group.add_argument("--bram_mapping",   type=str,   default="Primitives",    choices=OBJECTIVES,   help="BRAM Mapping (Fewest Primitives/Read Mux Rows)")
     
     # Core range value parameters.
     core_range_param_group = parser.add_argument_group(title="Core range parameters")
@@ -145,6 +57,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",                        help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                               help="Build Directory")
     build_group.add_argument("--build-name",    default="on_chip_memory",                   help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -169,6 +82,11 @@ def main():
             option_strings_to_remove = ['--common_clk']
             parser._actions = [action for action in parser._actions if action.option_strings and action.option_strings[0] not in option_strings_to_remove]
 
+    if (args.bram == 0):
+        dep_dict.update({
+            'bram_mapping'  :   'True'
+        })
+
     if (args.memory_type == "Single_Port"):
         memory = "Single Port RAM"
     elif (args.memory_type == "Simple_Dual_Port"):
@@ -176,8 +94,7 @@ def main():
     else:
         memory = "True Dual Port RAM"
     
-    m = math.ceil(args.data_width/36)
-    n = math.ceil(args.write_depth/1024)
+    mapping = map_memory(args.data_width, args.write_depth, args.bram_mapping)
     
     if (args.bram == 1):
         memory_mapping = "Block RAM"
@@ -193,7 +110,8 @@ def main():
     }
     
     if (args.bram == 1):
-        summary["Number of BRAMs"] = m*n
+        summary["Number of BRAMs"] = mapping["primitives"]
+        summary.update(mapping_summary(mapping))
         
     if (args.memory_type in ["Simple_Dual_Port", "True_Dual_Port"]):
         if (args.common_clk == 1):
@@ -206,19 +124,6 @@ def main():
     if args.json_template:
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
     
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = OCMWrapper(platform,
-        memory_type     = args.memory_type,
-        data_width      = args.data_width,
-        write_depth     = args.write_depth,
-        common_clk      = args.common_clk,
-        bram            = args.bram,
-        file_path       = args.file_path,
-        file_extension  = os.path.splitext(args.file_path)[1]
-        # wrapper         = os.path.join(args.build_dir, "rapidsilicon", "ip", "on_chip_memory", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-    )
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -226,57 +131,21 @@ def main():
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version     = "v1_0"
-        )
-        
-        # IP_ID Parameter
-        now = datetime.datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "on_chip_memory", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"OCMGEN\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
-        
-        # DRAM
+
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="OCMGEN", ip_version="00000000_00000000_0000000000000001")
+
+        # DRAM: logic RAM style and memory initialization.
         if (args.bram == 0):
-            # wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "on_chip_memory", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-            with open (wrapper, "r") as file:
-                lines = file.readlines()
+            def add_dram_attributes(content):
+                lines = content.splitlines(keepends=True)
                 for i, line in enumerate(lines):
                     if "Port" in line:
                         lines.insert(i, "(* ram_style = \"logic\" *)\n\n")
                         break
-                    
+
                 file_extension  = os.path.splitext(args.file_path)[1]
                 hex_path = "initial begin\n\t$readmemh(\"{}\", memory);\nend\n".format(args.file_path)
                 bin_path = "initial begin\n\t$readmemb(\"{}\", memory);\nend\n".format(args.file_path)
@@ -287,9 +156,40 @@ def main():
                         elif (file_extension == ".bin"):
                             lines.insert(i, bin_path)
                         break
-
-            with open(os.path.join(wrapper), "w") as file:
-                file.writelines(lines)
+                return "".join(lines)
+            rs_builder.add_wrapper_transform(add_dram_attributes)
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.on_chip_memory_wrapper import OCMWrapper
+            rs_builder.profiler.phase("elaboration")
+            # Memory Init Cache: packed INIT vectors (reused when only unrelated parameters change).
+            init_cache = None
+            if not args.no_cache:
+                init_cache = IP_Cache(os.path.join(args.cache_dir, "ocm_init"), args.cache_max_size*1024*1024, suffix=".init", binary=True)
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = OCMWrapper(platform,
+                memory_type     = args.memory_type,
+                data_width      = args.data_width,
+                write_depth     = args.write_depth,
+                common_clk      = args.common_clk,
+                bram            = args.bram,
+                file_path       = args.file_path,
+                file_extension  = os.path.splitext(args.file_path)[1],
+                bram_mapping    = args.bram_mapping,
+                init_cache      = init_cache
+                # wrapper         = os.path.join(args.build_dir, "rapidsilicon", "ip", "on_chip_memory", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
+            )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version     = "v1_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,65 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# pll LiteX wrapper: IOs and module elaborated by pll_gen.py on --build.
+
+from litex_wrapper.pll_litex_wrapper import PLL
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+
+def get_clkin_ios():
+    return [
+        ("PLL_EN",          0, Pins(1)),
+        ("CLK_IN",          0, Pins(1)),
+        ("CLK_OUT0_EN",     0, Pins(1)),
+        ("CLK_OUT1_EN",     0, Pins(1)),
+        ("CLK_OUT2_EN",     0, Pins(1)),
+        ("CLK_OUT3_EN",     0, Pins(1)),
+        ("CLK_OUT0",        0, Pins(1)),
+        ("CLK_OUT1",        0, Pins(1)),
+        ("CLK_OUT2",        0, Pins(1)),
+        ("CLK_OUT3",        0, Pins(1)),
+        ("GEARBOX_FAST_CLK",0, Pins(1)),
+        ("LOCK",            0, Pins(1)),
+            ]
+
+# AXI RAM Wrapper ----------------------------------------------------------------------------------
+class PLLWrapper(Module):
+    def __init__(self, platform, divided_clks, divide_clk_in_by_2, pll_mult, pll_div, clk_out0_div, clk_out1_div, clk_out2_div, clk_out3_div):
+
+        self.clock_domains.cd_sys  = ClockDomain()
+
+        # AXI-RAM ----------------------------------------------------------------------------------
+        self.submodules.pll = pll = PLL(platform,
+            divided_clks        =   divided_clks,
+            divide_clk_in_by_2  =   divide_clk_in_by_2, 
+            pll_mult            =   pll_mult,
+            pll_div             =   pll_div,
+            clk_out0_div        =   clk_out0_div,
+            clk_out1_div        =   clk_out1_div,
+            clk_out2_div        =   clk_out2_div,
+            clk_out3_div        =   clk_out3_div,
+            )
+
+        platform.add_extension(get_clkin_ios())
+        self.comb += pll.PLL_EN.eq(platform.request("PLL_EN"))
+        self.comb += pll.CLK_IN.eq(platform.request("CLK_IN"))
+        self.comb += pll.CLK_OUT0_EN.eq(platform.request("CLK_OUT0_EN"))
+        self.comb += pll.CLK_OUT1_EN.eq(platform.request("CLK_OUT1_EN"))
+        self.comb += pll.CLK_OUT2_EN.eq(platform.request("CLK_OUT2_EN"))
+        self.comb += pll.CLK_OUT3_EN.eq(platform.request("CLK_OUT3_EN"))
+
+        self.comb += platform.request("CLK_OUT0").eq(pll.CLK_OUT0)
+        self.comb += platform.request("CLK_OUT1").eq(pll.CLK_OUT1)
+        self.comb += platform.request("CLK_OUT2").eq(pll.CLK_OUT2)
+        self.comb += platform.request("CLK_OUT3").eq(pll.CLK_OUT3)
+        self.comb += platform.request("GEARBOX_FAST_CLK").eq(pll.GEARBOX_FAST_CLK)
+        self.comb += platform.request("LOCK").eq(pll.LOCK)
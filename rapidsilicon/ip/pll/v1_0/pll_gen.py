@@ -9,66 +9,8 @@ import sys
 import logging
 import argparse
 
-from litex_wrapper.pll_litex_wrapper import PLL
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-
-def get_clkin_ios():
-    return [
-        ("PLL_EN",          0, Pins(1)),
-        ("CLK_IN",          0, Pins(1)),
-        ("CLK_OUT0_EN",     0, Pins(1)),
-        ("CLK_OUT1_EN",     0, Pins(1)),
-        ("CLK_OUT2_EN",     0, Pins(1)),
-        ("CLK_OUT3_EN",     0, Pins(1)),
-        ("CLK_OUT0",        0, Pins(1)),
-        ("CLK_OUT1",        0, Pins(1)),
-        ("CLK_OUT2",        0, Pins(1)),
-        ("CLK_OUT3",        0, Pins(1)),
-        ("GEARBOX_FAST_CLK",0, Pins(1)),
-        ("LOCK",            0, Pins(1)),
-            ]
-
-# AXI RAM Wrapper ----------------------------------------------------------------------------------
-class PLLWrapper(Module):
-    def __init__(self, platform, divided_clks, divide_clk_in_by_2, fast_clk_freq, ref_clk_freq, clk_out0_div, clk_out1_div, clk_out2_div, clk_out3_div):
-
-        self.clock_domains.cd_sys  = ClockDomain()
-
-        # AXI-RAM ----------------------------------------------------------------------------------
-        self.submodules.pll = pll = PLL(platform,
-            divided_clks        =   divided_clks,
-            divide_clk_in_by_2  =   divide_clk_in_by_2, 
-            fast_clk_freq       =   fast_clk_freq,
-            ref_clk_freq        =   ref_clk_freq,
-            clk_out0_div        =   clk_out0_div,
-            clk_out1_div        =   clk_out1_div,
-            clk_out2_div        =   clk_out2_div,
-            clk_out3_div        =   clk_out3_div,
-            )
+from fractions import Fraction
 
-        platform.add_extension(get_clkin_ios())
-        self.comb += pll.PLL_EN.eq(platform.request("PLL_EN"))
-        self.comb += pll.CLK_IN.eq(platform.request("CLK_IN"))
-        self.comb += pll.CLK_OUT0_EN.eq(platform.request("CLK_OUT0_EN"))
-        self.comb += pll.CLK_OUT1_EN.eq(platform.request("CLK_OUT1_EN"))
-        self.comb += pll.CLK_OUT2_EN.eq(platform.request("CLK_OUT2_EN"))
-        self.comb += pll.CLK_OUT3_EN.eq(platform.request("CLK_OUT3_EN"))
-
-        self.comb += platform.request("CLK_OUT0").eq(pll.CLK_OUT0)
-        self.comb += platform.request("CLK_OUT1").eq(pll.CLK_OUT1)
-        self.comb += platform.request("CLK_OUT2").eq(pll.CLK_OUT2)
-        self.comb += platform.request("CLK_OUT3").eq(pll.CLK_OUT3)
-        self.comb += platform.request("GEARBOX_FAST_CLK").eq(pll.GEARBOX_FAST_CLK)
-        self.comb += platform.request("LOCK").eq(pll.LOCK)
 
 # Build --------------------------------------------------------------------------------------------
 def main():
@@ -79,6 +21,7 @@ def main():
     sys.path.append(common_path)
 
     from common import IP_Builder
+    from pll_solver import FAST_CLK_DIV, best_solution, nearest_solution, solution_summary
 
     # Parameter Dependency dictionary
     #                Ports     :    Dependency
@@ -105,6 +48,7 @@ def main():
     core_range_param_group = parser.add_argument_group(title="Core range parameters")
     core_range_param_group.add_argument("--fast_clk_freq",     type=int,   default=1600,     choices=range(800,3201),     help="Freq in MHz")
     core_range_param_group.add_argument("--ref_clk_freq",       type=int,   default=50,      choices=range(5, 1201),     help="Freq in MHz")
+    core_range_param_group.add_argument("--freq_tolerance",     type=int,   default=0,       choices=range(0, 10001),    help="Fast clock frequency tolerance in ppm")
     
     # Core bool value parameters.
     core_bool_param_group = parser.add_argument_group(title="Core bool parameters")
@@ -116,6 +60,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",            help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                   help="Build Directory")
     build_group.add_argument("--build-name",    default="pll_wrapper",          help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -155,42 +100,66 @@ def main():
 
 
 
+    # PLL_MULT/PLL_DIV: exact rational search within device limits (lib/pll_solver.py).
+    pll_args = dict(ref_freq=args.ref_clk_freq, target_freq=args.fast_clk_freq, post_dividers=[FAST_CLK_DIV],
+        divide_clk_in_by_2=args.divide_clk_in_by_2)
+    pll_solution = best_solution(**pll_args, tolerance=Fraction(args.freq_tolerance, 10**6))
+    if pll_solution is None:
+        nearest = nearest_solution(**pll_args)
+        pll_error = f"No PLL_MULT/PLL_DIV within {args.freq_tolerance} ppm of {args.fast_clk_freq} MHz"
+        if nearest is not None:
+            pll_error += f" (nearest: PLL_MULT={nearest['pll_mult']}, PLL_DIV={nearest['pll_div']}, {float(nearest['error'])*1e6:.3g} ppm)"
+
     summary =  { 
     "Number of divided clocks ": args.divided_clks,
     "Fast clock frequency selected": args.fast_clk_freq,
     "Input reference clock frequency": args.ref_clk_freq,
   }
+    if pll_solution is not None:
+        summary.update(solution_summary(pll_solution))
+    else:
+        summary["PLL_MULT/PLL_DIV"] = pll_error
     # Export JSON Template (Optional) --------------------------------------------------------------
     if args.json_template:
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
 
 
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = PLLWrapper(platform,
-              divide_clk_in_by_2=args.divide_clk_in_by_2,
-              divided_clks=args.divided_clks,
-              fast_clk_freq=args.fast_clk_freq,
-              ref_clk_freq=args.ref_clk_freq,
-              clk_out0_div=args.clk_out0_div,
-              clk_out1_div=args.clk_out1_div,
-              clk_out2_div=args.clk_out2_div,
-              clk_out3_div=args.clk_out3_div)
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
+        if pll_solution is None:
+            raise ValueError(pll_error)
         rs_builder.prepare(
             build_dir  = args.build_dir,
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version = "v1_0"
-        )
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.pll_wrapper import PLLWrapper
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = PLLWrapper(platform,
+                      divide_clk_in_by_2=args.divide_clk_in_by_2,
+                      divided_clks=args.divided_clks,
+                      pll_mult=pll_solution["pll_mult"],
+                      pll_div=pll_solution["pll_div"],
+                      clk_out0_div=args.clk_out0_div,
+                      clk_out1_div=args.clk_out1_div,
+                      clk_out2_div=args.clk_out2_div,
+                      clk_out3_div=args.clk_out3_div)
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version = "v1_0"
+            )
+
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
 
 if __name__ == "__main__":
     main()
@@ -8,42 +8,14 @@
 
 
 import os
-import datetime
 import logging
 
 from migen import *
 
 from litex.soc.interconnect.axi import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
-
 # Helpers ------------------------------------------------------------------------------------------
 
-def freq_calc(self, fast_clk_freq, ref_clk_freq, c_range, d_range):
-    self.product = Signal()
-    self.ready = Signal()
-    a = fast_clk_freq
-    b = ref_clk_freq
-    c_range = 1000
-    d_range = 63
-    # Nested loop for iterating over c and d
-    for c in range(c_range):
-        for d in range(d_range):
-            # Calculate 2 * (a / b)
-            product_candidate = 2 * (a/ b)
-            # Check if the candidate product matches the formula with c and d
-            if product_candidate == ((c+1) / (d+1)):
-                # If a match is found, assign c, d, and the product to the respective signals
-                pll_mult = c + 1
-                pll_div  = d + 1
-                return pll_mult, pll_div
-        #break                    
-
-    
 class Open(Signal): pass
 
 def colorer(s, color="bright"):
@@ -60,7 +32,7 @@ def colorer(s, color="bright"):
 # PLL Wrapper ------------------------------------------------------------------------------------
 
 class PLL(Module):
-    def __init__(self, platform, divide_clk_in_by_2, fast_clk_freq, ref_clk_freq, clk_div_1, clk_div_2, clk_div_3, clk_div_4, **kwargs):
+    def __init__(self, platform, divide_clk_in_by_2, pll_mult, pll_div, clk_div_1, clk_div_2, clk_div_3, clk_div_4, **kwargs):
         self.logger = logging.getLogger("PLL")
         self.logger.propagate = True
 
@@ -73,8 +45,8 @@ class PLL(Module):
         self.logger.info(f"=================== PARAMETERS ====================")
         
         self.logger.info(f"DIVIDE_CLK_IN_BY_2   : {divide_clk_in_by_2}")
-#        self.logger.info(f"PLL_MULT             : {pll_mult}")
-#        self.logger.info(f"PLL_DIV              : {pll_div}")
+        self.logger.info(f"PLL_MULT             : {pll_mult}")
+        self.logger.info(f"PLL_DIV              : {pll_div}")
         self.logger.info(f"CLK_OUT0_DIV         : {clk_div_1}")
         self.logger.info(f"CLK_OUT1_DIV         : {clk_div_2}")
         self.logger.info(f"CLK_OUT2_DIV         : {clk_div_3}")
@@ -95,8 +67,6 @@ class PLL(Module):
         self.GEARBOX_FAST_CLK = Signal()
         self.LOCK = Signal()
 
-        pll_mult, pll_div = freq_calc(self, fast_clk_freq, ref_clk_freq, c_range=63, d_range=1000)
-
 
         self.specials += Instance("PLL",
                     **kwargs,
@@ -8,7 +8,6 @@
 # LiteX wrapper around Alex Forencich verilog-axi's priority_encoder.v
 
 import os
-import datetime
 import math
 import logging
 
@@ -16,12 +15,6 @@ from migen import *
 
 from litex.soc.interconnect.axi import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
-
 # PRIORITY_ENCODER  ---------------------------------------------------------------------------------------
 class PRIORITYENCODER(Module):
     def __init__(self, platform, width, lsb_high_priority):
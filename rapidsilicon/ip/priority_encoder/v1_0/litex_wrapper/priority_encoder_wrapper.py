@@ -0,0 +1,49 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# priority_encoder LiteX wrapper: IOs and module elaborated by priority_encoder_gen.py on --build.
+
+import math
+
+from litex_wrapper.priority_encoder_litex_wrapper import PRIORITYENCODER
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1))
+    ]
+
+def get_other_ios(width):
+        return [
+            ("input_unencoded",  0, Pins(width)), 
+            ("output_valid",     0, Pins(1)), 
+            ("output_encoded",   0, Pins(math.ceil(math.log2(width)))), 
+            ("output_unencoded", 0, Pins(width)), 
+        ]
+
+# PRIORITY_ENCODER Wrapper ----------------------------------------------------------------------------------
+class PRIORITYENCODERWrapper(Module):
+    def __init__(self, platform, width, lsb_high_priority):
+        
+        self.clock_domains.cd_sys  = ClockDomain()
+        
+        # PRIORITY_ENCODER ----------------------------------------------------------------------------------
+        self.submodules.priority_encoder = priority_encoder = PRIORITYENCODER(platform,
+            width               = width,
+            lsb_high_priority   = lsb_high_priority
+            )
+        
+        # IOS 
+        platform.add_extension(get_other_ios(width))
+        self.comb += priority_encoder.input_unencoded.eq(platform.request("input_unencoded"))
+        self.comb += platform.request("output_valid").eq(priority_encoder.output_valid)
+        self.comb += platform.request("output_encoded").eq(priority_encoder.output_encoded)
+        self.comb += platform.request("output_unencoded").eq(priority_encoder.output_unencoded)
@@ -0,0 +1,61 @@
+#
+# This file is Copyright (c) 2022 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# reset_release LiteX wrapper: IOs and module elaborated by reset_release_gen.py on --build.
+
+from litex_wrapper.reset_release_litex_wrapper import RESETRELEASE
+
+from migen import *
+
+from litex.build.generic_platform import *
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+def get_clkin_ios():
+    return [
+        ("clk",  0, Pins(1)),
+        ("rst",  0, Pins(1))
+    ]
+
+def get_other_ios(peripheral_aresetn, interconnects ,bus_reset,  peripheral_reset):
+        return [    
+            ("slow_clk",        0, Pins(1)), 
+            ("ext_rst",         0, Pins(1)), 
+            ("cpu_dbg_rst",     0, Pins(1)), 
+            ("pll_lock",        0, Pins(1)), 
+
+            ("cpu_rst",             0, Pins(1)), 
+            ("periph_aresetn",      0, Pins(peripheral_aresetn)), 
+            ("interconnect_aresetn",0, Pins(interconnects)), 
+            ("bus_reset",           0, Pins(bus_reset)), 
+            ("periph_reset",        0, Pins(peripheral_reset)), 
+        ]
+
+# RESET_RELEASE Wrapper ----------------------------------------------------------------------------------
+class RESETRELEASEWrapper(Module):
+    def __init__(self, platform, ext_reset_width, interconnects, bus_reset, peripheral_reset,peripheral_aresetn):
+        
+        self.clock_domains.cd_sys  = ClockDomain()
+        
+        # RESET_RELEASE ----------------------------------------------------------------------------------
+        self.submodules.reset_release = reset_release = RESETRELEASE(platform,
+            EXT_RESET_WIDTH     = ext_reset_width,
+            INTERCONNECTS       = interconnects,
+            BUS_RESET           = bus_reset,
+            PERIPHERAL_RESET    = peripheral_reset,
+            PERIPHERAL_ARESETN  = peripheral_aresetn,
+            )
+        
+        # IOS 
+        platform.add_extension(get_other_ios(peripheral_aresetn, interconnects ,bus_reset,  peripheral_reset))
+        self.comb += reset_release.slow_clk.eq(platform.request("slow_clk"))
+        self.comb += reset_release.ext_rst.eq(platform.request("ext_rst"))
+        self.comb += reset_release.cpu_dbg_rst.eq(platform.request("cpu_dbg_rst"))
+        self.comb += reset_release.pll_lock.eq(platform.request("pll_lock"))
+
+        self.comb += platform.request("cpu_rst").eq(reset_release.cpu_rst)
+        self.comb += platform.request("periph_aresetn").eq(reset_release.periph_aresetn)
+        self.comb += platform.request("interconnect_aresetn").eq(reset_release.interconnect_aresetn)
+        self.comb += platform.request("bus_reset").eq(reset_release.bus_reset)
+        self.comb += platform.request("periph_reset").eq(reset_release.periph_reset)
@@ -9,65 +9,7 @@ import sys
 import logging
 import argparse
 from pathlib import Path
-from datetime import datetime
 
-from litex_wrapper.reset_release_litex_wrapper import RESETRELEASE
-
-from migen import *
-
-from litex.build.generic_platform import *
-
-from litex.build.osfpga import OSFPGAPlatform
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-def get_clkin_ios():
-    return [
-        ("clk",  0, Pins(1)),
-        ("rst",  0, Pins(1))
-    ]
-
-def get_other_ios(peripheral_aresetn, interconnects ,bus_reset,  peripheral_reset):
-        return [    
-            ("slow_clk",        0, Pins(1)), 
-            ("ext_rst",         0, Pins(1)), 
-            ("cpu_dbg_rst",     0, Pins(1)), 
-            ("pll_lock",        0, Pins(1)), 
-
-            ("cpu_rst",             0, Pins(1)), 
-            ("periph_aresetn",      0, Pins(peripheral_aresetn)), 
-            ("interconnect_aresetn",0, Pins(interconnects)), 
-            ("bus_reset",           0, Pins(bus_reset)), 
-            ("periph_reset",        0, Pins(peripheral_reset)), 
-        ]
-
-# RESET_RELEASE Wrapper ----------------------------------------------------------------------------------
-class RESETRELEASEWrapper(Module):
-    def __init__(self, platform, ext_reset_width, interconnects, bus_reset, peripheral_reset,peripheral_aresetn):
-        
-        self.clock_domains.cd_sys  = ClockDomain()
-        
-        # RESET_RELEASE ----------------------------------------------------------------------------------
-        self.submodules.reset_release = reset_release = RESETRELEASE(platform,
-            EXT_RESET_WIDTH     = ext_reset_width,
-            INTERCONNECTS       = interconnects,
-            BUS_RESET           = bus_reset,
-            PERIPHERAL_RESET    = peripheral_reset,
-            PERIPHERAL_ARESETN  = peripheral_aresetn,
-            )
-        
-        # IOS 
-        platform.add_extension(get_other_ios(peripheral_aresetn, interconnects ,bus_reset,  peripheral_reset))
-        self.comb += reset_release.slow_clk.eq(platform.request("slow_clk"))
-        self.comb += reset_release.ext_rst.eq(platform.request("ext_rst"))
-        self.comb += reset_release.cpu_dbg_rst.eq(platform.request("cpu_dbg_rst"))
-        self.comb += reset_release.pll_lock.eq(platform.request("pll_lock"))
-
-        self.comb += platform.request("cpu_rst").eq(reset_release.cpu_rst)
-        self.comb += platform.request("periph_aresetn").eq(reset_release.periph_aresetn)
-        self.comb += platform.request("interconnect_aresetn").eq(reset_release.interconnect_aresetn)
-        self.comb += platform.request("bus_reset").eq(reset_release.bus_reset)
-        self.comb += platform.request("periph_reset").eq(reset_release.periph_reset)
-        
 
 # Build --------------------------------------------------------------------------------------------
 def main():
@@ -103,6 +45,7 @@ def main():
     build_group.add_argument("--build",         action="store_true",                    help="Build Core")
     build_group.add_argument("--build-dir",     default="./",                           help="Build Directory")
     build_group.add_argument("--build-name",    default="reset_release_wrapper",     help="Build Folder Name, Build RTL File Name and Module Name")
+    rs_builder.add_build_arguments(build_group)
 
     # JSON Import/Template
     json_group = parser.add_argument_group(title="JSON Parameters")
@@ -138,15 +81,6 @@ def main():
     if args.json_template:
         rs_builder.export_json_template(parser=parser, dep_dict=dep_dict, summary=summary)
     
-    # Create Wrapper -------------------------------------------------------------------------------
-    platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
-    module   = RESETRELEASEWrapper(platform,
-        ext_reset_width     = args.ext_reset_width,
-        interconnects       = args.interconnects,
-        bus_reset           = args.bus_reset,
-        peripheral_reset    = args.peripheral_reset,
-        peripheral_aresetn  = args.peripheral_aresetn,   )
-
     # Build Project --------------------------------------------------------------------------------
     if args.build:
         rs_builder.prepare(
@@ -154,46 +88,30 @@ def main():
             build_name = args.build_name,
             version    = "v1_0"
         )
-        rs_builder.copy_files(gen_path=os.path.dirname(__file__))
+        rs_builder.copy_files(gen_path=os.path.dirname(__file__), mode=args.copy_mode)
         rs_builder.generate_tcl()
-        rs_builder.generate_wrapper(
-            platform   = platform,
-            module     = module,
-            version = "v1_0"
-        )
-        
-        # IP_ID Parameter
-        now = datetime.now()
-        my_year         = now.year - 2022
-        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
-        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
-        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
-        mod_hour        = now.hour % 12 # 12 hours Format
-        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
-        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
-        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
-        
-        # Concatenation for IP_ID Parameter
-        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
-        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
-        
-        # IP_VERSION parameter
-        #               Base  _  Major _ Minor
-        ip_version = "00000000_00000000_0000000000000001"
-        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
-        
-        wrapper = os.path.join(args.build_dir, "rapidsilicon", "ip", "reset_release", "v1_0", args.build_name, "src",args.build_name + "_" + "v1_0" + ".v")
-        new_lines = []
-        with open (wrapper, "r") as file:
-            lines = file.readlines()
-            for i, line in enumerate(lines):
-                if ("module {}".format(args.build_name)) in line:
-                    new_lines.append("module {} #(\n\tparameter IP_TYPE \t\t= \"RST_RLSE\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(".format(args.build_name, ip_version, ip_id))
-                else:
-                    new_lines.append(line)
-                
-        with open(os.path.join(wrapper), "w") as file:
-            file.writelines(new_lines)
+
+        # IP_TYPE/IP_VERSION/IP_ID Parameters (IP_VERSION: Base_Major_Minor) ---------------------------
+        rs_builder.add_ip_parameters(ip_type="RST_RLSE", ip_version="00000000_00000000_0000000000000001")
+
+        # Create Wrapper (skipped on Build Cache hit) ----------------------------------------------
+        if not rs_builder.restore_wrapper(args=args, version="v1_0"):
+            rs_builder.profiler.phase("imports")
+            from litex.build.osfpga import OSFPGAPlatform
+            from litex_wrapper.reset_release_wrapper import RESETRELEASEWrapper
+            rs_builder.profiler.phase("elaboration")
+            platform = OSFPGAPlatform(io=[], toolchain="raptor", device="gemini")
+            module   = RESETRELEASEWrapper(platform,
+                ext_reset_width     = args.ext_reset_width,
+                interconnects       = args.interconnects,
+                bus_reset           = args.bus_reset,
+                peripheral_reset    = args.peripheral_reset,
+                peripheral_aresetn  = args.peripheral_aresetn,   )
+            rs_builder.generate_wrapper(
+                platform   = platform,
+                module     = module,
+                version = "v1_0"
+            )
         
         build_name = args.build_name.rsplit( ".", 1 )[ 0 ]
         file = os.path.join(args.build_dir, "rapidsilicon/ip/reset_release/v1_0", build_name, "sim/testbench.v")
@@ -202,5 +120,8 @@ def main():
         text = text.replace("reset_release", "%s" % build_name)
         file.write_text(text)
 
+        # Build Profile (phase times/peak RSS in details.json, --trace, --profile) -----------------
+        rs_builder.export_profile(args=args)
+
 if __name__ == "__main__":
     main()
@@ -8,17 +8,9 @@
 # LiteX wrapper around SpinalHDL VexRiscv
 
 import os
-import datetime
-import logging
 
 from migen import *
 
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(filename="IP.log",filemode="w", level=logging.INFO, format='%(levelname)s: %(message)s\n')
-
-timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-logging.info(f'Log started at {timestamp}')
-
 ## ----------------VexRiscv Configuration without Cache and MMU----------------------------------------
 
 class vexriscv_nocache_nommu(Module):
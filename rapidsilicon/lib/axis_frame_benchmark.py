@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# AXI-Stream frame codec benchmark.
+#
+# Times AXIStreamFrame.build/parse of the shared simulation support (sim_support/axis_frame.py)
+# against the original per-element implementation of the IP axis_ep.py endpoints (legacy_build,
+# legacy_parse below) for every frame length/bus width combination: random byte frames (tkeep of the
+# last beat partial, random tkeep on parse) and word frames (--word-width bits words). Both results
+# must be identical.
+#
+# Exits with 1 if any combination differs or the codec is slower than the original (beyond --margin:
+# NumPy call overhead on short frames).
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from sim_support.axis_frame import AXIStreamFrame
+
+# Legacy Codec -------------------------------------------------------------------------------------
+
+def legacy_build(frame):
+    # Original AXIStreamFrame.build (B = 0).
+    f = list(frame.data)
+    tdata = []
+    tkeep = []
+    tid = []
+    tdest = []
+    tuser = []
+    i = 0
+
+    while len(f) > 0:
+        data = 0
+        keep = 0
+        for j in range(frame.M):
+            data = data | (f.pop(0) << (j*frame.WL))
+            keep = keep | (1 << j)
+            if len(f) == 0: break
+        tdata.append(data)
+        tkeep.append(keep if frame.keep is None else frame.keep[i])
+        tid.append(0 if frame.id is None else frame.id if type(frame.id) is int else frame.id[i])
+        tdest.append(0 if frame.dest is None else frame.dest if type(frame.dest) is int else frame.dest[i])
+        tuser.append(0 if frame.user is None else frame.user if type(frame.user) is int else frame.user[i])
+        i += 1
+
+    if frame.last_cycle_user:
+        tuser[-1] = frame.last_cycle_user
+
+    return tdata, tkeep, tid, tdest, tuser
+
+def legacy_parse(frame, tdata, tkeep, tid, tdest, tuser):
+    # Original AXIStreamFrame.parse (B = 0).
+    frame.data = []
+    frame.keep = []
+    frame.id = []
+    frame.dest = []
+    frame.user = []
+
+    mask = 2**frame.WL-1
+    for i in range(len(tdata)):
+        for j in range(frame.M):
+            if tkeep[i] & (1 << j):
+                frame.data.append((tdata[i] >> (j*frame.WL)) & mask)
+        frame.keep.append(tkeep[i])
+        frame.id.append(tid[i])
+        frame.dest.append(tdest[i])
+        frame.user.append(tuser[i])
+
+    if frame.WL == 8:
+        frame.data = bytearray(frame.data)
+
+    frame.last_cycle_user = frame.user[-1]
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def parse_list(value):
+    return [int(v) for v in value.split(",")]
+
+def new_frame(data, M, WL, id=None, dest=None, user=None):
+    frame = AXIStreamFrame(data, id=id, dest=dest, user=user)
+    frame.N  = M*WL
+    frame.M  = M
+    frame.WL = WL
+    return frame
+
+def timed(function, runs):
+    durations = []
+    for n in range(runs):
+        start  = time.perf_counter()
+        result = function()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), result
+
+def benchmark(rng, length, M, WL, runs):
+    if WL == 8:
+        data = bytes(rng.getrandbits(8) for n in range(length))
+    else:
+        data = [rng.getrandbits(WL) for n in range(length)]
+    beats = -(-length//M)
+    user  = [rng.getrandbits(1) for n in range(beats)]
+
+    # Build.
+    frame = new_frame(data, M, WL, id=3, dest=None, user=user)
+    legacy_time, legacy = timed(lambda: legacy_build(frame), runs)
+    build_time,  built  = timed(lambda: frame.build(), runs)
+    if legacy != built:
+        raise RuntimeError("build differs")
+
+    # Parse (random tkeep).
+    tdata, tkeep, tid, tdest, tuser = legacy
+    tkeep = [rng.getrandbits(M) for n in range(beats)]
+    legacy_frame = new_frame(b"", M, WL)
+    frame        = new_frame(b"", M, WL)
+    legacy_parse_time, _ = timed(lambda: legacy_parse(legacy_frame, tdata, tkeep, tid, tdest, tuser), runs)
+    parse_time,        _ = timed(lambda: frame.parse(tdata, tkeep, tid, tdest, tuser), runs)
+    if (frame.data != legacy_frame.data) or (frame != legacy_frame):
+        raise RuntimeError("parse differs")
+
+    return {"legacy_build": legacy_time, "build": build_time, "legacy_parse": legacy_parse_time, "parse": parse_time}
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="AXI-Stream frame codec benchmark")
+    parser.add_argument("--lengths",    default="64,1500,9000,65536", help="Frame lengths (words)")
+    parser.add_argument("--widths",     default="1,2,3,4,8,16,64",    help="Bus widths (words per beat)")
+    parser.add_argument("--word-width", default=12,  type=int,        help="Word frames word width (bits, 8: byte frames only)")
+    parser.add_argument("--runs",       default=3,   type=int,        help="Runs per combination (median is reported)")
+    parser.add_argument("--margin",     default=0.1, type=float,      help="Tolerated slowdown vs legacy (ms, build + parse)")
+    parser.add_argument("--seed",       default=0,   type=int,        help="Frames random seed")
+    parser.add_argument("--report",     default=None,                 help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    rng     = random.Random(args.seed)
+    results = []
+    for WL in sorted({8, args.word_width}):
+        for length in parse_list(args.lengths):
+            for M in parse_list(args.widths):
+                result = {"length": length, "width": M, "word_width": WL, "error": None}
+                try:
+                    result.update(benchmark(rng, length, M, WL, max(1, args.runs)))
+                except Exception as e:
+                    result["error"] = f"{type(e).__name__}: {e}"
+                if result["error"] is not None:
+                    result["status"] = f"FAILED ({result['error']})"
+                elif (result["build"] + result["parse"]) > (result["legacy_build"] + result["legacy_parse"] + args.margin*1e-3):
+                    result["status"] = "FAILED (slower than legacy)"
+                else:
+                    result["status"] = "OK"
+                if result["error"] is None:
+                    print(f"{length:>6} x {M:<2} ({WL:>2} bits): "
+                          f"build {result['legacy_build']*1e3:8.2f}ms -> {result['build']*1e3:7.2f}ms "
+                          f"(x{result['legacy_build']/result['build']:6.1f}), "
+                          f"parse {result['legacy_parse']*1e3:8.2f}ms -> {result['parse']*1e3:7.2f}ms "
+                          f"(x{result['legacy_parse']/result['parse']:6.1f}) {result['status']}", flush=True)
+                else:
+                    print(f"{length:>6} x {M:<2} ({WL:>2} bits): {result['status']}", flush=True)
+                results.append(result)
+
+    failed = [r for r in results if r["status"] != "OK"]
+    print(f"{len(results) - len(failed)}/{len(results)} combinations OK.")
+
+    if args.report is not None:
+        with open(args.report, "w") as f:
+            json.dump({"seed": args.seed, "combinations": results}, f, indent=4)
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# Parallel IP Catalog batch builder.
+#
+# Builds the (ip, version, args, build-name) entries of a JSON/YAML manifest across a process pool:
+#
+#   {"jobs": [
+#       {"ip": "axi_ram",   "version": "v1_0", "build_name": "ram_wrapper", "args": ["--data_width=32"]},
+#       {"ip": "axi_dpram", "version": "v1_0", "build_name": "dpram_wrapper", "args": {"data_width": 32}}
+#   ]}
+#
+# List args are passed to the generator as is, dict args are written to a JSON file and imported
+# with --json (same path as the GUI). Each job runs in its own working directory (stdout/stderr,
+# IP.log goes to the job build path), so any number of jobs can build concurrently into the same
+# --build-dir.
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import subprocess
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Paths --------------------------------------------------------------------------------------------
+
+ip_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "ip"))
+
+def get_gen_filename(ip_name, version):
+    return os.path.join(ip_path, ip_name, version, f"{ip_name}_gen.py")
+
+def latest_version(ip_name):
+    versions = sorted(v for v in os.listdir(os.path.join(ip_path, ip_name)) if v.startswith("v"))
+    return versions[-1]
+
+# Manifest -----------------------------------------------------------------------------------------
+
+def load_manifest(filename):
+    with open(filename, "r") as f:
+        if os.path.splitext(filename)[1] in [".yml", ".yaml"]:
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit("PyYAML is required for YAML manifests (or use a JSON manifest).")
+            manifest = yaml.safe_load(f)
+        else:
+            manifest = json.load(f)
+    jobs = manifest["jobs"] if isinstance(manifest, dict) else manifest
+
+    # Normalize jobs.
+    for n, job in enumerate(jobs):
+        if "ip" not in job:
+            raise SystemExit(f"Manifest job {n}: missing \"ip\".")
+        job.setdefault("version", latest_version(job["ip"]))
+        job.setdefault("build_name", f"{job['ip']}_wrapper")
+        job.setdefault("args", [])
+        job["name"] = f"{job['ip']}/{job['version']}/{job['build_name']}"
+        if not os.path.exists(get_gen_filename(job["ip"], job["version"])):
+            raise SystemExit(f"Manifest job {n}: unknown IP {job['ip']} {job['version']}.")
+
+    # Jobs writing to the same output directory can't run concurrently.
+    names = [job["name"] for job in jobs]
+    duplicates = sorted(set(name for name in names if names.count(name) > 1))
+    if duplicates:
+        raise SystemExit(f"Manifest jobs with identical ip/version/build_name: {', '.join(duplicates)}.")
+    return jobs
+
+# Job ----------------------------------------------------------------------------------------------
+
+def run_job(n, job, build_dir, python, extra_args):
+    # Isolated working directory: generate_wrapper/litex_wrappers write relative to cwd.
+    work_dir = os.path.join(build_dir, ".catalog_build", f"{n:03d}_{job['name'].replace('/', '_')}")
+    if os.path.exists(work_dir):
+        shutil.rmtree(work_dir)
+    os.makedirs(work_dir)
+
+    cmd = [python, get_gen_filename(job["ip"], job["version"])]
+    if isinstance(job["args"], dict):
+        json_filename = os.path.join(work_dir, "args.json")
+        with open(json_filename, "w") as f:
+            json.dump(job["args"], f, indent=4)
+        cmd += ["--json", json_filename]
+    else:
+        cmd += [str(arg) for arg in job["args"]]
+    cmd += ["--build", f"--build-dir={build_dir}", f"--build-name={job['build_name']}"]
+    cmd += extra_args
+
+    start = time.perf_counter()
+    with open(os.path.join(work_dir, "stdout.log"), "w") as stdout, \
+         open(os.path.join(work_dir, "stderr.log"), "w") as stderr:
+        returncode = subprocess.call(cmd, cwd=work_dir, stdout=stdout, stderr=stderr)
+    duration = time.perf_counter() - start
+
+    return {
+        "name"       : job["name"],
+        "returncode" : returncode,
+        "duration"   : duration,
+        "work_dir"   : work_dir,
+    }
+
+# Summary ------------------------------------------------------------------------------------------
+
+def print_summary(results, wall_time):
+    name_width = max([len("Job")] + [len(r["name"]) for r in results])
+    print()
+    print(f"{'Job':<{name_width}}  {'Status':<6}  {'Time (s)':>8}")
+    print(f"{'-'*name_width}  {'-'*6}  {'-'*8}")
+    for r in sorted(results, key=lambda r: r["name"]):
+        status = "OK" if r["returncode"] == 0 else "FAILED"
+        print(f"{r['name']:<{name_width}}  {status:<6}  {r['duration']:>8.2f}")
+    print(f"{'-'*name_width}  {'-'*6}  {'-'*8}")
+    failed = [r for r in results if r["returncode"] != 0]
+    print(f"{len(results) - len(failed)}/{len(results)} jobs OK, "
+          f"{sum(r['duration'] for r in results):.2f}s total job time, {wall_time:.2f}s wall time.")
+    for r in failed:
+        print(f"FAILED: {r['name']} (logs: {r['work_dir']})")
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="IP Catalog parallel batch builder")
+    parser.add_argument("manifest",                                          help="JSON/YAML manifest of jobs")
+    parser.add_argument("--build-dir",      default="./",                    help="Build Directory (shared by all jobs)")
+    parser.add_argument("--jobs", "-j",     default=os.cpu_count(), type=int, help="Number of parallel jobs")
+    parser.add_argument("--python",         default=sys.executable,          help="Python interpreter (LiteX environment)")
+    parser.add_argument("--keep-work-dirs", action="store_true",             help="Keep per-job working directories of successful jobs")
+    parser.add_argument("--report",         default=None,                    help="Write results to a JSON file")
+    args, extra_args = parser.parse_known_args()
+
+    jobs      = load_manifest(args.manifest)
+    python    = shutil.which(args.python) if os.sep not in args.python else os.path.abspath(args.python)
+    build_dir = os.path.abspath(args.build_dir)
+    os.makedirs(build_dir, exist_ok=True)
+
+    start   = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        futures = [executor.submit(run_job, n, job, build_dir, python, extra_args) for n, job in enumerate(jobs)]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            status = "OK" if result["returncode"] == 0 else "FAILED"
+            print(f"[{len(results)}/{len(jobs)}] {result['name']}: {status} ({result['duration']:.2f}s)", flush=True)
+            if (result["returncode"] == 0) and not args.keep_work_dirs:
+                shutil.rmtree(result["work_dir"], ignore_errors=True)
+    wall_time = time.perf_counter() - start
+
+    work_root = os.path.join(build_dir, ".catalog_build")
+    if os.path.isdir(work_root) and not os.listdir(work_root):
+        os.rmdir(work_root)
+
+    print_summary(results, wall_time)
+
+    if args.report is not None:
+        with open(args.report, "w") as f:
+            json.dump({"wall_time": wall_time, "jobs": results}, f, indent=4)
+
+    sys.exit(0 if all(r["returncode"] == 0 for r in results) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# IP Catalog JSON template index.
+#
+# Collects the --json-template output (parameters, ranges, options, dependencies, summary) and the
+# "IP details" block of every rapidsilicon/ip/*/*/*_gen.py in a single versioned catalog_index.json
+# (default: ~/.cache/rapidsilicon/ip_catalog/catalog_index.json, see --index), so the GUI can
+# populate its parameter panels without running ~45 LiteX processes:
+#
+#   catalog_index.py build                  # (Re)index changed generators only.
+#   catalog_index.py query axi_ram          # Template of latest axi_ram version (no migen import).
+#   catalog_index.py query axi_ram --version=v1_0 --details
+#   catalog_index.py list
+#
+# Each entry stores the sha256 of its generator, litex_wrapper/ and lib modules: only generators whose
+# sources changed are re-run on build.
+
+import os
+import ast
+import sys
+import json
+import glob
+import shutil
+import hashlib
+import argparse
+import tempfile
+import subprocess
+
+from concurrent.futures import ProcessPoolExecutor
+
+from common import LIB_MODULES, default_cache_dir, hash_file, hash_tree
+
+# Bump when the index format changes.
+INDEX_VERSION = 1
+
+# Paths --------------------------------------------------------------------------------------------
+
+lib_path   = os.path.abspath(os.path.dirname(__file__))
+ip_path    = os.path.abspath(os.path.join(lib_path, "..", "ip"))
+index_file = os.path.join(default_cache_dir(), "catalog_index.json")
+
+def find_generators(ip_path=ip_path):
+    generators = {}
+    for gen_filename in sorted(glob.glob(os.path.join(ip_path, "*", "*", "*_gen.py"))):
+        version_path = os.path.dirname(gen_filename)
+        ip_name      = os.path.basename(os.path.dirname(version_path))
+        version      = os.path.basename(version_path)
+        generators[f"{ip_name}/{version}"] = gen_filename
+    return generators
+
+def generator_hash(gen_filename):
+    # Template depends on generator, its litex_wrapper (imported by generator) and lib modules.
+    h = hashlib.sha256()
+    hash_file(gen_filename, h)
+    for module in LIB_MODULES:
+        hash_file(os.path.join(lib_path, module), h)
+    litex_path = os.path.join(os.path.dirname(gen_filename), "litex_wrapper")
+    if os.path.exists(litex_path):
+        hash_tree(litex_path, h)
+    return h.hexdigest()
+
+# Extraction ---------------------------------------------------------------------------------------
+
+def extract_details(gen_filename):
+    # "IP details" block: literal "details = {...}" assignment of the generator main().
+    with open(gen_filename, "r") as f:
+        tree = ast.parse(f.read(), filename=gen_filename)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "details" for t in node.targets):
+            try:
+                return ast.literal_eval(node.value)
+            except ValueError:
+                return None
+    return None
+
+def extract_template(gen_filename, python):
+    # Run generator with --json-template from a temporary directory (no files left in cwd).
+    cwd = tempfile.mkdtemp(prefix="catalog_index_")
+    try:
+        result = subprocess.run([python, gen_filename, "--json-template"],
+            cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    finally:
+        shutil.rmtree(cwd, ignore_errors=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f"returncode {result.returncode}")
+    # Template is the first JSON object printed on stdout.
+    pos = result.stdout.find("{")
+    if pos == -1:
+        raise RuntimeError("no JSON template on stdout")
+    template, _ = json.JSONDecoder().raw_decode(result.stdout[pos:])
+    return template
+
+def index_generator(name, gen_filename, python):
+    ip_name, version = name.split("/")
+    entry = {
+        "ip"       : ip_name,
+        "version"  : version,
+        "sha256"   : generator_hash(gen_filename),
+        "details"  : extract_details(gen_filename),
+        "template" : None,
+        "error"    : None,
+    }
+    try:
+        entry["template"] = extract_template(gen_filename, python)
+    except Exception as e:
+        entry["error"] = str(e)
+    return name, entry
+
+# Index --------------------------------------------------------------------------------------------
+
+def load_index(filename=index_file):
+    try:
+        with open(filename, "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("version", None) != INDEX_VERSION:
+        return None
+    return index
+
+def save_index(index, filename):
+    # Atomic write: the GUI may read the index while it is being updated.
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+    fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)), suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(index, f, indent=4)
+    os.replace(tmp_filename, filename)
+
+def build_index(filename=index_file, ip_path=ip_path, python=sys.executable, jobs=os.cpu_count(), force=False):
+    generators = find_generators(ip_path)
+    index      = None if force else load_index(filename)
+    previous   = {} if index is None else index["generators"]
+
+    # Only (re)index new/changed generators (and previous failures).
+    entries = {}
+    stale   = []
+    for name, gen_filename in generators.items():
+        entry = previous.get(name, None)
+        if (entry is not None) and (entry["error"] is None) and (entry["sha256"] == generator_hash(gen_filename)):
+            entries[name] = entry
+        else:
+            stale.append(name)
+
+    with ProcessPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = [executor.submit(index_generator, name, generators[name], python) for name in stale]
+        for future in futures:
+            name, entry = future.result()
+            entries[name] = entry
+            status = "OK" if entry["error"] is None else f"FAILED ({entry['error']})"
+            print(f"{name}: {status}", file=sys.stderr)
+
+    index = {"version": INDEX_VERSION, "generators": dict(sorted(entries.items()))}
+    save_index(index, filename)
+    print(f"{len(stale)} generators indexed, {len(entries) - len(stale)} unchanged.", file=sys.stderr)
+    return index
+
+# Query --------------------------------------------------------------------------------------------
+
+def get_entry(index, ip_name, version=None):
+    if version is None:
+        versions = sorted(e["version"] for e in index["generators"].values() if e["ip"] == ip_name)
+        if not versions:
+            return None
+        version = versions[-1]
+    return index["generators"].get(f"{ip_name}/{version}", None)
+
+def get_template(index, ip_name, version=None):
+    entry = get_entry(index, ip_name, version)
+    return None if entry is None else entry["template"]
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="IP Catalog JSON template index")
+    parser.add_argument("--index", default=index_file, help="Index file")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Build/Update index")
+    build_parser.add_argument("--ip-path",    default=ip_path,                 help="IP Catalog path")
+    build_parser.add_argument("--python",     default=sys.executable,          help="Python interpreter (LiteX environment)")
+    build_parser.add_argument("--jobs", "-j", default=os.cpu_count(), type=int, help="Number of parallel jobs")
+    build_parser.add_argument("--force",      action="store_true",             help="Re-index all generators")
+
+    query_parser = subparsers.add_parser("query", help="Print IP JSON template")
+    query_parser.add_argument("ip",                                            help="IP name")
+    query_parser.add_argument("--version",    default=None,                    help="IP version (default: latest)")
+    query_parser.add_argument("--details",    action="store_true",             help="Print IP details instead of template")
+
+    subparsers.add_parser("list", help="List indexed generators")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        python = shutil.which(args.python) if os.sep not in args.python else os.path.abspath(args.python)
+        index  = build_index(args.index, os.path.abspath(args.ip_path), python, args.jobs, args.force)
+        sys.exit(0 if all(e["error"] is None for e in index["generators"].values()) else 1)
+
+    index = load_index(args.index)
+    if index is None:
+        raise SystemExit(f"No (or outdated) index at {args.index}: run \"catalog_index.py build\".")
+
+    if args.command == "list":
+        for name, entry in index["generators"].items():
+            print(f"{name:<40} {'OK' if entry['error'] is None else 'FAILED'}")
+    elif args.command == "query":
+        entry = get_entry(index, args.ip, args.version)
+        if entry is None:
+            raise SystemExit(f"Unknown IP: {args.ip} {args.version or ''}".strip())
+        if entry["error"] is not None:
+            raise SystemExit(f"{args.ip}: {entry['error']}")
+        print(json.dumps(entry["details"] if args.details else entry["template"], indent=4))
+
+if __name__ == "__main__":
+    main()
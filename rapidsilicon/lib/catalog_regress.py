@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# Catalog-wide parallel simulation regression.
+#
+# Finds the sim harnesses of all IPs under --root (sources: rapidsilicon/ip/<ip>/<version>/sim, or a
+# build directory: <build>/rapidsilicon/ip/<ip>/<version>/<name>/sim, harnesses need the generated
+# ../src) and runs them across a thread pool (-j), one job per harness:
+#
+#   cocotb:      cocotb sim/Makefile (make -C sim, SIM/WAVES, results file parsed per test).
+#   cocotb-test: pytest on the test_*.py files with cocotb-test functions (sim_cache.run).
+#   myhdl:       sim/Makefile running the MyHDL cosimulation scripts (axis_uart, i2c_master, ...).
+#   bench:       other sim/Makefile benches (axil_ocla SystemVerilog bench, iverilog testbenches, ...).
+#
+# Each job has its own OUT_DIR/SIM_BUILD (SIM_BUILD_ROOT for cocotb-test) and results file in
+# <work-dir>/<job>. Passing results are cached in <cache-dir>/regress, keyed on the RTL (../src,
+# ../litex_wrapper), the test files (sim dir, sim_support), the command and its parameters (SIM,
+# WAVES, --param, simulator version): unchanged harnesses are reported as CACHED without running.
+#
+#   catalog_regress.py --root build/rapidsilicon/ip -j 8 --junit regress.xml
+#
+# Writes a JUnit XML file (one testsuite per job) and prints a per test wall time table. Exits with 1
+# unless all jobs pass.
+
+import os
+import sys
+import glob
+import json
+import time
+import shutil
+import fnmatch
+import hashlib
+import argparse
+import subprocess
+import xml.etree.ElementTree as ET
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from common import default_cache_dir, hash_file, IP_Cache
+from sim_compare import sim_label, parse_results
+from sim_support import sim_cache
+
+# Paths --------------------------------------------------------------------------------------------
+
+lib_path         = os.path.abspath(os.path.dirname(__file__))
+ip_path          = os.path.abspath(os.path.join(lib_path, "..", "ip"))
+sim_support_path = os.path.join(lib_path, "sim_support")
+
+KINDS = ["cocotb", "cocotb-test", "myhdl", "bench"]
+
+# Simulation outputs written in the sim directories (not part of the test hash).
+SIM_OUTPUT_DIRS  = ["sim_build", "__pycache__", ".pytest_cache"]
+SIM_OUTPUT_EXTS  = [".pyc", ".vvp", ".vcd", ".lxt", ".fst", ".fsdb", ".xml", ".log", ".tmp"]
+SIM_OUTPUT_FILES = ["iverilog_dump.v"]
+
+# Discovery ----------------------------------------------------------------------------------------
+
+def find_sim_dirs(root):
+    # <ip>/<version>/sim (sources) and <ip>/<version>/<name>/sim (build directory).
+    sim_dirs = glob.glob(os.path.join(root, "*", "*", "sim")) + glob.glob(os.path.join(root, "*", "*", "*", "sim"))
+    return sorted(os.path.abspath(d) for d in sim_dirs if os.path.isdir(d))
+
+def read_file(filename):
+    with open(filename, "r", errors="ignore") as f:
+        return f.read()
+
+def find_jobs(sim_dir):
+    jobs   = []
+    label  = sim_label(sim_dir)
+    py_files = sorted(glob.glob(os.path.join(sim_dir, "test_*.py")))
+    makefile = os.path.join(sim_dir, "Makefile")
+    if os.path.isfile(makefile):
+        if "cocotb-config" in read_file(makefile):
+            kind = "cocotb"
+        elif any("from myhdl import" in read_file(f) for f in py_files):
+            kind = "myhdl"
+        else:
+            kind = "bench"
+        jobs.append({"name": label, "kind": kind, "sim_dir": sim_dir})
+    for filename in py_files:
+        content = read_file(filename)
+        if ("sim_cache.run(" in content) and ("def test_" in content):
+            name = f"{label}:{os.path.basename(filename)}"
+            jobs.append({"name": name, "kind": "cocotb-test", "sim_dir": sim_dir, "test_file": filename})
+    return jobs
+
+def select_jobs(jobs, patterns, kinds):
+    # Jobs matching one of the patterns (fnmatch on <ip>/<version>[/<name>], or IP name).
+    def match(job):
+        name = job["name"].split(":")[0]
+        return any(fnmatch.fnmatch(name, p) or fnmatch.fnmatch(name, p + "/*") for p in patterns)
+    return [job for job in jobs if (job["kind"] in kinds) and (not patterns or match(job))]
+
+# Cache Key ----------------------------------------------------------------------------------------
+
+def hash_sim_dir(path, h):
+    # hash_tree of the sim directory without simulation outputs.
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d not in SIM_OUTPUT_DIRS)
+        for file_name in sorted(files):
+            if (os.path.splitext(file_name)[1] in SIM_OUTPUT_EXTS) or (file_name in SIM_OUTPUT_FILES):
+                continue
+            full_file_path = os.path.join(root, file_name)
+            h.update(os.path.relpath(full_file_path, path).encode())
+            hash_file(full_file_path, h)
+
+def job_key(job, params):
+    h = hashlib.sha256()
+    h.update(json.dumps({k: v for k, v in job.items() if k != "sim_dir"}, sort_keys=True).encode())
+    h.update(json.dumps(params, sort_keys=True).encode())
+    h.update(sim_cache.simulator_version(params["SIM"]).encode())
+    # RTL.
+    for name in ["src", "litex_wrapper"]:
+        path = os.path.join(job["sim_dir"], "..", name)
+        if os.path.isdir(path):
+            h.update(name.encode())
+            hash_sim_dir(path, h)
+    # Tests.
+    hash_sim_dir(job["sim_dir"], h)
+    hash_sim_dir(sim_support_path, h)
+    return h.hexdigest()
+
+# Job ----------------------------------------------------------------------------------------------
+
+def job_command(job, work_dir, params):
+    make_vars = [f"{k}={v}" for k, v in params.items()]
+    if job["kind"] == "cocotb-test":
+        return [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+            f"--junitxml={os.path.join(work_dir, 'results.xml')}", os.path.basename(job["test_file"])]
+    if job["kind"] == "cocotb":
+        make_vars += [f"OUT_DIR={work_dir}", f"SIM_BUILD={os.path.join(work_dir, 'sim_build')}"]
+    else:
+        make_vars += [f"OUT_DIR={work_dir}"]
+    return ["make", "-C", job["sim_dir"]] + make_vars
+
+def run_job(job, work_dir, params, timeout=None):
+    if os.path.exists(work_dir):
+        shutil.rmtree(work_dir)
+    os.makedirs(work_dir)
+    results = os.path.join(work_dir, "results.xml")
+    env = dict(os.environ, **params,
+        COCOTB_RESULTS_FILE = results,
+        SIM_BUILD_ROOT      = os.path.join(work_dir, "sim_build"),
+    )
+
+    start = time.perf_counter()
+    with open(os.path.join(work_dir, "run.log"), "w") as log:
+        try:
+            returncode = subprocess.call(job_command(job, work_dir, params), cwd=job["sim_dir"],
+                stdout=log, stderr=subprocess.STDOUT, env=env, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            returncode = -1
+    duration = time.perf_counter() - start
+
+    tests = parse_results(results) if os.path.exists(results) else []
+    if not tests:
+        # Harness without per test results (MyHDL scripts, benches): one test, exit status.
+        tests = [{"name": job["kind"], "status": "OK" if returncode == 0 else "FAILED", "time": duration, "sim_time_ns": 0}]
+    elif (returncode != 0) and not any(t["status"] == "FAILED" for t in tests):
+        # Build/harness failure (or timeout): reported as a failed harness test.
+        tests.append({"name": "<harness>", "status": "FAILED", "time": duration, "sim_time_ns": 0})
+    return {
+        "name"       : job["name"],
+        "kind"       : job["kind"],
+        "status"     : "OK" if not any(t["status"] == "FAILED" for t in tests) else "FAILED",
+        "returncode" : returncode,
+        "duration"   : duration,
+        "tests"      : tests,
+        "work_dir"   : work_dir,
+    }
+
+def cached_job(job, cache, key, work_dir, params, timeout=None):
+    if cache is not None:
+        content = cache.get(key)
+        if content is not None:
+            result = json.loads(content)
+            result.update(status="CACHED", duration=0.0, cached_duration=result["duration"])
+            return result
+    result = run_job(job, work_dir, params, timeout)
+    if (cache is not None) and (result["status"] == "OK"):
+        cache.put(key, json.dumps(result, indent=4))
+    return result
+
+# Report -------------------------------------------------------------------------------------------
+
+def write_junit(filename, results):
+    testsuites = ET.Element("testsuites", name="ip_catalog_regression",
+        tests    = str(sum(len(r["tests"]) for r in results)),
+        failures = str(sum(t["status"] == "FAILED" for r in results for t in r["tests"])),
+        time     = f"{sum(r['duration'] for r in results):.3f}",
+    )
+    for r in results:
+        testsuite = ET.SubElement(testsuites, "testsuite", name=r["name"],
+            tests    = str(len(r["tests"])),
+            failures = str(sum(t["status"] == "FAILED" for t in r["tests"])),
+            skipped  = str(sum(t["status"] == "SKIPPED" for t in r["tests"])),
+            time     = f"{r['duration']:.3f}",
+        )
+        properties = ET.SubElement(testsuite, "properties")
+        ET.SubElement(properties, "property", name="kind",   value=r["kind"])
+        ET.SubElement(properties, "property", name="cached", value=str(r["status"] == "CACHED").lower())
+        for t in r["tests"]:
+            testcase = ET.SubElement(testsuite, "testcase", classname=r["name"], name=t["name"],
+                time=f"{t['time']:.3f}", sim_time_ns=f"{t['sim_time_ns']:.3f}")
+            if t["status"] == "FAILED":
+                ET.SubElement(testcase, "failure", message=f"see {os.path.join(r['work_dir'], 'run.log')}")
+            elif t["status"] == "SKIPPED":
+                ET.SubElement(testcase, "skipped")
+    ET.indent(testsuites)
+    ET.ElementTree(testsuites).write(filename, encoding="utf-8", xml_declaration=True)
+
+def print_summary(results, wall_time):
+    rows = [(f"{r['name']}:{t['name']}", "CACHED" if r["status"] == "CACHED" else t["status"], t["time"])
+        for r in sorted(results, key=lambda r: r["name"]) for t in r["tests"]]
+    name_width = max([len("Test")] + [len(row[0]) for row in rows])
+    print()
+    print(f"{'Test':<{name_width}}  {'Status':<7}  {'Time (s)':>8}")
+    print(f"{'-'*name_width}  {'-'*7}  {'-'*8}")
+    for name, status, time_ in rows:
+        print(f"{name:<{name_width}}  {status:<7}  {time_:>8.2f}")
+    print(f"{'-'*name_width}  {'-'*7}  {'-'*8}")
+    failed = [r for r in results if r["status"] == "FAILED"]
+    cached = [r for r in results if r["status"] == "CACHED"]
+    print(f"{len(results) - len(failed)}/{len(results)} jobs OK ({len(cached)} cached), {len(rows)} tests, "
+          f"{sum(r['duration'] for r in results):.2f}s total job time, {wall_time:.2f}s wall time.")
+    for r in failed:
+        print(f"FAILED: {r['name']} (logs: {r['work_dir']})")
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="IP Catalog parallel simulation regression")
+    parser.add_argument("ips", nargs="*",                                   help="IP filters (<ip>, <ip>/<version>, fnmatch patterns)")
+    parser.add_argument("--root",           default=ip_path,                 help="IP root (sources or <build>/rapidsilicon/ip)")
+    parser.add_argument("--kinds",          default=",".join(KINDS),         help="Harness kinds to run")
+    parser.add_argument("--jobs", "-j",     default=os.cpu_count(), type=int, help="Number of parallel jobs")
+    parser.add_argument("--sim",            default="icarus",                help="Simulator (SIM)")
+    parser.add_argument("--waves",          action="store_true",             help="Enable waveforms (WAVES=1)")
+    parser.add_argument("--param",          default=[], action="append",     help="Extra NAME=VALUE make/environment variable (repeatable)")
+    parser.add_argument("--timeout",        default=None, type=float,        help="Timeout per job (s)")
+    parser.add_argument("--work-dir",       default="catalog_regress",       help="Per job OUT_DIR/SIM_BUILD/results root")
+    parser.add_argument("--no-cache",       action="store_true",             help="Run all jobs (no results cache)")
+    parser.add_argument("--cache-dir",      default=default_cache_dir(),     help="Results cache directory (<cache-dir>/regress)")
+    parser.add_argument("--cache-max-size", default=64, type=int,            help="Results cache size limit (MB, <cache-dir>/regress only)")
+    parser.add_argument("--list",           action="store_true",             help="List the jobs and exit")
+    parser.add_argument("--junit",          default="catalog_regress.xml",   help="JUnit XML output file")
+    parser.add_argument("--report",         default=None,                    help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    kinds = args.kinds.split(",")
+    for kind in kinds:
+        if kind not in KINDS:
+            raise SystemExit(f"Unknown harness kind {kind} (expected: {', '.join(KINDS)}).")
+    params = {"SIM": args.sim, "WAVES": str(int(args.waves))}
+    for param in args.param:
+        if "=" not in param:
+            raise SystemExit(f"Invalid --param {param} (expected NAME=VALUE).")
+        name, value = param.split("=", 1)
+        params[name] = value
+
+    jobs = []
+    for sim_dir in find_sim_dirs(args.root):
+        jobs += find_jobs(sim_dir)
+    jobs = select_jobs(jobs, args.ips, kinds)
+    if args.list:
+        for job in jobs:
+            print(f"{job['kind']:<12} {job['name']}")
+        return
+    if not jobs:
+        raise SystemExit(f"No sim harnesses found in {args.root}.")
+
+    cache     = None if args.no_cache else IP_Cache(os.path.join(args.cache_dir, "regress"), args.cache_max_size*1024*1024, suffix=".json")
+    work_root = os.path.abspath(args.work_dir)
+    # Keys before any job runs (harnesses write to their sim directories).
+    keys      = [job_key(job, params) for job in jobs]
+
+    start   = time.perf_counter()
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        futures = []
+        for n, (job, key) in enumerate(zip(jobs, keys)):
+            work_dir = os.path.join(work_root, f"{n:03d}_{job['name'].replace('/', '_').replace(':', '_')}")
+            futures.append(executor.submit(cached_job, job, cache, key, work_dir, params, args.timeout))
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(f"[{len(results)}/{len(jobs)}] {result['name']} ({result['kind']}): {result['status']} "
+                  f"({result['duration']:.2f}s)", flush=True)
+    wall_time = time.perf_counter() - start
+
+    print_summary(results, wall_time)
+    write_junit(args.junit, results)
+
+    if args.report is not None:
+        with open(args.report, "w") as f:
+            json.dump({"wall_time": wall_time, "params": params, "jobs": results}, f, indent=4)
+
+    sys.exit(0 if all(r["status"] != "FAILED" for r in results) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -5,43 +5,444 @@
 # SPDX-License-Identifier: MIT
 
 import os
+import sys
 import json
+import time
+import queue
 import shutil
+import logging
+import logging.handlers
+import hashlib
 import argparse
+import tempfile
+
+from datetime import datetime, timezone
+
+# IP Catalog Build Cache ---------------------------------------------------------------------------
+
+# Bump when the cached wrapper format/post-processing changes.
+CACHE_VERSION = 2
+
+# Shared modules of rapidsilicon/lib imported by generators/litex wrappers (part of cache/index keys).
+LIB_MODULES = ["common.py", "pll_solver.py"]
+
+def default_cache_dir():
+    cache_home = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache_home, "rapidsilicon", "ip_catalog")
+
+def hash_file(filename, h=None):
+    h = hashlib.sha256() if h is None else h
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h
+
+def hash_tree(path, h):
+    # Hash relative names and contents of all files under path (sorted, so stable across runs).
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for file_name in sorted(files):
+            if file_name.endswith(".pyc"):
+                continue
+            full_file_path = os.path.join(root, file_name)
+            h.update(os.path.relpath(full_file_path, path).encode())
+            hash_file(full_file_path, h)
+
+def toolchain_version():
+    # LiteX/migen versions (installed distributions) are part of the cache key.
+    from importlib import metadata
+    versions = []
+    for name in ["litex", "migen"]:
+        try:
+            versions.append(f"{name}={metadata.version(name)}")
+        except Exception:
+            versions.append(f"{name}=unknown")
+    return ",".join(versions)
+
+class IP_Cache:
+    # Content-addressed store of generated wrappers: <cache_dir>/<key[:2]>/<key><suffix>, LRU evicted
+    # on total size (mtime is refreshed on every hit). binary: bytes contents (IP specific payloads).
+    def __init__(self, cache_dir, max_size, suffix=".v", binary=False):
+        self.cache_dir = cache_dir
+        self.max_size  = max_size
+        self.suffix    = suffix
+        self.mode      = "b" if binary else ""
+
+    def filename(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}{self.suffix}")
+
+    def get(self, key):
+        filename = self.filename(key)
+        try:
+            with open(filename, "r" + self.mode) as f:
+                content = f.read()
+        except OSError:
+            return None
+        try:
+            os.utime(filename)
+        except OSError:
+            pass
+        return content
+
+    def put(self, key, content):
+        filename = self.filename(key)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        # Atomic write: concurrent builds may store the same key.
+        fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(filename), suffix=".tmp")
+        with os.fdopen(fd, "w" + self.mode) as f:
+            f.write(content)
+        os.replace(tmp_filename, filename)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        total   = 0
+        for root, dirs, files in os.walk(self.cache_dir):
+            for file_name in files:
+                if not file_name.endswith(self.suffix):
+                    continue
+                full_file_path = os.path.join(root, file_name)
+                try:
+                    st = os.stat(full_file_path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, full_file_path))
+                total += st.st_size
+        for mtime, size, full_file_path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(full_file_path)
+            except OSError:
+                pass
+            total -= size
+
+# IP Catalog Files Sync ----------------------------------------------------------------------------
+
+SYNC_MANIFEST = ".sync_manifest.json"
+
+# Linux FICLONE ioctl (copy-on-write clone on btrfs/XFS/...).
+FICLONE = 0x40049409
+
+def reflink_file(src, dst):
+    import fcntl
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+
+# Shared simulation support (AXI-Stream frame codec, ...), copied next to the testbenches using it.
+SIM_SUPPORT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sim_support")
+
+def uses_sim_support(sim_path):
+    for file_name in sorted(os.listdir(sim_path)):
+        if file_name.endswith(".py"):
+            with open(os.path.join(sim_path, file_name), "r", errors="ignore") as f:
+                if "sim_support" in f.read():
+                    return True
+    return False
+
+class IP_Sync:
+    # Incremental copy of generator files to the build directory. A manifest stored in the build
+    # directory records source size/mtime/sha256 and destination size/mtime of each synced file:
+    # unchanged files (same source content, destination untouched since last sync) are skipped.
+    # Modes: "copy", "hardlink" or "reflink" (falls back to copy when unsupported).
+    def __init__(self, root, mode="copy"):
+        self.root     = root
+        self.mode     = mode
+        self.manifest = {}
+        self.synced   = {}
+        self.stats    = {"copied": 0, "skipped": 0, "bytes_copied": 0, "bytes_skipped": 0}
+        try:
+            with open(os.path.join(root, SYNC_MANIFEST), "r") as f:
+                self.manifest = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def unchanged(self, src, dst, entry, st, mode):
+        if entry is None or entry.get("mode", None) != mode:
+            return False
+        try:
+            dst_st = os.stat(dst)
+        except OSError:
+            return False
+        # Destination modified/replaced since last sync (ex: testbench edited by the generator).
+        if (dst_st.st_size, dst_st.st_mtime_ns) != (entry["dst_size"], entry["dst_mtime"]):
+            return False
+        if st.st_size != entry["size"]:
+            return False
+        if st.st_mtime_ns == entry["mtime"]:
+            return True
+        # Source touched (checkout, ...): compare content.
+        return hash_file(src).hexdigest() == entry["sha256"]
+
+    def sync_file(self, src, dst, mode=None):
+        mode  = self.mode if mode is None else mode
+        st    = os.stat(src)
+        rel   = os.path.relpath(dst, self.root)
+        entry = self.manifest.get(rel, None)
+        if self.unchanged(src, dst, entry, st, mode):
+            self.synced[rel] = dict(entry, mtime=st.st_mtime_ns)
+            self.stats["skipped"]       += 1
+            self.stats["bytes_skipped"] += st.st_size
+            return
+
+        # Never write through an existing destination: it may be a hardlink to the source.
+        if os.path.lexists(dst):
+            os.remove(dst)
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        try:
+            if mode == "hardlink":
+                os.link(src, dst)
+            elif mode == "reflink":
+                reflink_file(src, dst)
+            else:
+                shutil.copy(src, dst)
+        except OSError:
+            # Cross-device link, no reflink support, ...: regular copy.
+            if os.path.lexists(dst):
+                os.remove(dst)
+            shutil.copy(src, dst)
+
+        dst_st = os.stat(dst)
+        self.synced[rel] = {
+            "mode"      : mode,
+            "size"      : st.st_size,
+            "mtime"     : st.st_mtime_ns,
+            "sha256"    : hash_file(src).hexdigest(),
+            "dst_size"  : dst_st.st_size,
+            "dst_mtime" : dst_st.st_mtime_ns,
+        }
+        self.stats["copied"]       += 1
+        self.stats["bytes_copied"] += st.st_size
+
+    def sync_tree(self, src_path, dst_path, ignore=[], mode=None):
+        for root, dirs, files in os.walk(src_path):
+            dirs[:] = sorted(d for d in dirs if d not in ignore)
+            for file_name in sorted(files):
+                if file_name in ignore:
+                    continue
+                full_file_path = os.path.join(root, file_name)
+                self.sync_file(full_file_path, os.path.join(dst_path, os.path.relpath(full_file_path, src_path)), mode=mode)
+
+    def save(self):
+        # Atomic write: keep previous manifest if interrupted.
+        fd, tmp_filename = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self.synced, f, indent=4, sort_keys=True)
+        os.replace(tmp_filename, os.path.join(self.root, SYNC_MANIFEST))
+
+    def report(self):
+        return "Copied {} files ({} bytes), skipped {} unchanged files ({} bytes).".format(
+            self.stats["copied"],  self.stats["bytes_copied"],
+            self.stats["skipped"], self.stats["bytes_skipped"])
+
+# IP Catalog Build Profiler ------------------------------------------------------------------------
+
+def peak_rss():
+    # Peak Resident Set Size of the process (bytes), None when unavailable (Windows).
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss*1024 # ru_maxrss: bytes on macOS, KB on Linux.
+
+class IP_Profiler:
+    # Sequential build phases: starting a phase ends the current one. Each phase records its start,
+    # duration and the process peak RSS at its end. "startup" is the CPU time spent before the
+    # profiler creation (interpreter start-up and generator imports).
+    # Phases listed in cprofile_phases are profiled with cProfile when enabled.
+    def __init__(self):
+        self.origin          = time.perf_counter()
+        self.phases          = [{"name": "startup", "start": 0.0, "duration": time.process_time(), "peak_rss": peak_rss()}]
+        self.current         = None
+        self.cprofile        = None
+        self.cprofiled       = False
+        self.cprofile_phases = ["elaboration", "verilog"]
+
+    def enable_cprofile(self):
+        import cProfile
+        self.cprofile = cProfile.Profile()
+
+    def now(self):
+        return self.phases[0]["duration"] + time.perf_counter() - self.origin
+
+    def phase(self, name):
+        self.stop()
+        self.current = {"name": name, "start": self.now()}
+        if (self.cprofile is not None) and (name in self.cprofile_phases):
+            self.cprofile.enable()
+            self.cprofiled = True
+
+    def stop(self):
+        if self.current is None:
+            return
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        self.current["duration"] = self.now() - self.current["start"]
+        self.current["peak_rss"] = peak_rss()
+        self.phases.append(self.current)
+        self.current = None
+
+    def summary(self):
+        durations = {}
+        for phase in self.phases:
+            durations[phase["name"]] = round(durations.get(phase["name"], 0.0) + phase["duration"], 6)
+        rss = [phase["peak_rss"] for phase in self.phases if phase["peak_rss"] is not None]
+        return {
+            "Phases (s)"    : durations,
+            "Total (s)"     : round(sum(phase["duration"] for phase in self.phases), 6),
+            "Peak RSS (MB)" : round(max(rss)/(1024*1024), 1) if rss else None,
+        }
+
+    # Chrome Trace Event Format (chrome://tracing, ui.perfetto.dev): one complete event per phase.
+    def export_trace(self, filename, process_name):
+        events = [{"name": "process_name", "ph": "M", "pid": os.getpid(), "tid": 0, "args": {"name": process_name}}]
+        for phase in self.phases:
+            events.append({
+                "name" : phase["name"],
+                "ph"   : "X",
+                "pid"  : os.getpid(),
+                "tid"  : 0,
+                "ts"   : round(phase["start"]*1e6, 1),
+                "dur"  : round(phase["duration"]*1e6, 1),
+                "args" : {"peak_rss": phase["peak_rss"]},
+            })
+        with open(filename, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, indent=4)
+
+    def export_pstats(self, filename):
+        # Nothing to dump on Build Cache hits (no elaboration).
+        if self.cprofiled:
+            self.cprofile.dump_stats(filename)
+
+# IP Catalog Logging -------------------------------------------------------------------------------
+
+LOG_FORMAT = "%(levelname)s: %(message)s\n"
+LOG_LEVELS = ["debug", "info", "warning", "error"]
+
+class IP_Log(logging.handlers.QueueHandler):
+    # Build log: records of the root logger are queued (logging never blocks on disk I/O) and written
+    # by a listener thread to <build_path>/IP.log once the build path is known; records emitted before
+    # (generator banner, ...) wait in the queue. Closed by logging.shutdown() (atexit, gen_server
+    # workers), which drains the queue, so the log is complete on every exit path.
+    def __init__(self, level="info"):
+        super().__init__(queue.SimpleQueue())
+        self.listener = None
+        self.stream   = None
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, IP_Log):
+                root.removeHandler(handler)
+                handler.close()
+        root.addHandler(self)
+        self.set_level(level)
+
+    @staticmethod
+    def set_level(level):
+        logging.getLogger().setLevel(level.upper())
+
+    def start(self, filename):
+        self.stop()
+        self.stream = open(filename, "w")
+        handler = logging.StreamHandler(self.stream)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.listener = logging.handlers.QueueListener(self.queue, handler)
+        self.listener.start()
+
+    def stop(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def close(self):
+        self.stop()
+        super().close()
 
 # IP Catalog Builder -------------------------------------------------------------------------------
 
 class IP_Builder:
     def __init__(self, device, ip_name, language):
-        self.device   = device
-        self.ip_name  = ip_name
-        self.language = language
-        self.prepared = False
-
+        self.device     = device
+        self.ip_name    = ip_name
+        self.language   = language
+        self.prepared   = False
+        self.gen_path   = None
+        self.cache      = None
+        self.cache_key  = None
+        self.sync       = None
+        self.transforms = [self.add_wrapper_header]
+        self.profiler   = IP_Profiler()
+        self.profiler.phase("arguments")
+        self.log        = IP_Log()
+
+    # Common Build Arguments (shared by all generators).
     @staticmethod
-    def add_wrapper_text(filename, text, line):
-        # Read Verilog content and add text.
-        f = open(filename, "r")
-        content = f.readlines()
-        content.insert(line, text)
-        f.close()
+    def add_build_arguments(build_group):
+        build_group.add_argument("--cache-dir",      default=default_cache_dir(),   help="Build Cache Directory")
+        build_group.add_argument("--cache-max-size", default=512, type=int,         help="Build Cache Maximum Size per cache (MB, wrappers and each IP specific cache)")
+        build_group.add_argument("--no-cache",       action="store_true",           help="Disable Build Cache")
+        build_group.add_argument("--copy-mode",      default="copy", choices=["copy", "hardlink", "reflink"], help="Build Directory Files Copy Mode")
+        build_group.add_argument("--profile",        action="store_true",           help="Profile elaboration/Verilog conversion (cProfile, <build_name>.pstats)")
+        build_group.add_argument("--trace",          default=None,                  help="Export build phases to a Chrome Trace/Perfetto JSON file")
+        build_group.add_argument("--log-level",      default="info", choices=LOG_LEVELS, help="Build Log (IP.log) Level (debug: elaboration parameter dumps)")
+
+    # IP_ID Parameter: build timestamp, taken from SOURCE_DATE_EPOCH when set (deterministic builds).
+    @staticmethod
+    def generate_ip_id():
+        source_date_epoch = os.environ.get("SOURCE_DATE_EPOCH", None)
+        if source_date_epoch is not None:
+            now = datetime.fromtimestamp(int(source_date_epoch), tz=timezone.utc)
+        else:
+            now = datetime.now()
+        my_year         = now.year - 2022
+        year            = (bin(my_year)[2:]).zfill(7) # 7-bits  # Removing '0b' prefix = [2:]
+        month           = (bin(now.month)[2:]).zfill(4) # 4-bits
+        day             = (bin(now.day)[2:]).zfill(5) # 5-bits
+        mod_hour        = now.hour % 12 # 12 hours Format
+        hour            = (bin(mod_hour)[2:]).zfill(4) # 4-bits
+        minute          = (bin(now.minute)[2:]).zfill(6) # 6-bits
+        second          = (bin(now.second)[2:]).zfill(6) # 6-bits
+
+        # Concatenation for IP_ID Parameter
+        ip_id = ("{}{}{}{}{}{}").format(year, day, month, hour, minute, second)
+        ip_id = ("32'h{}").format(hex(int(ip_id,2))[2:])
+        return ip_id
+
+    # Wrapper Transforms: ordered text transforms applied on the generated Verilog before writing it.
+    def add_wrapper_transform(self, transform):
+        self.transforms.append(transform)
 
-        #  Write Verilog content.
-        f = open(filename, "w")
-        f.write("".join(content))
-        f.close()
+    @staticmethod
+    def add_wrapper_text(content, text, line):
+        lines = content.splitlines(keepends=True)
+        lines.insert(line, text)
+        return "".join(lines)
 
-    def add_wrapper_header(self, filename):
+    def add_wrapper_header(self, content):
         header = []
         header.append("// This file is Copyright (c) 2022 RapidSilicon")
         header.append(f"//{'-'*80}")
         header.append("")
         header = "\n".join(header)
-        self.add_wrapper_text(filename, header, 13)
-
+        return self.add_wrapper_text(content, header, 13)
+
+    # IP_TYPE/IP_VERSION/IP_ID Parameters (ip_version: Base_Major_Minor binary string).
+    def add_ip_parameters(self, ip_type, ip_version):
+        ip_version = ("32'h{}").format(hex(int(ip_version, 2))[2:])
+        def add_parameters(content):
+            ip_id  = self.generate_ip_id()
+            module = "module {} #(\n\tparameter IP_TYPE \t\t= \"{}\",\n\tparameter IP_VERSION \t= {}, \n\tparameter IP_ID \t\t= {}\n)\n(\n".format(
+                self.build_name, ip_type, ip_version, ip_id)
+            lines = content.splitlines(keepends=True)
+            return "".join(module if f"module {self.build_name}" in line else line for line in lines)
+        self.add_wrapper_transform(add_parameters)
 
     # JSON template for GUI parsing
     def export_json_template(self, parser, dep_dict, summary):
+        self.profiler.phase("json_template")
 
         # Get "core_fix_param_group" group.
         core_fix_param_group = None
@@ -186,6 +587,7 @@ class IP_Builder:
 
 
     def import_args_from_json(self, parser, json_filename):
+        self.profiler.phase("json")
         with open(json_filename, "rt") as f:
             t_args = argparse.Namespace()
             t_args.__dict__.update(json.load(f))
@@ -202,6 +604,7 @@ class IP_Builder:
 
 
     def prepare(self, build_dir, build_name, version):
+        self.profiler.phase("prepare")
         # Remove build_name extension when specified.
         build_name = os.path.splitext(build_name)[0]
 
@@ -220,14 +623,21 @@ class IP_Builder:
         os.makedirs(self.src_path,           exist_ok=True)
         os.makedirs(self.synth_path,         exist_ok=True)
 
+        # Build log.
+        self.log.start(os.path.join(self.build_path, "IP.log"))
+        logging.info(f"Log started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
         self.prepared = True
 
-    def copy_files(self, gen_path):
+    def copy_files(self, gen_path, mode="copy"):
         assert self.prepared
+        self.profiler.phase("copy_files")
+        self.gen_path = gen_path
+        self.sync     = IP_Sync(self.build_path, mode=mode)
 
         # Copy Generator file.
         generator_filename = os.path.join(gen_path, f"{self.ip_name}_gen.py")
-        shutil.copy(generator_filename, self.build_path)
+        self.copy_file(generator_filename, self.build_path)
 
         # Copy RTL files.
         rtl_path  = os.path.join(gen_path, "src")
@@ -236,7 +646,7 @@ class IP_Builder:
             for file_name in rtl_files:
                 full_file_path = os.path.join(rtl_path, file_name)
                 if os.path.isfile(full_file_path):
-                    shutil.copy(full_file_path, self.src_path)
+                    self.copy_file(full_file_path, self.src_path)
 
         # Copy litex_wrapper file.
         litex_path  = os.path.join(gen_path, "litex_wrapper")
@@ -245,21 +655,25 @@ class IP_Builder:
             for file_name in litex_files:
                 full_file_path = os.path.join(litex_path, file_name)
                 if os.path.isfile(full_file_path):
-                    shutil.copy(full_file_path, self.litex_wrapper_path)
-        
-        # Copy sim files.
+                    self.copy_file(full_file_path, self.litex_wrapper_path)
+
+        # Copy sim files (always copied when hardlinking: generators edit testbenches in place).
         simulate_path  = os.path.join(gen_path, "sim")
         if os.path.exists(simulate_path):
-            simulate_files = os.listdir(simulate_path)
-            for file_name in simulate_files:
-                full_file_path = os.path.join(simulate_path, file_name)
-                if os.path.isfile(full_file_path):
-                    shutil.copy(full_file_path, self.sim_path)
-                elif os.path.isdir(full_file_path):
-                    shutil.copytree(simulate_path, self.sim_path, ignore=shutil.ignore_patterns('rapidsilicon'), dirs_exist_ok=True)
+            self.sync.sync_tree(simulate_path, self.sim_path, ignore=["rapidsilicon"],
+                mode = "copy" if mode == "hardlink" else mode)
+            if uses_sim_support(simulate_path):
+                self.sync.sync_tree(SIM_SUPPORT_PATH, os.path.join(self.sim_path, "sim_support"), ignore=["__pycache__"])
+
+        self.sync.save()
+        logging.info(f"{self.ip_name}: {self.sync.report()}")
+
+    def copy_file(self, filename, path):
+        self.sync.sync_file(filename, os.path.join(path, os.path.basename(filename)))
 
     def generate_tcl(self):
         assert self.prepared
+        self.profiler.phase("generate_tcl")
 
         # Build .tcl file.
         # ----------------
@@ -306,31 +720,106 @@ class IP_Builder:
         f.write("\n".join(tcl))
         f.close()
 
+    def wrapper_filename(self, version):
+        new_name = self.build_name + "_" + version
+        if (self.language == "sverilog"):
+            return os.path.join(self.src_path, f"{new_name}.sv")
+        return os.path.join(self.src_path, f"{new_name}.v")
+
+    # Build Cache key: generator/litex_wrapper/RTL sources, arguments, language and toolchain.
+    def wrapper_cache_key(self, args, version):
+        h = hashlib.sha256()
+        h.update(f"{CACHE_VERSION}:{self.device}:{self.ip_name}:{version}:{self.language}".encode())
+        h.update(toolchain_version().encode())
+        for module in LIB_MODULES:
+            hash_file(os.path.join(os.path.dirname(__file__), module), h)
+        hash_file(os.path.join(self.gen_path, f"{self.ip_name}_gen.py"), h)
+        for path in ["litex_wrapper", "src"]:
+            if os.path.exists(os.path.join(self.gen_path, path)):
+                h.update(path.encode())
+                hash_tree(os.path.join(self.gen_path, path), h)
+
+        # Arguments (build location/mode and cache settings do not change the wrapper).
+        ignored_args = ["build", "build_dir", "json", "json_template", "cache_dir", "cache_max_size", "no_cache", "copy_mode",
+            "profile", "trace", "log_level"]
+        _vars = {k: v for k, v in sorted(vars(args).items()) if k not in ignored_args}
+        h.update(repr(_vars).encode())
+        # Files passed as arguments (memory/coefficients init files, ...): hash content.
+        for k, v in _vars.items():
+            if isinstance(v, str) and os.path.isfile(v):
+                h.update(k.encode())
+                hash_file(v, h)
+        return h.hexdigest()
+
+    # Build options applying to elaboration (log level, profiling).
+    def configure(self, args):
+        self.log.set_level(getattr(args, "log_level", "info"))
+        if getattr(args, "profile", False):
+            self.profiler.enable_cprofile()
+
+    # Restore wrapper from Build Cache: returns True on hit (no elaboration needed).
+    def restore_wrapper(self, args, version):
+        assert self.prepared and self.gen_path is not None
+        self.profiler.phase("cache")
+        self.configure(args)
+        if getattr(args, "no_cache", True):
+            return False
+        self.cache     = IP_Cache(args.cache_dir, args.cache_max_size*1024*1024)
+        self.cache_key = self.wrapper_cache_key(args, version)
+        content = self.cache.get(self.cache_key)
+        if content is None:
+            return False
+        self.write_wrapper(content, version)
+        return True
+
+    # Apply Wrapper Transforms and write wrapper (.v/.sv) to destination.
+    def write_wrapper(self, content, version):
+        self.profiler.phase("write_wrapper")
+        for transform in self.transforms:
+            content = transform(content)
+        with open(self.wrapper_filename(version), "w") as f:
+            f.write(content)
+        self.profiler.phase("finalize")
+
     def generate_wrapper(self, platform, module, version):
         assert self.prepared
-        build_path     = "litex_build"
-        new_name =  self.build_name + "_" + version
-        build_filename = os.path.join(build_path, new_name) + ".v"
-
-        # Build LiteX module.
-        platform.build(module,
-            build_dir    = build_path,
-            build_name   = new_name,
-            run          = False,
-            regular_comb = False
-        )
-
-        # Insert header.
-        self.add_wrapper_header(build_filename)
-
-        # Copy file to destination.
-        shutil.copy(build_filename, self.src_path)
-        
-        # Changing File Extension from .v to .sv
-        if (self.language == "sverilog"):
-            old_wrapper = os.path.join(self.src_path, f'{new_name}.v')
-            new_wrapper = old_wrapper.replace('.v','.sv')
-            os.rename(old_wrapper, new_wrapper)
+        new_name = self.build_name + "_" + version
+
+        # Convert LiteX module to Verilog (in memory, no LiteX build directory).
+        self.profiler.phase("verilog")
+        fragment = module.get_fragment()
+        platform.finalize(fragment)
+        v_output = platform.get_verilog(fragment, name=new_name, regular_comb=False)
+        content  = v_output.main_source
+
+        # Store raw wrapper in Build Cache (transforms are re-applied on restore).
+        if self.cache_key is not None:
+            self.cache.put(self.cache_key, content)
+
+        self.write_wrapper(content, version)
+
+    # Build Profile: phase durations/peak RSS in details.json, Chrome trace (--trace) and elaboration
+    # pstats (--profile, <build_path>/<build_name>.pstats).
+    def export_profile(self, args):
+        assert self.prepared
+        self.profiler.stop()
+        summary = self.profiler.summary()
+        for name, duration in summary["Phases (s)"].items():
+            logging.info("Build phase %-14s: %.3fs", name, duration)
+        logging.info("Build peak RSS       : %s MB", summary["Peak RSS (MB)"])
+
+        details_filename = os.path.join(self.build_path, "details.json")
+        details = {}
+        try:
+            with open(details_filename, "r") as f:
+                details = json.load(f)
+        except (OSError, ValueError):
+            pass
+        details["Build Profile"] = summary
+        with open(details_filename, "w") as f:
+            json.dump(details, f, indent=4, default=None,)
 
-        # Remove build files.
-        shutil.rmtree(build_path)
+        if getattr(args, "trace", None) is not None:
+            self.profiler.export_trace(args.trace, process_name=f"{self.ip_name}: {self.build_name}")
+        if getattr(args, "profile", False):
+            self.profiler.export_pstats(os.path.join(self.build_path, f"{self.build_name}.pstats"))
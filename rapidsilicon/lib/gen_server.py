@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# Persistent IP generator server.
+#
+# Imports migen/LiteX and every rapidsilicon/ip/*/*/*_gen.py once, then serves build/json-template
+# requests as JSON lines over stdin/stdout (default) or a local UNIX socket (--socket). Each request
+# runs the generator main() in a forked worker so builds never share state with each other or with
+# the warm server process.
+#
+# Request  : {"id": 1, "method": "build", "params": {"ip": "axi_ram", "version": "v1_0",
+#             "args": ["--data_width=32", "--build-name=ram_wrapper"], "cwd": "/path/to/run/dir"}}
+# Response : {"id": 1, "result": {"returncode": 0, "stdout": "...", "stderr": "..."}}
+#
+# Methods  : build, json_template, run (args passed as is), list, shutdown.
+
+import os
+import sys
+import json
+import glob
+import signal
+import logging
+import argparse
+import tempfile
+import importlib.util
+import multiprocessing
+import socketserver
+
+# Generators Discovery -----------------------------------------------------------------------------
+
+ip_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "ip"))
+
+def find_generators(ip_path=ip_path):
+    generators = {}
+    for gen_filename in sorted(glob.glob(os.path.join(ip_path, "*", "*", "*_gen.py"))):
+        version_path = os.path.dirname(gen_filename)
+        ip_name      = os.path.basename(os.path.dirname(version_path))
+        version      = os.path.basename(version_path)
+        generators[(ip_name, version)] = gen_filename
+    return generators
+
+# Generator Loading --------------------------------------------------------------------------------
+
+class Generator:
+    def __init__(self, ip_name, version, filename):
+        self.ip_name  = ip_name
+        self.version  = version
+        self.filename = filename
+        self.gen_path = os.path.dirname(filename)
+        self.module   = None
+        self.modules  = {} # Generator local modules (litex_wrapper, ...) loaded with the generator.
+        self.error    = None
+
+    @staticmethod
+    def is_local_module(name, module, gen_path):
+        if name == "litex_wrapper" or name.startswith("litex_wrapper."):
+            return True
+        filename = getattr(module, "__file__", None)
+        return filename is not None and os.path.abspath(filename).startswith(gen_path + os.sep)
+
+    def load(self):
+        # Every generator imports its own "litex_wrapper" package from its directory: local modules
+        # are moved out of sys.modules after import and re-installed in the worker before running.
+        previous_modules = set(sys.modules)
+        sys.path.insert(0, self.gen_path)
+        try:
+            spec   = importlib.util.spec_from_file_location(f"{self.ip_name}_{self.version}_gen", self.filename)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self.module = module
+            # Generators import their LiteX wrapper modules on --build only: pre-import them too.
+            litex_path = os.path.join(self.gen_path, "litex_wrapper")
+            if os.path.isdir(litex_path):
+                for file_name in sorted(os.listdir(litex_path)):
+                    if file_name.endswith(".py"):
+                        importlib.import_module(f"litex_wrapper.{file_name[:-3]}")
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+        finally:
+            sys.path.remove(self.gen_path)
+            for name in set(sys.modules) - previous_modules:
+                if self.is_local_module(name, sys.modules[name], self.gen_path):
+                    self.modules[name] = sys.modules.pop(name)
+
+    def install(self):
+        for name in list(sys.modules):
+            if name == "litex_wrapper" or name.startswith("litex_wrapper."):
+                del sys.modules[name]
+        sys.modules.update(self.modules)
+        sys.path.insert(0, self.gen_path)
+
+# Worker -------------------------------------------------------------------------------------------
+
+def run_worker(generator, argv, cwd, conn):
+    # Redirect stdout/stderr at file descriptor level: nothing from the generator (or LiteX) can
+    # reach the server protocol channel.
+    stdout_file = tempfile.TemporaryFile(mode="w+")
+    stderr_file = tempfile.TemporaryFile(mode="w+")
+    os.dup2(stdout_file.fileno(), 1)
+    os.dup2(stderr_file.fileno(), 2)
+
+    returncode = 0
+    try:
+        os.makedirs(cwd, exist_ok=True)
+        os.chdir(cwd)
+        generator.install()
+
+        # Same logging setup as a fresh CLI process (IP_Builder installs the build log).
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+
+        sys.argv = [generator.filename] + argv
+        generator.module.main()
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            returncode = e.code
+        elif e.code is not None:
+            print(e.code, file=sys.stderr)
+            returncode = 1
+    except BaseException:
+        import traceback
+        traceback.print_exc()
+        returncode = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        logging.shutdown() # Drains/closes the build log.
+
+    stdout_file.seek(0)
+    stderr_file.seek(0)
+    conn.send({"returncode": returncode, "stdout": stdout_file.read(), "stderr": stderr_file.read()})
+    conn.close()
+    os._exit(0)
+
+# Generator Server ---------------------------------------------------------------------------------
+
+class GeneratorServer:
+    def __init__(self, ip_path=ip_path):
+        self.context    = multiprocessing.get_context("fork")
+        self.generators = {}
+        for (ip_name, version), filename in find_generators(ip_path).items():
+            self.generators[(ip_name, version)] = Generator(ip_name, version, filename)
+
+    def preload(self):
+        # Pre-import toolchain.
+        import migen
+        import litex.build.generic_platform
+        import litex.build.osfpga
+
+        # Pre-import generators.
+        for generator in self.generators.values():
+            generator.load()
+            if generator.error is not None:
+                print(f"{generator.ip_name}/{generator.version}: {generator.error}", file=sys.stderr)
+
+    def get_generator(self, params):
+        ip_name = params.get("ip")
+        version = params.get("version")
+        if version is None:
+            versions = sorted(v for (n, v) in self.generators if n == ip_name)
+            version  = versions[-1] if versions else None
+        generator = self.generators.get((ip_name, version), None)
+        if generator is None:
+            raise ValueError(f"Unknown IP: {ip_name} {version}")
+        if generator.module is None:
+            raise ValueError(f"IP {ip_name} {version} failed to load: {generator.error}")
+        return generator
+
+    def run(self, generator, argv, cwd):
+        parent_conn, child_conn = self.context.Pipe(duplex=False)
+        process = self.context.Process(target=run_worker, args=(generator, argv, cwd, child_conn))
+        process.start()
+        child_conn.close()
+        try:
+            result = parent_conn.recv()
+        except EOFError:
+            result = {"returncode": 1, "stdout": "", "stderr": "Worker exited unexpectedly.\n"}
+        process.join()
+        return result
+
+    def handle(self, request):
+        method = request.get("method")
+        params = request.get("params", {})
+        if method == "list":
+            return [{"ip": n, "version": v, "loaded": g.module is not None}
+                for (n, v), g in sorted(self.generators.items())]
+        if method in ["build", "json_template", "run"]:
+            generator = self.get_generator(params)
+            argv      = [str(arg) for arg in params.get("args", [])]
+            cwd       = os.path.abspath(params.get("cwd", os.getcwd()))
+            if method == "build" and "--build" not in argv:
+                argv.append("--build")
+            if method == "json_template" and "--json-template" not in argv:
+                argv.append("--json-template")
+            return self.run(generator, argv, cwd)
+        raise ValueError(f"Unknown method: {method}")
+
+    def serve(self, rfile, wfile):
+        for line in rfile:
+            line = line.strip()
+            if not line:
+                continue
+            response = {"id": None}
+            try:
+                request = json.loads(line)
+                response["id"] = request.get("id", None)
+                if request.get("method") == "shutdown":
+                    response["result"] = "ok"
+                    wfile.write(json.dumps(response) + "\n")
+                    wfile.flush()
+                    return False
+                response["result"] = self.handle(request)
+            except Exception as e:
+                response["error"] = f"{type(e).__name__}: {e}"
+            wfile.write(json.dumps(response) + "\n")
+            wfile.flush()
+        return True
+
+# UNIX Socket Server -------------------------------------------------------------------------------
+
+class ForkingUnixStreamServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    pass
+
+def serve_socket(server, socket_path):
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            rfile = (line.decode("utf-8") for line in self.rfile)
+            wfile = _SocketWriter(self.wfile)
+            if not server.serve(rfile, wfile):
+                os.kill(os.getppid(), signal.SIGTERM)
+
+    # Shutdown request: exit serve_forever cleanly (and remove socket).
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    with ForkingUnixStreamServer(socket_path, Handler) as unix_server:
+        try:
+            unix_server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+class _SocketWriter:
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, s):
+        self.wfile.write(s.encode("utf-8"))
+
+    def flush(self):
+        self.wfile.flush()
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="IP Catalog Generator Server")
+    parser.add_argument("--socket",  default=None,    help="Serve on a UNIX socket instead of stdin/stdout")
+    parser.add_argument("--ip-path", default=ip_path, help="IP Catalog path")
+    args = parser.parse_args()
+
+    server = GeneratorServer(ip_path=os.path.abspath(args.ip_path))
+    server.preload()
+    print(f"Generator server ready ({len(server.generators)} generators).", file=sys.stderr)
+
+    if args.socket is not None:
+        serve_socket(server, args.socket)
+    else:
+        server.serve(sys.stdin, sys.stdout)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# On Chip Memory initialization benchmark.
+#
+# Writes a random .hex/.bin init file for every supported depth/width combination and times the
+# on_chip_memory init loader (file read + INIT bit-vectors packing). BRAM mappings only depend on the
+# aspect ratio (1024/2048/4096/8192/16384/32768 depths) or on the number of 1024x36 BRAM rows (other
+# depths), so other depths are covered by the largest depth of each BRAM row count.
+#
+# Exits with 1 if any combination fails or exceeds the budget.
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import statistics
+
+# Paths --------------------------------------------------------------------------------------------
+
+ocm_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "ip", "on_chip_memory", "v1_0"))
+
+# Combinations -------------------------------------------------------------------------------------
+
+def supported_depths(ocm_bram_mapper):
+    depths = sorted(ocm_bram_mapper.ASPECT_RATIOS)
+    for rows in range(1, max(depths)//ocm_bram_mapper.PRIMITIVE_DEPTH + 1):
+        depths.append(rows*ocm_bram_mapper.PRIMITIVE_DEPTH - 1)
+    return sorted(depths)
+
+def parse_list(value):
+    # "1,2,8-16" -> [1, 2, 8, ..., 16].
+    values = []
+    for item in value.split(","):
+        first, _, last = item.partition("-")
+        values += list(range(int(first), int(last or first) + 1))
+    return values
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def write_init_file(filename, words, data_width, file_extension):
+    fmt = "x" if file_extension == ".hex" else f"0{data_width}b"
+    with open(filename, "w") as f:
+        f.write("\n".join(format(word, fmt) for word in words) + "\n")
+
+def benchmark(ocm_init_loader, filename, file_extension, data_width, mapping, runs):
+    durations = []
+    for n in range(runs):
+        start   = time.perf_counter()
+        words   = ocm_init_loader.read_init_file(filename, file_extension)
+        vectors = ocm_init_loader.init_vectors(words, data_width, mapping)
+        durations.append(time.perf_counter() - start)
+    if (len(vectors) != mapping["primitives"]) or any(len(v) != ocm_init_loader.INIT_WIDTH for v in vectors):
+        raise RuntimeError("Invalid INIT vectors")
+    return statistics.median(durations), len(vectors)
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="On Chip Memory initialization benchmark")
+    parser.add_argument("--ocm-path", default=ocm_path,               help="On Chip Memory generator path")
+    parser.add_argument("--depths",   default=None,                   help="Depths (ex: 1024,3000-3010), default: all depth classes")
+    parser.add_argument("--widths",   default="1-128",                help="Data widths (ex: 8,16,32-36)")
+    parser.add_argument("--format",   default=".hex", choices=[".hex", ".bin"], help="Init file format")
+    parser.add_argument("--mapping",  default="Primitives", choices=["Primitives", "Latency"], help="BRAM mapping objective")
+    parser.add_argument("--fill",     default=1.0,    type=float,     help="Init file words / depth (< 1: x filled addresses)")
+    parser.add_argument("--runs",     default=1,      type=int,       help="Runs per combination (median is reported)")
+    parser.add_argument("--budget",   default=1.0,    type=float,     help="Maximum time per combination (s)")
+    parser.add_argument("--seed",     default=0,      type=int,       help="Init data random seed")
+    parser.add_argument("--report",   default=None,                   help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.ocm_path))
+    from litex_wrapper import ocm_bram_mapper, ocm_init_loader
+
+    depths = supported_depths(ocm_bram_mapper) if args.depths is None else parse_list(args.depths)
+    widths = parse_list(args.widths)
+    rng    = random.Random(args.seed)
+
+    results = []
+    tmp_dir = tempfile.mkdtemp(prefix="ocm_init_benchmark_")
+    try:
+        for write_depth in depths:
+            times = []
+            for data_width in widths:
+                result = {"depth": write_depth, "width": data_width, "mapping": None, "time": None, "primitives": 0, "error": None}
+                try:
+                    mapping  = ocm_bram_mapper.map_memory(data_width, write_depth, args.mapping)
+                    result["mapping"] = ocm_bram_mapper.mapping_summary(mapping)["BRAM Mapping"]
+                    words    = [rng.getrandbits(data_width) for n in range(max(1, int(write_depth*args.fill)))]
+                    filename = os.path.join(tmp_dir, f"init{args.format}")
+                    write_init_file(filename, words, data_width, args.format)
+                    result["time"], result["primitives"] = benchmark(ocm_init_loader, filename, args.format,
+                        data_width, mapping, max(1, args.runs))
+                except Exception as e:
+                    result["error"] = f"{type(e).__name__}: {e}"
+                if result["error"] is not None:
+                    result["status"] = f"FAILED ({result['error']})"
+                elif result["time"] > args.budget:
+                    result["status"] = f"FAILED (over {args.budget:.2f}s budget)"
+                else:
+                    result["status"] = "OK"
+                    times.append(result["time"])
+                if result["status"] != "OK":
+                    print(f"{write_depth:>5} x {data_width:<3} {result['status']}", flush=True)
+                results.append(result)
+            if times:
+                print(f"depth {write_depth:>5}: {len(times)}/{len(widths)} widths OK, "
+                      f"max {max(times)*1e3:.1f}ms, total {sum(times)*1e3:.1f}ms", flush=True)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    failed = [r for r in results if r["status"] != "OK"]
+    total  = sum(r["time"] for r in results if r["time"] is not None)
+    print(f"{len(results) - len(failed)}/{len(results)} combinations OK in {total:.2f}s (budget: {args.budget:.2f}s).")
+
+    if args.report is not None:
+        with open(args.report, "w") as f:
+            json.dump({"budget": args.budget, "mapping": args.mapping, "fill": args.fill, "format": args.format, "combinations": results}, f, indent=4)
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# PLL clock synthesis solver: PLL_MULT/PLL_DIV/post-divider search on exact rationals (pure Python,
+# no migen). Used by the PLL generators and by the FIR generator (Area mode fast clock).
+#
+# out = ref / (DIVIDE_CLK_IN_BY_2 ? 2 : 1) / PLL_DIV * PLL_MULT / post_div
+#           |------------- PFD -------------|
+#           |------------------- VCO ------------------|
+
+import math
+
+from fractions import Fraction
+
+# Device Limits ------------------------------------------------------------------------------------
+
+PLL_MULT_RANGE = (16, 1000)
+PLL_DIV_RANGE  = (1, 63)
+POST_DIVIDERS  = [2, 3, 4, 5, 6, 7, 8, 10, 12, 16, 20, 24, 32, 40, 48, 64]  # CLK_OUT0..3_DIV.
+FAST_CLK_DIV   = 2              # GEARBOX_FAST_CLK = VCO/2.
+FAST_CLK_RANGE = (800, 3200)    # MHz.
+VCO_RANGE      = (1600, 6400)   # MHz (FAST_CLK_RANGE x FAST_CLK_DIV).
+REF_CLK_RANGE  = (5, 1200)      # MHz.
+PFD_RANGE      = (0, 1200)      # MHz (after input dividers, no lower limit documented).
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def rational(value):
+    # Exact value of an int/str/Fraction, decimal value of a float (0.1 -> 1/10, not 0x3FB999...).
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    return Fraction(value)
+
+def in_range(value, limits):
+    return limits[0] <= value <= limits[1]
+
+# Solver -------------------------------------------------------------------------------------------
+
+def solutions(ref_freq, target_freq, post_dividers=[1], divide_clk_in_by_2=False, tolerance=0, check_limits=True, nearest=False):
+    # Every legal (PLL_MULT, PLL_DIV, post_div) for target_freq within tolerance (relative, ex: 1e-6),
+    # best first: lowest frequency error, then largest VCO margin (distance to the closest VCO limit,
+    # relative to the VCO range), then lowest PLL_DIV (highest PFD frequency). With check_limits=False,
+    # only PLL_MULT/PLL_DIV ranges are enforced (ex: ratio only, ref_freq=1). With nearest=True, the
+    # closest PLL_MULT values are returned regardless of tolerance (near-miss report).
+    ref       = rational(ref_freq)
+    target    = rational(target_freq)
+    tolerance = rational(tolerance)
+    prediv    = 2 if divide_clk_in_by_2 else 1
+    results   = []
+    if check_limits and not in_range(ref, REF_CLK_RANGE):
+        return results
+    for post_div in post_dividers:
+        for pll_div in range(PLL_DIV_RANGE[0], PLL_DIV_RANGE[1] + 1):
+            pfd = ref/(prediv*pll_div)
+            if check_limits and not in_range(pfd, PFD_RANGE):
+                continue
+            # out = pfd*PLL_MULT/post_div: PLL_MULT values within tolerance of target.
+            scale = post_div/pfd
+            if nearest:
+                mults = {math.floor(target*scale), math.ceil(target*scale)}
+            else:
+                mults = range(max(math.ceil(target*(1 - tolerance)*scale), PLL_MULT_RANGE[0]),
+                              min(math.floor(target*(1 + tolerance)*scale), PLL_MULT_RANGE[1]) + 1)
+            for pll_mult in sorted(mults):
+                if not in_range(pll_mult, PLL_MULT_RANGE):
+                    continue
+                vco = pfd*pll_mult
+                if check_limits and not in_range(vco, VCO_RANGE):
+                    continue
+                freq = vco/post_div
+                results.append({
+                    "pll_mult"   : pll_mult,
+                    "pll_div"    : pll_div,
+                    "post_div"   : post_div,
+                    "freq"       : freq,
+                    "error"      : abs(freq - target)/target,
+                    "vco"        : vco,
+                    "vco_margin" : min(vco - VCO_RANGE[0], VCO_RANGE[1] - vco)/(VCO_RANGE[1] - VCO_RANGE[0]),
+                })
+    return sorted(results, key=lambda s: (s["error"], -s["vco_margin"], s["pll_div"], s["post_div"], s["pll_mult"]))
+
+def best_solution(*args, **kwargs):
+    # Best solution within tolerance (see solutions), None if there is none.
+    results = solutions(*args, **kwargs)
+    return results[0] if results else None
+
+def nearest_solution(*args, **kwargs):
+    # Closest solution regardless of tolerance, None if no PLL_MULT/PLL_DIV is within device limits.
+    return best_solution(*args, **kwargs, nearest=True)
+
+def solution_summary(solution):
+    return {
+        "PLL_MULT"        : solution["pll_mult"],
+        "PLL_DIV"         : solution["pll_div"],
+        "VCO Frequency"   : f"{float(solution['vco']):.6g} MHz",
+        "Frequency Error" : f"{float(solution['error'])*1e6:.3g} ppm",
+    }
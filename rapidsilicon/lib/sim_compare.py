@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# cocotb simulator comparison report.
+#
+# Runs the cocotb sim/Makefile harness of built IPs (<build>/rapidsilicon/ip/<ip>/<version>/<name>/sim)
+# under each simulator (default: Icarus and Verilator, SIM=<simulator>), each in its own OUT_DIR/
+# SIM_BUILD and cocotb results file, and reports per test status and wall time side by side with the
+# speedup over the first simulator:
+#
+#   sim_compare.py build/rapidsilicon/ip/axis_fifo/v1_0/fifo/sim build/rapidsilicon/ip/axi_dma/v1_0/dma/sim
+#
+# Waveforms are disabled (WAVES=0) unless --waves. Exits with 1 unless all tests pass on all
+# simulators (parity).
+
+import os
+import sys
+import csv
+import json
+import time
+import shutil
+import argparse
+import subprocess
+import xml.etree.ElementTree as ET
+
+# Harness ------------------------------------------------------------------------------------------
+
+def sim_label(sim_dir):
+    # <ip>/<version>/<name> of an IP sim directory (path otherwise).
+    parts = os.path.abspath(sim_dir).split(os.sep)
+    if parts[-1] == "sim":
+        parts = parts[:-1]
+    if "ip" in parts:
+        parts = parts[len(parts) - parts[::-1].index("ip"):]
+    return "/".join(parts[-3:])
+
+def parse_results(filename):
+    # Test cases of a cocotb (JUnit XML) results file.
+    tests = []
+    for testcase in ET.parse(filename).getroot().iter("testcase"):
+        if testcase.find("failure") is not None or testcase.find("error") is not None:
+            status = "FAILED"
+        elif testcase.find("skipped") is not None:
+            status = "SKIPPED"
+        else:
+            status = "OK"
+        tests.append({
+            "name"        : testcase.get("name"),
+            "status"      : status,
+            "time"        : float(testcase.get("time", 0)),
+            "sim_time_ns" : float(testcase.get("sim_time_ns", 0)),
+        })
+    return tests
+
+def run_make(sim_dir, simulator, work_dir, target=None, waves=False, timeout=None):
+    # make -C sim_dir with SIM/OUT_DIR/results file isolated in work_dir (cocotb Makefiles).
+    if os.path.exists(work_dir):
+        shutil.rmtree(work_dir)
+    os.makedirs(work_dir)
+    results = os.path.join(work_dir, "results.xml")
+    cmd     = ["make", "-C", os.path.abspath(sim_dir), f"SIM={simulator}", f"OUT_DIR={work_dir}", f"WAVES={int(waves)}"]
+    cmd    += [] if target is None else [target]
+    env     = dict(os.environ, SIM=simulator, COCOTB_RESULTS_FILE=results)
+
+    start = time.perf_counter()
+    with open(os.path.join(work_dir, "make.log"), "w") as log:
+        try:
+            returncode = subprocess.call(cmd, stdout=log, stderr=subprocess.STDOUT, env=env, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            returncode = -1
+    duration = time.perf_counter() - start
+
+    tests = parse_results(results) if os.path.exists(results) else []
+    if (returncode != 0) and not any(t["status"] == "FAILED" for t in tests):
+        # Build/harness failure (or timeout): reported as a failed harness test.
+        tests.append({"name": "<harness>", "status": "FAILED", "time": duration, "sim_time_ns": 0})
+    return {"returncode": returncode, "duration": duration, "tests": tests, "work_dir": work_dir}
+
+# Report -------------------------------------------------------------------------------------------
+
+def compare(runs, simulators):
+    # One row per (harness, test): status/time of each simulator, speedup vs the first one.
+    rows = []
+    for label, sim_runs in runs.items():
+        names = []
+        for simulator in simulators:
+            names += [t["name"] for t in sim_runs[simulator]["tests"] if t["name"] not in names]
+        for name in names:
+            row = {"harness": label, "test": name}
+            for simulator in simulators:
+                test = next((t for t in sim_runs[simulator]["tests"] if t["name"] == name), None)
+                row[f"{simulator}_status"] = "MISSING" if test is None else test["status"]
+                row[f"{simulator}_time"]   = None if test is None else test["time"]
+            reference = row[f"{simulators[0]}_time"]
+            for simulator in simulators[1:]:
+                time_ = row[f"{simulator}_time"]
+                row[f"{simulator}_speedup"] = (reference/time_) if (reference and time_) else None
+            row["parity"] = all(row[f"{s}_status"] in ["OK", "SKIPPED"] for s in simulators)
+            rows.append(row)
+    return rows
+
+def print_table(rows, simulators):
+    name_width = max([len("Test")] + [len(f"{r['harness']}:{r['test']}") for r in rows])
+    header = f"{'Test':<{name_width}}"
+    for simulator in simulators:
+        header += f"  {simulator:>18}"
+    for simulator in simulators[1:]:
+        header += f"  {'speedup ' + simulator:>18}"
+    print()
+    print(header)
+    print("-"*len(header))
+    for r in rows:
+        line = f"{r['harness'] + ':' + r['test']:<{name_width}}"
+        for simulator in simulators:
+            time_ = r[f"{simulator}_time"]
+            line += f"  {r[f'{simulator}_status']:>8} {'' if time_ is None else f'{time_:8.2f}s':>9}"
+        for simulator in simulators[1:]:
+            speedup = r[f"{simulator}_speedup"]
+            line += f"  {'' if speedup is None else f'x{speedup:.2f}':>18}"
+        print(line)
+    print("-"*len(header))
+
+def write_report(filename, rows, runs):
+    if os.path.splitext(filename)[1] == ".csv":
+        with open(filename, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else ["harness", "test"])
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(filename, "w") as f:
+            json.dump({"tests": rows, "runs": runs}, f, indent=4)
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="cocotb simulator comparison report")
+    parser.add_argument("sim_dirs", nargs="+",                           help="sim directories of built IPs")
+    parser.add_argument("--simulators", default="icarus,verilator",     help="Simulators (first one: speedup reference)")
+    parser.add_argument("--target",     default=None,                   help="Makefile target (default: cocotb sim)")
+    parser.add_argument("--work-dir",   default="sim_compare",          help="OUT_DIR/results root (one directory per harness/simulator)")
+    parser.add_argument("--waves",      action="store_true",            help="Enable waveforms (WAVES=1)")
+    parser.add_argument("--timeout",    default=None, type=float,       help="Timeout per harness run (s)")
+    parser.add_argument("--report",     default=None,                   help="Write results to a JSON/CSV file")
+    args = parser.parse_args()
+
+    simulators = args.simulators.split(",")
+    work_root  = os.path.abspath(args.work_dir)
+
+    runs = {}
+    for sim_dir in args.sim_dirs:
+        label = sim_label(sim_dir)
+        runs[label] = {}
+        for simulator in simulators:
+            work_dir = os.path.join(work_root, label.replace("/", "_"), simulator)
+            run = run_make(sim_dir, simulator, work_dir, args.target, args.waves, args.timeout)
+            runs[label][simulator] = run
+            failed = sum(t["status"] == "FAILED" for t in run["tests"])
+            print(f"{label} ({simulator}): {len(run['tests']) - failed}/{len(run['tests'])} tests OK "
+                  f"({run['duration']:.2f}s)", flush=True)
+
+    rows = compare(runs, simulators)
+    print_table(rows, simulators)
+    parity = [r for r in rows if r["parity"]]
+    totals = ", ".join(f"{s}: {sum(run[s]['duration'] for run in runs.values()):.2f}s" for s in simulators)
+    print(f"{len(parity)}/{len(rows)} tests pass on {'/'.join(simulators)} ({totals}).")
+
+    if args.report is not None:
+        write_report(args.report, rows, runs)
+
+    sys.exit(0 if len(parity) == len(rows) else 1)
+
+if __name__ == "__main__":
+    main()
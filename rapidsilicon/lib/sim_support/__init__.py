@@ -0,0 +1,11 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# Shared simulation support of the IP testbenches (sim/ directories), imported by module so that
+# testbenches only pull the dependencies they use:
+# - axis_frame: AXIStreamFrame codec of the MyHDL axis_ep.py endpoints (NumPy).
+# - sim_cache:  compiled simulation cache (Icarus/Verilator images).
@@ -0,0 +1,299 @@
+"""
+
+Copyright (c) 2014-2018 Alex Forencich
+Copyright (c) 2024 RapidSilicon
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+"""
+
+# AXI-Stream frame codec of the MyHDL AXI-Stream endpoints (axis_ep.py): same API as the original
+# AXIStreamFrame, beats packed/unpacked without per-element Python loops:
+# - Byte frames (WL = 8): beats read from a memoryview of the frame (no copy), through a NumPy
+#   little-endian view (M = 1/2/4/8 bytes), a (beats, M) bytes array (M < 8) or int.from_bytes.
+#   Parsed beats serialized the same way, kept bytes selected with a tkeep byte mask.
+# - Word frames (WL != 8): M words per beat packed/unpacked on a (beats, M) NumPy array (uint64 when
+#   a beat fits 64 bits, Python integers otherwise).
+
+import numpy as np
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def field_values(value, n):
+    # tid/tdest/tuser of n beats: None -> 0, int -> repeated, list -> per beat.
+    if value is None:
+        return [0]*n
+    if type(value) is int:
+        return [value]*n
+    return [value[i] for i in range(n)]
+
+def uint_array(values, width):
+    # values as a uint64 array when all fit on width (<= 64) bits, else None.
+    if width > 64:
+        return None
+    try:
+        array = np.array(values, dtype=np.uint64)
+    except (OverflowError, TypeError):
+        return None
+    if len(array) and (width < 64) and (int(array.max()) >> width):
+        return None
+    return array
+
+def keep_mask(tkeep, M):
+    # Boolean (beats, M) mask of the tkeep bits.
+    keep = uint_array(tkeep, 64) if M <= 64 else None
+    if keep is None:
+        keep = np.array(tkeep, dtype=object)
+        return ((keep[:, None] >> np.arange(M)) & 1).astype(bool)
+    return ((keep[:, None] >> np.arange(M, dtype=np.uint64)) & np.uint64(1)).astype(bool)
+
+def pack_bytes(data, M):
+    # Beats of M bytes (little-endian, last beat partial) of a bytes-like frame.
+    view = memoryview(data)
+    full = len(view)//M
+    if M in (1, 2, 4, 8):
+        beats = np.frombuffer(view, dtype="<u%d" % M, count=full).tolist()
+    elif M < 8:
+        octets = np.frombuffer(view, dtype=np.uint8, count=full*M).reshape(full, M).astype(np.uint64)
+        beats  = np.bitwise_or.reduce(octets << np.arange(0, 8*M, 8, dtype=np.uint64), axis=1).tolist()
+    else:
+        beats = [int.from_bytes(view[k*M:(k + 1)*M], "little") for k in range(full)]
+    if len(view) % M:
+        beats.append(int.from_bytes(view[full*M:], "little"))
+    return beats
+
+def unpack_bytes(tdata, tkeep, M):
+    # Kept bytes of beats of M bytes (tdata bits above the beat ignored).
+    words = uint_array(tdata, 8*M) if M in (1, 2, 4, 8) else None
+    if words is not None:
+        raw = words.astype("<u%d" % M).tobytes()
+    else:
+        mask = (1 << (8*M)) - 1
+        raw  = b"".join((d & mask).to_bytes(M, "little") for d in tdata)
+    full = (1 << M) - 1
+    if all(k == full for k in tkeep):
+        return bytearray(raw)
+    return bytearray(np.frombuffer(raw, dtype=np.uint8)[keep_mask(tkeep, M).reshape(-1)].tobytes())
+
+def pack_words(data, M, WL):
+    # Beats of M words of WL bits (last beat partial) of a word list.
+    data  = list(data)
+    beats = -(-len(data)//M)
+    if not beats:
+        return []
+    words = uint_array(data, WL) if (M*WL <= 64) else None
+    if words is not None:
+        shifts = np.arange(0, M*WL, WL, dtype=np.uint64)
+    else:
+        words  = np.array(data, dtype=object)
+        shifts = np.array(range(0, M*WL, WL), dtype=object)
+    padded = np.zeros(beats*M, dtype=words.dtype)
+    padded[:len(words)] = words
+    return np.bitwise_or.reduce(padded.reshape(beats, M) << shifts, axis=1).tolist()
+
+def unpack_words(tdata, tkeep, M, WL):
+    # Kept words of beats of M words of WL bits (tdata bits above the beat ignored).
+    words = uint_array(tdata, 64) if (M*WL <= 64) else None
+    if words is not None:
+        shifts = np.arange(0, M*WL, WL, dtype=np.uint64)
+        mask   = np.uint64(2**WL - 1)
+    else:
+        words  = np.array(tdata, dtype=object)
+        shifts = np.array(range(0, M*WL, WL), dtype=object)
+        mask   = 2**WL - 1
+    return ((words[:, None] >> shifts) & mask)[keep_mask(tkeep, M)].tolist()
+
+# AXI-Stream Frame ---------------------------------------------------------------------------------
+
+class AXIStreamFrame(object):
+    def __init__(self, data=b'', keep=None, id=None, dest=None, user=None, last_cycle_user=None):
+        self.B = 0
+        self.N = 8
+        self.M = 1
+        self.WL = 8
+        self.data = b''
+        self.keep = None
+        self.id = 0
+        self.dest = 0
+        self.user = None
+        self.last_cycle_user = None
+
+        if type(data) in (bytes, bytearray):
+            self.data = bytearray(data)
+            self.keep = keep
+            self.id = id
+            self.dest = dest
+            self.user = user
+            self.last_cycle_user = last_cycle_user
+        elif type(data) is AXIStreamFrame:
+            self.N = data.N
+            self.WL = data.WL
+            if type(data.data) is bytearray:
+                self.data = bytearray(data.data)
+            else:
+                self.data = list(data.data)
+            if data.keep is not None:
+                self.keep = list(data.keep)
+            if data.id is not None:
+                if type(data.id) in (int, bool):
+                    self.id = data.id
+                else:
+                    self.id = list(data.id)
+            if data.dest is not None:
+                if type(data.dest) in (int, bool):
+                    self.dest = data.dest
+                else:
+                    self.dest = list(data.dest)
+            if data.user is not None:
+                if type(data.user) in (int, bool):
+                    self.user = data.user
+                else:
+                    self.user = list(data.user)
+            self.last_cycle_user = data.last_cycle_user
+        else:
+            self.data = list(data)
+            self.keep = keep
+            self.id = id
+            self.dest = dest
+            self.user = user
+            self.last_cycle_user = last_cycle_user
+
+    def build(self):
+        if self.data is None:
+            return
+
+        if self.B == 0:
+            if (self.WL == 8) and isinstance(self.data, (bytes, bytearray)):
+                tdata = pack_bytes(self.data, self.M)
+            else:
+                tdata = pack_words(self.data, self.M, self.WL)
+            n = len(tdata)
+            if self.keep is None:
+                tkeep = [(1 << self.M) - 1]*n
+                if len(self.data) % self.M:
+                    tkeep[-1] = (1 << (len(self.data) % self.M)) - 1
+            else:
+                tkeep = [self.keep[i] for i in range(n)]
+        else:
+            # multiple tdata signals
+            tdata = list(self.data)
+            n = len(tdata)
+            tkeep = [0]*n
+
+        tid = field_values(self.id, n)
+        tdest = field_values(self.dest, n)
+        tuser = field_values(self.user, n)
+
+        if self.last_cycle_user:
+            tuser[-1] = self.last_cycle_user
+
+        return tdata, tkeep, tid, tdest, tuser
+
+    def parse(self, tdata, tkeep, tid, tdest, tuser):
+        if tdata is None or tkeep is None or tuser is None:
+            return
+        if len(tdata) != len(tkeep) or len(tdata) != len(tid) or len(tdata) != len(tdest) or len(tdata) != len(tuser):
+            raise Exception("Invalid data")
+
+        if self.B == 0:
+            if self.WL == 8:
+                self.data = unpack_bytes(tdata, tkeep, self.M)
+            else:
+                self.data = unpack_words(tdata, tkeep, self.M, self.WL)
+        else:
+            self.data = list(tdata)
+            if self.WL == 8:
+                self.data = bytearray(self.data)
+        self.keep = list(tkeep)
+        self.id = list(tid)
+        self.dest = list(tdest)
+        self.user = list(tuser)
+
+        self.last_cycle_user = self.user[-1]
+
+    def __eq__(self, other):
+        if not isinstance(other, AXIStreamFrame):
+            return False
+        if self.data != other.data:
+            return False
+        if self.keep is not None and other.keep is not None:
+            if self.keep != other.keep:
+                return False
+        if self.id is not None and other.id is not None:
+            if type(self.id) in (int, bool) and type(other.id) is list:
+                for k in other.id:
+                    if self.id != k:
+                        return False
+            elif type(other.id) in (int, bool) and type(self.id) is list:
+                for k in self.id:
+                    if other.id != k:
+                        return False
+            elif self.id != other.id:
+                return False
+        if self.dest is not None and other.dest is not None:
+            if type(self.dest) in (int, bool) and type(other.dest) is list:
+                for k in other.dest:
+                    if self.dest != k:
+                        return False
+            elif type(other.dest) in (int, bool) and type(self.dest) is list:
+                for k in self.dest:
+                    if other.dest != k:
+                        return False
+            elif self.dest != other.dest:
+                return False
+        if self.last_cycle_user is not None and other.last_cycle_user is not None:
+            if self.last_cycle_user != other.last_cycle_user:
+                return False
+            if self.user is not None and other.user is not None:
+                if type(self.user) in (int, bool) and type(other.user) is list:
+                    for k in other.user[:-1]:
+                        if self.user != k:
+                            return False
+                elif type(other.user) in (int, bool) and type(self.user) is list:
+                    for k in self.user[:-1]:
+                        if other.user != k:
+                            return False
+                elif self.user != other.user:
+                    return False
+        else:
+            if self.user is not None and other.user is not None:
+                if type(self.user) in (int, bool) and type(other.user) is list:
+                    for k in other.user:
+                        if self.user != k:
+                            return False
+                elif type(other.user) in (int, bool) and type(self.user) is list:
+                    for k in self.user:
+                        if other.user != k:
+                            return False
+                elif self.user != other.user:
+                    return False
+        return True
+
+    def __repr__(self):
+        return (
+                ('AXIStreamFrame(data=%s, ' % repr(self.data)) +
+                ('keep=%s, ' % repr(self.keep)) +
+                ('id=%s, ' % repr(self.id)) +
+                ('dest=%s, ' % repr(self.dest)) +
+                ('user=%s, ' % repr(self.user)) +
+                ('last_cycle_user=%s)' % repr(self.last_cycle_user))
+            )
+
+    def __iter__(self):
+        return self.data.__iter__()
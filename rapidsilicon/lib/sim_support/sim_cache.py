@@ -0,0 +1,216 @@
+#
+# This file is part of RapidSilicon's IP_Catalog.
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# Compiled simulation cache of the IP testbenches.
+#
+# Content-addressed store of simulator images (Icarus .vvp, Verilator executables) in
+# <cache_dir>/<key[:2]>/<key>/, key: RTL sources (names and contents), simulator and its version,
+# cocotb version and compile options (toplevel, parameters, defines, command, ...). A per key lock
+# (flock, POSIX) makes parallel workers wait for the one compiling an image instead of compiling it
+# again. Entries are LRU evicted on total size (SIM_CACHE_MAX_SIZE, MB).
+#
+# system(): cached os.system build command of the MyHDL cosimulation scripts.
+# run():    cached cocotb_test.simulator.run (image compiled once, copied to each sim_build).
+#
+# SIM_CACHE=0 disables the cache, SIM_CACHE_DIR overrides its location. SIM_BUILD_ROOT relocates the
+# run() sim_build directories (per job isolation of parallel regressions).
+
+import os
+import sys
+import glob
+import json
+import shutil
+import hashlib
+import tempfile
+import functools
+import contextlib
+import subprocess
+
+# Cache Key ----------------------------------------------------------------------------------------
+
+# Image of cocotb-test simulators (in sim_build).
+IMAGES = {
+    "icarus"    : "{toplevel}.vvp",
+    "verilator" : "{toplevel}",
+}
+
+# Verilator options of the cocotb testbenches (same as the sim/Makefile verilator branches).
+VERILATOR_COMPILE_ARGS = ["-Wno-SELRANGE", "-Wno-WIDTH", "-Wno-fatal"]
+
+VERSION_COMMANDS = {
+    "icarus"    : ["iverilog", "-V"],
+    "verilator" : ["verilator", "--version"],
+}
+
+def default_cache_dir():
+    if os.environ.get("SIM_CACHE_DIR"):
+        return os.environ["SIM_CACHE_DIR"]
+    cache_home = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache_home, "rapidsilicon", "ip_catalog", "sim")
+
+def enabled():
+    return os.environ.get("SIM_CACHE", "1") != "0"
+
+@functools.lru_cache(maxsize=None)
+def simulator_version(simulator):
+    # First output line of the simulator version command ("unknown" if not found).
+    try:
+        output = subprocess.run(VERSION_COMMANDS[simulator], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            universal_newlines=True).stdout
+    except (KeyError, OSError):
+        return "unknown"
+    return output.strip().split("\n")[0]
+
+@functools.lru_cache(maxsize=None)
+def cocotb_version():
+    from importlib import metadata
+    try:
+        return metadata.version("cocotb")
+    except Exception:
+        return "unknown"
+
+def expand_sources(sources):
+    # Sources files (glob patterns expanded), sorted.
+    filenames = []
+    for source in sources:
+        matches = glob.glob(source)
+        filenames += matches if matches else [source]
+    return sorted(set(filenames))
+
+def cache_key(sources, simulator, **options):
+    h = hashlib.sha256()
+    h.update(f"{simulator}:{simulator_version(simulator)}:{cocotb_version()}".encode())
+    for filename in expand_sources(sources):
+        h.update(os.path.basename(filename).encode())
+        with open(filename, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    h.update(json.dumps(options, sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+# Sim Cache ----------------------------------------------------------------------------------------
+
+class SimCache:
+    def __init__(self, cache_dir=None, max_size=None):
+        self.cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+        self.max_size  = int(os.environ.get("SIM_CACHE_MAX_SIZE", 2048))*1024*1024 if max_size is None else max_size
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        os.makedirs(os.path.dirname(self.path(key)), exist_ok=True)
+        with open(self.path(key) + ".lock", "w") as f:
+            try:
+                import fcntl
+            except ImportError:
+                fcntl = None # No lock (Windows): concurrent misses compile twice, stores stay atomic.
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def fetch(self, key, outputs):
+        # Copy the cached image files to outputs (fresh mtime: simulators see them up to date, atomic:
+        # a running simulation never sees a partial image).
+        path = self.path(key)
+        if not all(os.path.isfile(os.path.join(path, os.path.basename(o))) for o in outputs):
+            return False
+        for output in outputs:
+            os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+            tmp_output = f"{output}.{os.getpid()}.tmp"
+            shutil.copyfile(os.path.join(path, os.path.basename(output)), tmp_output)
+            shutil.copymode(os.path.join(path, os.path.basename(output)), tmp_output)
+            os.replace(tmp_output, output)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True
+
+    def store(self, key, outputs):
+        # Atomic store: entry directory renamed once complete.
+        tmp_path = tempfile.mkdtemp(dir=os.path.dirname(self.path(key)), suffix=".tmp")
+        for output in outputs:
+            shutil.copy2(output, os.path.join(tmp_path, os.path.basename(output)))
+        shutil.rmtree(self.path(key), ignore_errors=True)
+        os.replace(tmp_path, self.path(key))
+        self.evict()
+
+    def evict(self):
+        entries = []
+        total   = 0
+        for prefix in os.listdir(self.cache_dir):
+            prefix_path = os.path.join(self.cache_dir, prefix)
+            if not os.path.isdir(prefix_path):
+                continue
+            for key in os.listdir(prefix_path):
+                path = os.path.join(prefix_path, key)
+                if not os.path.isdir(path) or key.endswith(".tmp"):
+                    continue
+                try:
+                    size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+                    entries.append((os.path.getmtime(path), size, path))
+                except OSError:
+                    continue
+                total += size
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def build(self, key, outputs, compile):
+        # outputs from the cache, else compile() (returns an exit status, stored only on success).
+        with self.lock(key):
+            if self.fetch(key, outputs):
+                print(f"Sim Cache: hit ({key[:16]})", file=sys.stderr)
+                return 0
+            status = compile()
+            if not status and all(os.path.isfile(o) for o in outputs):
+                self.store(key, outputs)
+            print(f"Sim Cache: miss ({key[:16]})", file=sys.stderr)
+            return status
+
+# Runners ------------------------------------------------------------------------------------------
+
+def system(build_cmd, outputs, sources, simulator="icarus", cache=None):
+    # os.system(build_cmd) building outputs from sources (exit status, 0 on cache hit).
+    if not enabled():
+        return os.system(build_cmd)
+    cache = SimCache() if cache is None else cache
+    key   = cache_key(sources, simulator, command=build_cmd, outputs=[os.path.basename(o) for o in outputs])
+    return cache.build(key, outputs, lambda: os.system(build_cmd))
+
+def run(sim_build, toplevel, verilog_sources, parameters=None, cache=None, **kwargs):
+    # cocotb_test.simulator.run with the simulator image of sim_build taken from the cache (compiled
+    # there first on a miss, SIM environment variable selects the simulator as for cocotb-test).
+    import cocotb_test.simulator
+    if os.environ.get("SIM_BUILD_ROOT"):
+        sim_build = os.path.join(os.environ["SIM_BUILD_ROOT"], os.path.basename(os.path.normpath(sim_build)))
+    kwargs.update(sim_build=sim_build, toplevel=toplevel, verilog_sources=verilog_sources, parameters=parameters)
+    simulator = os.environ.get("SIM", "icarus").lower()
+    if simulator == "verilator":
+        # Icarus time unit/precision default (cocotb-test timescale) and lint warnings not fatal.
+        kwargs["compile_args"] = VERILATOR_COMPILE_ARGS + ["--timescale", kwargs.get("timescale") or "1ns/1ps"] + \
+            list(kwargs.get("compile_args") or [])
+    if enabled() and (simulator in IMAGES):
+        cache   = SimCache() if cache is None else cache
+        options = {k: kwargs.get(k) for k in ["toplevel", "parameters", "defines", "includes", "compile_args", "timescale",
+            "toplevel_lang", "waves"]}
+        options["waves_env"] = os.environ.get("WAVES")
+        key     = cache_key(verilog_sources, simulator, **options)
+        outputs = [os.path.join(sim_build, IMAGES[simulator].format(toplevel=toplevel))]
+        def compile():
+            cocotb_test.simulator.run(compile_only=True, **kwargs)
+            return 0
+        cache.build(key, outputs, compile)
+    return cocotb_test.simulator.run(**kwargs)
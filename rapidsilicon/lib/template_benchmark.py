@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+#
+# This file is Copyright (c) 2024 RapidSilicon.
+#
+# SPDX-License-Identifier: MIT
+#
+# --json-template startup benchmark.
+#
+# Runs every rapidsilicon/ip/*/*/*_gen.py with --json-template (fresh process, temporary working
+# directory) and checks that:
+# - the median wall time stays under --budget seconds.
+# - migen/LiteX are not imported (generators only import them on --build).
+#
+# Exits with 1 if any generator fails, exceeds the budget or imports the toolchain.
+
+import os
+import re
+import sys
+import glob
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+# Paths --------------------------------------------------------------------------------------------
+
+ip_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "ip"))
+
+# Toolchain packages that must not be imported for --json-template.
+toolchain_modules = re.compile(r"^(migen|litex|liteeth|litespi)(\.|$)")
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def run_template(python, gen_filename, cwd):
+    # -X importtime: one "import time: self | cumulative | module" line per imported module on stderr.
+    start  = time.perf_counter()
+    result = subprocess.run([python, "-X", "importtime", gen_filename, "--json-template"],
+        cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    duration = time.perf_counter() - start
+
+    imported = []
+    errors   = []
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:"):
+            module = line.split("|")[-1].strip()
+            if toolchain_modules.match(module):
+                imported.append(module)
+        else:
+            errors.append(line)
+    if result.returncode != 0:
+        raise RuntimeError(errors[-1] if errors else f"returncode {result.returncode}")
+    json.loads(result.stdout[result.stdout.find("{"):])
+    return duration, imported
+
+def benchmark(python, gen_filename, runs):
+    cwd = tempfile.mkdtemp(prefix="template_benchmark_")
+    try:
+        durations = []
+        for n in range(runs):
+            duration, imported = run_template(python, gen_filename, cwd)
+            durations.append(duration)
+    finally:
+        shutil.rmtree(cwd, ignore_errors=True)
+    return statistics.median(durations), imported
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="IP Catalog --json-template startup benchmark")
+    parser.add_argument("--ip-path", default=ip_path,        help="IP Catalog path")
+    parser.add_argument("--python",  default=sys.executable, help="Python interpreter (LiteX environment)")
+    parser.add_argument("--runs",    default=5,   type=int,   help="Runs per generator (median is reported)")
+    parser.add_argument("--budget",  default=0.5, type=float, help="Maximum median time per generator (s)")
+    parser.add_argument("--report",  default=None,            help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    results = []
+    for gen_filename in sorted(glob.glob(os.path.join(os.path.abspath(args.ip_path), "*", "*", "*_gen.py"))):
+        version_path = os.path.dirname(gen_filename)
+        name   = f"{os.path.basename(os.path.dirname(version_path))}/{os.path.basename(version_path)}"
+        result = {"name": name, "time": None, "toolchain_imports": [], "error": None}
+        try:
+            result["time"], result["toolchain_imports"] = benchmark(args.python, gen_filename, max(1, args.runs))
+        except Exception as e:
+            result["error"] = str(e)
+        if result["error"] is not None:
+            status = f"FAILED ({result['error']})"
+        elif result["toolchain_imports"]:
+            status = f"FAILED (imports {', '.join(sorted(set(m.split('.')[0] for m in result['toolchain_imports'])))})"
+        elif result["time"] > args.budget:
+            status = f"FAILED (over {args.budget:.2f}s budget)"
+        else:
+            status = "OK"
+        result["status"] = status
+        results.append(result)
+        time_str = "-" if result["time"] is None else f"{result['time']*1e3:.1f}ms"
+        print(f"{name:<40} {time_str:>10}  {status}", flush=True)
+
+    failed = [r for r in results if r["status"] != "OK"]
+    print(f"{len(results) - len(failed)}/{len(results)} generators OK (budget: {args.budget:.2f}s).")
+
+    if args.report is not None:
+        with open(args.report, "w") as f:
+            json.dump({"budget": args.budget, "generators": results}, f, indent=4)
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()